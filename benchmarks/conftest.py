@@ -0,0 +1,71 @@
+"""
+Shared fixtures for the hot-path benchmarks.
+
+Everything runs against local stand-ins: fakeredis behind RedisManager and
+an in-memory SQLite database, so results only reflect the code under test.
+"""
+
+import asyncio
+import os
+
+# core.config requires these at import time; nothing here connects to them
+for _name, _value in {
+    "DATABASE_URL": "sqlite://",
+    "MONGO_URL": "mongodb://localhost:27017",
+    "REDIS_URL": "redis://localhost:6379/0",
+    "CLOUDINARY_CLOUD_NAME": "benchmark",
+    "CLOUDINARY_API_KEY": "benchmark",
+    "CLOUDINARY_API_SECRET": "benchmark",
+    "JWT_SECRET": "benchmark",
+    "OPENROUTER_API_KEY": "benchmark",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from services.database.database import Base
+from services.database.redis import RedisManager
+from services.models.user_model import User
+from services.models.analytics_model import ContentPerformance, PostEngagement, UserMetrics
+from services.models.scheduled_post_model import ScheduledPost
+from services.models.token_model import PlatformToken
+
+# User's relationships are resolved against these mapped classes
+RELATED_MODELS = (PlatformToken, ScheduledPost, PostEngagement, UserMetrics, ContentPerformance)
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine function to completion on a dedicated loop; benchmark only calls plain functions"""
+    loop = asyncio.new_event_loop()
+    yield lambda coroutine_function, *args, **kwargs: loop.run_until_complete(coroutine_function(*args, **kwargs))
+    loop.close()
+
+
+@pytest.fixture
+def fake_redis():
+    """A fakeredis server installed as RedisManager's pool"""
+    previous = RedisManager._pool
+    RedisManager._pool = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    try:
+        yield RedisManager._pool
+    finally:
+        RedisManager._pool = previous
+
+
+@pytest.fixture
+def db_session():
+    """An in-memory SQLite session with the user and analytics tables"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    tables = [User.__table__, UserMetrics.__table__, ContentPerformance.__table__, PostEngagement.__table__]
+    Base.metadata.create_all(bind=engine, tables=tables)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,46 @@
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.analytics.data_analyzer import AnalyticsAnalyzer
+from services.models.analytics_model import ContentPerformance, UserMetrics
+from services.models.user_model import User
+
+PLATFORMS = ("instagram", "facebook", "twitter", "linkedin", "youtube")
+
+
+@pytest.fixture
+def analyzer(db_session):
+    """One account with 90 days of daily metrics on five platforms and 2,000 posts, among 20 accounts"""
+    rng = random.Random(42)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    user_ids = [uuid.uuid4() for _ in range(20)]
+    db_session.add_all(User(id=user_id, email=f"{user_id}@example.com") for user_id in user_ids)
+
+    for user_id in user_ids:
+        db_session.add_all(
+            UserMetrics(user_id=user_id, platform=platform, date=today - timedelta(days=day),
+                        followers_count=10_000 + day * 7, followers_growth=rng.randint(-5, 40),
+                        engagement_rate=rng.uniform(0.5, 8.0), total_engagements=rng.randint(50, 900),
+                        posts_count=rng.randint(0, 4))
+            for platform in PLATFORMS for day in range(90)
+        )
+        db_session.add_all(
+            ContentPerformance(user_id=user_id, platform=PLATFORMS[n % len(PLATFORMS)], platform_post_id=f"{user_id}-{n}",
+                               content_type="post", impressions=rng.randint(500, 50_000),
+                               engagement_count=rng.randint(10, 3_000), engagement_rate=rng.uniform(0.1, 12.0),
+                               likes=rng.randint(5, 2_000), comments=rng.randint(0, 300),
+                               post_date=today - timedelta(hours=rng.randint(0, 24 * 90)))
+            for n in range(100)
+        )
+    db_session.commit()
+    return AnalyticsAnalyzer(db=db_session), user_ids[0]
+
+
+def test_get_user_overview(benchmark, analyzer):
+    service, user_id = analyzer
+    overview = benchmark(service.get_user_overview, user_id, 30)
+    assert "error" not in overview
+    assert set(overview["platform_metrics"]) == set(PLATFORMS)
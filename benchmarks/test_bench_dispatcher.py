@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.scheduler import dispatcher
+from services.scheduler.dispatcher import dispatch_scheduled_posts
+
+PLATFORMS = ("instagram", "facebook", "twitter", "linkedin")
+
+
+def _posts(count: int = 500):
+    return [
+        {
+            "platform": PLATFORMS[n % len(PLATFORMS)],
+            "user_token": {"access_token": f"token-{n % 50}"},
+            "post_payload": {"caption": f"Post {n}", "image_url": f"https://cdn.example.com/{n}.png"},
+            "post_id": n,
+            "user_id": f"account-{n % 50}",
+            "priority": ("high", "normal", "low")[n % 3],
+        }
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def dispatch(fake_redis, run):
+    """Queue and release a batch of due posts from an empty Redis, with generous limits and no broker"""
+    limits = AsyncMock(return_value={"limits": {"hourly": 10_000, "daily": 100_000}})
+    with patch.object(dispatcher.SchedulerCacheService, "get_platform_posting_limits", limits), \
+            patch.object(dispatcher, "current_app", MagicMock()):
+        def setup():
+            run(fake_redis.flushall)
+            return (_posts(),), {}
+
+        yield setup, lambda posts: run(dispatch_scheduled_posts, posts)
+
+
+def test_dispatch_scheduled_posts(benchmark, dispatch):
+    setup, dispatch_posts = dispatch
+    result = benchmark.pedantic(dispatch_posts, setup=setup, rounds=5)
+    # Every lane holds fewer than RELEASE_BATCH_SIZE posts, so one pass releases the whole batch
+    assert result == {"queued": 500, "dispatched": 500, "failed": 0}
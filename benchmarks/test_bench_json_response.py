@@ -0,0 +1,83 @@
+import os
+import sys
+import types
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# tests/utils.py shadows the top-level utils namespace package when the test suite shares the session
+if not hasattr(sys.modules.get("utils"), "__path__"):
+    utils_package = types.ModuleType("utils")
+    utils_package.__path__ = [os.path.join(os.path.dirname(__file__), "..", "utils")]
+    sys.modules["utils"] = utils_package
+
+from utils.json_response import FastJSONResponse
+
+
+class ScheduledPostResponse(BaseModel):
+    """The fields of SecureScheduledPostResponse, whose router cannot be imported without the full app"""
+    id: str
+    content: str
+    platform: str
+    scheduled_time: datetime
+    status: str
+    media_urls: List[str] = []
+    tags: List[str] = []
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+def _chart_payload(points: int = 365):
+    """A year of daily time-series points on five platforms, as the analytics chart endpoint returns them"""
+    start = datetime(2025, 1, 1)
+    return {
+        "labels": [start + timedelta(days=n) for n in range(points)],
+        "datasets": [
+            {"label": platform, "data": [{"x": start + timedelta(days=n), "y": n * 1.5, "engagements": n * 3}
+                                         for n in range(points)]}
+            for platform in ("instagram", "facebook", "twitter", "linkedin", "youtube")
+        ],
+        "timestamp": datetime.utcnow().isoformat(),
+        "chart_config": {"type": "time_series", "metric": "engagement", "platform": None, "days": points},
+    }
+
+
+def _scheduled_posts(count: int = 100):
+    """A full page of scheduled posts as the list endpoint builds them"""
+    now = datetime(2025, 6, 1, 9, 30)
+    return [
+        ScheduledPostResponse(
+            id=f"post_{n}", content=f"Summer launch post {n} #sale #summer", platform="twitter",
+            scheduled_time=now + timedelta(hours=n), status="scheduled",
+            media_urls=["https://cdn.example.com/img/launch.png"], tags=["launch", "summer"],
+            created_at=now, updated_at=now,
+        )
+        for n in range(count)
+    ]
+
+
+def test_chart_jsonable_encoder(benchmark):
+    payload = _chart_payload()
+    response = benchmark(lambda: JSONResponse(jsonable_encoder(payload)))
+    assert response.body.startswith(b'{"labels"')
+
+
+def test_chart_fast_json(benchmark):
+    payload = _chart_payload()
+    response = benchmark(FastJSONResponse, payload)
+    assert response.body.startswith(b'{"labels"')
+
+
+def test_scheduled_posts_jsonable_encoder(benchmark):
+    posts = _scheduled_posts()
+    response = benchmark(lambda: JSONResponse(jsonable_encoder(posts)))
+    assert response.body.startswith(b'[{"id":"post_0"')
+
+
+def test_scheduled_posts_fast_json(benchmark):
+    posts = _scheduled_posts()
+    response = benchmark(FastJSONResponse, posts)
+    assert response.body.startswith(b'[{"id":"post_0"')
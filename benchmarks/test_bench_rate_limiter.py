@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+from services.database.redis import RedisManager
+from services.security.rate_limiter import RateLimitConfig, RateLimiter
+
+KEY = "rate_limit:per_ip:203.0.113.7"
+WINDOW = 3600
+
+
+@pytest.fixture
+def limiter(fake_redis, run):
+    """A limiter whose key already holds an hour of traffic at one request per second"""
+    rate_limiter = RateLimiter(RateLimitConfig())
+    rate_limiter.redis_manager = RedisManager
+    now = int(time.time())
+    run(fake_redis.zadd, KEY, {f"{now - age}-{age}": now - age for age in range(WINDOW)})
+    return rate_limiter
+
+
+def test_check_limit_under_limit(benchmark, limiter, run):
+    allowed, _, _ = benchmark(run, limiter._check_limit, KEY, 1_000_000, WINDOW)
+    assert allowed
+
+
+def test_check_limit_over_limit(benchmark, limiter, run):
+    allowed, _, retry_after = benchmark(run, limiter._check_limit, KEY, 100, WINDOW)
+    assert not allowed and retry_after > 0
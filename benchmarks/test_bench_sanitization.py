@@ -0,0 +1,51 @@
+import json
+
+from utils.sanitization import json_needs_sanitizing, loads_sanitized, sanitize_dict
+
+
+def _post_body(comments: int = 200):
+    """A scheduled post with its comment thread, roughly what the sanitization middleware sees per request"""
+    return {
+        "platform": "instagram",
+        "scheduled_time": "2025-06-01T09:30:00Z",
+        "post_payload": {
+            "caption": "Summer launch is here! Tap the link in bio for 20% off #sale #summer",
+            "hashtags": ["#sale", "#summer", "#launch", "#newin"],
+            "image_url": "https://cdn.example.com/img/launch.png",
+            "mentions": ["@brand", "@partner"],
+        },
+        "comments": [
+            {
+                "id": n,
+                "author": f"user_{n}",
+                "text": f"Love this <b>look</b> {n}!" if n % 10 else f"<script>alert({n})</script> click <a href='x'>",
+                "likes": n * 3,
+                "replies": [{"author": "brand", "text": "Thank you!"}],
+            }
+            for n in range(comments)
+        ],
+        "metadata": {"source": "web", "client": {"name": "dashboard", "version": "2.4.1"}},
+    }
+
+
+def test_sanitize_dict_post_body(benchmark):
+    body = _post_body()
+    result = benchmark(sanitize_dict, body)
+    assert len(result["comments"]) == len(body["comments"])
+
+
+def test_sanitize_dict_clean_payload(benchmark):
+    body = {f"field_{n}": f"plain value {n}" for n in range(500)}
+    result = benchmark(sanitize_dict, body)
+    assert result["field_0"] == "plain value 0"
+
+
+def test_loads_sanitized_post_body(benchmark):
+    raw = json.dumps(_post_body()).encode()
+    data, changed = benchmark(loads_sanitized, raw)
+    assert changed and data == sanitize_dict(_post_body())
+
+
+def test_clean_body_scan(benchmark):
+    raw = json.dumps({"posts": [{"content": f"Launch day post {n} #sale"} for n in range(500)]}).encode()
+    assert not benchmark(json_needs_sanitizing, raw)
@@ -1,7 +1,10 @@
 from celery import Celery
+from celery.signals import before_task_publish
 import os
 from dotenv import load_dotenv
 
+from services.scheduler.queue_telemetry import stamp_sent_at
+
 load_dotenv()
 
 # Load Redis broker URL from environment variables
@@ -15,7 +18,8 @@ celery_app = Celery(
     broker=REDIS_BROKER,
     backend=REDIS_BROKER,
     include=[
-        "services.scheduler.tasks"
+        "services.scheduler.tasks",
+        "services.analytics.tasks"
     ]
 )
 
@@ -43,4 +47,6 @@ celery_app.conf.update(
             "schedule": 60,
         },
     }
-)
\ No newline at end of file
+)
+# Stamp publish time on every task so queue telemetry can report message age
+before_task_publish.connect(stamp_sent_at, weak=False)
@@ -0,0 +1,103 @@
+"""
+Startup orchestration for the Social Suit API.
+
+Datastores connect concurrently rather than one after another, one-off work
+(MongoDB index builds, the Redis TTL sweep) runs in the background once the
+worker is serving, and every phase is timed. The report is served at
+/health/startup so a slow cold start can be traced to the phase behind it.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """Durations and outcomes of this worker's startup phases."""
+
+    def __init__(self):
+        # Measured from the first import of this module, which main.py does before anything else
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.ready_after: Optional[float] = None
+
+    def record(self, name: str, seconds: Optional[float], status: str = "ok",
+               background: bool = False, error: Optional[str] = None) -> None:
+        phase = {"seconds": None if seconds is None else round(seconds, 3), "status": status, "background": background}
+        if error:
+            phase["error"] = error
+        self.phases[name] = phase
+
+    def record_since_start(self, name: str) -> None:
+        """Record a phase that ran from process start until now, such as importing the app."""
+        self.record(name, time.perf_counter() - self.started_at)
+
+    def mark_ready(self) -> None:
+        self.ready_after = time.perf_counter() - self.started_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready_after is not None,
+            "ready_after_seconds": None if self.ready_after is None else round(self.ready_after, 3),
+            "phases": self.phases,
+        }
+
+
+startup_report = StartupReport()
+
+# Strong references, so background phases are not garbage-collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+
+
+async def timed_phase(name: str, awaitable: Awaitable[Any], background: bool = False) -> Any:
+    """Await a startup phase and record how long it took."""
+    started = time.perf_counter()
+    try:
+        result = await awaitable
+    except Exception as e:
+        startup_report.record(name, time.perf_counter() - started, "failed", background, error=str(e))
+        raise
+    startup_report.record(name, time.perf_counter() - started, "ok", background)
+    return result
+
+
+async def run_concurrently(phases: Dict[str, Callable[[], Awaitable[Any]]]) -> None:
+    """Run independent startup phases at the same time.
+
+    Every phase runs to completion so all of them are reported; the first
+    failure is then raised, as it would have been when they ran in turn.
+    """
+    results = await asyncio.gather(
+        *(timed_phase(name, start()) for name, start in phases.items()),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def run_in_background(name: str, start: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+    """Start a phase that must not hold up readiness; failures are logged and reported, not raised."""
+    startup_report.record(name, None, "running", background=True)
+
+    async def runner():
+        try:
+            await timed_phase(name, start(), background=True)
+        except Exception as e:
+            logger.error(f"Background startup phase {name} failed: {e}")
+
+    task = asyncio.create_task(runner())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def cancel_background_tasks() -> None:
+    """Stop background phases that are still running, e.g. on shutdown."""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,7 +1,17 @@
+# Imported first so the startup report's clock includes importing everything below
+from core.startup import (
+    startup_report,
+    timed_phase,
+    run_concurrently,
+    run_in_background,
+    cancel_background_tasks
+)
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 import logging
+import os
 
 # Import security components
 from services.security.rate_limiter import RateLimiter, RateLimitConfig
@@ -32,6 +42,7 @@ from services.endpoint.engagement_router import router as engagement_router
 from services.endpoint.customize import router as customize_router
 from services.endpoint.inbox_router import router as inbox_router
 from services.endpoint.secure_upload import router as upload_router
+from services.endpoint.queue_metrics import router as queue_metrics_router
 from services.endpoint import connect, callback, schedule
 
 # Database setup
@@ -39,7 +50,10 @@ from services.database.database import Base, engine
 from services.database.postgresql import init_db_pool, get_db_connection
 from services.database.mongodb import MongoDBManager
 from services.database.redis import RedisManager
+from services.llm_gateway import close_llm_gateway
+from services.auth.platform.oauth_client import close_oauth_client
 from middleware.sanitization_middleware import SanitizationMiddleware
+from utils.json_response import FastJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -48,13 +62,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Build MongoDB indexes in the background after startup. Set to false when a
+# deploy step runs scripts/create_mongo_indexes.py instead.
+MONGO_INDEXES_ON_STARTUP = os.getenv("MONGO_INDEXES_ON_STARTUP", "true").lower() == "true"
+
 # Create FastAPI app
 app = FastAPI(
     title="Social Suit API",
     description="A comprehensive social media management platform with enhanced security",
     version="2.0.0",
     docs_url="/docs" if not security_settings.cors_allow_origins else None,  # Disable docs in production
-    redoc_url="/redoc" if not security_settings.cors_allow_origins else None
+    redoc_url="/redoc" if not security_settings.cors_allow_origins else None,
+    default_response_class=FastJSONResponse
 )
 
 # -------------------------------
@@ -62,31 +81,30 @@ app = FastAPI(
 # -------------------------------
 @app.on_event("startup")
 async def connect_services():
-    # Initialize security components first
-    await initialize_security()
-    
-    # ✅ PostgreSQL
-    await init_db_pool()
-    print("✅ PostgreSQL Connected")
-
-    # ✅ MongoDB
-    await MongoDBManager.initialize()
-    print("✅ MongoDB Connected")
-
-    # ✅ Redis
-    await RedisManager.initialize()
-    async with RedisManager.get_connection() as redis:
-        is_redis_connected = await redis.ping()
-        print("✅ Redis Connected:", is_redis_connected)
+    # ✅ PostgreSQL, MongoDB and Redis connect concurrently; none depends on another
+    await run_concurrently({
+        "postgresql": init_db_pool,
+        "postgresql_tables": lambda: asyncio.to_thread(Base.metadata.create_all, bind=engine),
+        "mongodb": lambda: MongoDBManager.initialize(create_indexes=False),
+        "redis": lambda: RedisManager.initialize(clear_expired=False),
+    })
+    print("✅ PostgreSQL, MongoDB and Redis Connected")
+
+    # Security components use the Redis connection for rate limiting
+    await timed_phase("security", initialize_security())
+
+    # Maintenance that does not need to finish before the worker takes traffic
+    if MONGO_INDEXES_ON_STARTUP:
+        run_in_background("mongodb_indexes", MongoDBManager.create_indexes)
+    run_in_background("redis_ttl_sweep", RedisManager.clear_expired_cache)
+
+    startup_report.mark_ready()
+    logger.info(f"Startup complete in {startup_report.ready_after:.2f}s")
 
 # Initialize security components
 async def initialize_security():
     """Initialize security components."""
     try:
-        # Initialize Redis for rate limiting
-        await RedisManager.initialize()
-        logger.info("Redis initialized for security features")
-        
         # Create rate limiter
         rate_limit_config = RateLimitConfig(**RATE_LIMIT_CONFIG)
         rate_limiter = RateLimiter(rate_limit_config)
@@ -120,6 +138,8 @@ async def initialize_security():
 # -------------------------------
 @app.on_event("shutdown")
 async def shutdown_services():
+    await cancel_background_tasks()
+
     from services.database.postgresql import close_db_pool
     await close_db_pool()
     print("🔌 PostgreSQL Connection Closed")
@@ -130,10 +150,11 @@ async def shutdown_services():
     await RedisManager.close()
     print("🔌 Redis Connection Closed")
 
-# -------------------------------
-# Database Table Initialization
-# -------------------------------
-Base.metadata.create_all(bind=engine)
+    await close_llm_gateway()
+    print("🔌 LLM Gateway Closed")
+
+    await close_oauth_client()
+    print("🔌 OAuth HTTP Client Closed")
 
 # -------------------------------
 # Enable CORS for Frontend
@@ -163,6 +184,7 @@ app.include_router(engage_router, prefix="/api/v1")
 app.include_router(engagement_router, prefix="/api/v1")
 app.include_router(customize_router, prefix="/api/v1")
 app.include_router(upload_router, prefix="/api/v1")
+app.include_router(queue_metrics_router, prefix="/api/v1")
 app.include_router(inbox_router, prefix="/inbox")
 app.include_router(connect.router, prefix="/api/v1")
 app.include_router(callback.router, prefix="/api/v1")
@@ -173,6 +195,8 @@ app.include_router(email_auth_router)
 app.include_router(protected_router, prefix="/auth")
 app.include_router(connect_router)
 
+startup_report.record_since_start("imports")
+
 # -------------------------------
 # Root Endpoint
 # -------------------------------
@@ -180,5 +204,10 @@ app.include_router(connect_router)
 def home():
     return {"msg": "🚀 Social Suit Backend Running"}
 
+@app.get("/health/startup")
+def startup_health():
+    """How long each startup phase of this worker took."""
+    return startup_report.as_dict()
+
 
 
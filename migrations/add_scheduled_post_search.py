@@ -0,0 +1,61 @@
+"""Database migration adding an indexed search_text column to scheduled_posts."""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = 'scheduled_post_search_001'
+down_revision = 'unified_auth_001'
+branch_labels = None
+depends_on = None
+
+
+def _tag_text(field):
+    """SQL joining a payload tag list (or a space-separated string) into one string."""
+    return f"""
+        CASE json_typeof(post_payload->'{field}')
+            WHEN 'array' THEN (SELECT string_agg(tag, ' ') FROM json_array_elements_text(post_payload->'{field}') AS tag)
+            WHEN 'string' THEN post_payload->>'{field}'
+        END
+    """
+
+
+def upgrade():
+    """Add search_text, backfill it from post_payload and index it with pg_trgm."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('scheduled_posts', sa.Column('search_text', sa.Text(), nullable=True))
+
+    # Same fields, in the same order, as scheduled_post_model.extract_search_text
+    connection = op.get_bind()
+    connection.execute(
+        sa.text(f"""
+        UPDATE scheduled_posts
+        SET search_text = left(concat_ws(' ',
+            NULLIF(post_payload->>'title', ''),
+            NULLIF(post_payload->>'caption', ''),
+            NULLIF(post_payload->>'text', ''),
+            NULLIF(post_payload->>'message', ''),
+            NULLIF(post_payload->>'content', ''),
+            NULLIF(post_payload->>'description', ''),
+            {_tag_text('hashtags')},
+            {_tag_text('tags')}
+        ), 10000)
+        WHERE post_payload IS NOT NULL AND json_typeof(post_payload) = 'object'
+        """)
+    )
+
+    # Build the index without blocking writes to the table
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scheduled_posts_search_trgm "
+            "ON scheduled_posts USING gin (search_text gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    """Drop the search index and column (the pg_trgm extension is left installed)."""
+
+    op.drop_index('idx_scheduled_posts_search_trgm', 'scheduled_posts')
+    op.drop_column('scheduled_posts', 'search_text')
@@ -98,7 +98,7 @@ async def demo_scheduled_post_operations():
         query="social media",
         limit=5
     )
-    print(f"   🔍 Found {len(search_results)} matching posts")
+    print(f"   🔍 Found {len(search_results['posts'])} matching posts")
 
 async def demo_analytics_operations():
     """Demonstrate optimized analytics operations."""
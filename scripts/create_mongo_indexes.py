@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Build the MongoDB indexes as a one-off step, e.g. before a deploy.
+
+Usage:
+    python scripts/create_mongo_indexes.py
+
+API workers otherwise build them in the background after startup; run this
+as a release step and set MONGO_INDEXES_ON_STARTUP=false to skip that.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from services.database.mongodb import MongoDBManager
+
+
+async def main() -> int:
+    await MongoDBManager.initialize(create_indexes=False)
+    try:
+        await MongoDBManager.create_indexes()
+        return 0 if MongoDBManager._indexes_created else 1
+    finally:
+        await MongoDBManager.close_connection()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
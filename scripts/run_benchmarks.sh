@@ -0,0 +1,62 @@
+#!/bin/bash
+set -e
+
+# Hot-path benchmarks for Social Suit (benchmarks/) and Sparkr (sparkr-backend/benchmarks/, currently excluded below).
+# Both run against local stand-ins (fakeredis, in-memory SQLite); install benchmarks/requirements.txt first.
+#
+# Results are stored next to each suite in benchmarks/.results. They are machine-specific and not committed:
+# save a baseline from the base branch, then compare the change on the same machine (see docs/ci_cd_workflows.md).
+
+THRESHOLD="15%"
+MODE=""
+
+print_usage() {
+  echo "Usage: $0 [save|compare] [--threshold PERCENT]"
+  echo "  save                 Run the benchmarks and store the results as the new baseline"
+  echo "  compare              Run the benchmarks and fail if any mean is slower than the latest baseline"
+  echo "  --threshold PERCENT  Allowed slowdown of the mean before compare fails (default: 15%)"
+  exit 1
+}
+
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    save|compare)
+      MODE="$1"
+      shift
+      ;;
+    --threshold)
+      THRESHOLD="$2"
+      shift 2
+      ;;
+    *)
+      print_usage
+      ;;
+  esac
+done
+
+if [[ -z "$MODE" ]]; then
+  print_usage
+fi
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+
+run_suite() {
+  local dir="$1"
+  local args=(benchmarks -o addopts="" --benchmark-only --benchmark-storage="file://$dir/benchmarks/.results")
+
+  if [[ "$MODE" == "save" ]]; then
+    args+=(--benchmark-save=baseline)
+  else
+    args+=(--benchmark-compare --benchmark-compare-fail="mean:$THRESHOLD" --benchmark-sort=name)
+  fi
+
+  echo "Running benchmarks in $dir ($MODE)"
+  (cd "$dir" && python -m pytest "${args[@]}")
+}
+
+run_suite "$ROOT_DIR"
+
+# Excluded: sparkr-backend's app package imports the shared library, which does not import yet
+# (shared/database/repository.py needs PageParams and paginate from shared.database.pagination),
+# so sparkr-backend/benchmarks fails at collection. Re-enable once the shared package imports.
+echo "Skipping benchmarks in $ROOT_DIR/sparkr-backend: the shared package it depends on does not import"
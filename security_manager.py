@@ -45,8 +45,11 @@ class SecurityManager:
         self.logger.info("Starting comprehensive security audit...")
         
         try:
-            # Run security audit
-            report = run_security_audit(str(self.project_root))
+            # Run security audit, re-checking only files changed since the last one
+            report = run_security_audit(
+                str(self.project_root),
+                manifest_path=str(self.project_root / ".security_audit_manifest.json")
+            )
             
             # Save report to file
             report_file = self.project_root / f"security_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -115,24 +115,8 @@ async def run_ab_test(
             upsert=True
         )
         
-        # Initialize metrics for each variation
-        for variation in ["A", "B"]:
-            initial_metrics = {
-                "test_id": test_id,
-                "variation": variation,
-                "timestamp": start_time,
-                "impressions": 0,
-                "engagements": 0,
-                "clicks": 0,
-                "conversions": 0
-            }
-            
-            await MongoDBManager.update_with_options(
-                "ab_test_metrics",
-                {"test_id": test_id, "variation": variation, "timestamp": start_time},
-                {"$set": initial_metrics},
-                upsert=True
-            )
+        # Initialize the counters every metrics update increments
+        await ABTestCacheService.init_test_counters(test_id, ["A", "B"])
         
         # Invalidate user tests cache
         if user_id:
@@ -215,6 +199,8 @@ async def get_test_details(test_id: str) -> Dict[str, Any]:
         # Add winner if available
         if test_results.get("winner"):
             response["winner"] = test_results.get("winner")
+        if test_results.get("significance"):
+            response["significance"] = test_results["significance"]
             
         return response
         
@@ -266,6 +252,9 @@ async def complete_test(test_id: str) -> Dict[str, Any]:
     """
     Mark a test as completed and determine the winner
     
+    A winner is only recorded when the sequential test says its lead is
+    significant; otherwise the test completes as inconclusive.
+    
     Args:
         test_id: The ID of the test to complete
         
@@ -279,21 +268,14 @@ async def complete_test(test_id: str) -> Dict[str, Any]:
         if "error" in test_details:
             return test_details
             
-        # Get current results
+        # Only a significant lead is declared the winner; otherwise the test
+        # ends inconclusive rather than crowning a variation by noise
         test_results = await ABTestCacheService.get_test_results(test_id)
+        if "error" in test_results:
+            return test_results
         
-        # Determine winner based on target metric
-        target_metric = test_details.get("target_metric", "engagement_rate")
-        variations = test_results.get("variations", {})
-        
-        winner = None
-        best_score = 0
-        
-        for var_id, metrics in variations.items():
-            score = metrics.get(target_metric, 0)
-            if score > best_score:
-                best_score = score
-                winner = var_id
+        significance = test_results.get("significance", {})
+        winner = significance.get("leader") if significance.get("significant") else None
         
         # Update test status
         end_time = datetime.now()
@@ -305,6 +287,8 @@ async def complete_test(test_id: str) -> Dict[str, Any]:
                 "status": "completed",
                 "end_time": end_time.isoformat(),
                 "winner": winner,
+                "outcome": "winner" if winner else "inconclusive",
+                "final_p_value": significance.get("p_value"),
                 "metadata.updated_at": end_time.isoformat()
             }},
             upsert=False
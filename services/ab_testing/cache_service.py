@@ -2,14 +2,21 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import logging
 import json
+import re
+
+from pymongo.errors import DuplicateKeyError
 
 from services.database.redis import RedisManager, redis_cache
 from services.database.mongodb import MongoDBManager, mongo_performance_monitor
+from services.ab_testing.sequential import evaluate_test
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Variation ids become field names in the summary document
+VARIATION_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,32}$")
+
 class ABTestCacheService:
     """
     Service for caching A/B test data in Redis to improve performance
@@ -18,9 +25,10 @@ class ABTestCacheService:
     
     # Cache TTL constants
     TEST_DETAILS_CACHE_TTL = 1800  # 30 minutes for test details
-    TEST_RESULTS_CACHE_TTL = 900   # 15 minutes for test results (updated more frequently)
     USER_TESTS_CACHE_TTL = 3600    # 1 hour for user's test list
     ACTIVE_TESTS_CACHE_TTL = 300   # 5 minutes for active tests (checked frequently)
+
+    COUNTER_FIELDS = ("impressions", "engagements", "clicks", "conversions")
     
     @staticmethod
     @redis_cache(ttl_seconds=TEST_DETAILS_CACHE_TTL, key_prefix="abtest:details")
@@ -47,45 +55,74 @@ class ABTestCacheService:
             return {"error": str(e)}
     
     @staticmethod
-    @redis_cache(ttl_seconds=TEST_RESULTS_CACHE_TTL, key_prefix="abtest:results")
+    async def get_variation_counters(test_id: str) -> Dict[str, Dict[str, int]]:
+        """
+        Get the per-variation counters of a test.
+
+        Reads the single ``ab_test_summaries`` document kept current by
+        ``update_test_metrics``; tests created before summaries existed fall
+        back to aggregating their ``ab_test_metrics`` documents.
+        """
+        summaries = await MongoDBManager.find_with_options(
+            "ab_test_summaries",
+            {"test_id": test_id},
+            limit=1
+        )
+        if summaries:
+            return {
+                var_id: {field: int(counts.get(field, 0) or 0) for field in ABTestCacheService.COUNTER_FIELDS}
+                for var_id, counts in (summaries[0].get("variations") or {}).items()
+            }
+        return await ABTestCacheService._aggregate_metric_history(test_id)
+
+    @staticmethod
+    async def _aggregate_metric_history(test_id: str) -> Dict[str, Dict[str, int]]:
+        """Per-variation totals of a test's ``ab_test_metrics`` documents."""
+        pipeline = [
+            {"$match": {"test_id": test_id}},
+            {"$group": {
+                "_id": "$variation",
+                **{field: {"$sum": f"${field}"} for field in ABTestCacheService.COUNTER_FIELDS}
+            }}
+        ]
+        results = await MongoDBManager.aggregate("ab_test_metrics", pipeline)
+        return {
+            row["_id"]: {field: int(row.get(field, 0) or 0) for field in ABTestCacheService.COUNTER_FIELDS}
+            for row in results
+        }
+
+    @staticmethod
     async def get_test_results(test_id: str) -> Dict[str, Any]:
         """
-        Get A/B test results with Redis caching.
+        Get A/B test results with sequential significance.
+
+        Not cached: the counters are a single document read, so results stay
+        current after every metrics update at constant cost.
         """
         try:
             # Get test details first
             test_details = await ABTestCacheService.get_test_details(test_id)
             if "error" in test_details:
                 return test_details
-                
-            # Get performance metrics for each variation
-            pipeline = [
-                {"$match": {"test_id": test_id}},
-                {"$group": {
-                    "_id": "$variation",
-                    "impressions": {"$sum": "$impressions"},
-                    "engagements": {"$sum": "$engagements"},
-                    "clicks": {"$sum": "$clicks"},
-                    "conversions": {"$sum": "$conversions"}
-                }}
-            ]
-            
-            results = await MongoDBManager.aggregate("ab_test_metrics", pipeline)
-            
+
+            counters = await ABTestCacheService.get_variation_counters(test_id)
+            target_metric = test_details.get("target_metric", "engagement_rate")
+            evaluation = evaluate_test(counters, target_metric)
+
             # Calculate performance metrics
             variations_data = {}
-            for variation in results:
-                var_id = variation["_id"]
-                impressions = variation.get("impressions", 0)
-                engagements = variation.get("engagements", 0)
-                clicks = variation.get("clicks", 0)
-                conversions = variation.get("conversions", 0)
-                
+            for var_id, counts in counters.items():
+                impressions = counts["impressions"]
+                engagements = counts["engagements"]
+                clicks = counts["clicks"]
+                conversions = counts["conversions"]
+
                 # Calculate rates
                 engagement_rate = (engagements / impressions * 100) if impressions > 0 else 0
                 click_rate = (clicks / impressions * 100) if impressions > 0 else 0
                 conversion_rate = (conversions / impressions * 100) if impressions > 0 else 0
-                
+                low, high = evaluation["variations"][var_id]["rate_interval"]
+
                 variations_data[var_id] = {
                     "impressions": impressions,
                     "engagements": engagements,
@@ -93,35 +130,37 @@ class ABTestCacheService:
                     "conversions": conversions,
                     "engagement_rate": round(engagement_rate, 2),
                     "click_rate": round(click_rate, 2),
-                    "conversion_rate": round(conversion_rate, 2)
+                    "conversion_rate": round(conversion_rate, 2),
+                    "target_rate_interval": [round(low * 100, 2), round(high * 100, 2)]
                 }
-            
-            # Determine winner if test is complete
-            winner = None
+
+            # A completed test keeps the winner recorded when it was completed;
+            # a running test reports a winner as soon as the lead is significant
             if test_details.get("status") == "completed":
-                target_metric = test_details.get("target_metric", "engagement_rate")
-                best_score = 0
-                
-                for var_id, metrics in variations_data.items():
-                    score = metrics.get(target_metric, 0)
-                    if score > best_score:
-                        best_score = score
-                        winner = var_id
-            
+                winner = test_details.get("winner")
+            else:
+                winner = evaluation["winner"]
+
             return {
                 "test_id": test_id,
                 "status": test_details.get("status"),
                 "start_time": test_details.get("start_time"),
                 "end_time": test_details.get("end_time"),
-                "target_metric": test_details.get("target_metric"),
+                "target_metric": target_metric,
                 "variations": variations_data,
-                "winner": winner
+                "winner": winner,
+                "significance": {
+                    "leader": evaluation["leader"],
+                    "p_value": round(evaluation["p_value"], 4),
+                    "significant": evaluation["significant"],
+                    "can_stop": evaluation["significant"]
+                }
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting A/B test results: {e}")
             return {"error": str(e)}
-    
+
     @staticmethod
     @redis_cache(ttl_seconds=USER_TESTS_CACHE_TTL, key_prefix="abtest:user")
     async def get_user_tests(user_id: str, status: str = None, limit: int = 10) -> List[Dict[str, Any]]:
@@ -171,30 +210,74 @@ class ABTestCacheService:
     @staticmethod
     async def update_test_metrics(test_id: str, variation: str, metrics: Dict[str, int]) -> bool:
         """
-        Update A/B test metrics and invalidate related caches.
+        Add a batch of metric deltas to a variation's counters.
+
+        A single atomic ``$inc`` on the test's summary document, so concurrent
+        updates never lose counts and reads never have to re-aggregate. A test
+        without a summary yet gets one seeded from its ``ab_test_metrics``
+        history first, so earlier counts are carried over.
         """
         try:
-            # Update metrics in database
-            metrics["timestamp"] = datetime.now()
-            metrics["test_id"] = test_id
-            metrics["variation"] = variation
-            
-            await MongoDBManager.update_with_options(
-                "ab_test_metrics",
-                {"test_id": test_id, "variation": variation, "timestamp": metrics["timestamp"]},
-                {"$set": metrics},
-                upsert=True
-            )
-            
-            # Invalidate caches
-            await RedisManager.cache_delete(f"abtest:results:{test_id}")
-            
+            if not VARIATION_PATTERN.match(variation):
+                logger.warning(f"Rejected metrics update for invalid variation {variation!r}")
+                return False
+
+            increments = {
+                f"variations.{variation}.{field}": int(metrics.get(field, 0) or 0)
+                for field in ABTestCacheService.COUNTER_FIELDS
+            }
+            if any(value < 0 for value in increments.values()):
+                logger.warning(f"Rejected negative metrics update for test {test_id}")
+                return False
+
+            update = {"$inc": increments, "$set": {"updated_at": datetime.now()}}
+            result = await MongoDBManager.update_with_options("ab_test_summaries", {"test_id": test_id}, update)
+            if not result["matched_count"]:
+                await ABTestCacheService._seed_summary(test_id)
+                await MongoDBManager.update_with_options("ab_test_summaries", {"test_id": test_id}, update)
+
             return True
-            
+
         except Exception as e:
             logger.error(f"Error updating A/B test metrics: {e}")
             return False
-    
+
+    @staticmethod
+    async def _seed_summary(test_id: str) -> None:
+        """Create a missing summary document from the test's metric history."""
+        history = {
+            var_id: counts
+            for var_id, counts in (await ABTestCacheService._aggregate_metric_history(test_id)).items()
+            if isinstance(var_id, str) and VARIATION_PATTERN.match(var_id)
+        }
+        try:
+            await MongoDBManager.update_with_options(
+                "ab_test_summaries",
+                {"test_id": test_id},
+                {"$setOnInsert": {"test_id": test_id, "variations": history, "updated_at": datetime.now()}},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # A concurrent update seeded it first
+            pass
+
+    @staticmethod
+    async def init_test_counters(test_id: str, variations: List[str]) -> None:
+        """Create the summary document of a new test with zeroed counters."""
+        await MongoDBManager.update_with_options(
+            "ab_test_summaries",
+            {"test_id": test_id},
+            {"$setOnInsert": {
+                "test_id": test_id,
+                "variations": {
+                    var_id: {field: 0 for field in ABTestCacheService.COUNTER_FIELDS}
+                    for var_id in variations
+                },
+                "updated_at": datetime.now()
+            }},
+            upsert=True
+        )
+
     @staticmethod
     async def invalidate_test_cache(test_id: str) -> int:
         """
@@ -0,0 +1,135 @@
+"""
+Streaming sequential testing for A/B test rates.
+
+Everything here works from per-variation counters (successes, trials), which
+are sufficient statistics for a rate, so evaluating a test is O(1) in the
+number of events no matter how long it has run.
+
+Significance uses a normal-mixture sequential probability ratio test
+(mSPRT). Its p-values and confidence intervals stay valid when results are
+checked after every event, so a winner can be declared as soon as the
+evidence is there, without the false positives that come from repeatedly
+peeking at a fixed-horizon z-test.
+"""
+
+import math
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_ALPHA = 0.05
+# Prior variance of the true difference in rates; 0.01 means differences of
+# about +/-10 percentage points are plausible
+DEFAULT_MIXTURE_VARIANCE = 0.01
+MIN_TRIALS = 30
+
+# Target metric -> counter holding its successes (trials are impressions)
+METRIC_COUNTERS = {
+    "engagement_rate": "engagements",
+    "clicks": "clicks",
+    "conversions": "conversions",
+}
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a single rate."""
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def _difference_variance(s_a: int, n_a: int, s_b: int, n_b: int) -> Optional[float]:
+    if n_a <= 0 or n_b <= 0:
+        return None
+    p_a, p_b = s_a / n_a, s_b / n_b
+    variance = p_a * (1 - p_a) / n_a + p_b * (1 - p_b) / n_b
+    if variance <= 0:
+        # Both rates at 0 or 1; fall back to the pooled rate so the test stays defined
+        pooled = (s_a + s_b) / (n_a + n_b)
+        variance = max(pooled * (1 - pooled), 0.25 / (n_a + n_b)) * (1 / n_a + 1 / n_b)
+    return variance
+
+
+def compare_rates(s_a: int, n_a: int, s_b: int, n_b: int, alpha: float = DEFAULT_ALPHA,
+                  mixture_variance: float = DEFAULT_MIXTURE_VARIANCE) -> Dict[str, Any]:
+    """
+    Always-valid comparison of rate B against rate A.
+
+    Returns:
+        ``difference`` (B - A), an always-valid ``p_value``, the
+        ``confidence_interval`` for the difference at level 1 - alpha, and
+        ``significant`` once the p-value drops below alpha
+    """
+    variance = _difference_variance(s_a, n_a, s_b, n_b)
+    if variance is None or min(n_a, n_b) < MIN_TRIALS:
+        return {"difference": None, "p_value": 1.0, "confidence_interval": None, "significant": False}
+
+    difference = s_b / n_b - s_a / n_a
+    tau2 = mixture_variance
+    total = variance + tau2
+
+    # Mixture likelihood ratio of H1 (difference ~ N(0, tau2)) against H0 (difference = 0)
+    log_ratio = 0.5 * math.log(variance / total) + tau2 * difference * difference / (2 * variance * total)
+    p_value = 1.0 if log_ratio <= 0 else min(1.0, math.exp(-log_ratio))
+
+    radius = math.sqrt(variance * total / tau2 * (math.log(total / variance) - 2 * math.log(alpha)))
+    return {
+        "difference": difference,
+        "p_value": p_value,
+        "confidence_interval": (difference - radius, difference + radius),
+        "significant": p_value < alpha,
+    }
+
+
+def evaluate_test(variations: Dict[str, Dict[str, int]], target_metric: str,
+                  alpha: float = DEFAULT_ALPHA) -> Dict[str, Any]:
+    """
+    Pick the leading variation and decide whether its lead is significant.
+
+    The leader must beat every other variation; alpha is split across those
+    comparisons (Bonferroni) so tests with more than two arms stay correct.
+
+    Returns:
+        ``leader``, ``winner`` (the leader, only when significant),
+        ``p_value`` (the largest over the leader's comparisons) and
+        per-variation ``rate`` / ``rate_interval``
+    """
+    counter = METRIC_COUNTERS.get(target_metric, "engagements")
+    stats = {}
+    for var_id, counts in variations.items():
+        trials = int(counts.get("impressions", 0) or 0)
+        successes = min(int(counts.get(counter, 0) or 0), trials)
+        low, high = wilson_interval(successes, trials)
+        stats[var_id] = {
+            "successes": successes,
+            "trials": trials,
+            "rate": successes / trials if trials else 0.0,
+            "rate_interval": (low, high),
+        }
+
+    if len(stats) < 2:
+        return {"leader": None, "winner": None, "p_value": 1.0, "significant": False, "variations": stats}
+
+    leader = max(sorted(stats), key=lambda var_id: stats[var_id]["rate"])
+    comparisons = {}
+    per_comparison_alpha = alpha / (len(stats) - 1)
+    for var_id, other in stats.items():
+        if var_id == leader:
+            continue
+        comparisons[var_id] = compare_rates(
+            other["successes"], other["trials"],
+            stats[leader]["successes"], stats[leader]["trials"],
+            alpha=per_comparison_alpha
+        )
+
+    significant = all(c["significant"] and c["difference"] > 0 for c in comparisons.values())
+    return {
+        "leader": leader,
+        "winner": leader if significant else None,
+        "p_value": max(c["p_value"] for c in comparisons.values()),
+        "significant": significant,
+        "comparisons": comparisons,
+        "variations": stats,
+    }
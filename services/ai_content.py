@@ -1,13 +1,28 @@
 import os
 import re
+import asyncio
+import logging
+import threading
+import httpx
 import requests
 from dotenv import load_dotenv
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 from datetime import datetime
 
+from services.llm_gateway import get_llm_gateway
+
 # Load environment variables
 load_dotenv()
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+CAPTION_MODEL = "deepseek/deepseek-chat:free"
+CAPTION_HISTORY_FILE = "caption_history.log"
+
+logger = logging.getLogger(__name__)
+
+# Serializes history appends coming from worker threads
+_history_lock = threading.Lock()
+# Keeps pending background history writes alive until they finish
+_history_tasks = set()
 
 class OpenRouterAI:
     """Class for interacting with OpenRouter API to generate content using DeepSeek models with robust fallback logic"""
@@ -50,7 +65,7 @@ class OpenRouterAI:
     def generate_content(self, prompt: str) -> Dict[str, Union[str, Dict]]:
         """Generate general content using OpenRouter API with fallback logic"""
         data = {
-            "model": "deepseek/deepseek-chat:free",
+            "model": CAPTION_MODEL,
             "messages": [
                 {"role": "system", "content": "You are a helpful AI assistant."},
                 {"role": "user", "content": prompt}
@@ -106,7 +121,7 @@ class OpenRouterAI:
         prompt = f"Generate an engaging social media post about {topic} with 4-5 relevant hashtags for {platform} in a {tone} tone."
         
         data = {
-            "model": "deepseek/deepseek-chat:free",
+            "model": CAPTION_MODEL,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.8
         }
@@ -137,11 +152,67 @@ class OpenRouterAI:
             self.save_to_history(topic, fallback_caption, True)  # Mark as fallback
             return fallback_caption
 
+    async def generate_content_async(self, prompt: str) -> Dict[str, Union[str, Dict]]:
+        """Async variant of generate_content that goes through the shared LLM gateway"""
+        try:
+            result = await get_llm_gateway().chat(
+                [
+                    {"role": "system", "content": "You are a helpful AI assistant."},
+                    {"role": "user", "content": prompt}
+                ],
+                model=CAPTION_MODEL,
+                temperature=0.7,
+                title="Social Suit Content Generation"
+            )
+            return {
+                "generated": result["choices"][0]["message"]["content"],
+                "raw_response": result
+            }
+        except httpx.TimeoutException:
+            return {"error": "API request timed out", "fallback": True}
+        except Exception as e:
+            return {"error": str(e), "fallback": True}
+
+    async def generate_caption_async(self, topic: str, platform: str = "instagram", tone: str = "professional",
+                                     hashtags: Optional[int] = None) -> str:
+        """Async variant of generate_caption that goes through the shared LLM gateway"""
+        hashtag_hint = f"{hashtags} relevant hashtags" if hashtags is not None else "4-5 relevant hashtags"
+        prompt = f"Generate an engaging social media post about {topic} with {hashtag_hint} for {platform} in a {tone} tone."
+
+        try:
+            response_data = await get_llm_gateway().chat(
+                [{"role": "user", "content": prompt}],
+                model=CAPTION_MODEL,
+                temperature=0.8,
+                title="Social Suit Caption Generation"
+            )
+            if "choices" in response_data and response_data["choices"]:
+                raw_caption = response_data["choices"][0]["message"]["content"].strip()
+                cleaned = self.clean_caption(raw_caption)
+                self.save_to_history_async(topic, cleaned, False)  # Not a fallback
+                return cleaned
+        except Exception as e:
+            logger.warning(f"Caption generation failed, using fallback: {str(e)}")
+
+        fallback_caption = self.get_fallback_caption(topic, platform, tone)
+        self.save_to_history_async(topic, fallback_caption, True)  # Mark as fallback
+        return fallback_caption
+
     def save_to_history(self, topic: str, caption: str, is_fallback: bool = False):
         """Save generated caption to history log file"""
         fallback_marker = "[FALLBACK] " if is_fallback else ""
-        with open("caption_history.log", "a", encoding="utf-8") as f:
-            f.write(f"{datetime.now().isoformat()} | {fallback_marker}{topic} | {caption}\n")
+        line = f"{datetime.now().isoformat()} | {fallback_marker}{topic} | {caption}\n"
+        with _history_lock:
+            with open(CAPTION_HISTORY_FILE, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def save_to_history_async(self, topic: str, caption: str, is_fallback: bool = False):
+        """Append to the history log from a worker thread without blocking the event loop"""
+        task = asyncio.get_running_loop().create_task(
+            asyncio.to_thread(self.save_to_history, topic, caption, is_fallback)
+        )
+        _history_tasks.add(task)
+        task.add_done_callback(_history_tasks.discard)
 
 # Example usage
 if __name__ == "__main__":
@@ -1,9 +1,26 @@
 # Analytics package initialization
+#
+# The main classes are imported on first access rather than with the package, so
+# importing one submodule (e.g. services.analytics.cache_service) does not pull in
+# the collector, analyzer, chart generator and platform services along with it.
+import importlib
 
-# Import main classes for easier access
-from services.analytics.data_collector import AnalyticsCollector
-from services.analytics.data_analyzer import AnalyticsAnalyzer
-from services.analytics.chart_generator import ChartGenerator
+_EXPORTS = {
+    "AnalyticsCollector": "services.analytics.data_collector",
+    "AnalyticsAnalyzer": "services.analytics.data_analyzer",
+    "ChartGenerator": "services.analytics.chart_generator",
+    "collect_all_platform_data": "services.analytics.services",
+    "AnalyticsCollectorService": "services.analytics.services",
+    "AnalyticsAnalyzerService": "services.analytics.services",
+    "ChartGeneratorService": "services.analytics.services",
+}
 
-# Import services subpackage
-from services.analytics.services import collect_all_platform_data, AnalyticsCollectorService, AnalyticsAnalyzerService, ChartGeneratorService
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
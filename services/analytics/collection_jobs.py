@@ -0,0 +1,174 @@
+import asyncio
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+
+from services.database.redis import RedisManager
+from services.analytics.services.data_collector_service import PLATFORMS, create_collector_service
+from services.utils.logger_config import setup_logger
+
+# Set up logger
+logger = setup_logger("analytics_collection_jobs")
+
+# celery: run on the worker fleet; local: in-process stand-in for development and tests
+ANALYTICS_JOB_BACKEND = os.getenv("ANALYTICS_JOB_BACKEND", "celery")
+ANALYTICS_COLLECTION_CONCURRENCY = int(os.getenv("ANALYTICS_COLLECTION_CONCURRENCY", "3"))
+
+JOB_KEY = "analytics:collect:job:{job_id}"
+ACTIVE_KEY = "analytics:collect:active:{user_id}"
+JOB_TTL = 24 * 3600          # Job documents stay queryable for a day
+ACTIVE_LOCK_TTL = 3600       # A crashed job stops blocking new triggers after an hour
+
+TERMINAL_STATUSES = {"completed", "failed"}
+
+# Keeps local stand-in tasks referenced until they finish
+_local_tasks: Set[asyncio.Task] = set()
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _new_job(user_id: str, days_back: int, requester_id: Optional[str]) -> Dict[str, Any]:
+    return {
+        "job_id": uuid.uuid4().hex,
+        "user_id": user_id,
+        "days_back": days_back,
+        "requester_id": requester_id,
+        "status": "queued",
+        "platforms": {platform: {"status": "pending"} for platform in PLATFORMS},
+        "progress": {"completed": 0, "total": len(PLATFORMS)},
+        "created_at": _now(),
+        "updated_at": _now(),
+        "attempts": 0
+    }
+
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Return the stored state of a collection job, or None if unknown or expired"""
+    job = await RedisManager.cache_get(JOB_KEY.format(job_id=job_id))
+    return job if isinstance(job, dict) else None
+
+
+async def _save_job(job: Dict[str, Any]) -> None:
+    job["updated_at"] = _now()
+    job["progress"]["completed"] = sum(
+        1 for state in job["platforms"].values() if state["status"] in TERMINAL_STATUSES
+    )
+    # cache_set logs and returns False instead of raising; a job that was never stored cannot run
+    if not await RedisManager.cache_set(JOB_KEY.format(job_id=job["job_id"]), job, ttl_seconds=JOB_TTL):
+        raise RuntimeError(f"Could not store analytics collection job {job['job_id']}")
+
+
+async def _release_active(job: Dict[str, Any]) -> None:
+    key = ACTIVE_KEY.format(user_id=job["user_id"])
+    if await RedisManager.cache_get(key) == job["job_id"]:
+        await RedisManager.cache_delete(key)
+
+
+async def enqueue_collection(user_id: str, days_back: int = 7, requester_id: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Start an analytics collection for a user, or join the one already running.
+
+    At most one job per user is active; a second trigger gets the existing job
+    back instead of starting a duplicate collection.
+
+    Returns:
+        (job, created) where ``created`` is False when an active job was joined
+    """
+    active_key = ACTIVE_KEY.format(user_id=user_id)
+
+    for _ in range(2):
+        job = _new_job(user_id, days_back, requester_id)
+        if await RedisManager.cache_set_if_absent(active_key, job["job_id"], ttl_seconds=ACTIVE_LOCK_TTL):
+            try:
+                await _save_job(job)
+                _dispatch(job["job_id"])
+            except Exception:
+                # Nothing will run this job, so it must not hold the user's slot for ACTIVE_LOCK_TTL
+                await RedisManager.cache_delete(active_key)
+                raise
+            logger.info(f"Queued analytics collection job {job['job_id']} for user {user_id}")
+            return job, True
+
+        active_id = await RedisManager.cache_get(active_key)
+        existing = await get_job(active_id) if active_id else None
+        if existing and existing["status"] not in TERMINAL_STATUSES:
+            return existing, False
+
+        # The lock points at a finished or expired job; clear it and try again
+        if active_id:
+            await RedisManager.cache_delete(active_key)
+
+    raise RuntimeError(f"Could not acquire analytics collection slot for user {user_id}")
+
+
+def _dispatch(job_id: str) -> None:
+    if ANALYTICS_JOB_BACKEND == "local":
+        task = asyncio.get_running_loop().create_task(run_collection_job(job_id))
+        _local_tasks.add(task)
+        task.add_done_callback(_local_tasks.discard)
+        return
+
+    from services.analytics.tasks import collect_analytics_job
+    collect_analytics_job.delay(job_id)
+
+
+async def run_collection_job(job_id: str, collector_service=None) -> Optional[Dict[str, Any]]:
+    """
+    Run (or resume) a collection job.
+
+    Platforms are collected concurrently, at most ANALYTICS_COLLECTION_CONCURRENCY
+    at a time. Each finished platform is checkpointed into the job document, so
+    a redelivered job only collects the platforms that had not finished.
+    """
+    job = await get_job(job_id)
+    if job is None:
+        logger.warning(f"Analytics collection job {job_id} not found; skipping")
+        return None
+    if job["status"] in TERMINAL_STATUSES:
+        return job
+
+    job["status"] = "running"
+    job["attempts"] += 1
+    job.setdefault("started_at", _now())
+    await _save_job(job)
+
+    db = None
+    if collector_service is None:
+        from services.database.database import get_db_session
+
+        db = get_db_session()
+        collector_service = create_collector_service(db)
+
+    semaphore = asyncio.Semaphore(ANALYTICS_COLLECTION_CONCURRENCY)
+    checkpoint_lock = asyncio.Lock()
+
+    async def collect(platform: str) -> None:
+        async with semaphore:
+            try:
+                result = await collector_service.collect_platform_data(job["user_id"], platform, job["days_back"])
+            except Exception as e:
+                result = {"error": str(e), "platform": platform}
+        async with checkpoint_lock:
+            job["platforms"][platform] = {
+                "status": "failed" if "error" in result else "completed",
+                "result": result,
+                "finished_at": _now()
+            }
+            await _save_job(job)
+
+    pending = [p for p, state in job["platforms"].items() if state["status"] not in TERMINAL_STATUSES]
+    try:
+        await asyncio.gather(*(collect(platform) for platform in pending))
+        statuses = [state["status"] for state in job["platforms"].values()]
+        job["status"] = "failed" if statuses and all(s == "failed" for s in statuses) else "completed"
+        job["finished_at"] = _now()
+        await _save_job(job)
+        await _release_active(job)
+        logger.info(f"Analytics collection job {job_id} {job['status']} for user {job['user_id']}")
+        return job
+    finally:
+        if db:
+            db.close()
@@ -13,6 +13,7 @@ from services.utils.logger_config import setup_logger
 from services.interfaces.base_services import BaseService
 from services.database.query_optimizer import query_performance_tracker
 from services.database.redis import RedisManager
+from services.scheduler.posting_time_model import DAY_NAMES, EngagementHistogram
 import asyncio
 
 class AnalyticsAnalyzer:
@@ -838,29 +839,46 @@ class AnalyticsAnalyzer:
     
     def _analyze_best_posting_times(self, user_id: str, platform: str, start_date: datetime) -> Dict[str, Any]:
         """Analyze best times to post based on engagement"""
-        # This would analyze content performance by time of day and day of week
-        # For now, return sample data
+        # Bucket the period's posts into an hour-of-week engagement histogram
+        rows = self.db.query(
+            ContentPerformance.post_date,
+            ContentPerformance.engagement_rate
+        ).filter(
+            ContentPerformance.user_id == user_id,
+            ContentPerformance.platform == platform,
+            ContentPerformance.post_date >= start_date
+        ).all()
+        
+        histogram = EngagementHistogram()
+        for post_date, engagement_rate in rows:
+            histogram.add(post_date, engagement_rate or 0.0)
+        
+        if histogram.total_posts == 0:
+            return {"days": {}, "hours": {}, "best_times": [], "sample_size": 0}
+        
+        scores = histogram.scores()
+        top = max(scores) or 1.0
+        
+        # Mean score per part of the day, across all weekdays
+        hour_ranges = {"morning": range(6, 12), "afternoon": range(12, 18), "evening": range(18, 24), "night": range(0, 6)}
+        parts = {
+            name: sum(scores[day * 24 + hour] for day in range(7) for hour in hours) / (7 * len(hours))
+            for name, hours in hour_ranges.items()
+        }
+        best_part = max(parts.values()) or 1.0
+        
         return {
-            "days": {
-                "monday": 0.8,
-                "tuesday": 0.7,
-                "wednesday": 0.9,
-                "thursday": 0.85,
-                "friday": 0.75,
-                "saturday": 0.6,
-                "sunday": 0.5
-            },
-            "hours": {
-                "morning": 0.8,  # 6am-12pm
-                "afternoon": 0.9,  # 12pm-6pm
-                "evening": 0.7,  # 6pm-12am
-                "night": 0.4  # 12am-6am
-            },
+            "days": histogram.day_scores(),
+            "hours": {name: round(value / best_part, 2) for name, value in parts.items()},
             "best_times": [
-                {"day": "wednesday", "time": "2pm", "score": 0.95},
-                {"day": "thursday", "time": "11am", "score": 0.9},
-                {"day": "monday", "time": "3pm", "score": 0.85}
-            ]
+                {
+                    "day": DAY_NAMES[slot // 24].lower(),
+                    "time": f"{(slot % 24) % 12 or 12}{'am' if slot % 24 < 12 else 'pm'}",
+                    "score": round(score / top, 2)
+                }
+                for slot, score in histogram.best_slots(3)
+            ],
+            "sample_size": histogram.total_posts
         }
     
     def _analyze_content_type_performance(self, user_id: str, platform: str, start_date: datetime) -> Dict[str, Any]:
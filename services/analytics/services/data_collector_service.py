@@ -15,6 +15,7 @@ from services.repositories.analytics_repository import (
 from services.models.analytics_model import PostEngagement, UserMetrics, ContentPerformance, EngagementType
 from services.utils.logger_config import setup_logger
 from services.utils.monitoring import track_analytics_collection
+from services.scheduler.posting_time_model import record_post_engagement
 
 # Set up logger
 logger = setup_logger("analytics_collector_service")
@@ -112,6 +113,7 @@ class AnalyticsCollectorService(BaseService):
                     metrics=content["metrics"]
                 )
                 self.content_performance_repository.create(content_performance)
+                await self._update_posting_time_model(user_id, platform, content)
                 
             logger.info(f"Stored analytics data for user {user_id} on {platform}")
             
@@ -119,36 +121,47 @@ class AnalyticsCollectorService(BaseService):
             logger.error(f"Error processing analytics data: {str(e)}")
             raise
 
+    async def _update_posting_time_model(self, user_id: str, platform: str, content: Dict[str, Any]) -> None:
+        """Feed a collected post into the user's posting-time model"""
+        try:
+            posted_at = content["timestamp"]
+            if isinstance(posted_at, str):
+                posted_at = datetime.fromisoformat(posted_at.replace("Z", "+00:00"))
+            await record_post_engagement(
+                user_id, platform, str(content["content_id"]), posted_at, content.get("engagement_score", 0)
+            )
+        except Exception as e:
+            # The model is derived data; never fail a collection over it
+            logger.warning(f"Could not update posting time model for {user_id} on {platform}: {str(e)}")
+
+# Platforms collected by a full analytics run
+PLATFORMS = ["facebook", "instagram", "twitter", "linkedin", "youtube", "tiktok"]
+
+
+def create_collector_service(db: Session) -> AnalyticsCollectorService:
+    """Build a collector service bound to the given DB session"""
+    return AnalyticsCollectorService(
+        db=db,
+        user_repository=UserRepository(db),
+        post_engagement_repository=PostEngagementRepository(db),
+        user_metrics_repository=UserMetricsRepository(db),
+        content_performance_repository=ContentPerformanceRepository(db)
+    )
+
+
 # Async function to collect data from all platforms for a user
 async def collect_all_platform_data(user_id: str, days_back: int = 7, collector_service: Optional[AnalyticsCollectorService] = None) -> Dict[str, Any]:
     """Collect data from all platforms for a user"""
     from services.database.database import get_db_session
-    from services.repositories.user_repository import UserRepository
-    from services.repositories.analytics_repository import (
-        PostEngagementRepository, 
-        UserMetricsRepository, 
-        ContentPerformanceRepository
-    )
     
     # Create service if not provided
+    db = None
     if not collector_service:
         db = get_db_session()
         try:
-            user_repo = UserRepository(db)
-            post_engagement_repo = PostEngagementRepository(db)
-            user_metrics_repo = UserMetricsRepository(db)
-            content_performance_repo = ContentPerformanceRepository(db)
-            
-            collector_service = AnalyticsCollectorService(
-                db=db,
-                user_repository=user_repo,
-                post_engagement_repository=post_engagement_repo,
-                user_metrics_repository=user_metrics_repo,
-                content_performance_repository=content_performance_repo
-            )
+            collector_service = create_collector_service(db)
         except Exception as e:
-            if db:
-                db.close()
+            db.close()
             logger.error(f"Error creating collector service: {str(e)}")
             raise
     
@@ -158,20 +171,17 @@ async def collect_all_platform_data(user_id: str, days_back: int = 7, collector_
         if not user:
             return {"error": "User not found"}
         
-        # Define platforms to collect from
-        platforms = ["facebook", "instagram", "twitter", "linkedin", "youtube", "tiktok"]
-        
         # Collect data from each platform concurrently
-        tasks = [collector_service.collect_platform_data(user_id, platform, days_back) for platform in platforms]
+        tasks = [collector_service.collect_platform_data(user_id, platform, days_back) for platform in PLATFORMS]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results
         platform_results = {}
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                platform_results[platforms[i]] = {"error": str(result)}
+                platform_results[PLATFORMS[i]] = {"error": str(result)}
             else:
-                platform_results[platforms[i]] = result
+                platform_results[PLATFORMS[i]] = result
         
         return {
             "user_id": user_id,
@@ -182,5 +192,5 @@ async def collect_all_platform_data(user_id: str, days_back: int = 7, collector_
     
     finally:
         # Close DB session if we created it
-        if not collector_service and db:
-            db.close()
\ No newline at end of file
+        if db:
+            db.close()
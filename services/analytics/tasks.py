@@ -0,0 +1,28 @@
+import asyncio
+
+from celery import shared_task
+
+from services.analytics.collection_jobs import run_collection_job
+from services.utils.logger_config import setup_logger
+
+logger = setup_logger("analytics_tasks")
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3, default_retry_delay=30)
+def collect_analytics_job(self, job_id):
+    """
+    Collect analytics for the job's user on a Celery worker.
+
+    acks_late means a job lost with its worker is redelivered; progress is
+    checkpointed per platform, so the retry only collects what is missing.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        job = loop.run_until_complete(run_collection_job(job_id))
+        return {"job_id": job_id, "status": job["status"] if job else "missing"}
+    except Exception as e:
+        logger.exception(f"[ANALYTICS_JOB] Collection job {job_id} failed: {e}")
+        raise self.retry(exc=e)
+    finally:
+        loop.close()
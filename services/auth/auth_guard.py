@@ -12,6 +12,9 @@ security = HTTPBearer(
     description="JWT token required in Authorization header with Bearer prefix"
 )
 
+# Same scheme without auto error, so a missing token reaches optional_auth as None
+optional_security = HTTPBearer(auto_error=False)
+
 def auth_required(
     credentials: HTTPAuthorizationCredentials = Security(security),
     db: Session = Depends(get_db)
@@ -22,7 +25,7 @@ def auth_required(
 
 
 def optional_auth(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
     """Optional authentication - doesn't require a token but uses it if provided."""
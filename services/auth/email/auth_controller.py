@@ -11,12 +11,13 @@ from services.auth.email.auth_schema import (
 )
 from services.auth.jwt_handler import create_access_token, create_refresh_token, decode_token
 from services.models.user_model import User
-from passlib.context import CryptContext
 from typing import Optional, Dict
 from core.config import settings
+from services.auth.password_hasher import get_password_hasher
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing runs in a bounded pool shared with the unified auth service
+password_hasher = get_password_hasher()
+pwd_context = password_hasher.context
 
 # In-memory store for password reset tokens (should use Redis in production)
 PASSWORD_RESET_TOKENS: Dict[str, Dict] = {}
@@ -32,11 +33,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """Authenticate a user by email and password."""
+async def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+    """Authenticate a user by email and password, upgrading outdated hashes."""
     user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not user.hashed_password:
         return None
+    valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+    if not valid:
+        return None
+    if new_hash:
+        user.hashed_password = new_hash
     return user
 
 
@@ -52,7 +58,7 @@ async def register_user(db: Session, request: RegisterRequest) -> AuthResponse:
     
     # Create new user
     user_id = str(uuid.uuid4())
-    hashed_password = get_password_hash(request.password)
+    hashed_password = await password_hasher.hash(request.password)
     
     new_user = User(
         id=user_id,
@@ -83,7 +89,7 @@ async def register_user(db: Session, request: RegisterRequest) -> AuthResponse:
 
 async def login_user(db: Session, request: LoginRequest) -> AuthResponse:
     """Authenticate a user and return tokens."""
-    user = authenticate_user(db, request.email, request.password)
+    user = await authenticate_user(db, request.email, request.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -158,7 +164,7 @@ async def confirm_password_reset(db: Session, request: PasswordResetConfirmReque
         )
     
     # Update password
-    user.hashed_password = get_password_hash(request.new_password)
+    user.hashed_password = await password_hasher.hash(request.new_password)
     db.commit()
     
     # Remove used token
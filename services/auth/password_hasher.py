@@ -0,0 +1,130 @@
+"""Off-loop password hashing with per-worker admission control."""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+# Changing the cost makes existing hashes "need update"; they are rehashed on the next login
+BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "32"))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5.0"))
+
+
+def build_password_context(rounds: int = BCRYPT_ROUNDS) -> CryptContext:
+    """bcrypt context whose hashes below or above ``rounds`` are flagged for rehash."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+class PasswordHasherBusy(HTTPException):
+    """Raised when the hashing pool is saturated; maps to 503 with Retry-After."""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service is busy, please retry shortly",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a small dedicated thread pool instead of on the event loop.
+
+    At most ``max_workers`` hashes run at once and at most ``max_queue`` more
+    may wait; anything beyond that is rejected immediately with
+    ``PasswordHasherBusy`` so a login storm cannot build an unbounded backlog
+    or starve unrelated requests on the same worker. bcrypt releases the GIL,
+    so the pool also gives real parallelism.
+    """
+
+    def __init__(
+        self,
+        context: Optional[CryptContext] = None,
+        max_workers: int = PASSWORD_HASH_WORKERS,
+        max_queue: int = PASSWORD_HASH_QUEUE,
+        queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT,
+    ):
+        self.context = context or build_password_context()
+        self.max_workers = max(1, max_workers)
+        self.max_pending = self.max_workers + max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Hashes currently running or waiting for a worker."""
+        return self._pending
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def _run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                logger.warning("Password hashing pool saturated (%d pending), rejecting request", self._pending)
+                raise PasswordHasherBusy()
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(result), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            # The timeout bounds queueing only: a hash that already started is awaited
+            if not future.cancel():
+                return await result
+            logger.warning("Password hashing waited %.1fs for a worker, rejecting request", self.queue_timeout)
+            raise PasswordHasherBusy()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and return ``(valid, new_hash)``.
+
+        ``new_hash`` is set only when the password is valid and the stored
+        hash uses outdated parameters, so callers can persist it in place.
+        """
+        return await self._run(self.context.verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide hasher so every auth path shares the same admission budget."""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
@@ -1,8 +1,6 @@
 # services/auth/farcaster_auth.py
 
-from fastapi import Request
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import save_platform_token
 import time
 import hashlib
 
@@ -18,16 +16,14 @@ def get_farcaster_login_url() -> str:
     return "Handled on frontend. Use WalletConnect modal."
 
 
-def handle_farcaster_callback(request: Request) -> dict:
+async def handle_farcaster_callback(signature: str, address: str, nonce: str = None, user_id: str = "PLACEHOLDER") -> dict:
     """
     Farcaster callback. Frontend sends:
       - signature: signed message
       - address: wallet address
       - nonce: nonce used
     """
-    signature = request.query_params.get("signature")
-    user_address = request.query_params.get("address")
-    nonce = request.query_params.get("nonce")
+    user_address = address
 
     if not signature or not user_address or not nonce:
         return {"error": "Missing signature, address, or nonce"}
@@ -37,20 +33,20 @@ def handle_farcaster_callback(request: Request) -> dict:
     if len(nonce_parts) != 2:
         return {"error": "Invalid nonce format"}
 
-    issued_at = int(nonce_parts[1])
+    try:
+        issued_at = int(nonce_parts[1])
+    except ValueError:
+        return {"error": "Invalid nonce format"}
     if time.time() - issued_at > NONCE_VALIDITY_SECONDS:
         return {"error": "Nonce expired"}
 
     # ✔️ Ideally: verify signature properly using a library like eth_account
     # Here we store it directly for demo
-    db = next(get_db())
-    new_token = PlatformToken(
-        user_id="PLACEHOLDER",
+    await save_platform_token(
+        user_id=user_id,
         platform="farcaster",
         access_token=signature,  # Store signature for session validation
     )
-    db.add(new_token)
-    db.commit()
 
     return {
         "msg": "Farcaster connected!",
@@ -1,9 +1,7 @@
 # services/auth/linkedin_auth.py
 
 import os
-import requests
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 LINKEDIN_CLIENT_ID = os.getenv("LINKEDIN_CLIENT_ID")
 LINKEDIN_CLIENT_SECRET = os.getenv("LINKEDIN_CLIENT_SECRET")
@@ -23,7 +21,7 @@ def get_linkedin_login_url() -> str:
     return AUTH_URL
 
 
-def exchange_code(code: str, user_id: str) -> dict:
+async def exchange_code(code: str, user_id: str) -> dict:
     """
     Exchange authorization code for access + refresh token.
     Save token in DB.
@@ -36,8 +34,7 @@ def exchange_code(code: str, user_id: str) -> dict:
         "client_secret": LINKEDIN_CLIENT_SECRET
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     access_token = res_json.get("access_token")
     expires_in = res_json.get("expires_in")
@@ -46,20 +43,17 @@ def exchange_code(code: str, user_id: str) -> dict:
         return {"error": "No access token returned", "raw": res_json}
 
     # Save in DB
-    db = next(get_db())
-    new_token = PlatformToken(
+    await save_platform_token(
         user_id=user_id,
         platform="linkedin",
         access_token=access_token,
         expires_in=expires_in
     )
-    db.add(new_token)
-    db.commit()
 
     return {"msg": "LinkedIn connected!", "access_token": access_token, "expires_in": expires_in}
 
 
-def refresh_token(refresh_token: str) -> dict:
+async def refresh_token(refresh_token: str) -> dict:
     """
     Refresh LinkedIn token using refresh_token.
     """
@@ -70,8 +64,7 @@ def refresh_token(refresh_token: str) -> dict:
         "client_secret": LINKEDIN_CLIENT_SECRET
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     new_access_token = res_json.get("access_token")
     expires_in = res_json.get("expires_in")
@@ -1,10 +1,8 @@
 # services/auth/meta_auth.py
 
 import os
-import requests
 from fastapi import Request
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 META_APP_ID = os.getenv("META_APP_ID")
 META_APP_SECRET = os.getenv("META_APP_SECRET")
@@ -24,12 +22,13 @@ def get_meta_login_url() -> str:
     return AUTH_URL.format(app_id=META_APP_ID, redirect_uri=REDIRECT_URI)
 
 
-def exchange_code(code: str, user_id: str):
+async def exchange_code(code: str, user_id: str):
     """
     1) Exchange short-lived code for access token
     2) Exchange short-lived token for long-lived token (Meta best practice)
     3) Save to DB
     """
+    client = get_oauth_client()
     params = {
         "client_id": META_APP_ID,
         "client_secret": META_APP_SECRET,
@@ -37,15 +36,14 @@ def exchange_code(code: str, user_id: str):
         "code": code
     }
 
-    res = requests.get(TOKEN_URL, params=params)
-    res_json = res.json()
+    res_json = await client.get_json(TOKEN_URL, params=params)
 
     short_token = res_json.get("access_token")
     if not short_token:
         return {"error": "Meta code exchange failed"}
 
     # Now exchange short-lived for long-lived token
-    long_res = requests.get(
+    long_json = await client.get_json(
         LONG_LIVED_URL,
         params={
             "grant_type": "fb_exchange_token",
@@ -54,32 +52,27 @@ def exchange_code(code: str, user_id: str):
             "fb_exchange_token": short_token
         }
     )
-    long_json = long_res.json()
     access_token = long_json.get("access_token")
 
     if not access_token:
         return {"error": "Long-lived token exchange failed"}
 
-    # Save in DB
-    db = next(get_db())
-
-    new_token = PlatformToken(
+    # Save in DB (Meta uses long-lived access tokens instead of refresh_token)
+    await save_platform_token(
         user_id=user_id,
         platform="meta",
         access_token=access_token,
-        refresh_token=None  # Meta uses long-lived access tokens instead of refresh_token
+        expires_in=long_json.get("expires_in")
     )
-    db.add(new_token)
-    db.commit()
 
     return {"msg": "Meta connected!", "access_token": access_token}
 
 
-def refresh_token(old_token: str) -> dict:
+async def refresh_token(old_token: str) -> dict:
     """
     Meta tokens: refresh means repeat long-lived step.
     """
-    res = requests.get(
+    return await get_oauth_client().get_json(
         LONG_LIVED_URL,
         params={
             "grant_type": "fb_exchange_token",
@@ -88,6 +81,4 @@ def refresh_token(old_token: str) -> dict:
             "fb_exchange_token": old_token
         }
     )
-    res.raise_for_status()
-    return res.json()
 
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import httpx
+
+from services.database.database import SessionLocal
+from services.models.token_model import PlatformToken
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+OAUTH_HTTP_TIMEOUT = float(os.getenv("OAUTH_HTTP_TIMEOUT", "10.0"))
+OAUTH_MAX_CONNECTIONS = int(os.getenv("OAUTH_MAX_CONNECTIONS", "50"))
+OAUTH_MAX_RETRIES = int(os.getenv("OAUTH_MAX_RETRIES", "2"))
+
+# Responses where the provider explicitly refused the request, so a retry
+# cannot redeem an authorization code twice
+RETRYABLE_STATUS = {429, 503}
+
+
+class OAuthExchangeError(Exception):
+    """A token endpoint could not be reached or returned a non-JSON error."""
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    during a provider outage retries stay at roughly ``ratio`` x normal load
+    instead of multiplying it. ``min_tokens`` keeps a little headroom for
+    retries when traffic is low.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class OAuthHTTPClient:
+    """
+    Pooled async HTTP client for OAuth token endpoints of every provider.
+
+    Connection-phase failures (nothing reached the provider) and 429/503
+    responses are retried with jittered backoff, bounded both per request
+    and by a shared ``RetryBudget``. Any other response is returned to the
+    provider module, which decides what a failed exchange looks like.
+    """
+
+    def __init__(self, timeout: float = OAUTH_HTTP_TIMEOUT, max_connections: int = OAUTH_MAX_CONNECTIONS,
+                 max_retries: int = OAUTH_MAX_RETRIES, backoff: float = 0.25, budget: Optional[RetryBudget] = None):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.budget = budget or RetryBudget()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    async def request_json(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send a request and return the decoded JSON body.
+
+        Error bodies are returned as-is (providers put error details in JSON),
+        only transport failures and undecodable bodies raise ``OAuthExchangeError``.
+        """
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = await self._get_client().request(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if not self._should_retry(attempt):
+                    raise OAuthExchangeError(f"Could not reach {url}: {e}") from e
+            except httpx.HTTPError as e:
+                # The request may have reached the provider; an authorization
+                # code must not be sent twice
+                raise OAuthExchangeError(f"Token request to {url} failed: {e}") from e
+            else:
+                if response.status_code not in RETRYABLE_STATUS or not self._should_retry(attempt):
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        raise OAuthExchangeError(
+                            f"Token endpoint {url} returned HTTP {response.status_code} without JSON"
+                        ) from e
+
+            attempt += 1
+            delay = self.backoff * (2 ** (attempt - 1))
+            logger.warning(f"Retrying OAuth request to {url} (attempt {attempt + 1}) in {delay:.2f}s")
+            await asyncio.sleep(delay * (0.5 + random.random()))
+
+    def _should_retry(self, attempt: int) -> bool:
+        return attempt < self.max_retries and self.budget.try_withdraw()
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return await self.request_json("GET", url, params=params, **kwargs)
+
+    async def post_form(self, url: str, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        return await self.request_json("POST", url, data=data, headers=headers)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+_oauth_client: Optional[OAuthHTTPClient] = None
+
+
+def get_oauth_client() -> OAuthHTTPClient:
+    """Return the process-wide OAuth HTTP client."""
+    global _oauth_client
+    if _oauth_client is None:
+        _oauth_client = OAuthHTTPClient()
+    return _oauth_client
+
+
+async def close_oauth_client() -> None:
+    """Close the process-wide OAuth HTTP client, if one was created."""
+    global _oauth_client
+    if _oauth_client is not None:
+        await _oauth_client.close()
+        _oauth_client = None
+
+
+def _save_platform_token(user_id: str, platform: str, access_token: str, refresh_token: Optional[str] = None,
+                         expires_in: Optional[int] = None, channel_id: Optional[str] = None) -> None:
+    db = SessionLocal()
+    try:
+        db.add(PlatformToken(
+            user_id=user_id,
+            platform=platform,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_at=datetime.utcnow() + timedelta(seconds=int(expires_in)) if expires_in else None,
+            channel_id=channel_id
+        ))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def save_platform_token(user_id: str, platform: str, access_token: str, refresh_token: Optional[str] = None,
+                              expires_in: Optional[int] = None, channel_id: Optional[str] = None) -> None:
+    """Persist a connected platform token without blocking the event loop."""
+    await asyncio.to_thread(
+        _save_platform_token, user_id, platform, access_token,
+        refresh_token, expires_in, channel_id
+    )
@@ -1,9 +1,6 @@
 # services/auth/telegram_auth.py
 
-import requests
-from fastapi import Request
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/getMe"
 TELEGRAM_CHAT_URL = "https://api.telegram.org/bot{token}/getChat?chat_id={chat_id}"
@@ -22,42 +19,38 @@ def get_telegram_connect_instructions() -> str:
     )
 
 
-def handle_telegram_callback(request: Request) -> dict:
+async def handle_telegram_callback(bot_token: str, channel_id: str, user_id: str = "PLACEHOLDER") -> dict:
     """
     Receives: bot_token & channel_id
     1️⃣ Verifies bot is valid.
     2️⃣ Verifies bot has access to the channel.
     3️⃣ Stores credentials.
     """
-    bot_token = request.query_params.get("bot_token")
-    channel_id = request.query_params.get("channel_id")
+    client = get_oauth_client()
 
     if not bot_token or not channel_id:
         return {"error": "Bot token or channel ID missing."}
 
     # ✅ Verify bot token
-    verify_bot = requests.get(TELEGRAM_API_URL.format(token=bot_token)).json()
+    verify_bot = await client.get_json(TELEGRAM_API_URL.format(token=bot_token))
     if not verify_bot.get("ok"):
         return {"error": "Invalid Bot Token."}
 
     # ✅ Verify bot can access the channel
-    verify_chat = requests.get(
+    verify_chat = await client.get_json(
         TELEGRAM_CHAT_URL.format(token=bot_token, chat_id=channel_id)
-    ).json()
+    )
 
     if not verify_chat.get("ok"):
         return {"error": "Invalid Channel ID or bot has no access. Add bot as admin!"}
 
     # ✅ Save to DB
-    db = next(get_db())
-    new_token = PlatformToken(
-        user_id="PLACEHOLDER",
+    await save_platform_token(
+        user_id=user_id,
         platform="telegram",
         access_token=bot_token,
         channel_id=channel_id
     )
-    db.add(new_token)
-    db.commit()
 
     return {
         "msg": "✅ Telegram Bot connected successfully!",
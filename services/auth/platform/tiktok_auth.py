@@ -1,9 +1,7 @@
 # services/auth/tiktok_auth.py
 
 import os
-import requests
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 TIKTOK_CLIENT_KEY = os.getenv("TIKTOK_CLIENT_KEY")
 TIKTOK_CLIENT_SECRET = os.getenv("TIKTOK_CLIENT_SECRET")
@@ -24,7 +22,7 @@ def get_tiktok_login_url() -> str:
     return AUTH_URL.format(client_key=TIKTOK_CLIENT_KEY, redirect_uri=TIKTOK_REDIRECT_URI)
 
 
-def exchange_code(code: str, user_id: str) -> dict:
+async def exchange_code(code: str, user_id: str) -> dict:
     """
     Exchange TikTok OAuth code for access & refresh tokens.
     """
@@ -36,8 +34,7 @@ def exchange_code(code: str, user_id: str) -> dict:
         "redirect_uri": TIKTOK_REDIRECT_URI
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     access_token = res_json.get("data", {}).get("access_token")
     refresh_token = res_json.get("data", {}).get("refresh_token")
@@ -46,16 +43,13 @@ def exchange_code(code: str, user_id: str) -> dict:
     if not access_token:
         return {"error": "No access token returned", "raw": res_json}
 
-    db = next(get_db())
-    new_token = PlatformToken(
+    await save_platform_token(
         user_id=user_id,
         platform="tiktok",
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=expires_in
     )
-    db.add(new_token)
-    db.commit()
 
     return {
         "msg": "TikTok connected!",
@@ -65,7 +59,7 @@ def exchange_code(code: str, user_id: str) -> dict:
     }
 
 
-def refresh_tiktok_token(refresh_token: str) -> dict:
+async def refresh_tiktok_token(refresh_token: str) -> dict:
     """
     Refresh TikTok access token using refresh_token.
     """
@@ -76,8 +70,7 @@ def refresh_tiktok_token(refresh_token: str) -> dict:
         "refresh_token": refresh_token
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     new_access_token = res_json.get("data", {}).get("access_token")
     new_refresh_token = res_json.get("data", {}).get("refresh_token")
@@ -1,9 +1,7 @@
 # services/auth/twitter_auth.py
 
 import os
-import requests
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 TWITTER_CLIENT_ID = os.getenv("TWITTER_CLIENT_ID")
 TWITTER_CLIENT_SECRET = os.getenv("TWITTER_CLIENT_SECRET")
@@ -26,7 +24,7 @@ def get_twitter_login_url() -> str:
     return AUTH_URL
 
 
-def exchange_code(code: str, user_id: str) -> dict:
+async def exchange_code(code: str, user_id: str) -> dict:
     """
     Exchange Twitter OAuth code for access & refresh token.
     """
@@ -43,8 +41,7 @@ def exchange_code(code: str, user_id: str) -> dict:
         "Authorization": f"Basic {TWITTER_CLIENT_ID}:{TWITTER_CLIENT_SECRET}"
     }
 
-    res = requests.post(TOKEN_URL, data=data, headers=headers)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data, headers=headers)
 
     access_token = res_json.get("access_token")
     refresh_token = res_json.get("refresh_token")
@@ -53,16 +50,13 @@ def exchange_code(code: str, user_id: str) -> dict:
     if not access_token:
         return {"error": "No access token returned", "raw": res_json}
 
-    db = next(get_db())
-    new_token = PlatformToken(
+    await save_platform_token(
         user_id=user_id,
         platform="twitter",
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=expires_in
     )
-    db.add(new_token)
-    db.commit()
 
     return {
         "msg": "Twitter connected!",
@@ -72,7 +66,7 @@ def exchange_code(code: str, user_id: str) -> dict:
     }
 
 
-def refresh_twitter_token(refresh_token: str) -> dict:
+async def refresh_twitter_token(refresh_token: str) -> dict:
     """
     Refresh Twitter access token using refresh_token.
     """
@@ -87,8 +81,7 @@ def refresh_twitter_token(refresh_token: str) -> dict:
         "Authorization": f"Basic {TWITTER_CLIENT_ID}:{TWITTER_CLIENT_SECRET}"
     }
 
-    res = requests.post(TOKEN_URL, data=data, headers=headers)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data, headers=headers)
 
     new_access_token = res_json.get("access_token")
     new_refresh_token = res_json.get("refresh_token")
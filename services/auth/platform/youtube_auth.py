@@ -1,9 +1,7 @@
 # services/auth/youtube_auth.py
 
 import os
-import requests
-from services.database.database import get_db
-from services.models.token_model import PlatformToken
+from services.auth.platform.oauth_client import get_oauth_client, save_platform_token
 
 YOUTUBE_CLIENT_ID = os.getenv("YOUTUBE_CLIENT_ID")
 YOUTUBE_CLIENT_SECRET = os.getenv("YOUTUBE_CLIENT_SECRET")
@@ -26,7 +24,7 @@ def get_youtube_login_url() -> str:
     return AUTH_URL.format(client_id=YOUTUBE_CLIENT_ID, redirect_uri=YOUTUBE_REDIRECT_URI)
 
 
-def exchange_code(code: str, user_id: str) -> dict:
+async def exchange_code(code: str, user_id: str) -> dict:
     """
     Exchange YouTube OAuth code for access & refresh token.
     """
@@ -38,8 +36,7 @@ def exchange_code(code: str, user_id: str) -> dict:
         "grant_type": "authorization_code"
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     access_token = res_json.get("access_token")
     refresh_token = res_json.get("refresh_token")
@@ -48,16 +45,13 @@ def exchange_code(code: str, user_id: str) -> dict:
     if not access_token:
         return {"error": "No access token returned", "raw": res_json}
 
-    db = next(get_db())
-    new_token = PlatformToken(
+    await save_platform_token(
         user_id=user_id,
         platform="youtube",
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=expires_in
     )
-    db.add(new_token)
-    db.commit()
 
     return {
         "msg": "YouTube connected!",
@@ -67,7 +61,7 @@ def exchange_code(code: str, user_id: str) -> dict:
     }
 
 
-def refresh_youtube_token(refresh_token: str) -> dict:
+async def refresh_youtube_token(refresh_token: str) -> dict:
     """
     Refresh YouTube access token using refresh_token.
     """
@@ -78,8 +72,7 @@ def refresh_youtube_token(refresh_token: str) -> dict:
         "grant_type": "refresh_token"
     }
 
-    res = requests.post(TOKEN_URL, data=data)
-    res_json = res.json()
+    res_json = await get_oauth_client().post_form(TOKEN_URL, data=data)
 
     new_access_token = res_json.get("access_token")
     new_refresh_token = res_json.get("refresh_token")
@@ -6,22 +6,22 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, status
-from passlib.context import CryptContext
 from jose import JWTError, jwt
-from eth_account.messages import encode_defunct
-from eth_account import Account
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from services.models.user_model import User, AuthType
 from services.core.config import settings
+from services.auth.password_hasher import get_password_hasher
+from services.auth.wallet.signature import recover_address, verify_wallet_signature_async
 
 
 class UnifiedAuthService:
     """Unified authentication service supporting email/password and wallet authentication."""
     
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = get_password_hasher()
+        self.pwd_context = self.password_hasher.context
         self.algorithm = "HS256"
         self.access_token_expire_minutes = 30
         self.refresh_token_expire_days = 7
@@ -34,6 +34,14 @@ class UnifiedAuthService:
         """Generate password hash."""
         return self.pwd_context.hash(password)
     
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the bounded hashing pool, off the event loop."""
+        return await self.password_hasher.verify(plain_password, hashed_password)
+    
+    async def get_password_hash_async(self, password: str) -> str:
+        """Generate a password hash in the bounded hashing pool, off the event loop."""
+        return await self.password_hasher.hash(password)
+    
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """Create JWT access token."""
         to_encode = data.copy()
@@ -60,17 +68,13 @@ class UnifiedAuthService:
     
     def verify_wallet_signature(self, wallet_address: str, message: str, signature: str) -> bool:
         """Verify wallet signature for authentication."""
-        try:
-            # Create the message that was signed
-            message_hash = encode_defunct(text=message)
-            
-            # Recover the address from the signature
-            recovered_address = Account.recover_message(message_hash, signature=signature)
-            
-            # Compare addresses (case-insensitive)
-            return recovered_address.lower() == wallet_address.lower()
-        except Exception:
-            return False
+        recovered_address = recover_address(message, signature)
+        # Compare addresses (case-insensitive)
+        return recovered_address is not None and recovered_address == wallet_address.lower()
+    
+    async def verify_wallet_signature_async(self, wallet_address: str, message: str, signature: str) -> bool:
+        """Verify wallet signature in the signature worker pool, with cached recovery."""
+        return await verify_wallet_signature_async(wallet_address, message, signature)
     
     def generate_wallet_challenge(self, wallet_address: str) -> str:
         """Generate a challenge message for wallet authentication."""
@@ -78,24 +82,28 @@ class UnifiedAuthService:
         nonce = secrets.token_hex(16)
         return f"Sign this message to authenticate with Social Suit:\nWallet: {wallet_address}\nTimestamp: {timestamp}\nNonce: {nonce}"
     
-    def authenticate_user_email(self, db: Session, email: str, password: str) -> Optional[User]:
-        """Authenticate user with email and password."""
+    async def authenticate_user_email(self, db: Session, email: str, password: str) -> Optional[User]:
+        """Authenticate user with email and password, upgrading outdated hashes."""
         user = db.query(User).filter(User.email == email).first()
         if not user or not user.hashed_password:
             return None
-        if not self.verify_password(password, user.hashed_password):
+        valid, new_hash = await self.password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
         return user
     
-    def authenticate_user_wallet(self, db: Session, wallet_address: str, message: str, signature: str) -> Optional[User]:
+    async def authenticate_user_wallet(self, db: Session, wallet_address: str, message: str, signature: str) -> Optional[User]:
         """Authenticate user with wallet signature."""
-        if not self.verify_wallet_signature(wallet_address, message, signature):
+        if not await self.verify_wallet_signature_async(wallet_address, message, signature):
             return None
         
         user = db.query(User).filter(User.wallet_address == wallet_address.lower()).first()
         return user
     
-    def register_user_email(self, db: Session, email: str, password: str) -> User:
+    async def register_user_email(self, db: Session, email: str, password: str) -> User:
         """Register a new user with email and password."""
         # Check if email already exists
         existing_user = db.query(User).filter(User.email == email).first()
@@ -106,7 +114,7 @@ class UnifiedAuthService:
             )
         
         # Create new user
-        hashed_password = self.get_password_hash(password)
+        hashed_password = await self.get_password_hash_async(password)
         user = User(
             email=email,
             hashed_password=hashed_password,
@@ -172,7 +180,7 @@ class UnifiedAuthService:
         db.refresh(user)
         return user
     
-    def link_email_to_user(self, db: Session, user_id: str, email: str, password: str) -> User:
+    async def link_email_to_user(self, db: Session, user_id: str, email: str, password: str) -> User:
         """Link email and password to an existing wallet-only user account."""
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
@@ -194,7 +202,7 @@ class UnifiedAuthService:
         
         # Link email to user
         user.email = email
-        user.hashed_password = self.get_password_hash(password)
+        user.hashed_password = await self.get_password_hash_async(password)
         user.email_verified = False
         user.update_auth_type()
         
@@ -13,36 +13,34 @@ from services.auth.jwt_handler import (
     create_access_token,
     create_refresh_token,
 )
+from services.auth.wallet.nonce_store import get_nonce_store, WALLET_NONCE_TTL
+from services.auth.wallet.signature import verify_wallet_signature_async
 from services.database.database import get_db # Your DB session
 
-# In-memory nonce store (should use Redis or DB in production)
-NONCE_STORE = {}
+NONCE_SCOPE = "login"
 
-# Generate a nonce for wallet login
+# Generate a single-use nonce for wallet login
 async def generate_wallet_nonce(payload: WalletNonceRequest):
     nonce = secrets.token_hex(16)
     key = f"{payload.network}:{payload.address}"
-    NONCE_STORE[key] = nonce
-    return {"nonce": nonce}
+    await get_nonce_store().issue(NONCE_SCOPE, key, nonce, ttl_seconds=WALLET_NONCE_TTL)
+    return {"nonce": nonce, "expires_in": WALLET_NONCE_TTL}
 
 
 # Verify the signature and issue tokens
 async def verify_wallet_signature_controller(payload: WalletSignatureVerifyRequest):
-    # ⛔ FIX: Lazy import to avoid circular import
-    from services.auth.wallet.auth_controller import verify_wallet_signature
-
     key = f"{payload.network}:{payload.address}"
-    expected_nonce = NONCE_STORE.get(key)
+    # Atomic get-and-delete: a nonce can be redeemed once, even across workers
+    expected_nonce = await get_nonce_store().consume(NONCE_SCOPE, key)
 
     if not expected_nonce or payload.nonce != expected_nonce:
         raise ValueError("Invalid or expired nonce")
 
-    # Signature Verification
-    is_valid = await verify_wallet_signature(
-        address=payload.address,
-        signature=payload.signature,
+    # Signature Verification (off the event loop)
+    is_valid = await verify_wallet_signature_async(
+        wallet_address=payload.address,
         message=expected_nonce,
-        network=payload.network
+        signature=payload.signature
     )
     if not is_valid:
         raise ValueError("Signature verification failed")
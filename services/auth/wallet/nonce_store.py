@@ -0,0 +1,105 @@
+"""Single-use wallet nonces and challenges with a TTL."""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from services.database.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+WALLET_NONCE_TTL = int(os.getenv("WALLET_NONCE_TTL", "300"))  # 5 minutes
+WALLET_NONCE_BACKEND = os.getenv("WALLET_NONCE_BACKEND", "redis")  # redis | memory
+
+
+class RedisNonceStore:
+    """
+    Nonces shared by every worker through Redis.
+
+    ``consume`` is an atomic get-and-delete, so a nonce can be redeemed at most
+    once even when two workers race on the same signature; ``consume_if_matches``
+    is an atomic compare-and-delete, so a wrong value leaves the nonce in place.
+    Expired nonces are dropped by Redis itself, so nothing accumulates in
+    process memory.
+    """
+
+    KEY = "wallet:nonce:{scope}:{subject}"
+
+    async def issue(self, scope: str, subject: str, value: Any, ttl_seconds: int = WALLET_NONCE_TTL) -> bool:
+        return await RedisManager.cache_set(self.KEY.format(scope=scope, subject=subject), value, ttl_seconds=ttl_seconds)
+
+    async def consume(self, scope: str, subject: str) -> Optional[Any]:
+        return await RedisManager.cache_pop(self.KEY.format(scope=scope, subject=subject))
+
+    async def consume_if_matches(self, scope: str, subject: str, expected: Any) -> bool:
+        return await RedisManager.cache_pop_if_equal(self.KEY.format(scope=scope, subject=subject), expected)
+
+
+class InMemoryNonceStore:
+    """
+    Process-local stand-in for tests and single-worker development.
+
+    Bounded by ``max_entries`` (oldest issued nonce is evicted first) and
+    expired entries are purged as new ones are issued.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires_at, value), oldest issued first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+
+    def _purge_expired(self, now: float) -> None:
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
+
+    async def issue(self, scope: str, subject: str, value: Any, ttl_seconds: int = WALLET_NONCE_TTL) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            key = (scope, subject)
+            self._entries.pop(key, None)
+            self._entries[key] = (now + ttl_seconds, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    async def consume(self, scope: str, subject: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.pop((scope, subject), None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def consume_if_matches(self, scope: str, subject: str, expected: Any) -> bool:
+        key = (scope, subject)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic() or entry[1] != expected:
+                return False
+            del self._entries[key]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_nonce_store = None
+
+
+def get_nonce_store():
+    """Store selected by WALLET_NONCE_BACKEND; Redis unless explicitly set to memory."""
+    global _nonce_store
+    if _nonce_store is None:
+        if WALLET_NONCE_BACKEND == "memory":
+            logger.warning("Using in-memory wallet nonce store; nonces are not shared across workers")
+            _nonce_store = InMemoryNonceStore()
+        else:
+            _nonce_store = RedisNonceStore()
+    return _nonce_store
@@ -0,0 +1,71 @@
+"""Off-loop, cached recovery of signer addresses from wallet signatures."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_WORKERS = int(os.getenv("WALLET_SIGNATURE_WORKERS", str(min(4, os.cpu_count() or 1))))
+SIGNATURE_CACHE_SIZE = int(os.getenv("WALLET_SIGNATURE_CACHE_SIZE", "4096"))
+
+_executor = ThreadPoolExecutor(max_workers=SIGNATURE_WORKERS, thread_name_prefix="wallet-signature")
+_cache_lock = threading.Lock()
+# sha256(message, signature) -> lowercase recovered address, or None if unrecoverable
+_recovered: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
+
+def signature_digest(message: str, signature: str) -> str:
+    """Cache key for a (message, signature) pair; length-prefixed so fields cannot bleed."""
+    payload = f"{len(message)}:{message}{signature.lower()}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def recover_address(message: str, signature: str) -> Optional[str]:
+    """Recover the signer of an EIP-191 personal message, or None if the signature is malformed."""
+    # eth_account is slow to import, so it is loaded on the first login rather than at startup
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    try:
+        return Account.recover_message(encode_defunct(text=message), signature=signature).lower()
+    except Exception:
+        return None
+
+
+async def recover_address_async(message: str, signature: str) -> Optional[str]:
+    """
+    Recover the signer address in a worker thread.
+
+    Recovery is a pure function of its inputs, so results (including failures)
+    are kept in a bounded LRU keyed by the digest of the pair.
+    """
+    key = signature_digest(message, signature)
+    with _cache_lock:
+        if key in _recovered:
+            _recovered.move_to_end(key)
+            return _recovered[key]
+
+    address = await asyncio.get_running_loop().run_in_executor(_executor, recover_address, message, signature)
+
+    with _cache_lock:
+        _recovered[key] = address
+        while len(_recovered) > SIGNATURE_CACHE_SIZE:
+            _recovered.popitem(last=False)
+    return address
+
+
+async def verify_wallet_signature_async(wallet_address: str, message: str, signature: str) -> bool:
+    """Check that ``signature`` over ``message`` was produced by ``wallet_address``."""
+    recovered = await recover_address_async(message, signature)
+    return recovered is not None and recovered == wallet_address.lower()
+
+
+def clear_signature_cache() -> None:
+    with _cache_lock:
+        _recovered.clear()
@@ -4,11 +4,11 @@ import httpx
 import json
 import logging
 from typing import Dict, Any, Optional, List, Tuple
-from sqlalchemy.orm import Session
 
 from core.config import settings
-from services.database.database import get_db_session
-from services.models.custom_reply_model import CustomReply
+from services.custom_reply_cache import CustomReplyCache
+from services.llm_gateway import get_llm_gateway
+from services.utils.keyword_matcher import KeywordMatcher
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -99,60 +99,40 @@ def preprocess_text(text: str) -> str:
     text = re.sub(r'[^\w\s]', '', text)  # Remove punctuation
     return text
 
+# Simple keyword-based intent detection
+# In a production environment, this would use a more sophisticated ML model
+INTENT_KEYWORDS = {
+    "pricing": ["price", "cost", "pricing", "how much", "rate", "fee", "plan", "subscription"],
+    "support": ["help", "support", "issue", "problem", "error", "not working", "broken"],
+    "onboarding": ["start", "begin", "tutorial", "guide", "how to", "setup", "getting started"],
+    "feature": ["can it", "feature", "function", "capability", "able to", "does it"],
+    "feedback": ["feedback", "suggest", "improve", "better", "opinion"],
+}
+
+# Compiled once; intents are reported in the order declared above
+_INTENT_MATCHER = KeywordMatcher.from_groups(INTENT_KEYWORDS)
+
 def detect_intent(message: str) -> tuple:
     """Enhanced intent detection with NLP"""
-    # Simple keyword-based intent detection
-    # In a production environment, this would use a more sophisticated ML model
-    intents = {
-        "pricing": ["price", "cost", "pricing", "how much", "rate", "fee", "plan", "subscription"],
-        "support": ["help", "support", "issue", "problem", "error", "not working", "broken"],
-        "onboarding": ["start", "begin", "tutorial", "guide", "how to", "setup", "getting started"],
-        "feature": ["can it", "feature", "function", "capability", "able to", "does it"],
-        "feedback": ["feedback", "suggest", "improve", "better", "opinion"],
-    }
-    
-    # Check each intent's keywords
-    for intent, keywords in intents.items():
-        for keyword in keywords:
-            if keyword in message:
-                return (intent, 0.85)  # Simple confidence score
+    intent = _INTENT_MATCHER.first_value(message)
+    if intent:
+        return (intent, 0.85)  # Simple confidence score
     
     # Default if no intent is detected
     return ("general", 0.5)
 
 async def check_custom_reply(message: str, platform: str, brand_id: str, intent: str) -> Optional[Dict[str, Any]]:
-    """Check if there's a custom reply for this message in the database"""
+    """Check if there's a custom reply for this message in the brand's cached rules"""
     if not brand_id:
         return None
     
     try:
-        db = get_db_session()
-        
-        # First try to match by intent and brand_id
-        custom_replies = db.query(CustomReply).filter(
-            CustomReply.brand_id == brand_id,
-            CustomReply.intent == intent,
-            CustomReply.platform.in_([platform, "general"])
-        ).all()
+        rule_set = await CustomReplyCache.get_rule_set(brand_id)
+        reply = rule_set.match(message, platform, intent)
         
-        if not custom_replies:
-            # If no match by intent, try to match by keyword
-            all_replies = db.query(CustomReply).filter(
-                CustomReply.brand_id == brand_id,
-                CustomReply.platform.in_([platform, "general"])
-            ).all()
-            
-            # Check if any keywords match the message
-            for reply in all_replies:
-                if reply.keyword.lower() in message.lower():
-                    custom_replies = [reply]
-                    break
-        
-        if custom_replies:
-            # Use the first matching reply
-            reply = custom_replies[0]
+        if reply:
             return {
-                "reply": reply.custom_reply,
+                "reply": reply["custom_reply"],
                 "action": "custom_reply_action",
                 "priority": "high"
             }
@@ -161,8 +141,6 @@ async def check_custom_reply(message: str, platform: str, brand_id: str, intent:
     except Exception as e:
         logger.error(f"Error checking custom replies: {str(e)}")
         return None
-    finally:
-        db.close()
 
 async def get_deepseek_response(message: str, platform: str, user_type: str, 
                               brand_id: str = None, context: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -224,54 +202,37 @@ async def get_deepseek_response(message: str, platform: str, user_type: str,
         Keep your responses concise and suitable for social media.
         """
         
-        # Prepare the API request
-        headers = {
-            "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://social-suit.com",  # Replace with your actual domain
-            "X-Title": "Social Suit Auto-Engagement"
-        }
-        
-        payload = {
-            "model": settings.OPENROUTER_MODEL,
-            "messages": [
+        # Make the API request through the shared gateway (pooled client, bounded concurrency)
+        result = await get_llm_gateway().chat(
+            [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": message}
             ],
-            "temperature": 0.7,
-            "max_tokens": 300
-        }
+            model=settings.OPENROUTER_MODEL,
+            temperature=0.7,
+            max_tokens=300,
+            title="Social Suit Auto-Engagement"
+        )
         
-        # Make the API request with a shorter timeout to fail faster
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(
-                settings.OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            # Extract the response content
-            ai_response = result["choices"][0]["message"]["content"]
-            
-            # Parse the JSON response
-            try:
-                parsed_response = json.loads(ai_response)
-                return {
-                    "reply": parsed_response.get("reply", "I'm not sure how to respond to that."),
-                    "action": parsed_response.get("action", "default_action"),
-                    "priority": parsed_response.get("priority", "medium")
-                }
-            except json.JSONDecodeError:
-                # If the AI didn't return valid JSON, use the raw response
-                return {
-                    "reply": ai_response,
-                    "action": "default_action",
-                    "priority": "medium"
-                }
-    
+        # Extract the response content
+        ai_response = result["choices"][0]["message"]["content"]
+        
+        # Parse the JSON response
+        try:
+            parsed_response = json.loads(ai_response)
+            return {
+                "reply": parsed_response.get("reply", "I'm not sure how to respond to that."),
+                "action": parsed_response.get("action", "default_action"),
+                "priority": parsed_response.get("priority", "medium")
+            }
+        except json.JSONDecodeError:
+            # If the AI didn't return valid JSON, use the raw response
+            return {
+                "reply": ai_response,
+                "action": "default_action",
+                "priority": "medium"
+            }
+
     except httpx.TimeoutException as e:
         logger.warning(f"DeepSeek API timeout: {str(e)}")
         # Get the intent from the message to provide a relevant fallback
@@ -0,0 +1,243 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from core.config import settings
+from services.database.redis import RedisManager
+from services.llm_gateway import get_llm_gateway
+from services.utils.keyword_matcher import KeywordMatcher
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("spam", "relevant", "community")
+
+# Keyword lists used both for local resolution and as the LLM fallback.
+# Order matters: spam is checked before community.
+CATEGORY_KEYWORDS = {
+    "spam": [
+        "buy now", "click here", "free offer", "limited time", "discount code",
+        "www.", "http:", "https:", "earn money", "make money", "$$$",
+        "casino", "lottery", "viagra", "cialis", "weight loss", "diet pill"
+    ],
+    "community": [
+        "love your content", "great page", "following you", "big fan",
+        "keep it up", "love your work", "awesome profile", "nice feed"
+    ],
+}
+
+# Whole-comment texts that carry no information (see the classification prompt)
+LOW_VALUE_COMMENTS = {
+    "gm", "gn", "hi", "hello", "hey", "moon", "wagmi", "lfg", "first", "nice", "wow", "up"
+}
+
+CLASSIFICATION_CACHE_PREFIX = "inbox:classification"
+CLASSIFICATION_CACHE_TTL = 7 * 24 * 3600  # Same text, same category
+LLM_BATCH_SIZE = 25  # Comments packed into one prompt
+LLM_MAX_CONCURRENCY = 4  # Batched prompts in flight at once
+LLM_MAX_COMMENT_CHARS = 500  # Long comments are truncated in the prompt
+
+# Compiled once at import; scanning a comment is linear in its length
+_CATEGORY_MATCHER = KeywordMatcher.from_groups(CATEGORY_KEYWORDS)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+BATCH_SYSTEM_PROMPT = (
+    "You are an AI that classifies social media comments into one of three categories:\n"
+    "1. 'spam': Low-value comments like 'hello', 'gm', 'moon', or repeated text\n"
+    "2. 'relevant': Questions about product, roadmap, pricing, events, or specific inquiries\n"
+    "3. 'community': Compliments, casual positive engagement, or general community interaction\n\n"
+    "You will receive a JSON array of objects with an 'id' and a 'text'. "
+    "Respond with ONLY a JSON array containing one object per input, in this exact format: "
+    "[{\"id\": 1, \"category\": \"spam|relevant|community\", \"confidence\": 0.0-1.0}]"
+)
+
+
+def normalize_comment(text: str) -> str:
+    """Lowercase and collapse whitespace so trivially different comments share a cache entry"""
+    return _WHITESPACE_RE.sub(" ", (text or "").lower()).strip()
+
+
+def comment_hash(text: str) -> str:
+    """Stable digest of a normalized comment, used as the classification cache key"""
+    return hashlib.sha256(normalize_comment(text).encode("utf-8")).hexdigest()
+
+
+def fallback_classify(text: str) -> Tuple[str, float]:
+    """Keyword-based classifier used when the LLM is unavailable"""
+    categories = _CATEGORY_MATCHER.matched_values(text)
+    if categories:
+        return categories[0], 0.8
+
+    # Default to relevant if no patterns match
+    return "relevant", 0.6
+
+
+def classify_locally(text: str) -> Optional[Tuple[str, float]]:
+    """
+    Resolve a comment without the LLM when the answer is unambiguous.
+
+    Returns:
+        (category, confidence), or None when the comment needs the LLM
+    """
+    normalized = normalize_comment(text)
+    if not normalized:
+        return "spam", 0.9
+
+    words = _PUNCTUATION_RE.sub("", normalized).split()
+    if not words or (len(words) == 1 and words[0] in LOW_VALUE_COMMENTS):
+        return "spam", 0.9
+    if len(words) > 2 and len(set(words)) == 1:
+        # The same word repeated, e.g. "moon moon moon"
+        return "spam", 0.9
+
+    categories = _CATEGORY_MATCHER.matched_values(normalized)
+    if categories:
+        return categories[0], 0.8
+
+    return None
+
+
+def _parse_batch_response(ai_response: str, expected: int) -> Dict[int, Tuple[str, float]]:
+    """Parse the JSON array returned for a batched prompt, ignoring malformed entries"""
+    start, end = ai_response.find("["), ai_response.rfind("]")
+    if start == -1 or end <= start:
+        return {}
+
+    try:
+        items = json.loads(ai_response[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+
+    parsed: Dict[int, Tuple[str, float]] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("id"))
+            category = str(item.get("category", "")).strip().lower()
+            confidence = min(max(float(item.get("confidence", 0.7)), 0.0), 1.0)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= index <= expected and category in CATEGORIES:
+            parsed[index - 1] = (category, confidence)
+    return parsed
+
+
+async def _classify_llm_batch(texts: List[str]) -> List[Optional[Tuple[str, float]]]:
+    """
+    Classify up to LLM_BATCH_SIZE comments with a single OpenRouter call.
+
+    Entries the model did not answer (or every entry, if the call failed) are None.
+    """
+    comments = [
+        {"id": index + 1, "text": text[:LLM_MAX_COMMENT_CHARS]}
+        for index, text in enumerate(texts)
+    ]
+
+    parsed: Dict[int, Tuple[str, float]] = {}
+    try:
+        # Classifications are cached per comment below, so skip the gateway's prompt cache
+        result = await get_llm_gateway().chat(
+            [
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": json.dumps(comments, ensure_ascii=False)}
+            ],
+            model=settings.OPENROUTER_MODEL,
+            temperature=0.3,
+            title="Social Suit Comment Classification",
+            cache_ttl=0
+        )
+        ai_response = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        parsed = _parse_batch_response(ai_response, len(texts))
+        if len(parsed) < len(texts):
+            logger.warning(f"Batched classification answered {len(parsed)}/{len(texts)} comments. Using fallback for the rest.")
+    except httpx.TimeoutException as e:
+        logger.warning(f"DeepSeek API timeout during batched classification: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        logger.error(f"DeepSeek API HTTP error during batched classification: {e.response.status_code} - {str(e)}")
+    except Exception as e:
+        logger.error(f"Error calling OpenRouter API for batched classification: {str(e)}")
+
+    return [parsed.get(index) for index in range(len(texts))]
+
+
+async def classify_comments_batch(texts: List[str], batch_size: int = LLM_BATCH_SIZE,
+                                  max_concurrency: int = LLM_MAX_CONCURRENCY) -> Tuple[List[Tuple[str, float]], Dict[str, int]]:
+    """
+    Classify many comments with as few LLM calls as possible.
+
+    Each distinct normalized comment is resolved by, in order: the local
+    keyword matcher, the Redis classification cache, and finally batched
+    LLM prompts run with bounded concurrency. LLM results are cached.
+
+    Args:
+        texts: Comment texts to classify
+        batch_size: Maximum number of comments per LLM prompt
+        max_concurrency: Maximum number of LLM prompts in flight
+
+    Returns:
+        A list of (category, confidence) aligned with ``texts``, and counters
+        describing how the comments were resolved
+    """
+    stats = {"local": 0, "cached": 0, "llm": 0, "llm_calls": 0}
+    resolved: Dict[str, Tuple[str, float]] = {}
+    pending: Dict[str, str] = {}  # hash -> representative text
+
+    text_digests = [comment_hash(text) for text in texts]
+    for text, digest in zip(texts, text_digests):
+        if digest in resolved or digest in pending:
+            continue
+        local = classify_locally(text)
+        if local:
+            resolved[digest] = local
+            stats["local"] += 1
+        else:
+            pending[digest] = text
+
+    if pending:
+        digests = list(pending)
+        cached = await RedisManager.cache_get_many([f"{CLASSIFICATION_CACHE_PREFIX}:{digest}" for digest in digests])
+        for digest, value in zip(digests, cached):
+            if isinstance(value, dict) and value.get("category") in CATEGORIES:
+                resolved[digest] = (value["category"], float(value.get("confidence", 0.7)))
+                stats["cached"] += 1
+                del pending[digest]
+
+    if pending:
+        digests = list(pending)
+        chunks = [digests[i:i + batch_size] for i in range(0, len(digests), batch_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_chunk(chunk: List[str]) -> List[Optional[Tuple[str, float]]]:
+            async with semaphore:
+                return await _classify_llm_batch([pending[digest] for digest in chunk])
+
+        chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+
+        cache_operations = []
+        for chunk, results in zip(chunks, chunk_results):
+            for digest, result in zip(chunk, results):
+                if result is None:
+                    # Not cached, so the next run asks the LLM again
+                    resolved[digest] = fallback_classify(pending[digest])
+                    continue
+                category, confidence = result
+                resolved[digest] = result
+                cache_operations.append({
+                    "key": f"{CLASSIFICATION_CACHE_PREFIX}:{digest}",
+                    "value": {"category": category, "confidence": confidence},
+                    "ttl": CLASSIFICATION_CACHE_TTL
+                })
+        stats["llm"] += len(digests)
+        stats["llm_calls"] += len(chunks)
+        if cache_operations:
+            await RedisManager.warm_cache_batch(cache_operations)
+
+    return [resolved[digest] for digest in text_digests], stats
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.database.database import get_db_session
+from services.database.redis import RedisManager
+from services.models.custom_reply_model import CustomReply
+from services.utils.keyword_matcher import KeywordMatcher
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class CustomReplyRuleSet:
+    """
+    A brand's custom replies compiled for constant-cost lookups.
+
+    Matching mirrors the original query-based behaviour: a rule for the
+    detected intent wins, otherwise the first rule whose keyword occurs in
+    the message. Only rules for the message's platform or "general" apply.
+    Rules are ordered by id, so "first" is stable.
+    """
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.rules = sorted(rules, key=lambda rule: rule["id"])
+        self._by_intent: Dict[str, List[int]] = {}
+        self._keywords = KeywordMatcher()
+
+        for index, rule in enumerate(self.rules):
+            self._by_intent.setdefault(rule["intent"], []).append(index)
+            self._keywords.add(rule["keyword"], index)
+        self._keywords.build()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, message: str, platform: str, intent: str) -> Optional[Dict[str, Any]]:
+        """Return the rule that answers ``message``, or None."""
+        platforms = (platform, "general")
+
+        for index in self._by_intent.get(intent, ()):
+            if self.rules[index]["platform"] in platforms:
+                return self.rules[index]
+
+        for index in self._keywords.matched_values(message):
+            if self.rules[index]["platform"] in platforms:
+                return self.rules[index]
+
+        return None
+
+
+class CustomReplyCache:
+    """
+    Two-tier cache of compiled custom-reply rule sets, keyed by brand.
+
+    Rule rows live in Redis next to a per-brand version counter; each worker
+    keeps the compiled rule sets in a bounded in-process LRU. Changing a rule
+    bumps the version, which every worker notices within
+    VERSION_CHECK_INTERVAL seconds. Postgres is only read when Redis has no
+    rows for the current version. The version counter never expires: a
+    counter that restarted from zero could match a stale local copy.
+    """
+
+    RULES_KEY = "engagement:custom_replies:{brand_id}"
+    VERSION_KEY = "engagement:custom_replies:version:{brand_id}"
+    RULES_CACHE_TTL = 3600            # 1 hour for serialized rule rows
+    VERSION_CHECK_INTERVAL = 5        # Seconds a worker trusts its local copy
+    MAX_LOCAL_BRANDS = 1024
+
+    # brand_id -> (version, rule set, last version check)
+    _local: "OrderedDict[str, Tuple[int, CustomReplyRuleSet, float]]" = OrderedDict()
+
+    @classmethod
+    async def get_rule_set(cls, brand_id: str) -> CustomReplyRuleSet:
+        """Return the compiled rule set for a brand, loading it if needed."""
+        entry = cls._local.get(brand_id)
+        now = time.monotonic()
+        if entry and now - entry[2] < cls.VERSION_CHECK_INTERVAL:
+            cls._local.move_to_end(brand_id)
+            return entry[1]
+
+        version_value, cached = await RedisManager.cache_get_many([
+            cls.VERSION_KEY.format(brand_id=brand_id),
+            cls.RULES_KEY.format(brand_id=brand_id)
+        ])
+        version = int(version_value or 0)
+
+        if entry and entry[0] == version:
+            cls._remember(brand_id, version, entry[1], now)
+            return entry[1]
+
+        if isinstance(cached, dict) and cached.get("version") == version:
+            rules = cached.get("rules", [])
+        else:
+            rules = await asyncio.to_thread(cls._load_rules_from_db, brand_id)
+            await RedisManager.cache_set(
+                cls.RULES_KEY.format(brand_id=brand_id),
+                {"version": version, "rules": rules},
+                ttl_seconds=cls.RULES_CACHE_TTL
+            )
+
+        rule_set = CustomReplyRuleSet(rules)
+        cls._remember(brand_id, version, rule_set, now)
+        return rule_set
+
+    @classmethod
+    async def invalidate(cls, brand_id: str) -> None:
+        """Drop cached rules for a brand after one of its rules changed."""
+        cls._local.pop(brand_id, None)
+        await RedisManager.cache_increment(cls.VERSION_KEY.format(brand_id=brand_id))
+        await RedisManager.cache_delete(cls.RULES_KEY.format(brand_id=brand_id))
+
+    @classmethod
+    def clear_local(cls) -> None:
+        """Forget every in-process rule set."""
+        cls._local.clear()
+
+    @classmethod
+    def _remember(cls, brand_id: str, version: int, rule_set: CustomReplyRuleSet, checked_at: float) -> None:
+        cls._local[brand_id] = (version, rule_set, checked_at)
+        cls._local.move_to_end(brand_id)
+        while len(cls._local) > cls.MAX_LOCAL_BRANDS:
+            cls._local.popitem(last=False)
+
+    @staticmethod
+    def _load_rules_from_db(brand_id: str) -> List[Dict[str, Any]]:
+        """Read a brand's rules from Postgres (blocking; run off the event loop)."""
+        db = get_db_session()
+        try:
+            rows = db.query(CustomReply).filter(
+                CustomReply.brand_id == brand_id
+            ).order_by(CustomReply.id).all()
+            return [
+                {
+                    "id": row.id,
+                    "intent": row.intent,
+                    "keyword": row.keyword,
+                    "custom_reply": row.custom_reply,
+                    "platform": row.platform
+                }
+                for row in rows
+            ]
+        finally:
+            db.close()
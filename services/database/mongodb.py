@@ -43,8 +43,13 @@ class MongoDBManager:
     _indexes_created: bool = False
     
     @classmethod
-    async def initialize(cls):
-        """Initialize the MongoDB connection pool and create indexes"""
+    async def initialize(cls, create_indexes: bool = True):
+        """Initialize the MongoDB connection pool and create indexes
+        
+        Args:
+            create_indexes: Also build the indexes. The API skips this at startup and
+                builds them in the background, or leaves them to scripts/create_mongo_indexes.py.
+        """
         MONGO_URL = os.getenv("MONGO_URL")
         if not MONGO_URL:
             raise ConfigurationError("MONGO_URL environment variable not set")
@@ -66,7 +71,8 @@ class MongoDBManager:
             logger.info("✅ Successfully connected to MongoDB")
             
             # Create indexes for better query performance
-            await cls.create_indexes()
+            if create_indexes:
+                await cls.create_indexes()
         except ConnectionFailure as e:
             logger.error(f"🚨 MongoDB connection failed: {e}")
             raise
@@ -99,10 +105,21 @@ class MongoDBManager:
             await cls._db.ab_tests.create_index([('user_id', 1), ('status', 1)])
             await cls._db.ab_tests.create_index([('test_id', 1)], unique=True)
             await cls._db.ab_tests.create_index([('end_date', 1)])
+            # One summary per test; concurrent first updates rely on it to seed only once
+            await cls._db.ab_test_summaries.create_index([('test_id', 1)], name="ab_summaries_test_idx", unique=True)
+            
+            # Inbox comment indexes
+            await cls._db.comments.create_index([('id', 1)], unique=True)
+            await cls._db.comments.create_index([('category', 1), ('timestamp', -1)])
             
             # Scheduled posts indexes (if using MongoDB for this)
             await cls._db.scheduled_posts.create_index([('user_id', 1), ('platform', 1)])
             await cls._db.scheduled_posts.create_index([('scheduled_time', 1), ('status', 1)])
+
+            # One posting time model per user and platform; concurrent bootstraps rely on it
+            await cls._db.posting_time_models.create_index(
+                [('user_id', 1), ('platform', 1)], name="posting_time_models_user_platform_idx", unique=True
+            )
             
             cls._indexes_created = True
             logger.info("✅ MongoDB indexes created successfully")
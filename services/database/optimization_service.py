@@ -14,12 +14,9 @@ from functools import wraps
 import time
 import json
 
-from services.database.mongodb import MongoDBManager, DatabaseOptimizationService as MongoOptimizer
+from services.database.mongodb import MongoDBManager
 from services.database.redis import RedisManager
 from services.database.postgresql import get_db_connection
-from services.database.supabase import SupabaseManager
-from services.analytics.cache_service import AnalyticsCacheService
-from services.scheduler.cache_service import SchedulerCacheService
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -566,11 +563,26 @@ class ComprehensiveDatabaseOptimizer:
     """
     
     def __init__(self):
-        self.mongodb_optimizer = MongoOptimizer()
+        self.mongodb_optimizer = MongoDBManager
         self.redis_manager = RedisManager()
-        self.supabase_manager = SupabaseManager()
-        self.analytics_cache = AnalyticsCacheService()
-        self.scheduler_cache = SchedulerCacheService()
+        self._analytics_cache = None
+        self._scheduler_cache = None
+
+    # The cache services import this module for DatabaseOptimizationService, so they
+    # are imported on first use rather than while this module is being loaded
+    @property
+    def analytics_cache(self):
+        if self._analytics_cache is None:
+            from services.analytics.cache_service import AnalyticsCacheService
+            self._analytics_cache = AnalyticsCacheService()
+        return self._analytics_cache
+
+    @property
+    def scheduler_cache(self):
+        if self._scheduler_cache is None:
+            from services.scheduler.cache_service import SchedulerCacheService
+            self._scheduler_cache = SchedulerCacheService()
+        return self._scheduler_cache
     
     async def run_full_optimization(self) -> Dict[str, Any]:
         """
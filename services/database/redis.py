@@ -3,6 +3,7 @@ import logging
 import json
 import time
 from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Optional, Dict, Any, List, Union, Callable
 from datetime import datetime, timedelta
@@ -58,8 +59,13 @@ class RedisManager:
     _cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
 
     @classmethod
-    async def initialize(cls):
-        """Initialize Redis connection pool"""
+    async def initialize(cls, clear_expired: bool = True):
+        """Initialize Redis connection pool
+        
+        Args:
+            clear_expired: Also sweep the keyspace for keys without a TTL. The API
+                skips this at startup and runs the sweep in the background.
+        """
         try:
             cls._pool = Redis.from_url(
                 os.getenv("REDIS_URL", "redis://localhost:6379"),
@@ -74,7 +80,8 @@ class RedisManager:
             logger.info("✅ Redis connection pool initialized")
             
             # Clear expired cache entries on startup
-            await cls.clear_expired_cache()
+            if clear_expired:
+                await cls.clear_expired_cache()
         except Exception as e:
             logger.error(f"❌ Failed to connect to Redis: {e}")
             raise
@@ -147,6 +154,21 @@ class RedisManager:
             logger.error(f"❌ Failed to set cache key {key}: {e}")
             return False
     
+    @classmethod
+    async def cache_set_if_absent(cls, key: str, value: Any, ttl_seconds: int = 300) -> bool:
+        """Set a value only if the key does not exist (SET NX); True if this call set it"""
+        if not cls._pool:
+            await cls.initialize()
+
+        try:
+            if not isinstance(value, (str, int, float, bool)):
+                value = json.dumps(value)
+
+            return bool(await cls._pool.set(key, value, ex=ttl_seconds, nx=True))
+        except Exception as e:
+            logger.error(f"❌ Failed to set cache key {key}: {e}")
+            return False
+
     @classmethod
     async def cache_get(cls, key: str, default: Any = None) -> Any:
         """Get a value from the cache with automatic deserialization"""
@@ -171,6 +193,81 @@ class RedisManager:
             logger.error(f"❌ Failed to get cache key {key}: {e}")
             return default
     
+    @classmethod
+    async def cache_get_many(cls, keys: List[str]) -> List[Any]:
+        """Get several values in one round trip; missing keys come back as None"""
+        if not keys:
+            return []
+        if not cls._pool:
+            await cls.initialize()
+
+        try:
+            values = await cls._pool.mget(keys)
+        except Exception as e:
+            logger.error(f"❌ Failed to get {len(keys)} cache keys: {e}")
+            return [None] * len(keys)
+
+        result = []
+        for value in values:
+            if value is None:
+                cls._cache_stats["misses"] += 1
+                result.append(None)
+                continue
+
+            cls._cache_stats["hits"] += 1
+            try:
+                result.append(json.loads(value))
+            except (json.JSONDecodeError, TypeError):
+                result.append(value)
+        return result
+
+    @classmethod
+    async def cache_pop(cls, key: str, default: Any = None) -> Any:
+        """Atomically get and delete a key, so only one caller can ever consume it"""
+        if not cls._pool:
+            await cls.initialize()
+
+        try:
+            try:
+                value = await cls._pool.getdel(key)
+            except ResponseError:
+                # GETDEL needs Redis 6.2+; a MULTI/EXEC pipeline gives the same guarantee
+                async with cls._pool.pipeline(transaction=True) as pipe:
+                    value, _ = await pipe.get(key).delete(key).execute()
+        except Exception as e:
+            logger.error(f"❌ Failed to pop cache key {key}: {e}")
+            return default
+
+        if value is None:
+            return default
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return value
+
+    # Compare-and-delete in one step, so a wrong guess never consumes the key
+    _POP_IF_EQUAL_SCRIPT = """
+        if redis.call('GET', KEYS[1]) == ARGV[1] then
+            return redis.call('DEL', KEYS[1])
+        end
+        return 0
+    """
+
+    @classmethod
+    async def cache_pop_if_equal(cls, key: str, expected: Any) -> bool:
+        """Atomically delete a key only if it holds ``expected``; True if this call deleted it"""
+        if not cls._pool:
+            await cls.initialize()
+
+        try:
+            if not isinstance(expected, (str, int, float, bool)):
+                expected = json.dumps(expected)
+
+            return bool(await cls._pool.eval(cls._POP_IF_EQUAL_SCRIPT, 1, key, expected))
+        except Exception as e:
+            logger.error(f"❌ Failed to pop cache key {key}: {e}")
+            return False
+
     @classmethod
     async def cache_delete(cls, key: str) -> bool:
         """Delete a key from the cache"""
@@ -620,8 +717,9 @@ async def set_nonce(user_id: str, nonce: str, ttl: int = 300) -> bool:
     return await RedisManager.cache_set(f"nonce:{user_id}", nonce, ttl_seconds=ttl)
 
 async def verify_nonce(user_id: str, nonce: str) -> bool:
-    stored_nonce = await RedisManager.cache_get(f"nonce:{user_id}")
-    return stored_nonce == nonce
+    # Single use: the nonce is removed in the same operation that reads it
+    stored_nonce = await RedisManager.cache_pop(f"nonce:{user_id}")
+    return stored_nonce is not None and stored_nonce == nonce
 
 # Convenience functions for rate limiting
 async def get_redis() -> Redis:
@@ -337,7 +337,10 @@ async def update_ab_test_metrics(
         if "user_id" in test_details and test_details["user_id"] != str(current_user.id):
             raise HTTPException(status_code=403, detail="You do not have permission to update this test")
             
-        # Update metrics
+        if variation not in test_details.get("variations", {}):
+            raise HTTPException(status_code=400, detail=f"Unknown variation: {variation}")
+            
+        # Metrics are deltas added to the variation's running counters
         metrics_dict = metrics.dict()
         success = await update_test_metrics(test_id, variation, metrics_dict)
         
@@ -345,6 +348,8 @@ async def update_ab_test_metrics(
             raise Exception("Failed to update metrics")
             
         return {"success": True, "message": "Metrics updated successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(status_code=404, detail=f"A/B test not found: {str(e)}")
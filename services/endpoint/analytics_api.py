@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Path
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Any
 import asyncio
@@ -9,10 +9,9 @@ from services.repositories.user_repository import UserRepository
 from services.dependencies.repository_providers import get_user_repository
 from services.dependencies.service_providers import (
     get_analytics_analyzer_service,
-    get_analytics_collector_service,
     get_chart_generator_service
 )
-from services.analytics.services.data_collector_service import collect_all_platform_data
+from services.analytics.collection_jobs import enqueue_collection
 from services.utils.logger_config import setup_logger
 
 # Set up logger
@@ -21,39 +20,26 @@ logger = setup_logger("analytics_api")
 # Create router
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
-# Background task to collect analytics data
-async def collect_analytics_background(user_id: str, days_back: int = 7):
-    """Background task to collect analytics data for a user"""
-    try:
-        logger.info(f"Starting background analytics collection for user {user_id}")
-        result = await collect_all_platform_data(user_id, days_back)
-        logger.info(f"Completed analytics collection for user {user_id}: {result}")
-    except Exception as e:
-        logger.error(f"Error in background analytics collection for user {user_id}: {str(e)}")
-
-@router.post("/collect/{user_id}")
+@router.post("/collect/{user_id}", status_code=202)
 async def trigger_data_collection(
     user_id: str, 
     days_back: int = Query(7, ge=1, le=90), 
-    background_tasks: BackgroundTasks = None, 
-    user_repository: UserRepository = Depends(get_user_repository),
-    collector_service = Depends(get_analytics_collector_service)
+    user_repository: UserRepository = Depends(get_user_repository)
 ):
-    """Trigger collection of analytics data for a user"""
+    """Queue collection of analytics data for a user, or join the collection already running"""
     # Verify user exists
     user = user_repository.get_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     try:
-        if background_tasks:
-            # Run in background
-            background_tasks.add_task(collect_analytics_background, user_id, days_back)
-            return {"message": f"Analytics collection started for user {user_id}", "status": "processing"}
-        else:
-            # Run immediately (may timeout for large data collections)
-            result = await collect_all_platform_data(user_id, days_back, collector_service)
-            return {"message": f"Analytics collection completed for user {user_id}", "status": "completed", "result": result}
+        job, created = await enqueue_collection(user_id, days_back)
+        return {
+            "message": f"Analytics collection {'queued' if created else 'already in progress'} for user {user_id}",
+            "status": job["status"],
+            "job_id": job["job_id"],
+            "progress": job["progress"]
+        }
     except Exception as e:
         logger.error(f"Error triggering analytics collection: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error collecting analytics data: {str(e)}")
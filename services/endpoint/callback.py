@@ -32,7 +32,7 @@ async def callback_meta(
     Meta (FB/IG) redirects here with ?code=&user_id=
     """
     try:
-        result = exchange_meta(code, user_id)
+        result = await exchange_meta(code, user_id)
         return PlatformAuthResponse(
             success=True,
             platform="meta",
@@ -52,7 +52,7 @@ async def callback_linkedin(
     LinkedIn redirects here with ?code=
     """
     try:
-        result = exchange_linkedin(code, user_id)
+        result = await exchange_linkedin(code, user_id)
         return PlatformAuthResponse(
             success=True,
             platform="linkedin",
@@ -72,7 +72,7 @@ async def callback_twitter(
     Twitter redirects here with ?code=
     """
     try:
-        result = exchange_twitter(code, user_id)
+        result = await exchange_twitter(code, user_id)
         return PlatformAuthResponse(
             success=True,
             platform="twitter",
@@ -91,7 +91,7 @@ async def callback_youtube(
     YouTube redirects here with ?code=
     """
     try:
-        result = exchange_youtube(code, user_id)
+        result = await exchange_youtube(code, user_id)
         return JSONResponse(content={"success": True, "details": result})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -105,7 +105,7 @@ async def callback_tiktok(
     TikTok redirects here with ?code=
     """
     try:
-        result = exchange_tiktok(code, user_id)
+        result = await exchange_tiktok(code, user_id)
         return JSONResponse(content={"success": True, "details": result})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -117,7 +117,7 @@ async def callback_farcaster(
     nonce: str = Query(...)
 ):
     try:
-        result = exchange_farcaster(signature=signature, address=address, nonce=nonce)
+        result = await exchange_farcaster(signature=signature, address=address, nonce=nonce)
         return JSONResponse(content={"success": True, "details": result})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -129,7 +129,7 @@ async def callback_telegram(
     channel_id: str = Query(...)
 ):
     try:
-        result = exchange_telegram(bot_token=bot_token, channel_id=channel_id)
+        result = await exchange_telegram(bot_token=bot_token, channel_id=channel_id)
         return JSONResponse(content={"success": True, "details": result})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -13,28 +13,28 @@ router = APIRouter(prefix="/callback")
 
 @router.get("/meta")
 async def callback_meta(code: str = Query(...), user_id: str = Query(...)):
-    return exchange_meta(code, user_id)
+    return await exchange_meta(code, user_id)
 
 @router.get("/twitter")
 async def callback_twitter(code: str = Query(...), user_id: str = Query(...)):
-    return exchange_twitter(code, user_id)
+    return await exchange_twitter(code, user_id)
 
 @router.get("/linkedin")
 async def callback_linkedin(code: str = Query(...), user_id: str = Query(...)):
-    return exchange_linkedin(code, user_id)
+    return await exchange_linkedin(code, user_id)
 
 @router.get("/youtube")
 async def callback_youtube(code: str = Query(...), user_id: str = Query(...)):
-    return exchange_youtube(code, user_id)
+    return await exchange_youtube(code, user_id)
 
 @router.get("/tiktok")
 async def callback_tiktok(code: str = Query(...), user_id: str = Query(...)):
-    return exchange_tiktok(code, user_id)
+    return await exchange_tiktok(code, user_id)
 
 @router.get("/farcaster")
 async def callback_farcaster(signature: str = Query(...), address: str = Query(...)):
-    return handle_farcaster_callback(signature=signature, address=address)
+    return await handle_farcaster_callback(signature=signature, address=address)
 
 @router.post("/telegram")
 async def callback_telegram(bot_token: str = Query(...), channel_id: str = Query(...)):
-    return handle_telegram_callback(bot_token=bot_token, channel_id=channel_id)
\ No newline at end of file
+    return await handle_telegram_callback(bot_token=bot_token, channel_id=channel_id)
\ No newline at end of file
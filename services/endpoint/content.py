@@ -17,6 +17,9 @@ class CaptionResponse(BaseModel):
             }
         }
 
+# Shared instance; HTTP connections are pooled by the LLM gateway
+ai = OpenRouterAI()
+
 router = APIRouter(
     prefix="/content", 
     tags=["AI Content"],
@@ -68,8 +71,7 @@ async def generate_caption(
         HTTPException: If caption generation fails
     """
     try:
-        ai = OpenRouterAI()
-        caption = ai.generate_caption(prompt, style, hashtags)
+        caption = await ai.generate_caption_async(prompt, tone=style, hashtags=hashtags)
         return {"caption": caption}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate caption: {str(e)}")
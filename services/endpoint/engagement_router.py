@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from services.database.database import get_db
 from services.models.custom_reply_model import CustomReply
+from services.custom_reply_cache import CustomReplyCache
 from services.auth.auth_guard import auth_required
 from services.models.user_model import User
 
@@ -62,6 +63,7 @@ async def create_custom_reply(
     db.add(db_custom_reply)
     db.commit()
     db.refresh(db_custom_reply)
+    await CustomReplyCache.invalidate(db_custom_reply.brand_id)
     
     return db_custom_reply
 
@@ -152,6 +154,7 @@ async def update_custom_reply(
     
     db.commit()
     db.refresh(db_custom_reply)
+    await CustomReplyCache.invalidate(db_custom_reply.brand_id)
     
     return db_custom_reply
 
@@ -180,5 +183,6 @@ async def delete_custom_reply(
     
     db.delete(db_custom_reply)
     db.commit()
+    await CustomReplyCache.invalidate(str(current_user.id))
     
     return None
\ No newline at end of file
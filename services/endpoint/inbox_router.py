@@ -10,7 +10,10 @@ import logging
 from services.auth.auth_guard import auth_required
 from services.models.user_model import User
 from services.database.mongodb import MongoDBManager
+from services.comment_classifier import classify_comments_batch, fallback_classify
+from services.llm_gateway import get_llm_gateway
 from core.config import settings
+from utils.json_response import fast_json_response
 
 # Create router
 router = APIRouter(
@@ -21,6 +24,7 @@ router = APIRouter(
 
 # Constants
 COMMENTS_COLLECTION = "comments"
+MAX_BATCH_CLASSIFICATION = 5000
 
 # Comment schema model
 class CommentBase(BaseModel):
@@ -97,6 +101,41 @@ class ClassificationResponse(BaseModel):
             }
         }
 
+class BatchClassificationRequest(BaseModel):
+    """
+    Model for requesting classification of many comments at once.
+    """
+    comment_ids: Optional[List[str]] = Field(
+        None,
+        description="IDs of the comments to classify. When omitted, unclassified comments are classified"
+    )
+    limit: int = Field(
+        500,
+        ge=1,
+        le=MAX_BATCH_CLASSIFICATION,
+        description="Maximum number of unclassified comments to pick up when comment_ids is omitted"
+    )
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "comment_ids": [
+                    "550e8400-e29b-41d4-a716-446655440000",
+                    "6fa459ea-ee8a-3ca4-894e-db77e160355e"
+                ]
+            }
+        }
+
+class BatchClassificationResponse(BaseModel):
+    """
+    Model for batch classification response.
+    """
+    results: List[ClassificationResponse] = Field(..., description="Classification result for each comment")
+    local_matches: int = Field(..., description="Distinct comments resolved by the keyword matcher")
+    cache_hits: int = Field(..., description="Distinct comments resolved from the classification cache")
+    llm_classified: int = Field(..., description="Distinct comments sent to the LLM")
+    llm_calls: int = Field(..., description="Number of batched LLM requests made")
+
 
 # GET endpoints
 @router.get(
@@ -106,6 +145,7 @@ class ClassificationResponse(BaseModel):
     description="Retrieves all comments from all platforms",
     response_description="Returns a list of all comments"
 )
+@fast_json_response
 async def get_all_comments(
     skip: int = Query(0, description="Number of comments to skip"),
     limit: int = Query(50, description="Maximum number of comments to return"),
@@ -145,6 +185,7 @@ async def get_all_comments(
     description="Retrieves comments filtered by category (relevant, community, spam)",
     response_description="Returns a list of filtered comments"
 )
+@fast_json_response
 async def get_filtered_comments(
     category: str,
     skip: int = Query(0, description="Number of comments to skip"),
@@ -285,54 +326,96 @@ async def classify_comment(
         raise HTTPException(status_code=500, detail=f"Failed to classify comment: {str(e)}")
 
 
-async def classify_with_deepseek(comment_text: str) -> tuple[str, float]:
+# POST endpoint for classifying comments in bulk
+@router.post(
+    "/classify/batch",
+    response_model=BatchClassificationResponse,
+    summary="Classify Comments in Bulk",
+    description="Classifies many comments using a keyword matcher, a result cache and batched OpenRouter DeepSeek prompts",
+    response_description="Returns the classification result for every comment"
+)
+async def classify_comments(
+    batch_request: BatchClassificationRequest = Body(..., description="The comments to classify"),
+    current_user: User = Depends(auth_required)
+):
     """
-    Classify a comment using OpenRouter DeepSeek API with robust fallback logic.
+    Classify many comments with a handful of LLM calls.
+    
+    Comments with an unambiguous keyword match are resolved locally, previously
+    seen texts come from the cache, and the rest are packed into batched prompts.
     
     Args:
-        comment_text: The text of the comment to classify
+        batch_request: The comment IDs to classify, or a limit of unclassified comments
+        current_user: The authenticated user (injected by dependency)
         
     Returns:
-        A tuple containing the category and confidence score
+        The classification results and how they were obtained
     """
-    # Define a simple keyword-based fallback classifier
-    def fallback_classify(text: str) -> tuple[str, float]:
-        text = text.lower()
-        
-        # Spam indicators
-        spam_keywords = [
-            "buy now", "click here", "free offer", "limited time", "discount code",
-            "www.", "http:", "https:", "earn money", "make money", "$$$",
-            "casino", "lottery", "viagra", "cialis", "weight loss", "diet pill"
-        ]
+    if batch_request.comment_ids is not None and len(batch_request.comment_ids) > MAX_BATCH_CLASSIFICATION:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_CLASSIFICATION} comments can be classified per request"
+        )
+    
+    try:
+        if batch_request.comment_ids is not None:
+            query = {"id": {"$in": batch_request.comment_ids}}
+            limit = len(batch_request.comment_ids)
+        else:
+            query = {"category": "all"}
+            limit = batch_request.limit
         
-        # Community indicators
-        community_keywords = [
-            "love your content", "great page", "following you", "big fan",
-            "keep it up", "love your work", "awesome profile", "nice feed"
-        ]
+        comments = await MongoDBManager.find_with_options(
+            collection=COMMENTS_COLLECTION,
+            query=query,
+            projection={"_id": 0, "id": 1, "comment_text": 1},
+            limit=limit
+        )
+        if not comments:
+            return BatchClassificationResponse(
+                results=[], local_matches=0, cache_hits=0, llm_classified=0, llm_calls=0
+            )
         
-        # Check for spam first (higher priority)
-        for keyword in spam_keywords:
-            if keyword in text:
-                return "spam", 0.8
+        classifications, stats = await classify_comments_batch(
+            [comment.get("comment_text", "") for comment in comments]
+        )
         
-        # Then check for community comments
-        for keyword in community_keywords:
-            if keyword in text:
-                return "community", 0.8
+        # One update per category instead of one per comment
+        ids_by_category: Dict[str, List[str]] = {}
+        for comment, (category, _) in zip(comments, classifications):
+            ids_by_category.setdefault(category, []).append(comment["id"])
+        for category, ids in ids_by_category.items():
+            await MongoDBManager._db[COMMENTS_COLLECTION].update_many(
+                {"id": {"$in": ids}},
+                {"$set": {"category": category}}
+            )
         
-        # Default to relevant if no patterns match
-        return "relevant", 0.6
-    
-    # Prepare the request to OpenRouter API
-    headers = {
-        "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://social-suit.com",
-        "X-Title": "Social Suit Comment Classification"
-    }
+        return BatchClassificationResponse(
+            results=[
+                ClassificationResponse(comment_id=comment["id"], category=category, confidence=confidence)
+                for comment, (category, confidence) in zip(comments, classifications)
+            ],
+            local_matches=stats["local"],
+            cache_hits=stats["cached"],
+            llm_classified=stats["llm"],
+            llm_calls=stats["llm_calls"]
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to classify comments: {str(e)}")
+
+
+async def classify_with_deepseek(comment_text: str) -> tuple[str, float]:
+    """
+    Classify a comment using OpenRouter DeepSeek API with robust fallback logic.
     
+    Args:
+        comment_text: The text of the comment to classify
+        
+    Returns:
+        A tuple containing the category and confidence score
+    """
     # Prepare the prompt for classification
     system_prompt = (
         "You are an AI that classifies social media comments into one of three categories:\n"
@@ -343,50 +426,40 @@ async def classify_with_deepseek(comment_text: str) -> tuple[str, float]:
         "Format your response exactly like this: 'category: [category], confidence: [score]'"
     )
     
-    payload = {
-        "model": settings.OPENROUTER_MODEL,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": comment_text}
-        ],
-        "temperature": 0.3  # Lower temperature for more consistent classification
-    }
-    
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:  # Reduced timeout for better UX
-            response = await client.post(
-                settings.OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            
-            # Check if the request was successful
-            response.raise_for_status()
-            
-            # Parse the response
-            result = response.json()
-            ai_response = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        # The shared gateway pools connections and caches identical prompts
+        result = await get_llm_gateway().chat(
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": comment_text}
+            ],
+            model=settings.OPENROUTER_MODEL,
+            temperature=0.3,  # Lower temperature for more consistent classification
+            title="Social Suit Comment Classification"
+        )
+        
+        ai_response = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        
+        # Extract category and confidence from the response
+        # Expected format: "category: [category], confidence: [score]"
+        try:
+            category_part = ai_response.split("category:")[1].split(",")[0].strip().lower()
+            confidence_part = ai_response.split("confidence:")[1].strip()
+            confidence = float(confidence_part)
             
-            # Extract category and confidence from the response
-            # Expected format: "category: [category], confidence: [score]"
-            try:
-                category_part = ai_response.split("category:")[1].split(",")[0].strip().lower()
-                confidence_part = ai_response.split("confidence:")[1].strip()
-                confidence = float(confidence_part)
-                
-                # Validate the category
-                if category_part in ["spam", "relevant", "community"]:
-                    category = category_part
-                else:
-                    # Use fallback classifier if AI response doesn't match expected categories
-                    logging.warning(f"Unexpected DeepSeek classification response: {ai_response}. Using fallback.")
-                    return fallback_classify(comment_text)
-                    
-                return category, confidence
-            except (IndexError, ValueError):
-                # If parsing fails, use fallback classifier
-                logging.warning(f"Failed to parse DeepSeek response: {ai_response}. Using fallback.")
+            # Validate the category
+            if category_part in ["spam", "relevant", "community"]:
+                category = category_part
+            else:
+                # Use fallback classifier if AI response doesn't match expected categories
+                logging.warning(f"Unexpected DeepSeek classification response: {ai_response}. Using fallback.")
                 return fallback_classify(comment_text)
+                
+            return category, confidence
+        except (IndexError, ValueError):
+            # If parsing fails, use fallback classifier
+            logging.warning(f"Failed to parse DeepSeek response: {ai_response}. Using fallback.")
+            return fallback_classify(comment_text)
     except httpx.TimeoutException as e:
         logging.warning(f"DeepSeek API timeout during comment classification: {str(e)}")
         # Use fallback classifier on timeout
@@ -0,0 +1,37 @@
+import os
+import secrets
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from typing import Optional
+from services.scheduler.queue_telemetry import refresh_queue_metrics
+from services.utils.monitoring import QUEUE_REGISTRY
+
+router = APIRouter(prefix="/queues", tags=["Queue Telemetry"])
+
+# Scrapers and autoscalers send this as a bearer token; the endpoints are disabled while it is unset
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+def _check_token(authorization: Optional[str]) -> None:
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=503, detail="Queue telemetry is disabled: METRICS_TOKEN is not set")
+    if not secrets.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+@router.get("/metrics", summary="Prometheus metrics", description="Refreshes broker queue gauges and returns them in Prometheus text format")
+async def queue_metrics(authorization: Optional[str] = Header(None)):
+    _check_token(authorization)
+    try:
+        await refresh_queue_metrics()
+    except Exception as e:
+        # Still serve the gauges; they keep their last values
+        return Response(generate_latest(QUEUE_REGISTRY), media_type=CONTENT_TYPE_LATEST, headers={"X-Queue-Telemetry-Error": type(e).__name__})
+    return Response(generate_latest(QUEUE_REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+@router.get("/status", summary="Queue status", description="Per-queue depth, lag, reserved and ETA-held counts, and the desired worker count")
+async def queue_status(authorization: Optional[str] = Header(None)):
+    _check_token(authorization)
+    try:
+        return await refresh_queue_metrics()
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Broker unavailable: {str(e)}")
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Depends
 from typing import Optional, Dict, Any, List
 import pytz  # for timezone validation
 from services.smart_schedule import smart_schedule
+from services.scheduler.posting_time_model import get_histogram
+from services.auth.auth_guard import optional_auth
+from services.models.user_model import User
 from pydantic import BaseModel
 
 VALID_PLATFORMS = ["facebook", "instagram", "twitter", "linkedin"]
@@ -14,11 +17,12 @@ class ScheduleResponse(BaseModel):
 router = APIRouter(prefix="/schedule", tags=["Smart Scheduling"])
 
 @router.get("/best-times", response_model=ScheduleResponse, summary="Get optimal posting times", description="Determines the best times to post content based on platform, content type, and audience location")
-def get_schedule(
+async def get_schedule(
     platform: str = Query(..., min_length=1, description="Social media platform (facebook, instagram, twitter, linkedin)"),
     content_type: Optional[str] = Query("post", description="Type of content (post, video, story, etc.)"),
     timezone: Optional[str] = Query("UTC", description="Timezone for scheduling (e.g., UTC, America/New_York)"),
-    audience_location: Optional[str] = Query(None, description="Primary audience location for better targeting")
+    audience_location: Optional[str] = Query(None, description="Primary audience location for better targeting"),
+    current_user: Optional[User] = Depends(optional_auth)
 ):
     # Validate platform
     if platform.lower() not in VALID_PLATFORMS:
@@ -29,11 +33,17 @@ def get_schedule(
         raise HTTPException(status_code=400, detail="Invalid timezone provided.")
 
     try:
+        # Signed-in users get times from their own engagement history
+        engagement_model = None
+        if current_user is not None:
+            engagement_model = await get_histogram(str(current_user.id), platform.lower())
+        
         result = smart_schedule(
             platform=platform,
             content_type=content_type,
             timezone=timezone,
-            audience_location=audience_location
+            audience_location=audience_location,
+            engagement_model=engagement_model
         )
         
         # Format response to match the response model
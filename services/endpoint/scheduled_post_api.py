@@ -321,6 +321,11 @@ async def get_scheduled_post(
             "created_at": post.created_at.isoformat() if post.created_at else None,
             "updated_at": post.updated_at.isoformat() if post.updated_at else None
         }
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Error retrieving scheduled post: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error retrieving scheduled post: {str(e)}")
 
 class UpdatePostRequest(BaseModel):
     """Request model for updating a scheduled post.
@@ -9,7 +9,7 @@ This module provides enhanced analytics endpoints with:
 - Audit logging
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request
 from sqlalchemy.orm import Session
 from typing import Dict, List, Optional, Any
 import asyncio
@@ -22,10 +22,9 @@ from services.repositories.user_repository import UserRepository
 from services.dependencies.repository_providers import get_user_repository
 from services.dependencies.service_providers import (
     get_analytics_analyzer_service,
-    get_analytics_collector_service,
     get_chart_generator_service
 )
-from services.analytics.services.data_collector_service import collect_all_platform_data
+from services.analytics.collection_jobs import enqueue_collection, get_job
 from services.utils.logger_config import setup_logger
 from services.security.validation_models import (
     UserIdValidation,
@@ -37,6 +36,7 @@ from services.security.validation_models import (
 )
 from services.security.rate_limiter import RateLimiter, RateLimitConfig
 from services.auth.auth_guard import auth_required, get_current_user
+from utils.json_response import fast_json_response
 
 # Set up logger
 logger = setup_logger("secure_analytics_api")
@@ -71,29 +71,15 @@ class AnalyticsAuditLogger:
         logger.info(f"AUDIT: Analytics access - User: {user_id}, Requester: {requester_id}, "
                    f"Endpoint: {endpoint}, Success: {success}, Error: {error}")
 
-# Background task to collect analytics data
-async def collect_analytics_background(user_id: str, requester_id: str, days_back: int = 7):
-    """Background task to collect analytics data for a user"""
-    try:
-        logger.info(f"Starting background analytics collection for user {user_id} by {requester_id}")
-        result = await collect_all_platform_data(user_id, days_back)
-        AnalyticsAuditLogger.log_data_collection(user_id, requester_id, days_back, True)
-        logger.info(f"Completed analytics collection for user {user_id}: {result}")
-    except Exception as e:
-        AnalyticsAuditLogger.log_data_collection(user_id, requester_id, days_back, False, str(e))
-        logger.error(f"Error in background analytics collection for user {user_id}: {str(e)}")
-
-@router.post("/collect/{user_id}")
+@router.post("/collect/{user_id}", status_code=202)
 async def trigger_data_collection(
     request: Request,
     user_id: str = Path(..., description="User ID to collect analytics for"),
     days_back: int = Query(7, ge=1, le=90, description="Number of days to collect data for"), 
-    background_tasks: BackgroundTasks = None,
     current_user: User = Depends(auth_required),
-    user_repository: UserRepository = Depends(get_user_repository),
-    collector_service = Depends(get_analytics_collector_service)
+    user_repository: UserRepository = Depends(get_user_repository)
 ):
-    """Trigger collection of analytics data for a user"""
+    """Queue collection of analytics data for a user, or join the collection already running"""
     
     # Validate input
     try:
@@ -113,31 +99,34 @@ async def trigger_data_collection(
         raise HTTPException(status_code=404, detail="User not found")
     
     try:
-        if background_tasks:
-            # Run in background
-            background_tasks.add_task(collect_analytics_background, validated_user_id, current_user.id, days_back)
-            AnalyticsAuditLogger.log_data_collection(validated_user_id, current_user.id, days_back, True)
-            return {
-                "message": f"Analytics collection started for user {validated_user_id}", 
-                "status": "processing",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        else:
-            # Run immediately (may timeout for large data collections)
-            result = await collect_all_platform_data(validated_user_id, days_back, collector_service)
-            AnalyticsAuditLogger.log_data_collection(validated_user_id, current_user.id, days_back, True)
-            return {
-                "message": f"Analytics collection completed for user {validated_user_id}", 
-                "status": "completed", 
-                "result": result,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        job, created = await enqueue_collection(validated_user_id, days_back, requester_id=str(current_user.id))
+        AnalyticsAuditLogger.log_data_collection(validated_user_id, current_user.id, days_back, True)
+        return {
+            "message": f"Analytics collection {'queued' if created else 'already in progress'} for user {validated_user_id}",
+            "status": job["status"],
+            "job_id": job["job_id"],
+            "progress": job["progress"],
+            "timestamp": datetime.utcnow().isoformat()
+        }
     except Exception as e:
         AnalyticsAuditLogger.log_data_collection(validated_user_id, current_user.id, days_back, False, str(e))
         logger.error(f"Error triggering analytics collection: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error collecting analytics data: {str(e)}")
 
+@router.get("/collect/jobs/{job_id}")
+async def get_collection_job(
+    job_id: str = Path(..., description="Collection job ID"),
+    current_user: User = Depends(auth_required)
+):
+    """Get status and per-platform progress of an analytics collection job"""
+    job = await get_job(job_id)
+    # Other users' jobs are reported as missing rather than forbidden
+    if not job or (job["user_id"] != str(current_user.id) and not getattr(current_user, 'is_admin', False)):
+        raise HTTPException(status_code=404, detail="Collection job not found")
+    return job
+
 @router.get("/overview/{user_id}")
+@fast_json_response
 async def get_analytics_overview(
     request: Request,
     user_id: str = Path(..., description="User ID to get analytics overview for"),
@@ -181,6 +170,7 @@ async def get_analytics_overview(
         raise HTTPException(status_code=500, detail=f"Error retrieving analytics overview: {str(e)}")
 
 @router.get("/platforms/{user_id}/{platform}")
+@fast_json_response
 async def get_platform_insights(
     request: Request,
     user_id: str = Path(..., description="User ID to get platform insights for"),
@@ -229,6 +219,7 @@ async def get_platform_insights(
         raise HTTPException(status_code=500, detail=f"Error retrieving platform insights: {str(e)}")
 
 @router.get("/chart/{chart_type}/{user_id}")
+@fast_json_response
 async def get_chart_data(
     request: Request,
     chart_type: str = Path(..., description="Type of chart to generate"),
@@ -307,6 +298,7 @@ async def get_chart_data(
         raise HTTPException(status_code=500, detail=f"Error generating chart data: {str(e)}")
 
 @router.get("/recommendations/{user_id}")
+@fast_json_response
 async def get_recommendations(
     request: Request,
     user_id: str = Path(..., description="User ID to get recommendations for"),
@@ -350,6 +342,7 @@ async def get_recommendations(
         raise HTTPException(status_code=500, detail=f"Error retrieving recommendations: {str(e)}")
 
 @router.get("/comparative/{user_id}")
+@fast_json_response
 async def get_comparative_analytics(
     request: Request,
     user_id: str = Path(..., description="User ID to get comparative analytics for"),
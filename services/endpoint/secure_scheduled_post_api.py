@@ -19,10 +19,11 @@ import logging
 from services.database.database import get_db
 from services.models.scheduled_post_model import ScheduledPost, PostStatus
 from services.models.user_model import User
-from services.scheduled_post_service import ScheduledPostService
+from services.scheduled_post_service import ScheduledPostService, MAX_BULK_POSTS
 from services.dependencies.scheduled_post_providers import get_scheduled_post_service
 from services.auth.auth_guard import auth_required
 from services.utils.logger_config import setup_logger
+from utils.json_response import fast_json_response
 
 # Import security validation models
 from services.security.validation_models import (
@@ -141,6 +142,54 @@ class PostSearchRequest(SearchValidation, PaginationValidation):
     """Request model for searching posts."""
     platform: Optional[PlatformType] = Field(None, description="Filter by platform")
     tags: Optional[List[str]] = Field(None, max_items=10, description="Filter by tags")
+    cursor: Optional[str] = Field(None, max_length=64, description="next_cursor from the previous page; used instead of offset")
+
+class PostSearchResponse(BaseModel):
+    """Ranked search results with a keyset cursor for the next page."""
+    posts: List[SecureScheduledPostResponse] = Field(default=[], description="Matching posts, best match first")
+    next_cursor: Optional[str] = Field(None, description="Pass as cursor to fetch the next page; null on the last page")
+
+class BulkPostItem(BaseModel):
+    """A single post within a bulk create; platform and time are checked per item by the service."""
+    content: str = Field(..., min_length=1, max_length=10000, description="The main text content of the post")
+    platform: str = Field(..., description="Social media platform for posting")
+    scheduled_time: str = Field(..., description="ISO format datetime for when to publish")
+    media_urls: List[str] = Field(default=[], max_items=10, description="List of media URLs to attach")
+    metadata: Dict[str, Any] = Field(default={}, description="Additional post metadata")
+
+class BulkCreatePostsRequest(BaseModel):
+    """Request model for creating many scheduled posts at once, e.g. a content calendar import."""
+    posts: List[BulkPostItem] = Field(..., min_items=1, max_items=MAX_BULK_POSTS, description="Posts to schedule")
+
+class RescheduleItem(BaseModel):
+    """A single post move within a bulk reschedule."""
+    post_id: int = Field(..., gt=0, description="ID of the scheduled post")
+    scheduled_time: str = Field(..., description="New ISO format datetime for when to publish")
+
+class BulkRescheduleRequest(BaseModel):
+    """Request model for moving many scheduled posts at once."""
+    posts: List[RescheduleItem] = Field(..., min_items=1, max_items=MAX_BULK_POSTS, description="Posts and their new times")
+
+class BulkCancelRequest(BaseModel):
+    """Request model for cancelling many scheduled posts at once."""
+    post_ids: List[int] = Field(..., min_items=1, max_items=MAX_BULK_POSTS, description="IDs of the posts to cancel")
+
+class BulkItemResult(BaseModel):
+    """An item of a bulk request that was applied."""
+    index: int = Field(..., description="Position of the item in the request")
+    post_id: int = Field(..., description="ID of the affected post")
+    scheduled_time: Optional[str] = Field(None, description="Scheduled time after the operation (ISO format)")
+
+class BulkItemError(BaseModel):
+    """An item of a bulk request that was rejected."""
+    index: int = Field(..., description="Position of the item in the request")
+    post_id: Optional[int] = Field(None, description="ID of the post, when the item referenced one")
+    error: str = Field(..., description="Why the item was rejected")
+
+class BulkOperationResponse(BaseModel):
+    """Per-item outcome of a bulk operation; valid items are applied even when others fail."""
+    succeeded: List[BulkItemResult] = Field([], description="Items that were applied")
+    failed: List[BulkItemError] = Field([], description="Items that were rejected")
 
 # Create secure router
 router = APIRouter(
@@ -255,6 +304,7 @@ async def create_secure_scheduled_post(
     summary="Get Scheduled Posts",
     description="Retrieve scheduled posts with secure filtering and pagination"
 )
+@fast_json_response
 async def get_scheduled_posts(
     platform: Optional[PlatformType] = Query(None, description="Filter by platform"),
     status: Optional[str] = Query(
@@ -478,9 +528,9 @@ async def delete_scheduled_post(
 
 @router.post(
     "/search",
-    response_model=List[SecureScheduledPostResponse],
+    response_model=PostSearchResponse,
     summary="Search Scheduled Posts",
-    description="Search posts with secure validation"
+    description="Ranked search over post text with cursor pagination"
 )
 async def search_scheduled_posts(
     search_request: PostSearchRequest = Body(..., description="Search parameters"),
@@ -490,32 +540,38 @@ async def search_scheduled_posts(
     """Search scheduled posts with comprehensive validation."""
     try:
         # Search posts using service
-        posts = scheduled_post_service.search_posts(
-            user_id=current_user.id,
-            query=search_request.query,
-            platform=search_request.platform.value if search_request.platform else None,
-            tags=search_request.tags,
-            limit=search_request.limit,
-            offset=search_request.offset
-        )
+        try:
+            page = scheduled_post_service.search_posts(
+                user_id=current_user.id,
+                query=search_request.query,
+                platform=search_request.platform.value if search_request.platform else None,
+                tags=search_request.tags,
+                limit=search_request.limit,
+                cursor=search_request.cursor
+            )
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid search cursor")
         
         # Convert to secure response format
         secure_posts = []
-        for post in posts:
+        for post in page["posts"]:
+            payload = post.post_payload or {}
             secure_posts.append(SecureScheduledPostResponse(
                 id=str(post.id),
-                content=post.content,
+                content=payload.get("content") or payload.get("text") or payload.get("caption") or "",
                 platform=PlatformType(post.platform),
                 scheduled_time=post.scheduled_time,
                 status=post.status.value if hasattr(post.status, 'value') else str(post.status),
-                media_urls=post.media_urls or [],
-                tags=post.tags or [],
+                media_urls=payload.get("media_urls") or [],
+                tags=payload.get("tags") or [],
                 created_at=post.created_at,
                 updated_at=post.updated_at
             ))
         
-        return secure_posts
+        return PostSearchResponse(posts=secure_posts, next_cursor=page["next_cursor"])
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error searching posts for user {current_user.id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -557,6 +613,125 @@ async def bulk_update_status(
         logger.error(f"Error bulk updating posts for user {current_user.id}: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post(
+    "/bulk",
+    response_model=BulkOperationResponse,
+    summary="Bulk Create Scheduled Posts",
+    description=f"Creates up to {MAX_BULK_POSTS} scheduled posts in one request and one transaction",
+    response_description="Returns the created post IDs and the rejected items with reasons"
+)
+async def bulk_create_scheduled_posts(
+    bulk_data: BulkCreatePostsRequest = Body(..., description="Posts to schedule"),
+    current_user: User = Depends(auth_required),
+    scheduled_post_service: ScheduledPostService = Depends(get_scheduled_post_service)
+):
+    """Create many scheduled posts at once.
+    
+    Every post is validated before anything is written; the valid ones are
+    inserted together and the rest are reported back by their position.
+    
+    Args:
+        bulk_data: The posts to schedule
+        current_user: The authenticated user (injected by dependency)
+        scheduled_post_service: Service for post scheduling operations
+        
+    Returns:
+        Per-item results: created posts and rejected items
+        
+    Raises:
+        HTTPException: If the batch cannot be processed
+    """
+    try:
+        posts = [{
+            "platform": post.platform,
+            "scheduled_time": post.scheduled_time,
+            "post_payload": {
+                "content": post.content,
+                "media_urls": post.media_urls,
+                "metadata": post.metadata
+            }
+        } for post in bulk_data.posts]
+        
+        return scheduled_post_service.bulk_create_scheduled_posts(current_user.id, posts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error bulk creating posts for user {current_user.id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.post(
+    "/bulk/reschedule",
+    response_model=BulkOperationResponse,
+    summary="Bulk Reschedule Posts",
+    description=f"Moves up to {MAX_BULK_POSTS} pending or failed posts to new times in one request",
+    response_description="Returns the rescheduled posts and the rejected items with reasons"
+)
+async def bulk_reschedule_posts(
+    bulk_data: BulkRescheduleRequest = Body(..., description="Posts and their new times"),
+    current_user: User = Depends(auth_required),
+    scheduled_post_service: ScheduledPostService = Depends(get_scheduled_post_service)
+):
+    """Reschedule many of the current user's posts at once.
+    
+    Only posts owned by the current user are touched; other IDs are reported
+    back as not found.
+    
+    Args:
+        bulk_data: The post IDs and their new scheduled times
+        current_user: The authenticated user (injected by dependency)
+        scheduled_post_service: Service for post scheduling operations
+        
+    Returns:
+        Per-item results: rescheduled posts and rejected items
+        
+    Raises:
+        HTTPException: If the batch cannot be processed
+    """
+    try:
+        changes = [{"post_id": item.post_id, "scheduled_time": item.scheduled_time} for item in bulk_data.posts]
+        return scheduled_post_service.bulk_reschedule_posts(current_user.id, changes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error bulk rescheduling posts for user {current_user.id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.post(
+    "/bulk/cancel",
+    response_model=BulkOperationResponse,
+    summary="Bulk Cancel Posts",
+    description=f"Cancels up to {MAX_BULK_POSTS} unpublished posts in one request",
+    response_description="Returns the cancelled posts and the rejected items with reasons"
+)
+async def bulk_cancel_posts(
+    bulk_data: BulkCancelRequest = Body(..., description="IDs of the posts to cancel"),
+    current_user: User = Depends(auth_required),
+    scheduled_post_service: ScheduledPostService = Depends(get_scheduled_post_service)
+):
+    """Cancel many of the current user's posts at once.
+    
+    Only posts owned by the current user are touched; other IDs are reported
+    back as not found.
+    
+    Args:
+        bulk_data: The IDs of the posts to cancel
+        current_user: The authenticated user (injected by dependency)
+        scheduled_post_service: Service for post scheduling operations
+        
+    Returns:
+        Per-item results: cancelled posts and rejected items
+        
+    Raises:
+        HTTPException: If the batch cannot be processed
+    """
+    try:
+        return scheduled_post_service.bulk_cancel_posts(current_user.id, bulk_data.post_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error bulk cancelling posts for user {current_user.id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Background task functions
 async def _post_creation_tasks(post_id: str, user_id: str):
     """Background tasks to run after post creation."""
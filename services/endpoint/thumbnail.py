@@ -1,21 +1,95 @@
-from fastapi import APIRouter, Form
+import re
+import asyncio
+from fastapi import APIRouter, Form, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
 from typing import Optional
 from services.thumbnail import SDXLThumbnailGenerator
+from services.thumbnail_store import THUMBNAIL_KEY_RE
 
 router = APIRouter()
 generator = SDXLThumbnailGenerator()
 
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
 class ThumbnailRequest(BaseModel):
     prompt: str
     platform: str = "universal"
     logo_base64: Optional[str] = None
+    include_base64: bool = False  # Legacy clients that still want the image inline
 
 @router.post("/generate-thumbnail")
-async def generate_image(req: ThumbnailRequest):
-    result = generator.generate_thumbnail(
+async def generate_image(req: ThumbnailRequest, request: Request):
+    if req.include_base64:
+        return await asyncio.to_thread(
+            generator.generate_thumbnail,
+            prompt=req.prompt,
+            platform=req.platform,
+            logo_base64=req.logo_base64
+        )
+
+    result = await generator.generate_thumbnail_async(
         prompt=req.prompt,
         platform=req.platform,
         logo_base64=req.logo_base64
     )
-    return result
\ No newline at end of file
+    if "thumbnail_id" in result:
+        result["url"] = str(request.url_for("get_thumbnail", thumbnail_id=result["thumbnail_id"]))
+    return result
+
+@router.get("/thumbnails/{thumbnail_id}", name="get_thumbnail")
+async def get_thumbnail(thumbnail_id: str, request: Request):
+    """
+    Serve a stored thumbnail. Thumbnails are immutable for a given id, so the id
+    doubles as a strong ETag and responses may be cached indefinitely.
+    Single byte ranges are supported for partial downloads.
+    """
+    if not THUMBNAIL_KEY_RE.match(thumbnail_id):
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    path = await asyncio.to_thread(generator.store.get_path, thumbnail_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+
+    etag = f'"{thumbnail_id}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "Accept-Ranges": "bytes"
+    }
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if range_header:
+        match = RANGE_RE.match(range_header.strip())
+        size = generator.store.size_of(thumbnail_id)
+        if not match or size is None or not any(match.groups()):
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size or 0}"})
+
+        start_text, end_text = match.groups()
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = max(size - int(end_text), 0)
+            end = size - 1
+        if start > end or start >= size:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+        def read_range() -> bytes:
+            with open(path, "rb") as f:
+                f.seek(start)
+                return f.read(end - start + 1)
+
+        body = await asyncio.to_thread(read_range)
+        return Response(
+            content=body,
+            status_code=206,
+            media_type="image/png",
+            headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}"}
+        )
+
+    return FileResponse(path, media_type="image/png", headers=headers)
@@ -1,7 +1,6 @@
 """Unified Authentication API endpoints."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -11,6 +10,7 @@ from slowapi.errors import RateLimitExceeded
 
 from services.database.database import get_db
 from services.auth.unified_auth_service import auth_service
+from services.auth.wallet.nonce_store import get_nonce_store, WALLET_NONCE_TTL
 from services.models.user_model import User
 from services.schemas.auth_schemas import (
     UserCreate, UserCreateWallet, UserLogin, UserLoginWallet,
@@ -24,8 +24,13 @@ limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 security = HTTPBearer()
 
-# In-memory storage for wallet challenges (in production, use Redis)
-wallet_challenges: Dict[str, Dict[str, Any]] = {}
+# Wallet challenges are single-use and expire; shared across workers via Redis
+WALLET_CHALLENGE_SCOPE = "challenge"
+
+
+async def redeem_wallet_challenge(wallet_address: str, message: str) -> bool:
+    """Consume the challenge issued to a wallet if it matches the signed message; a mismatch leaves it in place."""
+    return await get_nonce_store().consume_if_matches(WALLET_CHALLENGE_SCOPE, wallet_address.lower(), message)
 
 
 def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)) -> User:
@@ -62,7 +67,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 async def register_with_email(request: Request, user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user with email and password."""
     try:
-        user = auth_service.register_user_email(db, user_data.email, user_data.password)
+        user = await auth_service.register_user_email(db, user_data.email, user_data.password)
         tokens = auth_service.create_token_pair(user)
         return tokens
     except HTTPException:
@@ -79,8 +84,9 @@ async def register_with_email(request: Request, user_data: UserCreate, db: Sessi
 async def register_with_wallet(request: Request, user_data: UserCreateWallet, db: Session = Depends(get_db)):
     """Register a new user with wallet address."""
     try:
-        # Verify the wallet signature
-        if not auth_service.verify_wallet_signature(user_data.wallet_address, user_data.message, user_data.signature):
+        # Verify the wallet signature over an issued challenge
+        if not await redeem_wallet_challenge(user_data.wallet_address, user_data.message) or \
+                not await auth_service.verify_wallet_signature_async(user_data.wallet_address, user_data.message, user_data.signature):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid wallet signature"
@@ -102,7 +108,7 @@ async def register_with_wallet(request: Request, user_data: UserCreateWallet, db
 @limiter.limit("10/minute")
 async def login_with_email(request: Request, login_data: UserLogin, db: Session = Depends(get_db)):
     """Login with email and password."""
-    user = auth_service.authenticate_user_email(db, login_data.email, login_data.password)
+    user = await auth_service.authenticate_user_email(db, login_data.email, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -121,7 +127,9 @@ async def login_with_email(request: Request, login_data: UserLogin, db: Session
 @limiter.limit("10/minute")
 async def login_with_wallet(request: Request, login_data: UserLoginWallet, db: Session = Depends(get_db)):
     """Login with wallet signature."""
-    user = auth_service.authenticate_user_wallet(db, login_data.wallet_address, login_data.message, login_data.signature)
+    user = None
+    if await redeem_wallet_challenge(login_data.wallet_address, login_data.message):
+        user = await auth_service.authenticate_user_wallet(db, login_data.wallet_address, login_data.message, login_data.signature)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -141,13 +149,10 @@ async def login_with_wallet(request: Request, login_data: UserLoginWallet, db: S
 async def get_wallet_challenge(request: Request, challenge_data: WalletChallenge):
     """Get a challenge message for wallet authentication."""
     message = auth_service.generate_wallet_challenge(challenge_data.wallet_address)
-    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=WALLET_NONCE_TTL)
     
-    # Store challenge temporarily (in production, use Redis with TTL)
-    wallet_challenges[challenge_data.wallet_address] = {
-        "message": message,
-        "expires_at": expires_at
-    }
+    # A new challenge replaces any outstanding one for the wallet
+    await get_nonce_store().issue(WALLET_CHALLENGE_SCOPE, challenge_data.wallet_address.lower(), message, ttl_seconds=WALLET_NONCE_TTL)
     
     return WalletChallengeResponse(message=message, expires_at=expires_at)
 
@@ -173,8 +178,9 @@ async def refresh_token(request: Request, token_data: RefreshToken, db: Session
 async def link_wallet_to_account(request: Request, wallet_data: LinkWallet, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Link a wallet address to the current user account."""
     try:
-        # Verify the wallet signature
-        if not auth_service.verify_wallet_signature(wallet_data.wallet_address, wallet_data.message, wallet_data.signature):
+        # Verify the wallet signature over an issued challenge
+        if not await redeem_wallet_challenge(wallet_data.wallet_address, wallet_data.message) or \
+                not await auth_service.verify_wallet_signature_async(wallet_data.wallet_address, wallet_data.message, wallet_data.signature):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid wallet signature"
@@ -196,7 +202,7 @@ async def link_wallet_to_account(request: Request, wallet_data: LinkWallet, curr
 async def link_email_to_account(request: Request, email_data: LinkEmail, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Link email and password to the current wallet-only user account."""
     try:
-        user = auth_service.link_email_to_user(db, str(current_user.id), email_data.email, email_data.password)
+        user = await auth_service.link_email_to_user(db, str(current_user.id), email_data.email, email_data.password)
         return ApiResponse(success=True, message="Email linked successfully", data={"auth_type": user.auth_type.value})
     except HTTPException:
         raise
@@ -258,14 +264,14 @@ async def get_auth_methods(current_user: User = Depends(get_current_user)):
 async def change_password(request: Request, password_data: PasswordChange, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Change user password."""
     # Verify current password
-    if not current_user.hashed_password or not auth_service.verify_password(password_data.current_password, current_user.hashed_password):
+    if not current_user.hashed_password or not await auth_service.verify_password_async(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid current password"
         )
     
     # Update password
-    current_user.hashed_password = auth_service.get_password_hash(password_data.new_password)
+    current_user.hashed_password = await auth_service.get_password_hash_async(password_data.new_password)
     db.commit()
     
     return ApiResponse(success=True, message="Password changed successfully")
@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from services.database.redis import RedisManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class LLMGateway:
+    """
+    Shared async client for OpenRouter chat completions.
+
+    One pooled ``httpx.AsyncClient`` serves every caller, so TLS handshakes
+    are paid once per connection instead of once per request. In-flight
+    requests are capped by a semaphore, successful responses are cached by
+    model + prompt (in process, then in Redis) for a TTL, and identical
+    prompts that arrive while one is already in flight share its result.
+
+    HTTP errors and timeouts are raised as the usual ``httpx`` exceptions so
+    callers keep their existing fallback handling.
+    """
+
+    CACHE_KEY_PREFIX = "llm:response"
+
+    def __init__(self, api_url: str, api_key: str, default_model: str, max_concurrency: int = 16,
+                 timeout: float = 20.0, cache_ttl: int = 3600, max_local_entries: int = 1024):
+        self.api_url = api_url
+        self.api_key = api_key
+        self.default_model = default_model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.max_local_entries = max_local_entries
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._local_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": "https://social-suit.com"
+                }
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    @staticmethod
+    def cache_key(payload: Dict[str, Any]) -> str:
+        """Stable digest of everything that determines a completion."""
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    async def chat(self, messages: List[Dict[str, str]], model: str = None, temperature: float = 0.7,
+                   max_tokens: Optional[int] = None, title: Optional[str] = None,
+                   cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run a chat completion and return the raw OpenRouter response.
+
+        Args:
+            messages: Chat messages in OpenAI format
+            model: Model name; defaults to the gateway's default model
+            temperature: Sampling temperature
+            max_tokens: Optional completion length cap
+            title: Value for the X-Title header (caller attribution)
+            cache_ttl: Seconds to cache the response; 0 disables caching
+
+        Returns:
+            The decoded JSON response
+        """
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+
+        ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+        key = self.cache_key(payload)
+
+        if ttl > 0:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                return cached
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.stats["coalesced"] += 1
+        else:
+            # The upstream call runs detached, so a cancelled caller never cancels it for the others
+            in_flight = asyncio.create_task(self._fetch(key, payload, title, ttl))
+            self._in_flight[key] = in_flight
+            in_flight.add_done_callback(lambda task: self._forget(key, task))
+        return await asyncio.shield(in_flight)
+
+    async def _fetch(self, key: str, payload: Dict[str, Any], title: Optional[str], ttl: int) -> Dict[str, Any]:
+        result = await self._post(payload, title)
+        if ttl > 0:
+            await self._cache_set(key, result, ttl)
+        return result
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def complete(self, messages: List[Dict[str, str]], **kwargs) -> str:
+        """Run a chat completion and return the first choice's message content."""
+        result = await self.chat(messages, **kwargs)
+        return result["choices"][0]["message"]["content"]
+
+    async def _post(self, payload: Dict[str, Any], title: Optional[str]) -> Dict[str, Any]:
+        headers = {"X-Title": title} if title else None
+        async with self._get_semaphore():
+            self.stats["requests"] += 1
+            response = await self._get_client().post(self.api_url, json=payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._local_cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._local_cache.move_to_end(key)
+                return value
+            del self._local_cache[key]
+
+        try:
+            value = await RedisManager.cache_get(f"{self.CACHE_KEY_PREFIX}:{key}")
+        except Exception as e:
+            logger.warning(f"LLM response cache unavailable: {e}")
+            return None
+        if isinstance(value, dict):
+            self._remember(key, value, self.cache_ttl)
+            return value
+        return None
+
+    async def _cache_set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._remember(key, value, ttl)
+        try:
+            await RedisManager.cache_set(f"{self.CACHE_KEY_PREFIX}:{key}", value, ttl_seconds=ttl)
+        except Exception as e:
+            logger.warning(f"LLM response cache unavailable: {e}")
+
+    def _remember(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._local_cache[key] = (time.monotonic() + ttl, value)
+        self._local_cache.move_to_end(key)
+        while len(self._local_cache) > self.max_local_entries:
+            self._local_cache.popitem(last=False)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Return the process-wide LLM gateway."""
+    global _gateway
+    if _gateway is None:
+        from core.config import settings
+
+        _gateway = LLMGateway(
+            api_url=settings.OPENROUTER_API_URL,
+            api_key=settings.OPENROUTER_API_KEY,
+            default_model=settings.OPENROUTER_MODEL
+        )
+    return _gateway
+
+
+async def close_llm_gateway() -> None:
+    """Close the process-wide LLM gateway, if it was ever used."""
+    if _gateway is not None:
+        await _gateway.close()
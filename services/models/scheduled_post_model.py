@@ -1,10 +1,28 @@
 from sqlalchemy import Column, Integer, String, DateTime, JSON, Enum, ForeignKey, Index, Text
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.dialects.postgresql import ARRAY
 from services.database.database import Base
 import enum
 
+# Payload fields that carry user-visible text, in the order they are indexed
+SEARCH_TEXT_FIELDS = ("title", "caption", "text", "message", "content", "description")
+SEARCH_TAG_FIELDS = ("hashtags", "tags")
+MAX_SEARCH_TEXT_LENGTH = 10000
+
+def extract_search_text(post_payload) -> str:
+    """Flatten the searchable text of a post payload into a single string"""
+    if not isinstance(post_payload, dict):
+        return ""
+    parts = [str(post_payload[field]) for field in SEARCH_TEXT_FIELDS if post_payload.get(field)]
+    for field in SEARCH_TAG_FIELDS:
+        tags = post_payload.get(field)
+        if isinstance(tags, str):
+            tags = tags.split()
+        if isinstance(tags, (list, tuple)):
+            parts.extend(str(tag) for tag in tags if tag)
+    return " ".join(parts)[:MAX_SEARCH_TEXT_LENGTH]
+
 class PostStatus(str, enum.Enum):
     PENDING = "pending"
     PUBLISHING = "publishing"
@@ -25,6 +43,7 @@ class ScheduledPost(Base):
     platform = Column(String)  # e.g. facebook, instagram
     
     post_payload = Column(JSON)  # e.g. {"caption": "...", "image_url": "..."}
+    search_text = Column(Text)  # Kept in sync with post_payload; backs the search indexes
     
     scheduled_time = Column(DateTime)  # e.g. 2025-06-24T05:00:00Z
     
@@ -38,8 +57,16 @@ class ScheduledPost(Base):
         Index('idx_scheduled_time', 'scheduled_time'),
         Index('idx_user_platform', 'user_id', 'platform'),
         Index('idx_status', 'status'),
+        # pg_trgm GIN index serving ILIKE and word-similarity search (PostgreSQL only)
+        Index('idx_scheduled_posts_search_trgm', 'search_text', postgresql_using='gin',
+              postgresql_ops={'search_text': 'gin_trgm_ops'}).ddl_if(dialect='postgresql'),
         {'extend_existing': True, 'sqlite_autoincrement': True}
     )
     
+    @validates('post_payload')
+    def _sync_search_text(self, key, post_payload):
+        self.search_text = extract_search_text(post_payload)
+        return post_payload
+    
     def __repr__(self):
         return f"<ScheduledPost(id={self.id}, user_id={self.user_id}, platform={self.platform}, status={self.status})"
\ No newline at end of file
@@ -313,15 +313,40 @@ class BackgroundTaskMonitoringMixin:
         return decorator
 
 class HealthCheckMiddleware:
-    """Health check endpoint for monitoring."""
+    """Health check endpoint for monitoring.
+
+    The performance, error and alert summaries are recomputed at most once per
+    ``cache_ttl`` seconds, so frequent probes from load balancers do not rescan
+    the recorded metrics on every request.
+    """
     
-    def __init__(self):
+    def __init__(self, cache_ttl: float = 10.0):
         self.start_time = datetime.utcnow()
+        self.cache_ttl = cache_ttl
+        self._summary: Optional[dict] = None
+        self._summary_at = 0.0
     
     async def health_check(self) -> dict:
         """Return system health status."""
+        if self._summary is None or time.monotonic() - self._summary_at >= self.cache_ttl:
+            self._summary = self._summarize()
+            self._summary_at = time.monotonic()
+        
         uptime = datetime.utcnow() - self.start_time
+        summary = self._summary
         
+        return {
+            "status": summary["status"],
+            "timestamp": datetime.utcnow().isoformat(),
+            "uptime_seconds": int(uptime.total_seconds()),
+            "health_score": summary["health_score"],
+            "performance": summary["performance"],
+            "errors": summary["errors"],
+            "alerts": summary["alerts"]
+        }
+    
+    def _summarize(self) -> dict:
+        """Compute the health score and the summaries it is based on."""
         # Get performance summary
         perf_summary = structured_logger.get_performance_summary(hours=1)
         error_summary = structured_logger.get_error_summary()
@@ -331,8 +356,6 @@ class HealthCheckMiddleware:
         
         return {
             "status": "healthy" if health_score > 0.8 else "degraded" if health_score > 0.5 else "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "uptime_seconds": int(uptime.total_seconds()),
             "health_score": health_score,
             "performance": {
                 "avg_response_time_ms": perf_summary.get("avg_duration_ms", 0),
@@ -4,7 +4,7 @@ import os
 from services.utils.media_helpers import (
     download_media_from_cloudinary,
     cleanup_temp_file,
-    upload_temp_file_to_cdn
+    audit_media_copy
 )
 
 logger = logging.getLogger("socialsuit")  # ✅ Use standard logger
@@ -45,9 +45,8 @@ def call_telegram_api(user_token: dict, post_payload: dict):
         temp_file = download_media_from_cloudinary(media_url, suffix=suffix)
         logger.info(f"[Telegram] Downloaded temp file: {temp_file}")
 
-        # ✅ Optional: Upload temp file to your CDN (for logs / reuse)
-        cdn_url = upload_temp_file_to_cdn(temp_file)
-        logger.info(f"[Telegram] Uploaded temp file to CDN: {cdn_url}")
+        # ✅ Optional: audit copy on your CDN (for logs / reuse), fetched from the source URL
+        audit_media_copy(media_url)
 
         if media_type == "video":
             api_url = f"https://api.telegram.org/bot{bot_token}/sendVideo"
@@ -3,7 +3,7 @@ import logging
 from services.utils.media_helpers import (
     download_media_from_cloudinary,
     cleanup_temp_file,
-    upload_temp_file_to_cdn
+    audit_media_copy
 )
 
 logger = logging.getLogger("socialsuit")  # ✅ Standard logger
@@ -11,7 +11,7 @@ logger = logging.getLogger("socialsuit")  # ✅ Standard logger
 def call_tiktok_post(user_token: dict, post_payload: dict):
     """
     Publishes a video post to TikTok using TikTok Open API.
-    Uses Cloudinary video URL → temp download → optional CDN upload → native upload.
+    Uses Cloudinary video URL → temp download → native upload, with an optional audit copy.
     """
     access_token = user_token["access_token"]
     open_id = user_token["open_id"]
@@ -29,9 +29,8 @@ def call_tiktok_post(user_token: dict, post_payload: dict):
         temp_file = download_media_from_cloudinary(video_url, suffix=".mp4")
         logger.info(f"[TikTok] Downloaded temp video: {temp_file}")
 
-        # ✅ Upload temp video to CDN for audit (optional)
-        cdn_url = upload_temp_file_to_cdn(temp_file)
-        logger.info(f"[TikTok] Uploaded temp video to CDN: {cdn_url}")
+        # ✅ Audit copy (optional, fetched by the CDN from the source URL)
+        audit_media_copy(video_url)
 
         # ✅ Upload to TikTok (native binary)
         upload_url = f"https://open.tiktokapis.com/v2/post/publish/video/"
@@ -1,19 +1,97 @@
 import os
+import hashlib
 import requests
 import logging
 
 from services.utils.media_helpers import (
-    download_media_from_cloudinary,
+    fetch_media,
     cleanup_temp_file,
-    upload_temp_file_to_cdn
+    audit_media_copy,
+    lookup_platform_media,
+    remember_platform_media,
+    upload_file_chunks
 )
 
 logger = logging.getLogger("socialsuit")  # ✅ Standard named logger
 
+TWITTER_UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
+TWITTER_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MB
+# Twitter accepts APPEND segments in any order before FINALIZE
+TWITTER_UPLOAD_CONCURRENCY = int(os.getenv("TWITTER_UPLOAD_CONCURRENCY", "3"))
+
+
+def _account_id(user_token: dict) -> str:
+    """Identify the Twitter account for media dedupe without storing the token."""
+    if user_token.get("user_id"):
+        return str(user_token["user_id"])
+    return hashlib.sha256(user_token["access_token"].encode("utf-8")).hexdigest()[:16]
+
+
+def _upload_video(session: requests.Session, media) -> tuple:
+    """Chunked video upload. Returns (media_id, expires_after_secs)."""
+    # ✅ INIT upload
+    init_res = session.post(
+        TWITTER_UPLOAD_URL,
+        data={
+            "command": "INIT",
+            "media_type": "video/mp4",
+            "total_bytes": media.size,
+            "media_category": "tweet_video"
+        }
+    )
+    init_res.raise_for_status()
+    media_id = init_res.json().get("media_id_string")
+    logger.info(f"[Twitter] INIT media_id: {media_id}")
+
+    # ✅ APPEND chunks with bounded parallelism
+    def append(segment_index: int, chunk: bytes) -> None:
+        append_res = session.post(
+            TWITTER_UPLOAD_URL,
+            data={
+                "command": "APPEND",
+                "media_id": media_id,
+                "segment_index": segment_index
+            },
+            files={"media": chunk}
+        )
+        append_res.raise_for_status()
+        logger.info(f"[Twitter] APPEND segment {segment_index}: {append_res.status_code}")
+
+    upload_file_chunks(media.path, media.size, TWITTER_CHUNK_SIZE, append, TWITTER_UPLOAD_CONCURRENCY)
+
+    # ✅ FINALIZE
+    finalize_res = session.post(
+        TWITTER_UPLOAD_URL,
+        data={
+            "command": "FINALIZE",
+            "media_id": media_id
+        }
+    )
+    finalize_res.raise_for_status()
+    finalize_json = finalize_res.json()
+    logger.info(f"[Twitter] FINALIZE response: {finalize_json}")
+    return media_id, finalize_json.get("expires_after_secs")
+
+
+def _upload_image(session: requests.Session, media) -> tuple:
+    """Simple image upload. Returns (media_id, expires_after_secs)."""
+    with open(media.path, "rb") as f:
+        img_res = session.post(TWITTER_UPLOAD_URL, files={"media": f})
+    img_res.raise_for_status()
+    img_json = img_res.json()
+    media_id = img_json.get("media_id_string")
+    logger.info(f"[Twitter] Uploaded image media_id: {media_id}")
+    return media_id, img_json.get("expires_after_secs")
+
+
 def call_twitter_post(user_token: dict, post_payload: dict):
     """
     Twitter native upload: handles both image and chunked video.
     Includes proper error handling and retry logic for API rate limits.
+
+    Media is fetched once (hashed while streaming) and reused when the same
+    bytes were already uploaded for this account; the audit copy is made by
+    Cloudinary from the source URL according to MEDIA_AUDIT_MODE.
     """
     # Validate required token fields
     if not user_token.get("access_token"):
@@ -25,94 +103,50 @@ def call_twitter_post(user_token: dict, post_payload: dict):
     media_type = post_payload.get("media_type", "image")
 
     headers = {"Authorization": f"Bearer {access_token}"}
+    session = requests.Session()
+    session.headers.update(headers)
 
     media_id = None
     temp_file = None
 
     try:
         if media_url:
-            if media_type == "video":
-                # ✅ Download video to temp
-                temp_file = download_media_from_cloudinary(media_url, suffix=".mp4")
-                total_bytes = os.path.getsize(temp_file)
-
-                # ✅ Upload to CDN for audit
-                cdn_url = upload_temp_file_to_cdn(temp_file)
-                logger.info(f"[Twitter] Video uploaded to CDN: {cdn_url}")
-
-                logger.info(f"[Twitter] Video size: {total_bytes} bytes")
-
-                # ✅ INIT upload
-                init_res = requests.post(
-                    "https://upload.twitter.com/1.1/media/upload.json",
-                    data={
-                        "command": "INIT",
-                        "media_type": "video/mp4",
-                        "total_bytes": total_bytes,
-                        "media_category": "tweet_video"
-                    },
-                    headers=headers
-                )
-                init_json = init_res.json()
-                media_id = init_json.get("media_id_string")
-                logger.info(f"[Twitter] INIT media_id: {media_id}")
-
-                # ✅ APPEND chunks
-                segment_id = 0
-                with open(temp_file, "rb") as f:
-                    while True:
-                        chunk = f.read(4 * 1024 * 1024)  # 4 MB
-                        if not chunk:
-                            break
-
-                        append_res = requests.post(
-                            "https://upload.twitter.com/1.1/media/upload.json",
-                            data={
-                                "command": "APPEND",
-                                "media_id": media_id,
-                                "segment_index": segment_id
-                            },
-                            files={"media": chunk},
-                            headers=headers
-                        )
-                        logger.info(f"[Twitter] APPEND segment {segment_id}: {append_res.status_code}")
-                        segment_id += 1
-
-                # ✅ FINALIZE
-                finalize_res = requests.post(
-                    "https://upload.twitter.com/1.1/media/upload.json",
-                    data={
-                        "command": "FINALIZE",
-                        "media_id": media_id
-                    },
-                    headers=headers
-                )
-                logger.info(f"[Twitter] FINALIZE response: {finalize_res.json()}")
+            account_id = _account_id(user_token)
+            media_id = lookup_platform_media("twitter", account_id, media_url=media_url)
 
+            if media_id:
+                logger.info(f"[Twitter] Reusing uploaded media_id: {media_id}")
             else:
-                # ✅ For image, download temp optional but good for audit
-                temp_file = download_media_from_cloudinary(media_url, suffix=".jpg")
-
-                # ✅ Upload image to CDN for audit
-                cdn_url = upload_temp_file_to_cdn(temp_file)
-                logger.info(f"[Twitter] Image uploaded to CDN: {cdn_url}")
-
-                with open(temp_file, "rb") as f:
-                    img_res = requests.post(
-                        "https://upload.twitter.com/1.1/media/upload.json",
-                        files={"media": f},
-                        headers=headers
-                    )
-                img_json = img_res.json()
-                media_id = img_json.get("media_id_string")
-                logger.info(f"[Twitter] Uploaded image media_id: {media_id}")
-                # ✅ Post Tweet
+                suffix = ".mp4" if media_type == "video" else ".jpg"
+                media = fetch_media(media_url, suffix=suffix)
+                temp_file = media.path
+                logger.info(f"[Twitter] Media size: {media.size} bytes")
+
+                media_id = lookup_platform_media("twitter", account_id, content_hash=media.sha256)
+                if media_id:
+                    logger.info(f"[Twitter] Reusing uploaded media_id for identical content: {media_id}")
+                else:
+                    if media_type == "video":
+                        media_id, expires_after = _upload_video(session, media)
+                    else:
+                        media_id, expires_after = _upload_image(session, media)
+
+                    if media_id:
+                        remember_platform_media(
+                            "twitter", account_id, media_id, media.sha256,
+                            media_url=media_url, ttl_seconds=expires_after
+                        )
+
+                # ✅ Audit copy (never blocks the publish in the default async mode)
+                audit_media_copy(media_url)
+
+        # ✅ Post Tweet
         payload = {"status": text}
         if media_id:
             payload["media_ids"] = media_id
 
         post_url = "https://api.twitter.com/1.1/statuses/update.json"
-        res = requests.post(post_url, params=payload, headers=headers)
+        res = session.post(post_url, params=payload)
         logger.info(f"[Twitter] Tweet posted: {res.status_code}")
 
         return res.json()
@@ -120,37 +154,38 @@ def call_twitter_post(user_token: dict, post_payload: dict):
     except requests.exceptions.HTTPError as http_err:
         status_code = getattr(http_err.response, 'status_code', 0)
         response_text = getattr(http_err.response, 'text', '')
-        
+
         # Handle rate limiting (429) - should retry
         if status_code == 429:
             logger.warning(f"[Twitter] Rate limited: {response_text}")
             return {"error": "Rate limited by Twitter API", "retry": True}
-        
+
         # Handle authentication errors (401) - should not retry
         elif status_code == 401:
             logger.error(f"[Twitter] Authentication failed: {response_text}")
             return {"error": "Authentication failed", "retry": False}
-            
+
         # Handle other HTTP errors
         else:
             logger.error(f"[Twitter] HTTP error {status_code}: {response_text}")
             # Retry for server errors (5xx), don't retry for client errors (4xx)
             should_retry = status_code >= 500
             return {"error": f"HTTP error {status_code}: {str(http_err)}", "retry": should_retry}
-    
+
     except requests.exceptions.ConnectionError as conn_err:
         logger.error(f"[Twitter] Connection error: {conn_err}")
         return {"error": f"Connection error: {str(conn_err)}", "retry": True}
-        
+
     except requests.exceptions.Timeout as timeout_err:
         logger.error(f"[Twitter] Request timed out: {timeout_err}")
         return {"error": f"Request timed out: {str(timeout_err)}", "retry": True}
-        
+
     except Exception as e:
         logger.exception(f"[Twitter] Unexpected error: {e}")
         return {"error": str(e), "retry": True}
 
     finally:
+        session.close()
         if temp_file:
             cleanup_temp_file(temp_file)
-            logger.info(f"[Twitter] Cleaned up temp file: {temp_file}")
\ No newline at end of file
+            logger.info(f"[Twitter] Cleaned up temp file: {temp_file}")
@@ -1,5 +1,3 @@
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseUpload
 import io
 import requests
 import logging
@@ -14,6 +12,10 @@ def call_youtube_post(user_token: dict, post_payload: dict):
     Upload a video to YouTube using Google API client.
     Resumable native upload with Cloudinary temp.
     """
+    # The Google API client is heavy and only needed for YouTube uploads
+    from googleapiclient.discovery import build
+    from googleapiclient.http import MediaIoBaseUpload
+
     credentials = user_token["credentials"]  # Valid OAuth2 credentials
 
     title = post_payload.get("title", "Untitled Video")
@@ -1,14 +1,48 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc, asc, text
+from sqlalchemy import and_, or_, func, desc, asc, text, cast, Numeric, case, insert, update, literal
 from datetime import datetime, timedelta
 import asyncio
+import re
 
 from services.interfaces.base_repository import BaseRepository
-from services.models.scheduled_post_model import ScheduledPost
+from services.models.scheduled_post_model import ScheduledPost, PostStatus, extract_search_text
 from services.database.query_optimizer import query_performance_tracker
 from services.database.redis import RedisManager
 
+# pg_trgm's default word_similarity_threshold, applied by the %> operator
+SEARCH_SIMILARITY_THRESHOLD = 0.6
+SEARCH_RANK_PRECISION = 4
+
+# Posts that have not started publishing and may still be moved or cancelled
+EDITABLE_STATUSES = (PostStatus.PENDING, PostStatus.FAILED, PostStatus.RETRY)
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _trigrams(value: str) -> set:
+    """Trigrams as pg_trgm builds them: lower-cased words padded with two spaces in front and one behind"""
+    grams = set()
+    for word in re.findall(r"[^\W_]+", value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def search_rank(term: str, search_text: str) -> float:
+    """In-memory approximation of pg_trgm's word_similarity(term, search_text)"""
+    term_grams = _trigrams(term)
+    if not term_grams:
+        return 0.0
+    return round(len(term_grams & _trigrams(search_text)) / len(term_grams), SEARCH_RANK_PRECISION)
+
+def encode_search_cursor(rank: float, post_id: int) -> str:
+    return f"{rank:.{SEARCH_RANK_PRECISION}f}:{post_id}"
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """Raises ValueError for a malformed cursor"""
+    rank, _, post_id = cursor.partition(":")
+    return float(rank), int(post_id)
+
 class ScheduledPostRepository(BaseRepository[ScheduledPost]):
     """
     Optimized Repository for ScheduledPost entity operations with caching and performance monitoring
@@ -234,30 +268,156 @@ class ScheduledPostRepository(BaseRepository[ScheduledPost]):
             self.db.rollback()
             raise e
     
-    @query_performance_tracker("postgresql", "search_posts")
-    def search_posts(self, search_term: str, user_id: Optional[str] = None, limit: int = 50) -> List[ScheduledPost]:
+    @query_performance_tracker("postgresql", "bulk_create")
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Insert many posts with one multi-row INSERT ... RETURNING and a single commit
+        
+        Returns:
+            The new post IDs, in the same order as ``rows``
         """
-        Search posts by content with text search optimization
+        if not rows:
+            return []
+        now = datetime.utcnow()
+        values = [{
+            "user_id": row["user_id"],
+            "platform": row["platform"],
+            "post_payload": row["post_payload"],
+            "search_text": extract_search_text(row["post_payload"]),
+            "scheduled_time": row["scheduled_time"],
+            "status": PostStatus.PENDING,
+            "retries": 0,
+            "created_at": now,
+            "updated_at": now
+        } for row in rows]
+        try:
+            statement = insert(ScheduledPost).returning(ScheduledPost.id, sort_by_parameter_order=True)
+            post_ids = list(self.db.execute(statement, values).scalars())
+            self.db.commit()
+            return post_ids
+        except Exception as e:
+            self.db.rollback()
+            raise e
+    
+    @query_performance_tracker("postgresql", "bulk_reschedule")
+    def bulk_reschedule(self, user_id: str, schedule: Dict[int, datetime]) -> List[int]:
         """
-        cache_key = f"posts:search:{search_term}:{user_id or 'all'}:{limit}"
+        Move the user's editable posts to new times in one UPDATE ... RETURNING
         
-        search_pattern = f"%{search_term}%"
+        Posts that do not exist, belong to someone else or can no longer be
+        edited are left untouched and simply not returned.
+        """
+        if not schedule:
+            return []
+        try:
+            statement = (update(ScheduledPost)
+                         .where(and_(
+                             ScheduledPost.id.in_(list(schedule)),
+                             ScheduledPost.user_id == user_id,
+                             ScheduledPost.status.in_(EDITABLE_STATUSES)
+                         ))
+                         .values(scheduled_time=case(schedule, value=ScheduledPost.id),
+                                 updated_at=datetime.utcnow())
+                         .returning(ScheduledPost.id)
+                         .execution_options(synchronize_session=False))
+            post_ids = list(self.db.execute(statement).scalars())
+            self.db.commit()
+            return post_ids
+        except Exception as e:
+            self.db.rollback()
+            raise e
+    
+    @query_performance_tracker("postgresql", "bulk_cancel")
+    def bulk_cancel(self, user_id: str, post_ids: List[int]) -> List[int]:
+        """
+        Cancel the user's unpublished posts in one UPDATE ... RETURNING
+        """
+        if not post_ids:
+            return []
+        try:
+            statement = (update(ScheduledPost)
+                         .where(and_(
+                             ScheduledPost.id.in_(post_ids),
+                             ScheduledPost.user_id == user_id,
+                             ScheduledPost.status.in_(EDITABLE_STATUSES)
+                         ))
+                         .values(status=PostStatus.CANCELLED, updated_at=datetime.utcnow())
+                         .returning(ScheduledPost.id)
+                         .execution_options(synchronize_session=False))
+            cancelled = list(self.db.execute(statement).scalars())
+            self.db.commit()
+            return cancelled
+        except Exception as e:
+            self.db.rollback()
+            raise e
+    
+    @query_performance_tracker("postgresql", "search_posts")
+    def search_posts(self, search_term: str, user_id: Optional[str] = None, platform: Optional[str] = None,
+                     limit: int = 50, cursor: Optional[str] = None, tags: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Ranked, keyset-paginated search over the text extracted from post_payload.
         
-        query = self.db.query(ScheduledPost).filter(
-            or_(
-                ScheduledPost.content.ilike(search_pattern),
-                ScheduledPost.title.ilike(search_pattern) if hasattr(ScheduledPost, 'title') else False
-            )
-        )
+        On PostgreSQL this is served by the pg_trgm GIN index on search_text
+        (substring ILIKE or word similarity above the pg_trgm threshold);
+        other databases fall back to ranking the candidates in memory.
         
+        Returns:
+            {"posts": [...], "next_cursor": str | None}; pass next_cursor back for the next page
+        """
+        term = search_term.strip()
+        after = decode_search_cursor(cursor) if cursor else None
+        
+        query = self.db.query(ScheduledPost)
         if user_id:
             query = query.filter(ScheduledPost.user_id == user_id)
-        
-        result = (query.order_by(desc(ScheduledPost.created_at))
-                 .limit(limit)
-                 .all())
-        
-        return result
+        if platform:
+            query = query.filter(ScheduledPost.platform == platform)
+        # Tags match whole space-separated words, with or without a leading "#"
+        padded_text = literal(" ") + ScheduledPost.search_text + literal(" ")
+        for tag in tags or []:
+            word = _escape_like(tag.strip().lstrip("#"))
+            query = query.filter(or_(padded_text.ilike(f"% {word} %", escape="\\"),
+                                     padded_text.ilike(f"% #{word} %", escape="\\")))
+        
+        if self.db.get_bind().dialect.name == "postgresql":
+            ranked = self._search_postgresql(query, term, limit + 1, after)
+        else:
+            ranked = self._search_in_memory(query, term, limit + 1, after)
+        
+        next_cursor = None
+        if len(ranked) > limit:
+            ranked = ranked[:limit]
+            last_post, last_rank = ranked[-1]
+            next_cursor = encode_search_cursor(last_rank, last_post.id)
+        
+        return {"posts": [post for post, _ in ranked], "next_cursor": next_cursor}
+    
+    def _search_postgresql(self, query, term: str, limit: int, after: Optional[Tuple[float, int]]) -> List[Tuple[ScheduledPost, float]]:
+        rank = func.round(cast(func.word_similarity(term, ScheduledPost.search_text), Numeric), SEARCH_RANK_PRECISION)
+        query = query.add_columns(rank.label("rank")).filter(or_(
+            ScheduledPost.search_text.ilike(f"%{_escape_like(term)}%", escape="\\"),
+            ScheduledPost.search_text.op("%>")(term)  # Word similarity; indexable with the column on the left
+        ))
+        if after:
+            after_rank, after_id = after
+            query = query.filter(or_(rank < after_rank, and_(rank == after_rank, ScheduledPost.id < after_id)))
+        
+        rows = query.order_by(desc("rank"), desc(ScheduledPost.id)).limit(limit).all()
+        return [(post, float(post_rank)) for post, post_rank in rows]
+    
+    def _search_in_memory(self, query, term: str, limit: int, after: Optional[Tuple[float, int]]) -> List[Tuple[ScheduledPost, float]]:
+        needle = term.lower()
+        ranked = []
+        for post in query.all():
+            text_value = post.search_text or ""
+            post_rank = search_rank(term, text_value)
+            if needle in text_value.lower() or post_rank >= SEARCH_SIMILARITY_THRESHOLD:
+                ranked.append((post, post_rank))
+        
+        ranked.sort(key=lambda item: (item[1], item[0].id), reverse=True)
+        if after:
+            ranked = [item for item in ranked if (item[1], item[0].id) < after]
+        return ranked[:limit]
     
     async def _invalidate_post_cache(self, post_id: str, user_id: str, platform: str):
         """
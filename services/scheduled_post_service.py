@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 import asyncio
 from typing import Dict, List, Optional, Any, Union
@@ -7,11 +7,25 @@ from services.models.scheduled_post_model import ScheduledPost, PostStatus
 from services.repositories.scheduled_post_repository import ScheduledPostRepository
 from services.repositories.user_repository import UserRepository
 from services.utils.logger_config import setup_logger
-from services.database.performance_tracker import query_performance_tracker
+from services.database.query_optimizer import query_performance_tracker
 from services.database.redis import RedisManager
 
 logger = setup_logger("scheduled_post_service")
 
+# Largest batch accepted by the bulk create/reschedule/cancel operations
+MAX_BULK_POSTS = 500
+
+# Platforms services.scheduler.platform_post can publish to
+SCHEDULABLE_PLATFORMS = ("facebook", "instagram", "twitter", "linkedin", "youtube", "tiktok", "telegram", "farcaster")
+
+def _to_utc_naive(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO timestamp (or datetime) into the naive UTC form stored in scheduled_time"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 class ScheduledPostService:
     """
     Service for managing scheduled posts across different social media platforms.
@@ -282,6 +296,145 @@ class ScheduledPostService:
         
         return published_count
     
+    def bulk_create_scheduled_posts(self, user_id: str, posts: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Create a batch of scheduled posts in one transaction.
+        
+        The whole batch is validated up front; valid posts are then inserted
+        with a single multi-row INSERT and caches are invalidated once.
+        
+        Args:
+            user_id: The ID of the user creating the posts
+            posts: Dicts with platform, post_payload and scheduled_time (ISO string or datetime)
+            
+        Returns:
+            {"succeeded": [{"index", "post_id", "scheduled_time"}], "failed": [{"index", "error"}]}
+            
+        Raises:
+            ValueError: If the user doesn't exist or the batch is too large
+        """
+        self._check_batch(user_id, posts)
+        
+        now = datetime.utcnow()
+        rows, indexes, failed = [], [], []
+        for index, post in enumerate(posts):
+            platform = (post.get("platform") or "").lower()
+            payload = post.get("post_payload") or {}
+            try:
+                scheduled_time = _to_utc_naive(post.get("scheduled_time"))
+            except (TypeError, ValueError, AttributeError):
+                failed.append({"index": index, "error": "Invalid scheduled_time format. Use ISO format."})
+                continue
+            
+            if platform not in SCHEDULABLE_PLATFORMS:
+                failed.append({"index": index, "error": f"Unsupported platform: {post.get('platform')}"})
+            elif not (payload.get("content") or payload.get("media_urls")):
+                failed.append({"index": index, "error": "Post needs content or media"})
+            elif scheduled_time <= now:
+                failed.append({"index": index, "error": "scheduled_time must be in the future"})
+            else:
+                rows.append({"user_id": user_id, "platform": platform, "post_payload": payload, "scheduled_time": scheduled_time})
+                indexes.append(index)
+        
+        post_ids = self.scheduled_post_repository.bulk_create(rows)
+        succeeded = [
+            {"index": index, "post_id": post_id, "scheduled_time": row["scheduled_time"].isoformat()}
+            for index, post_id, row in zip(indexes, post_ids, rows)
+        ]
+        
+        if post_ids:
+            self._run_cache_invalidation(self._invalidate_batch_cache(user_id, post_ids))
+        
+        return {"succeeded": succeeded, "failed": failed}
+    
+    def bulk_reschedule_posts(self, user_id: str, changes: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Move a batch of the user's posts to new times in one UPDATE.
+        
+        Args:
+            user_id: The ID of the user owning the posts
+            changes: Dicts with post_id and the new scheduled_time
+            
+        Returns:
+            {"succeeded": [{"index", "post_id", "scheduled_time"}], "failed": [{"index", "post_id", "error"}]}
+            
+        Raises:
+            ValueError: If the user doesn't exist or the batch is too large
+        """
+        self._check_batch(user_id, changes)
+        
+        now = datetime.utcnow()
+        schedule, indexes, failed = {}, {}, []
+        for index, change in enumerate(changes):
+            post_id = change.get("post_id")
+            try:
+                scheduled_time = _to_utc_naive(change.get("scheduled_time"))
+            except (TypeError, ValueError, AttributeError):
+                failed.append({"index": index, "post_id": post_id, "error": "Invalid scheduled_time format. Use ISO format."})
+                continue
+            
+            if post_id in schedule:
+                failed.append({"index": index, "post_id": post_id, "error": "Duplicate post_id in batch"})
+            elif scheduled_time <= now:
+                failed.append({"index": index, "post_id": post_id, "error": "scheduled_time must be in the future"})
+            else:
+                schedule[post_id] = scheduled_time
+                indexes[post_id] = index
+        
+        updated = set(self.scheduled_post_repository.bulk_reschedule(user_id, schedule))
+        succeeded = []
+        for post_id, scheduled_time in schedule.items():
+            if post_id in updated:
+                succeeded.append({"index": indexes[post_id], "post_id": post_id, "scheduled_time": scheduled_time.isoformat()})
+            else:
+                failed.append({"index": indexes[post_id], "post_id": post_id, "error": "Post not found or can no longer be rescheduled"})
+        
+        if updated:
+            self._run_cache_invalidation(self._invalidate_batch_cache(user_id, list(updated)))
+        
+        return {"succeeded": succeeded, "failed": sorted(failed, key=lambda item: item["index"])}
+    
+    def bulk_cancel_posts(self, user_id: str, post_ids: List[int]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Cancel a batch of the user's unpublished posts in one UPDATE.
+        
+        Args:
+            user_id: The ID of the user owning the posts
+            post_ids: IDs of the posts to cancel
+            
+        Returns:
+            {"succeeded": [{"index", "post_id"}], "failed": [{"index", "post_id", "error"}]}
+            
+        Raises:
+            ValueError: If the user doesn't exist or the batch is too large
+        """
+        self._check_batch(user_id, post_ids)
+        
+        cancelled = set(self.scheduled_post_repository.bulk_cancel(user_id, list(dict.fromkeys(post_ids))))
+        succeeded, failed, seen = [], [], set()
+        for index, post_id in enumerate(post_ids):
+            if post_id in seen:
+                failed.append({"index": index, "post_id": post_id, "error": "Duplicate post_id in batch"})
+            elif post_id in cancelled:
+                succeeded.append({"index": index, "post_id": post_id})
+            else:
+                failed.append({"index": index, "post_id": post_id, "error": "Post not found or can no longer be cancelled"})
+            seen.add(post_id)
+        
+        if cancelled:
+            self._run_cache_invalidation(self._invalidate_batch_cache(user_id, list(cancelled)))
+        
+        return {"succeeded": succeeded, "failed": failed}
+    
+    def _check_batch(self, user_id: str, items: List[Any]) -> None:
+        if len(items) > MAX_BULK_POSTS:
+            raise ValueError(f"Batch too large: {len(items)} items (maximum {MAX_BULK_POSTS})")
+        
+        # One user lookup per batch rather than per post
+        if not self.user_repository.get_by_id(user_id):
+            logger.error(f"User with ID {user_id} not found")
+            raise ValueError(f"User with ID {user_id} not found")
+    
     def cancel_scheduled_post(self, post_id: int) -> bool:
         """
         Cancel a scheduled post that hasn't been published yet.
@@ -519,32 +672,30 @@ class ScheduledPostService:
         query: str, 
         user_id: Optional[str] = None,
         platform: Optional[str] = None,
-        limit: int = 50
-    ) -> List[ScheduledPost]:
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        tags: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
-        Search posts by content with caching.
+        Search posts by content, best matches first.
+        
+        Results are not cached: the search index makes the lookup cheap and
+        cached pages would go stale as soon as a post is edited.
         
         Args:
             query: Search query
             user_id: Filter by user ID (optional)
             platform: Filter by platform (optional)
             limit: Maximum number of posts to return
+            cursor: next_cursor from the previous page (optional)
+            tags: Tags the posts must mention (optional)
             
         Returns:
-            List of matching ScheduledPost objects
+            Dictionary with the matching ScheduledPost objects and the next page cursor
         """
-        cache_key = f"search_posts:{query}:{user_id or 'all'}:{platform or 'all'}:{limit}"
-        cached_posts = self.redis_manager.get(cache_key)
-        if cached_posts:
-            return [ScheduledPost(**post) for post in cached_posts]
-        
-        posts = self.scheduled_post_repository.search_posts(query, user_id, platform, limit)
-        
-        # Cache for 30 minutes
-        if posts:
-            self.redis_manager.set(cache_key, [post.__dict__ for post in posts], ttl=1800)
-        
-        return posts
+        return self.scheduled_post_repository.search_posts(
+            query, user_id=user_id, platform=platform, limit=limit, cursor=cursor, tags=tags
+        )
     
     def get_platform_performance(self, user_id: str, days: int = 30) -> Dict[str, Any]:
         """
@@ -608,8 +759,7 @@ class ScheduledPostService:
                 f"user_posts:{user_id}:*",
                 f"post_stats:{user_id}:*",
                 f"platform_performance:{user_id}:*",
-                f"failed_posts:{user_id}:*",
-                f"search_posts:*:{user_id}:*"
+                f"failed_posts:{user_id}:*"
             ]
             
             for pattern in patterns:
@@ -617,6 +767,26 @@ class ScheduledPostService:
         except Exception as e:
             logger.error(f"Error invalidating user post cache: {str(e)}")
     
+    async def _invalidate_batch_cache(self, user_id: str, post_ids: List[int]):
+        """Invalidate the cached posts of one batch and the user's listings, once."""
+        try:
+            await self.redis_manager.cache_pipeline_execute([
+                {"operation": "delete", "args": [f"scheduled_post:{post_id}" for post_id in post_ids]}
+            ])
+            for pattern in (f"user_posts:{user_id}:*", f"post_stats:{user_id}:*",
+                            f"platform_performance:{user_id}:*", f"failed_posts:{user_id}:*"):
+                await self.redis_manager.cache_delete_pattern(pattern)
+        except Exception as e:
+            logger.error(f"Error invalidating batch cache: {str(e)}")
+    
+    @staticmethod
+    def _run_cache_invalidation(coroutine):
+        """Run cache invalidation in the background, or inline when no event loop is running."""
+        try:
+            asyncio.get_running_loop().create_task(coroutine)
+        except RuntimeError:
+            asyncio.run(coroutine)
+    
     async def _invalidate_bulk_cache(self):
         """Invalidate bulk cache patterns."""
         try:
@@ -15,6 +15,8 @@ from services.database.redis import RedisManager, redis_cache
 from services.database.mongodb import MongoDBManager
 from services.database.postgresql import get_db_connection
 from services.database.optimization_service import DatabaseOptimizationService
+from services.scheduler.posting_time_model import DAY_NAMES, get_histogram
+from services.scheduler.queue_telemetry import refresh_queue_metrics
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +33,6 @@ class SchedulerCacheService:
         "scheduled_posts": 300,    # 5 minutes for scheduled posts
         "user_schedule": 1800,     # 30 minutes for user schedule data
         "platform_limits": 3600,  # 1 hour for platform posting limits
-        "optimal_times": 7200,    # 2 hours for optimal posting times
         "queue_status": 60,       # 1 minute for queue status
         "retry_posts": 300,       # 5 minutes for retry posts
         "posting_history": 1800   # 30 minutes for posting history
@@ -186,66 +187,25 @@ class SchedulerCacheService:
         }
     
     @classmethod
-    @redis_cache(ttl_seconds=CACHE_TTL["optimal_times"], key_prefix="scheduler:optimal_times")
     async def get_optimal_posting_times(cls, user_id: str, platform: str) -> Dict[str, Any]:
-        """Get cached optimal posting times based on historical performance"""
+        """Get optimal posting times from the user's hour-of-week engagement model"""
         
-        # Analyze historical performance to find optimal times
-        pipeline = [
-            {
-                "$match": {
-                    "user_id": user_id,
-                    "platform": platform,
-                    "posted_at": {"$gte": datetime.now() - timedelta(days=90)}
-                }
-            },
-            {
-                "$addFields": {
-                    "hour": {"$hour": "$posted_at"},
-                    "day_of_week": {"$dayOfWeek": "$posted_at"}
-                }
-            },
-            {
-                "$group": {
-                    "_id": {
-                        "hour": "$hour",
-                        "day_of_week": "$day_of_week"
-                    },
-                    "avg_engagement": {"$avg": "$engagement_score"},
-                    "post_count": {"$sum": 1},
-                    "total_engagement": {"$sum": "$engagement_score"}
-                }
-            },
-            {
-                "$match": {
-                    "post_count": {"$gte": 3}  # Only consider times with at least 3 posts
-                }
-            },
-            {
-                "$sort": {"avg_engagement": -1}
-            },
-            {"$limit": 20}
-        ]
-        
-        results = await MongoDBManager.aggregate("posted_content", pipeline)
+        histogram = await get_histogram(user_id, platform)
+        scores = histogram.scores()
         
         # Group by day of week
         optimal_times = {}
-        day_names = ["", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        
-        for result in results:
-            day_of_week = result["_id"]["day_of_week"]
-            hour = result["_id"]["hour"]
-            day_name = day_names[day_of_week]
+        for slot, score in enumerate(scores):
+            post_count = int(histogram.posts[slot])
+            if post_count == 0:
+                continue
             
-            if day_name not in optimal_times:
-                optimal_times[day_name] = []
-            
-            optimal_times[day_name].append({
-                "hour": hour,
-                "avg_engagement": round(result["avg_engagement"], 2),
-                "post_count": result["post_count"],
-                "confidence": min(100, (result["post_count"] / 10) * 100)  # Confidence based on sample size
+            day_name = DAY_NAMES[slot // 24]
+            optimal_times.setdefault(day_name, []).append({
+                "hour": slot % 24,
+                "avg_engagement": round(score, 2),
+                "post_count": post_count,
+                "confidence": round(histogram.confidence(slot) * 100)
             })
         
         # Sort each day's times by engagement
@@ -256,40 +216,33 @@ class SchedulerCacheService:
             "user_id": user_id,
             "platform": platform,
             "optimal_times": optimal_times,
-            "analysis_period_days": 90,
+            "sample_size": histogram.total_posts,
             "timestamp": datetime.now().isoformat()
         }
     
     @classmethod
     @redis_cache(ttl_seconds=CACHE_TTL["queue_status"], key_prefix="scheduler:queue_status")
     async def get_queue_status(cls) -> Dict[str, Any]:
-        """Get current scheduler queue status"""
+        """Get current scheduler queue status straight from the Celery broker"""
         
-        # Get queue statistics from Redis/Celery
         try:
+            snapshot = await refresh_queue_metrics()
+            
             async with RedisManager.get_connection() as redis:
-                # Get Celery queue information
-                queue_info = {}
-                
-                # Check different queue lengths
-                queues = ["celery", "scheduler", "high_priority", "low_priority"]
-                for queue in queues:
-                    length = await redis.llen(queue)
-                    queue_info[queue] = length
-                
-                # Get active tasks count (approximate)
-                active_tasks = await redis.get("celery:active_tasks") or 0
-                
                 # Get failed tasks count
                 failed_tasks = await redis.get("celery:failed_tasks") or 0
-                
-                return {
-                    "queue_lengths": queue_info,
-                    "active_tasks": int(active_tasks),
-                    "failed_tasks": int(failed_tasks),
-                    "total_queued": sum(queue_info.values()),
-                    "timestamp": datetime.now().isoformat()
-                }
+            
+            return {
+                "queue_lengths": {queue: stats["ready"] for queue, stats in snapshot["queues"].items()},
+                "queues": snapshot["queues"],
+                "active_tasks": snapshot["total_reserved"],
+                "scheduled_tasks": snapshot["total_scheduled"],
+                "failed_tasks": int(failed_tasks),
+                "total_queued": snapshot["total_ready"] + snapshot["total_scheduled"],
+                "oldest_ready_age_seconds": snapshot["oldest_ready_age_seconds"],
+                "desired_workers": snapshot["desired_workers"],
+                "timestamp": snapshot["timestamp"]
+            }
                 
         except Exception as e:
             logger.error(f"❌ Failed to get queue status: {e}")
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
-from services.scheduler.dispatcher import dispatch_scheduled_posts
+from services.scheduler.dispatcher import dispatch_scheduled_posts, release_ready_posts
 from services.database.database import get_db_session
 from services.models.scheduled_post_model import ScheduledPost, PostStatus
 from services.models.token_model import PlatformToken
@@ -9,6 +9,8 @@ from services.utils.monitoring import update_scheduled_post_gauges
 
 logger = setup_logger(__name__)
 
+LATE_POST_THRESHOLD = timedelta(minutes=10)
+
 def get_user_tokens(db, user_id, platform):
     """
     Retrieve tokens for a specific user and platform
@@ -106,7 +108,11 @@ async def beat_job():
                     "platform": post.platform,
                     "user_token": user_token,
                     "post_payload": post.post_payload,
-                    "post_id": post.id  # Include the post ID for tracking
+                    "post_id": post.id,  # Include the post ID for tracking
+                    "user_id": str(post.user_id),  # Account the post's rate limit is charged to
+                    "priority": (post.post_payload or {}).get("priority"),
+                    # Posts already running late jump ahead of ones that are merely due
+                    "time_critical": now - post.scheduled_time > LATE_POST_THRESHOLD
                 })
 
                 # Mark as in progress
@@ -120,6 +126,8 @@ async def beat_job():
 
         else:
             logger.info("[BEAT_JOB] No pending posts at this time.")
+            # Posts queued earlier are released as platform capacity refills
+            await release_ready_posts()
             
         # Update monitoring metrics with post counts
         try:
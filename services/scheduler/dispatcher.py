@@ -2,15 +2,226 @@ from celery import current_app
 from services.utils.logger_config import setup_logger
 from services.scheduler.cache_service import SchedulerCacheService
 from services.database.redis import RedisManager
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
 import json
+import time
+import uuid
 from datetime import datetime, timedelta
 
 logger = setup_logger("dispatcher")
 
+# Lanes are drained in this order; within a lane, earliest due first
+LANES = ("retry", "critical", "normal", "low")
+
+LANE_KEY = "dispatch:lane:{platform}:{lane}"
+PLATFORMS_KEY = "dispatch:platforms"
+PLATFORM_BUCKET_KEY = "dispatch:bucket:platform:{platform}"
+ACCOUNT_BUCKET_KEY = "dispatch:bucket:account:{platform}:{account}"
+PAUSE_KEY = "dispatch:paused:{platform}"
+RELEASE_LOCK_KEY = "dispatch:release:lock"
+
+RELEASE_BATCH_SIZE = 50      # Posts examined per lane per release pass
+RELEASE_LOCK_TTL = 55        # Shorter than the beat interval, so a crashed releaser frees up quickly
+REQUIRED_FIELDS = ("platform", "user_token", "post_payload")
+
+# Takes one token from both buckets or from neither.
+# Returns 1 when taken, 0 when the platform bucket is empty, 2 when only the account bucket is.
+_TAKE_TOKENS_LUA = """
+local now = tonumber(ARGV[1])
+local function refill(key, capacity, rate)
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    return math.min(capacity, tokens + math.max(0, now - ts) * rate)
+end
+local function save(key, tokens, capacity, rate)
+    redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) * 2)
+end
+local p_cap, p_rate = tonumber(ARGV[2]), tonumber(ARGV[3])
+local a_cap, a_rate = tonumber(ARGV[4]), tonumber(ARGV[5])
+local p_tokens = refill(KEYS[1], p_cap, p_rate)
+local a_tokens = refill(KEYS[2], a_cap, a_rate)
+if p_tokens < 1 then
+    save(KEYS[1], p_tokens, p_cap, p_rate)
+    return 0
+end
+if a_tokens < 1 then
+    save(KEYS[2], a_tokens, a_cap, a_rate)
+    return 2
+end
+save(KEYS[1], p_tokens - 1, p_cap, p_rate)
+save(KEYS[2], a_tokens - 1, a_cap, a_rate)
+return 1
+"""
+
+# Deletes the release lock only while it still holds this run's token, so a
+# run that outlived the TTL cannot free a lock another run has since taken
+_RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def lane_for(post: Dict[str, Any]) -> str:
+    """Retries first, then time-critical posts, then everything else by priority"""
+    if post.get("attempt", 0) > 0:
+        return "retry"
+    priority = post.get("priority")
+    if priority in ("high", "critical") or post.get("time_critical"):
+        return "critical"
+    if priority == "low":
+        return "low"
+    return "normal"
+
+
+def account_for(post: Dict[str, Any]) -> str:
+    """The platform account a post is published from"""
+    if post.get("user_id") is not None:
+        return str(post["user_id"])
+    token = post.get("user_token") or {}
+    account = token.get("page_id") or token.get("ig_user_id") or token.get("user_id") or token.get("organization_id")
+    if account:
+        return str(account)
+    return hashlib.sha256(str(token.get("access_token", "")).encode()).hexdigest()[:16]
+
+
+def bucket_parameters(limits: Dict[str, int]) -> Tuple[float, float, float, float]:
+    """
+    (platform capacity, platform refill/s, account capacity, account refill/s).
+
+    The platform bucket holds the hourly limit and refills over the hour, so
+    a top-of-the-hour burst drains it and the rest waits for capacity. Each
+    account may burst up to the hourly limit but refills at its daily share.
+    """
+    hourly = max(1, int(limits.get("hourly", 2)))
+    daily = max(1, int(limits.get("daily", hourly)))
+    return float(hourly), hourly / 3600.0, float(hourly), daily / 86400.0
+
+
+async def enqueue_posts(posts: List[Dict[str, Any]], not_before: Optional[float] = None) -> int:
+    """
+    Add posts to their platform's priority lanes in one round trip.
+
+    Args:
+        posts: Post dicts as accepted by ``dispatch_scheduled_posts``
+        not_before: Epoch seconds before which the posts must not be released
+
+    Returns:
+        Number of posts enqueued
+    """
+    ready_at = not_before or time.time()
+    async with RedisManager.get_connection() as redis:
+        pipe = redis.pipeline(transaction=False)
+        for post in posts:
+            platform = post["platform"]
+            pipe.zadd(LANE_KEY.format(platform=platform, lane=lane_for(post)),
+                      {json.dumps(post, sort_keys=True, default=str): ready_at})
+            pipe.sadd(PLATFORMS_KEY, platform)
+        await pipe.execute()
+    return len(posts)
+
+
+async def pause_platform(platform: str, seconds: int) -> None:
+    """Hold every release for a platform, e.g. after it answered with a rate limit"""
+    async with RedisManager.get_connection() as redis:
+        await redis.set(PAUSE_KEY.format(platform=platform), 1, ex=max(1, int(seconds)))
+
+
+async def _release_platform(redis, take_tokens, platform: str, now: float) -> Dict[str, int]:
+    released = deferred = 0
+    limits_info = await SchedulerCacheService.get_platform_posting_limits(platform)
+    p_cap, p_rate, a_cap, a_rate = bucket_parameters(limits_info.get("limits", {}))
+    exhausted_accounts = set()
+
+    for lane in LANES:
+        lane_key = LANE_KEY.format(platform=platform, lane=lane)
+        members = await redis.zrangebyscore(lane_key, "-inf", now, start=0, num=RELEASE_BATCH_SIZE)
+        for member in members:
+            post = json.loads(member)
+            account = account_for(post)
+            if account in exhausted_accounts:
+                deferred += 1
+                continue
+
+            taken = await take_tokens(
+                keys=[PLATFORM_BUCKET_KEY.format(platform=platform),
+                      ACCOUNT_BUCKET_KEY.format(platform=platform, account=account)],
+                args=[now, p_cap, p_rate, a_cap, a_rate]
+            )
+            if taken == 0:
+                # No platform capacity left; later lanes must wait too
+                return {"released": released, "deferred": deferred}
+            if taken == 2:
+                exhausted_accounts.add(account)
+                deferred += 1
+                continue
+
+            # Published before it leaves the lane: if the broker is unreachable the
+            # post stays queued for the next pass instead of being lost
+            current_app.send_task(
+                'services.scheduler.tasks.schedule_post',
+                args=(post["platform"], post["user_token"], post["post_payload"], post.get("post_id")),
+                kwargs={"attempt": post.get("attempt", 0), "user_id": post.get("user_id")},
+                queue="high_priority" if lane in ("retry", "critical") else "celery"
+            )
+            await redis.zrem(lane_key, member)
+            released += 1
+            logger.info(f"[DISPATCHER] Released post {post.get('post_id')} to {platform} from {lane} lane")
+
+    return {"released": released, "deferred": deferred}
+
+
+async def release_ready_posts() -> Dict[str, Any]:
+    """
+    Send queued posts to Celery while their platform and account have capacity.
+
+    Only one releaser runs at a time; posts stay queued (not in the broker)
+    until a token is available, so a burst of due posts never turns into a
+    burst of platform calls.
+    """
+    token = uuid.uuid4().hex
+    if not await RedisManager.cache_set_if_absent(RELEASE_LOCK_KEY, token, ttl_seconds=RELEASE_LOCK_TTL):
+        return {"skipped": True, "reason": "release_in_progress"}
+
+    summary = {"released": 0, "deferred": 0, "platforms": {}}
+    try:
+        async with RedisManager.get_connection() as redis:
+            take_tokens = redis.register_script(_TAKE_TOKENS_LUA)
+            now = time.time()
+            for platform in sorted(await redis.smembers(PLATFORMS_KEY)):
+                if await redis.exists(PAUSE_KEY.format(platform=platform)):
+                    summary["platforms"][platform] = {"paused": True}
+                    continue
+                try:
+                    result = await _release_platform(redis, take_tokens, platform, now)
+                except Exception as e:
+                    logger.exception(f"[DISPATCHER] Error releasing posts for {platform}: {e}")
+                    await update_dispatch_metrics(platform, "failed")
+                    continue
+
+                summary["platforms"][platform] = result
+                summary["released"] += result["released"]
+                summary["deferred"] += result["deferred"]
+                if result["released"]:
+                    await update_dispatch_metrics(platform, "dispatched", result["released"])
+    finally:
+        async with RedisManager.get_connection() as redis:
+            release_lock = redis.register_script(_RELEASE_LOCK_LUA)
+            await release_lock(keys=[RELEASE_LOCK_KEY], args=[token])
+
+    return summary
+
+
 async def dispatch_scheduled_posts(posts: list):
     """
-    Dispatches a list of posts to the Celery task queue with intelligent optimization.
+    Queues due posts for rate-limited release to the Celery task queue.
+    
+    Posts go into per-platform priority lanes and are released as the
+    platform's and account's token buckets allow (see ``release_ready_posts``).
     
     Args:
         posts: List of post dictionaries with the following structure:
@@ -19,109 +230,52 @@ async def dispatch_scheduled_posts(posts: list):
                     "platform": "instagram", 
                     "user_token": {...}, 
                     "post_payload": {...},
-                    "post_id": 123  # Optional database ID of the scheduled post
+                    "post_id": 123,  # Optional database ID of the scheduled post
+                    "user_id": "...",  # Optional; identifies the account bucket
+                    "priority": "high"  # Optional; high/critical, normal or low
                 },
                 ...
             ]
     """
-    if not posts:
-        logger.info("[DISPATCHER] No posts to dispatch")
-        return
-        
-    logger.info(f"[DISPATCHER] Dispatching {len(posts)} posts with optimization")
-    
-    # Group posts by platform for optimized dispatching
-    posts_by_platform = {}
-    for post in posts:
-        platform = post.get("platform")
-        if platform not in posts_by_platform:
-            posts_by_platform[platform] = []
-        posts_by_platform[platform].append(post)
-    
-    dispatched_count = 0
+    posts = posts or []
+    valid_posts = []
     failed_count = 0
+    for post in posts:
+        if not all(key in post for key in REQUIRED_FIELDS):
+            logger.error(f"[DISPATCHER] Missing required fields in post: {post.get('post_id', 'unknown')}")
+            failed_count += 1
+            continue
+        valid_posts.append(post)
     
-    for platform, platform_posts in posts_by_platform.items():
+    queued_count = 0
+    if valid_posts:
         try:
-            # Check platform posting limits
-            limits_info = await SchedulerCacheService.get_platform_posting_limits(platform)
-            
-            if not limits_info.get("can_post", True):
-                logger.warning(f"[DISPATCHER] Platform {platform} has reached posting limits. Skipping {len(platform_posts)} posts")
-                continue
-            
-            # Calculate optimal delay based on platform limits
-            hourly_limit = limits_info.get("limits", {}).get("hourly", 10)
-            optimal_delay = max(1, 3600 / hourly_limit)  # Spread posts evenly across the hour
-            
-            for i, post in enumerate(platform_posts):
-                try:
-                    # Validate required fields
-                    if not all(key in post for key in ["platform", "user_token", "post_payload"]):
-                        logger.error(f"[DISPATCHER] Missing required fields in post: {post.get('post_id', 'unknown')}")
-                        failed_count += 1
-                        continue
-                    
-                    # Calculate intelligent delay
-                    base_delay = i * optimal_delay
-                    priority_delay = 0
-                    
-                    # Add priority handling
-                    if post.get("priority") == "high":
-                        priority_delay = -30  # High priority posts go 30 seconds earlier
-                    elif post.get("priority") == "low":
-                        priority_delay = 60   # Low priority posts go 60 seconds later
-                    
-                    total_delay = max(0, base_delay + priority_delay)
-                    
-                    # Extract post_id if it exists, otherwise pass None
-                    post_id = post.get("post_id", None)
-                    
-                    # Log dispatch with optimization info
-                    logger.info(f"[DISPATCHER] Sending post {post_id} to {platform} with {total_delay:.1f}s delay (optimized)")
-                    
-                    # Send to appropriate Celery queue based on priority
-                    queue_name = "high_priority" if post.get("priority") == "high" else "celery"
-                    
-                    # Send to Celery task queue
-                    current_app.send_task(
-                        'services.scheduler.tasks.schedule_post',
-                        args=(post["platform"], post["user_token"], post["post_payload"], post_id),
-                        countdown=total_delay,
-                        queue=queue_name
-                    )
-                    
-                    dispatched_count += 1
-                    
-                    # Update dispatch metrics in cache
-                    await update_dispatch_metrics(platform, "dispatched")
-                    
-                except Exception as e:
-                    logger.exception(f"[DISPATCHER] Error dispatching post {post.get('post_id', 'unknown')}: {e}")
-                    failed_count += 1
-                    await update_dispatch_metrics(platform, "failed")
-                    
+            queued_count = await enqueue_posts(valid_posts)
+            logger.info(f"[DISPATCHER] Queued {queued_count} posts for release")
         except Exception as e:
-            logger.exception(f"[DISPATCHER] Error processing platform {platform}: {e}")
-            failed_count += len(platform_posts)
+            logger.exception(f"[DISPATCHER] Error queueing posts: {e}")
+            failed_count += len(valid_posts)
+    
+    release = await release_ready_posts()
+    dispatched_count = release.get("released", 0)
     
     # Update overall dispatch statistics
     await update_overall_dispatch_stats(dispatched_count, failed_count)
     
-    logger.info(f"[DISPATCHER] Completed dispatching. Success: {dispatched_count}, Failed: {failed_count}")
-    return {"dispatched": dispatched_count, "failed": failed_count}
+    logger.info(f"[DISPATCHER] Completed dispatching. Queued: {queued_count}, Released: {dispatched_count}, Failed: {failed_count}")
+    return {"queued": queued_count, "dispatched": dispatched_count, "failed": failed_count}
 
-async def update_dispatch_metrics(platform: str, status: str):
+async def update_dispatch_metrics(platform: str, status: str, count: int = 1):
     """Update dispatch metrics in Redis for monitoring"""
     try:
         async with RedisManager.get_connection() as redis:
             # Increment platform-specific counter
-            await redis.incr(f"dispatch_metrics:{platform}:{status}")
+            await redis.incrby(f"dispatch_metrics:{platform}:{status}", count)
             await redis.expire(f"dispatch_metrics:{platform}:{status}", 86400)  # 24 hours
             
             # Increment daily counter
             today = datetime.now().strftime("%Y-%m-%d")
-            await redis.incr(f"dispatch_daily:{today}:{status}")
+            await redis.incrby(f"dispatch_daily:{today}:{status}", count)
             await redis.expire(f"dispatch_daily:{today}:{status}", 86400 * 7)  # 7 days
             
     except Exception as e:
@@ -137,7 +291,7 @@ async def update_overall_dispatch_stats(dispatched: int, failed: int):
             "success_rate": (dispatched / (dispatched + failed) * 100) if (dispatched + failed) > 0 else 0
         }
         
-        await RedisManager.cache_set("dispatch_stats:latest", json.dumps(stats), ttl=3600)
+        await RedisManager.cache_set("dispatch_stats:latest", json.dumps(stats), ttl_seconds=3600)
         
     except Exception as e:
         logger.error(f"Failed to update overall dispatch stats: {e}")
@@ -191,20 +345,23 @@ async def get_dispatch_statistics() -> Dict[str, Any]:
         return {"error": str(e)}
 
 async def optimize_dispatch_queue():
-    """Optimize the dispatch queue by reordering posts based on priority and platform limits"""
+    """Release whatever the token buckets allow and report the remaining lane depths"""
     try:
-        # Get current queue status
-        queue_status = await SchedulerCacheService.get_queue_status()
+        release = await release_ready_posts()
         
-        if queue_status.get("total_queued", 0) == 0:
-            return {"message": "No posts in queue to optimize"}
+        lanes = {}
+        async with RedisManager.get_connection() as redis:
+            for platform in sorted(await redis.smembers(PLATFORMS_KEY)):
+                lanes[platform] = {
+                    lane: await redis.zcard(LANE_KEY.format(platform=platform, lane=lane))
+                    for lane in LANES
+                }
         
-        # This would implement queue reordering logic
-        # For now, just log the optimization attempt
-        logger.info(f"[OPTIMIZER] Queue optimization completed. Current queue size: {queue_status.get('total_queued', 0)}")
+        queue_size = sum(sum(depths.values()) for depths in lanes.values())
+        logger.info(f"[OPTIMIZER] Released {release.get('released', 0)} posts. Still queued: {queue_size}")
         
-        return {"optimized": True, "queue_size": queue_status.get("total_queued", 0)}
+        return {"optimized": True, "released": release.get("released", 0), "queue_size": queue_size, "lanes": lanes}
         
     except Exception as e:
         logger.error(f"Failed to optimize dispatch queue: {e}")
-        return {"error": str(e)}
\ No newline at end of file
+        return {"error": str(e)}
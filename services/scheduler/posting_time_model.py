@@ -0,0 +1,286 @@
+"""
+Posting Time Model
+==================
+
+Per-user, per-platform hour-of-week engagement histograms.
+
+Each model is two fixed-size arrays of 168 slots (one per hour of the week,
+Monday 00:00 UTC first): summed engagement and number of posts. Collected
+engagement is added to the stored arrays with an atomic ``$inc`` as it
+arrives, so a suggestion only needs one small document and a single pass
+over 168 slots instead of re-aggregating months of post history.
+"""
+
+import logging
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.database.mongodb import MongoDBManager
+from services.database.redis import RedisManager
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_WEEK = 168
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+MODEL_COLLECTION = "posting_time_models"
+PRIOR_WEIGHT = 5.0             # Posts' worth of the user's mean engagement blended into every slot
+MIN_MODEL_POSTS = 10           # Below this, callers fall back to platform defaults
+ENGAGEMENT_MATURITY = timedelta(hours=24)  # Posts younger than this are still accruing engagement
+SEEN_POST_TTL = 45 * 24 * 3600             # Longer than any collection window
+BOOTSTRAP_DAYS = 90
+
+MODEL_CACHE_TTL = 60.0         # Seconds a loaded model is served from process memory
+MODEL_CACHE_SIZE = 2048
+
+SEEN_POST_KEY = "posting_model:seen:{user_id}:{platform}:{content_id}"
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Naive UTC, the way timestamps are stored in MongoDB."""
+    return moment.astimezone(timezone.utc).replace(tzinfo=None) if moment.tzinfo else moment
+
+
+def slot_for(moment: datetime) -> int:
+    """Hour-of-week slot of a timestamp; naive timestamps are taken as UTC."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.weekday() * 24 + moment.hour
+
+
+class EngagementHistogram:
+    """Summed engagement and post counts for each hour of the week."""
+
+    def __init__(self, engagement: Optional[List[float]] = None, posts: Optional[List[float]] = None):
+        self.engagement = array("d", engagement or [0.0] * HOURS_PER_WEEK)
+        self.posts = array("d", posts or [0.0] * HOURS_PER_WEEK)
+        if len(self.engagement) != HOURS_PER_WEEK or len(self.posts) != HOURS_PER_WEEK:
+            raise ValueError(f"Histograms must have {HOURS_PER_WEEK} slots")
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "EngagementHistogram":
+        return cls(document.get("engagement"), document.get("posts"))
+
+    def to_document(self) -> Dict[str, Any]:
+        return {"engagement": list(self.engagement), "posts": list(self.posts)}
+
+    def add(self, posted_at: datetime, engagement: float, count: int = 1) -> None:
+        slot = slot_for(posted_at)
+        self.engagement[slot] += engagement
+        self.posts[slot] += count
+
+    @property
+    def total_posts(self) -> int:
+        return int(sum(self.posts))
+
+    def scores(self, prior_weight: float = PRIOR_WEIGHT) -> List[float]:
+        """
+        Expected engagement of a post in each slot.
+
+        Neighbouring hours count at half weight and every slot is
+        shrunk towards the user's mean, so a single lucky post cannot make an
+        hour the favourite.
+        """
+        total_posts = sum(self.posts)
+        if not total_posts:
+            return [0.0] * HOURS_PER_WEEK
+        mean = sum(self.engagement) / total_posts
+        prior = prior_weight * mean
+
+        e, n = self.engagement, self.posts
+        return [
+            (e[s] + 0.5 * (e[s - 1] + e[(s + 1) % HOURS_PER_WEEK]) + prior)
+            / (n[s] + 0.5 * (n[s - 1] + n[(s + 1) % HOURS_PER_WEEK]) + prior_weight)
+            for s in range(HOURS_PER_WEEK)
+        ]
+
+    def confidence(self, slot: int, prior_weight: float = PRIOR_WEIGHT) -> float:
+        """Share of a slot's score that comes from its own posts (0..1)."""
+        return self.posts[slot] / (self.posts[slot] + prior_weight)
+
+    def best_slots(self, limit: int = 5) -> List[Tuple[int, float]]:
+        """Highest scoring ``(slot, score)`` pairs, best first."""
+        scores = self.scores()
+        return sorted(enumerate(scores), key=lambda item: item[1], reverse=True)[:limit]
+
+    def day_scores(self) -> Dict[str, float]:
+        """Mean slot score per weekday, normalised so the best day is 1.0."""
+        scores = self.scores()
+        days = [sum(scores[d * 24:(d + 1) * 24]) / 24 for d in range(7)]
+        top = max(days) or 1.0
+        return {DAY_NAMES[d].lower(): round(days[d] / top, 2) for d in range(7)}
+
+    def next_best_times(self, now: datetime, limit: int = 3,
+                        horizon_hours: int = HOURS_PER_WEEK) -> List[Tuple[datetime, float]]:
+        """
+        Best upcoming hour starts within the horizon, best first.
+
+        ``now`` must be timezone-aware; results are in the same timezone.
+        """
+        scores = self.scores()
+        start = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        candidates = [start + timedelta(hours=offset) for offset in range(horizon_hours)]
+        ranked = sorted(candidates, key=lambda moment: scores[slot_for(moment)], reverse=True)
+        return [(moment, scores[slot_for(moment)]) for moment in ranked[:limit]]
+
+
+# (user_id, platform) -> (loaded_at, histogram)
+_model_cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[EngagementHistogram]]]" = OrderedDict()
+
+
+def _cache_put(key: Tuple[str, str], histogram: Optional[EngagementHistogram]) -> None:
+    _model_cache[key] = (time.monotonic(), histogram)
+    _model_cache.move_to_end(key)
+    while len(_model_cache) > MODEL_CACHE_SIZE:
+        _model_cache.popitem(last=False)
+
+
+def clear_model_cache() -> None:
+    _model_cache.clear()
+
+
+async def load_histogram(user_id: str, platform: str) -> Optional[EngagementHistogram]:
+    """Load a stored model, served from process memory for MODEL_CACHE_TTL seconds."""
+    key = (user_id, platform)
+    cached = _model_cache.get(key)
+    if cached and time.monotonic() - cached[0] < MODEL_CACHE_TTL:
+        return cached[1]
+
+    documents = await MongoDBManager.find_with_options(
+        MODEL_COLLECTION,
+        {"user_id": user_id, "platform": platform},
+        projection={"engagement": 1, "posts": 1},
+        limit=1
+    )
+    histogram = EngagementHistogram.from_document(documents[0]) if documents else None
+    _cache_put(key, histogram)
+    return histogram
+
+
+async def _increment(user_id: str, platform: str, posted_at: datetime, engagement: float) -> bool:
+    slot = slot_for(posted_at)
+    result = await MongoDBManager.update_with_options(
+        MODEL_COLLECTION,
+        # Posts up to history_through were already counted when the model was bootstrapped
+        {"user_id": user_id, "platform": platform, "history_through": {"$not": {"$gte": _as_utc(posted_at)}}},
+        {
+            "$inc": {f"engagement.{slot}": engagement, f"posts.{slot}": 1},
+            "$set": {"updated_at": datetime.utcnow()}
+        }
+    )
+    return bool(result.get("matched_count"))
+
+
+async def _create_model(user_id: str, platform: str, histogram: EngagementHistogram,
+                        history_through: Optional[datetime] = None) -> None:
+    try:
+        await MongoDBManager.update_with_options(
+            MODEL_COLLECTION,
+            {"user_id": user_id, "platform": platform},
+            {"$setOnInsert": {
+                "user_id": user_id,
+                "platform": platform,
+                **histogram.to_document(),
+                "history_through": history_through,
+                "updated_at": datetime.utcnow()
+            }},
+            upsert=True
+        )
+    except Exception as e:
+        # A concurrent writer created it first (unique index); theirs is kept
+        logger.debug(f"Posting time model for {user_id}/{platform} already exists: {e}")
+
+
+async def record_engagement(user_id: str, platform: str, posted_at: datetime, engagement: float) -> bool:
+    """
+    Add one post's engagement to the user's model.
+
+    A missing model is bootstrapped from posting history first; posts that
+    history already covered are not counted again.
+
+    Returns:
+        True if the post was added to the model
+    """
+    added = await _increment(user_id, platform, posted_at, engagement)
+    if not added:
+        existing = await MongoDBManager.find_with_options(
+            MODEL_COLLECTION,
+            {"user_id": user_id, "platform": platform},
+            projection={"_id": 1},
+            limit=1
+        )
+        if not existing:
+            await bootstrap_from_history(user_id, platform)
+            added = await _increment(user_id, platform, posted_at, engagement)
+    _model_cache.pop((user_id, platform), None)
+    return added
+
+
+async def record_post_engagement(user_id: str, platform: str, content_id: str,
+                                 posted_at: datetime, engagement: float) -> bool:
+    """
+    Add a collected post to the model once it has had time to accrue engagement.
+
+    Collection windows overlap, so each post is counted at most once; posts
+    already covered by the model's bootstrap history are skipped.
+
+    Returns:
+        True if the post was added to the model
+    """
+    if datetime.utcnow() - _as_utc(posted_at) < ENGAGEMENT_MATURITY:
+        return False
+
+    seen_key = SEEN_POST_KEY.format(user_id=user_id, platform=platform, content_id=content_id)
+    if not await RedisManager.cache_set_if_absent(seen_key, 1, ttl_seconds=SEEN_POST_TTL):
+        return False
+
+    return await record_engagement(user_id, platform, posted_at, float(engagement or 0))
+
+
+async def bootstrap_from_history(user_id: str, platform: str, days: int = BOOTSTRAP_DAYS) -> EngagementHistogram:
+    """Build a user's first model from ``posted_content`` history (run once per model)."""
+    pipeline = [
+        {
+            "$match": {
+                "user_id": user_id,
+                "platform": platform,
+                "posted_at": {"$gte": datetime.utcnow() - timedelta(days=days)}
+            }
+        },
+        {
+            "$group": {
+                "_id": {"hour": {"$hour": "$posted_at"}, "day_of_week": {"$dayOfWeek": "$posted_at"}},
+                "total_engagement": {"$sum": "$engagement_score"},
+                "post_count": {"$sum": 1},
+                "last_posted_at": {"$max": "$posted_at"}
+            }
+        }
+    ]
+    results = await MongoDBManager.aggregate("posted_content", pipeline)
+
+    histogram = EngagementHistogram()
+    history_through = None
+    for row in results:
+        # $dayOfWeek is 1 = Sunday .. 7 = Saturday
+        weekday = (row["_id"]["day_of_week"] + 5) % 7
+        slot = weekday * 24 + row["_id"]["hour"]
+        histogram.engagement[slot] += row.get("total_engagement") or 0.0
+        histogram.posts[slot] += row.get("post_count", 0)
+        if row.get("last_posted_at") and (history_through is None or row["last_posted_at"] > history_through):
+            history_through = row["last_posted_at"]
+
+    await _create_model(user_id, platform, histogram, history_through)
+    _model_cache.pop((user_id, platform), None)
+    return histogram
+
+
+async def get_histogram(user_id: str, platform: str) -> EngagementHistogram:
+    """The user's model, bootstrapped from posting history the first time it is needed."""
+    histogram = await load_histogram(user_id, platform)
+    if histogram is None:
+        histogram = await bootstrap_from_history(user_id, platform)
+        _cache_put((user_id, platform), histogram)
+    return histogram
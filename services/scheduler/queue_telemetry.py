@@ -0,0 +1,210 @@
+"""
+Queue Telemetry
+===============
+
+Reads Celery's real backlog straight from the Redis broker.
+
+Kombu's Redis transport keeps each queue as a list (one per priority step),
+and every message a worker has taken but not yet acknowledged, including
+countdown/ETA tasks it is holding until they are due, in the ``unacked``
+hash with its reservation time in ``unacked_index``. Counting those gives
+the true depth, lag and in-flight work per queue, which LLEN on a few
+hand-picked keys cannot.
+
+Unacked messages are classified once and remembered by delivery tag, so a
+snapshot only fetches the messages reserved since the previous one.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+BROKER_URL = os.getenv("REDIS_BROKER") or os.getenv("REDIS_URL", "redis://localhost:6379")
+MONITORED_QUEUES = [q.strip() for q in os.getenv("CELERY_MONITORED_QUEUES", "celery,high_priority,scheduler,low_priority").split(",") if q.strip()]
+
+# Autoscaling inputs
+WORKER_CONCURRENCY = int(os.getenv("CELERY_WORKER_CONCURRENCY", str(os.cpu_count() or 1)))
+AVG_TASK_SECONDS = float(os.getenv("CELERY_AVG_TASK_SECONDS", "2.0"))
+TARGET_LAG_SECONDS = float(os.getenv("CELERY_TARGET_LAG_SECONDS", "60"))
+MIN_WORKERS = int(os.getenv("CELERY_MIN_WORKERS", "1"))
+MAX_WORKERS = int(os.getenv("CELERY_MAX_WORKERS", "20"))
+
+# Kombu Redis transport layout
+PRIORITY_SEPARATOR = "\x06\x16"
+PRIORITY_STEPS = [0, 3, 6, 9]
+UNACKED_KEY = "unacked"
+UNACKED_INDEX_KEY = "unacked_index"
+MAX_UNACKED_SCAN = 10000     # Oldest unacked messages inspected to split in-flight from ETA-held
+
+SENT_AT_HEADER = "sent_at"
+
+_broker: Optional[Redis] = None
+
+# Delivery tag -> (routing key, ETA) of the unacked messages seen so far
+_unacked_seen: Dict[str, Tuple[str, Optional[float]]] = {}
+
+
+def stamp_sent_at(headers=None, **kwargs) -> None:
+    """``before_task_publish`` handler recording when a task entered the broker."""
+    if headers is not None:
+        headers.setdefault(SENT_AT_HEADER, time.time())
+
+
+def _get_broker() -> Redis:
+    global _broker
+    if _broker is None:
+        options = {"decode_responses": True, "socket_timeout": 5}
+        if BROKER_URL.startswith("rediss://"):
+            options["ssl_cert_reqs"] = None  # Matches the worker's broker_use_ssl
+        _broker = Redis.from_url(BROKER_URL, **options)
+    return _broker
+
+
+def queue_keys(queue: str) -> List[str]:
+    """Broker list keys holding a queue's messages, one per priority step."""
+    return [queue if step == 0 else f"{queue}{PRIORITY_SEPARATOR}{step}" for step in PRIORITY_STEPS]
+
+
+def _sent_at(raw: Optional[str]) -> Optional[float]:
+    if not raw:
+        return None
+    try:
+        return float(json.loads(raw).get("headers", {}).get(SENT_AT_HEADER))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _eta(message: Dict[str, Any]) -> Optional[float]:
+    eta = (message.get("headers") or {}).get("eta")
+    if not eta:
+        return None
+    try:
+        return datetime.fromisoformat(eta).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def desired_workers(ready: int, in_flight: int, oldest_age: float,
+                    concurrency: int = WORKER_CONCURRENCY, avg_task_seconds: float = AVG_TASK_SECONDS,
+                    target_lag: float = TARGET_LAG_SECONDS) -> int:
+    """
+    Workers needed to clear the backlog within the target lag.
+
+    Outstanding work is (ready + in-flight) x average task time; one worker
+    clears ``concurrency x target_lag`` seconds of it per target window. When
+    the oldest ready message is already older than the target, the estimate
+    is scaled up by how far behind the queue is.
+    """
+    work_seconds = (ready + in_flight) * avg_task_seconds
+    workers = work_seconds / (max(1, concurrency) * target_lag)
+    if ready and oldest_age > target_lag:
+        workers *= oldest_age / target_lag
+    return max(MIN_WORKERS, min(MAX_WORKERS, math.ceil(workers)))
+
+
+def _classify_unacked(tag: str, raw: Optional[str]) -> None:
+    try:
+        message, _exchange, routing_key = json.loads(raw)
+    except (TypeError, ValueError):
+        return
+    _unacked_seen[tag] = (routing_key, _eta(message))
+
+
+async def collect_queue_snapshot(queues: Optional[List[str]] = None, broker: Optional[Redis] = None) -> Dict[str, Any]:
+    """
+    Per-queue depth, oldest-message age and reserved/ETA-held counts.
+
+    One pipelined round trip reads the queue lists and the unacked index;
+    a second one fetches only the unacked messages not classified before.
+
+    Returns:
+        Snapshot with a ``queues`` breakdown, totals and ``desired_workers``
+    """
+    queues = queues or MONITORED_QUEUES
+    broker = broker or _get_broker()
+    now = time.time()
+
+    pipe = broker.pipeline(transaction=False)
+    for queue in queues:
+        for key in queue_keys(queue):
+            pipe.llen(key)
+            pipe.lindex(key, -1)  # Messages are pushed left and consumed right: -1 is the oldest
+    pipe.zcard(UNACKED_INDEX_KEY)
+    pipe.zrange(UNACKED_INDEX_KEY, 0, MAX_UNACKED_SCAN - 1, withscores=True)
+    results = await pipe.execute()
+
+    snapshot = {}
+    position = 0
+    for queue in queues:
+        ready = 0
+        oldest = None
+        for _ in PRIORITY_STEPS:
+            length, head = results[position], results[position + 1]
+            position += 2
+            ready += int(length or 0)
+            sent_at = _sent_at(head)
+            if sent_at is not None:
+                oldest = sent_at if oldest is None else min(oldest, sent_at)
+        snapshot[queue] = {
+            "ready": ready,
+            "oldest_age_seconds": round(now - oldest, 3) if oldest else 0.0,
+            "reserved": 0,
+            "scheduled": 0
+        }
+    unacked_total = int(results[position] or 0)
+    reserved_index = results[position + 1] or []
+    tags = [tag for tag, _ in reserved_index]
+
+    # Acknowledged messages have left the index; only new reservations are fetched
+    current = set(tags)
+    for tag in [tag for tag in _unacked_seen if tag not in current]:
+        del _unacked_seen[tag]
+    new_tags = [tag for tag in tags if tag not in _unacked_seen]
+    if new_tags:
+        for tag, raw in zip(new_tags, await broker.hmget(UNACKED_KEY, new_tags)):
+            _classify_unacked(tag, raw)
+
+    # Split unacked messages into in-flight work and countdown/ETA tasks held by workers
+    for tag in tags:
+        if tag not in _unacked_seen:
+            continue
+        routing_key, eta = _unacked_seen[tag]
+        stats = snapshot.setdefault(routing_key, {"ready": 0, "oldest_age_seconds": 0.0, "reserved": 0, "scheduled": 0})
+        if eta is not None and eta > now:
+            stats["scheduled"] += 1
+        else:
+            stats["reserved"] += 1
+
+    total_ready = sum(q["ready"] for q in snapshot.values())
+    total_reserved = sum(q["reserved"] for q in snapshot.values())
+    oldest_age = max((q["oldest_age_seconds"] for q in snapshot.values()), default=0.0)
+
+    return {
+        "queues": snapshot,
+        "total_ready": total_ready,
+        "total_reserved": total_reserved,
+        "total_scheduled": sum(q["scheduled"] for q in snapshot.values()),
+        "unacked": unacked_total,
+        "unacked_sampled": unacked_total > MAX_UNACKED_SCAN,
+        "oldest_ready_age_seconds": oldest_age,
+        "oldest_reserved_age_seconds": round(now - reserved_index[0][1], 3) if reserved_index else 0.0,
+        "desired_workers": desired_workers(total_ready, total_reserved, oldest_age),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+async def refresh_queue_metrics() -> Dict[str, Any]:
+    """Collect a snapshot and publish it to the Prometheus gauges."""
+    from services.utils.monitoring import update_queue_gauges
+
+    snapshot = await collect_queue_snapshot()
+    update_queue_gauges(snapshot)
+    return snapshot
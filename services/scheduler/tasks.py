@@ -6,19 +6,14 @@ from services.refresh.twitter_refresh import refresh_twitter_token
 from services.refresh.youtube_refresh import refresh_youtube_token
 from services.refresh.tiktok_refresh import refresh_tiktok_token
 
-from services.scheduler.dispatcher import dispatch_scheduled_posts  # ✅ Directly use dispatcher, no loop!
+from services.scheduler.dispatcher import dispatch_scheduled_posts, enqueue_posts, pause_platform  # ✅ Directly use dispatcher, no loop!
 from services.utils.logger_config import setup_logger
 from services.models.scheduled_post_model import ScheduledPost, PostStatus
-from services.database.postgresql import get_db, get_db_connection
-from services.database.optimization_service import DatabaseOptimizationService
+from services.database.postgresql import get_db_connection
 from services.scheduler.cache_service import SchedulerCacheService
 from services.database.redis import RedisManager
-from services.platform.meta import MetaAPI
-from services.platform.linkedin import LinkedInAPI
-from services.platform.twitter import TwitterAPI
-from services.platform.youtube import YouTubeAPI
-from services.platform.tiktok import TikTokAPI
 import json
+import time
 import asyncio
 import asyncpg
 from datetime import datetime, timedelta
@@ -129,16 +124,23 @@ async def update_post_metrics(status: str, platform: str):
         logger.error(f"Failed to update post metrics: {e}")
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def schedule_post(self, platform, user_token, post_payload, post_id=None):
+def schedule_post(self, platform, user_token, post_payload, post_id=None, attempt=0, user_id=None):
     """
     Runs when a scheduled post needs to be published with optimization features.
     Retries up to 3 times if fails, based on platform-specific retry logic.
     
+    Failed posts are retried through the dispatcher's retry lane, so retries
+    wait for platform capacity like any other post instead of hitting the
+    platform again on a fixed countdown.
+    
     Args:
         platform: The social platform to post to
         user_token: Authentication tokens for the platform
         post_payload: Content and media to post
         post_id: Optional ID of the ScheduledPost in the database
+        attempt: Number of earlier failed attempts for this post
+        user_id: Optional account the post belongs to, kept on retries so they
+            draw from the same account bucket
     """
     logger.info(f"[SCHEDULE_POST] Posting on platform: {platform} (optimized)")
 
@@ -176,10 +178,10 @@ def schedule_post(self, platform, user_token, post_payload, post_id=None):
                 
                 logger.error(f"[SCHEDULE_POST] Post failed for {platform}: {error_msg}")
                 
-                if should_retry and self.request.retries < self.max_retries:
+                if should_retry and attempt < self.max_retries:
                     # Intelligent retry delay based on platform and error type
-                    retry_delay = calculate_retry_delay(platform, error_msg, self.request.retries)
-                    logger.info(f"[SCHEDULE_POST] Retrying in {retry_delay}s (attempt {self.request.retries + 1}/{self.max_retries})")
+                    retry_delay = calculate_retry_delay(platform, error_msg, attempt)
+                    logger.info(f"[SCHEDULE_POST] Retrying in {retry_delay}s (attempt {attempt + 1}/{self.max_retries})")
                     
                     # Update post status in database if post_id is provided
                     if post_id:
@@ -188,10 +190,22 @@ def schedule_post(self, platform, user_token, post_payload, post_id=None):
                     # Update retry metrics
                     await update_platform_retry_metrics(platform, error_msg)
                     
-                    raise self.retry(countdown=retry_delay)
+                    # A rate-limited platform gets no calls from any post until the delay passes
+                    if "rate limit" in error_msg.lower():
+                        await pause_platform(platform, retry_delay)
+                    
+                    await enqueue_posts([{
+                        "platform": platform,
+                        "user_token": user_token,
+                        "post_payload": post_payload,
+                        "post_id": post_id,
+                        "user_id": user_id,
+                        "attempt": attempt + 1
+                    }], not_before=time.time() + retry_delay)
+                    return {**result, "retry_queued": True}
                 else:
                     # Max retries exceeded or platform says don't retry
-                    logger.critical(f"[SCHEDULE_POST] {'Max retries exceeded' if self.request.retries >= self.max_retries else 'Platform says do not retry'} for {platform}")
+                    logger.critical(f"[SCHEDULE_POST] {'Max retries exceeded' if attempt >= self.max_retries else 'Platform says do not retry'} for {platform}")
                     
                     # Update post status in database if post_id is provided
                     if post_id:
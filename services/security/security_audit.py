@@ -12,15 +12,26 @@ This module provides comprehensive security auditing capabilities for:
 import re
 import os
 import ast
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
 import secrets
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from enum import Enum
 
+# Bump to discard the check results kept in audit manifests. They are also
+# discarded whenever this module changes, since the checks may have changed.
+MANIFEST_VERSION = 1
+
+# Fewer changed files than this are checked in-process; starting worker
+# processes would cost more than it saves
+PARALLEL_SCAN_THRESHOLD = 16
+
 # Security audit result levels
 class SecurityLevel(str, Enum):
     CRITICAL = "critical"
@@ -41,13 +52,54 @@ class SecurityFinding:
     recommendation: Optional[str] = None
     code_snippet: Optional[str] = None
 
+def _finding_to_dict(finding: SecurityFinding) -> Dict[str, Any]:
+    data = asdict(finding)
+    data["level"] = finding.level.value
+    return data
+
+def _finding_from_dict(data: Dict[str, Any]) -> SecurityFinding:
+    return SecurityFinding(**{**data, "level": SecurityLevel(data["level"])})
+
+def _file_digest(file_path: str) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+CHECKS_FINGERPRINT = _file_digest(__file__)
+
+def _run_file_checks(project_root: str, file_path: str, checks: Tuple[str, ...]) -> Dict[str, List[SecurityFinding]]:
+    """Run per-file checks on one file, in a worker process or inline, and return each check's findings."""
+    auditor = SecurityAuditor(project_root)
+    results = {}
+    for check in checks:
+        auditor.findings = []
+        getattr(auditor, check)(Path(file_path))
+        results[check] = auditor.findings
+    return results
+
 class SecurityAuditor:
     """Main security auditor class."""
     
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, manifest_path: Optional[str] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            project_root: Root of the source tree to audit
+            manifest_path: Where to persist file fingerprints and per-file check results between audits
+            max_workers: Processes used to check changed files (defaults to the CPU count)
+        """
         self.project_root = Path(project_root)
         self.findings: List[SecurityFinding] = []
         self.logger = logging.getLogger(__name__)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._manifest: Dict[str, Any] = {}
+        
+        # How the last audit_all got its per-file results
+        self.files_scanned = 0
+        self.files_reused = 0
         
         # Security patterns to detect
         self.sql_injection_patterns = [
@@ -77,39 +129,203 @@ class SecurityAuditor:
         ]
 
     def audit_all(self) -> List[SecurityFinding]:
-        """Run complete security audit."""
+        """Run complete security audit.
+        
+        Per-file checks only run on files that changed since the last audit, in
+        parallel; unchanged files reuse the results kept in the manifest.
+        """
         self.findings = []
         
         self.logger.info("Starting comprehensive security audit...")
         
-        # Audit different components
-        self.audit_jwt_security()
-        self.audit_database_security()
-        self.audit_scheduler_security()
-        self.audit_api_endpoints()
-        self.audit_configuration_security()
-        self.audit_file_permissions()
-        self.audit_dependencies()
-        self.audit_input_validation()
-        self.audit_error_handling()
-        self.audit_logging_security()
-        
-        self.logger.info(f"Security audit completed. Found {len(self.findings)} findings.")
+        plan = self._audit_plan()
+        results = self._collect_file_results(plan)
+        
+        # Assemble findings in the same order as running each audit_* method in turn
+        for checks, files, project_check in plan:
+            for file_path in files:
+                for check in checks:
+                    self.findings.extend(results[str(file_path)][check])
+            if project_check:
+                project_check()
+        
+        self.logger.info(
+            f"Security audit completed. Found {len(self.findings)} findings "
+            f"({self.files_scanned} files checked, {self.files_reused} unchanged)."
+        )
         return self.findings
 
-    def audit_jwt_security(self):
-        """Audit JWT token handling security."""
-        self.logger.info("Auditing JWT security...")
+    def _audit_plan(self) -> List[Tuple[Tuple[str, ...], List[Path], Optional[Callable[[], None]]]]:
+        """The per-file checks of a full audit, in order, each with its files and the project-wide check that follows it."""
+        python_files = self._python_files()
+        return [
+            (("_audit_file_for_jwt_issues",), self._jwt_files(), self._check_jwt_configuration),
+            (("_audit_file_for_sql_injection", "_audit_file_for_nosql_injection"), self._database_files(),
+             self._check_database_configuration),
+            (("_audit_scheduler_file",), self._scheduler_files(), None),
+            (("_audit_endpoint_file",), self._endpoint_files(), None),
+            (("_audit_config_file",), self._config_files(), self.audit_file_permissions),
+            (("_audit_requirements_file",), self._requirements_files(), None),
+            (("_audit_input_validation_in_file",), python_files, None),
+            (("_audit_error_handling_in_file",), python_files, None),
+            (("_audit_logging_in_file",), python_files, None),
+        ]
+
+    def _collect_file_results(self, plan) -> Dict[str, Dict[str, List[SecurityFinding]]]:
+        """Per-file check results for the plan, running checks only where the manifest has none for the current content."""
+        needed: Dict[str, List[str]] = {}
+        for checks, files, _ in plan:
+            for file_path in files:
+                file_checks = needed.setdefault(str(file_path), [])
+                file_checks.extend(check for check in checks if check not in file_checks)
+        
+        previous = self._load_manifest()
+        entries: Dict[str, Dict[str, Any]] = {}
+        results: Dict[str, Dict[str, List[SecurityFinding]]] = {}
+        pending: List[Tuple[str, Tuple[str, ...]]] = []
+        
+        for path, checks in needed.items():
+            entry = self._manifest_entry(path, previous.get(path))
+            cached = entry["results"] if entry else {}
+            if entry:
+                entries[path] = entry
+            results[path] = {
+                check: [_finding_from_dict(data) for data in cached[check]]
+                for check in checks if check in cached
+            }
+            missing = tuple(check for check in checks if check not in cached)
+            if missing:
+                pending.append((path, missing))
+        
+        for path, file_results in self._run_checks(pending):
+            results[path].update(file_results)
+            if path in entries:
+                entries[path]["results"].update({
+                    check: [_finding_to_dict(finding) for finding in findings]
+                    for check, findings in file_results.items()
+                })
+        
+        self.files_scanned = len(pending)
+        self.files_reused = len(needed) - len(pending)
+        self._save_manifest(entries)
+        return results
+
+    def _manifest_entry(self, path: str, entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The manifest entry for a file's current content, keeping cached results if the content is unchanged.
+        
+        Returns None if the file cannot be read; its checks then run uncached.
+        """
+        try:
+            stat = os.stat(path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                return entry
+            digest = _file_digest(path)
+        except OSError:
+            return None
+        
+        # Touched but identical files keep their results
+        results = entry["results"] if entry and entry["sha256"] == digest else {}
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest, "results": results}
+
+    def _run_checks(self, pending: List[Tuple[str, Tuple[str, ...]]]) -> List[Tuple[str, Dict[str, List[SecurityFinding]]]]:
+        """Run the pending per-file checks, spread over worker processes when there are enough of them."""
+        project_root = str(self.project_root)
+        if self.max_workers <= 1 or len(pending) < PARALLEL_SCAN_THRESHOLD:
+            return [(path, _run_file_checks(project_root, path, checks)) for path, checks in pending]
         
+        paths = [path for path, _ in pending]
+        checks = [file_checks for _, file_checks in pending]
+        chunksize = max(1, len(pending) // (self.max_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(zip(paths, executor.map(_run_file_checks, repeat(project_root), paths, checks, chunksize=chunksize)))
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """File entries from the last audit, or none if they were made by different checks."""
+        manifest = self._manifest
+        if self.manifest_path and self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable audit manifest {self.manifest_path}: {e}")
+                manifest = {}
+        
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("fingerprint") != CHECKS_FINGERPRINT:
+            return {}
+        return manifest["files"]
+
+    def _save_manifest(self, entries: Dict[str, Dict[str, Any]]):
+        """Keep the file entries of this audit for the next one."""
+        self._manifest = {"version": MANIFEST_VERSION, "fingerprint": CHECKS_FINGERPRINT, "files": entries}
+        if not self.manifest_path:
+            return
+        
+        # Write then rename, so a concurrent audit never reads a partial manifest
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._manifest, f)
+            os.replace(temp_path, self.manifest_path)
+        except OSError as e:
+            self.logger.error(f"Error saving audit manifest {self.manifest_path}: {e}")
+
+    def _jwt_files(self) -> List[Path]:
         jwt_files = [
             'services/auth/jwt_handler.py',
             'services/auth/auth_guard.py'
         ]
+        return [self.project_root / file_path for file_path in jwt_files if (self.project_root / file_path).exists()]
+
+    def _database_files(self) -> List[Path]:
+        # Find all Python files that might contain database queries
+        db_files = []
+        for pattern in ['**/*repository*.py', '**/database/*.py', '**/models/*.py']:
+            db_files.extend(self.project_root.glob(pattern))
+        return db_files
+
+    def _scheduler_files(self) -> List[Path]:
+        scheduler_files = list(self.project_root.glob('**/scheduler*.py'))
+        scheduler_files.extend(self.project_root.glob('**/tasks/*.py'))
+        return scheduler_files
+
+    def _endpoint_files(self) -> List[Path]:
+        endpoint_files = list(self.project_root.glob('**/endpoint/*.py'))
+        endpoint_files.extend(self.project_root.glob('**/*api*.py'))
+        return endpoint_files
+
+    def _config_files(self) -> List[Path]:
+        config_files = [
+            'core/config.py',
+            '.env',
+            '.env.example',
+            'config.py',
+            'settings.py'
+        ]
+        return [self.project_root / config_file for config_file in config_files if (self.project_root / config_file).exists()]
+
+    def _requirements_files(self) -> List[Path]:
+        requirements_files = [
+            'requirements.txt',
+            'requirements-dev.txt',
+            'Pipfile',
+            'pyproject.toml'
+        ]
+        return [self.project_root / req_file for req_file in requirements_files if (self.project_root / req_file).exists()]
+
+    def _python_files(self) -> List[Path]:
+        # Match against the path inside the project, so a checkout under e.g. ~/tests is still audited
+        return [
+            file_path for file_path in self.project_root.glob('**/*.py')
+            if 'test' not in str(file_path.relative_to(self.project_root))
+            and '__pycache__' not in str(file_path.relative_to(self.project_root))
+        ]
+
+    def audit_jwt_security(self):
+        """Audit JWT token handling security."""
+        self.logger.info("Auditing JWT security...")
         
-        for file_path in jwt_files:
-            full_path = self.project_root / file_path
-            if full_path.exists():
-                self._audit_file_for_jwt_issues(full_path)
+        for file_path in self._jwt_files():
+            self._audit_file_for_jwt_issues(file_path)
         
         # Check for JWT configuration issues
         self._check_jwt_configuration()
@@ -201,12 +417,7 @@ class SecurityAuditor:
         """Audit database query security."""
         self.logger.info("Auditing database security...")
         
-        # Find all Python files that might contain database queries
-        db_files = []
-        for pattern in ['**/*repository*.py', '**/database/*.py', '**/models/*.py']:
-            db_files.extend(self.project_root.glob(pattern))
-        
-        for file_path in db_files:
+        for file_path in self._database_files():
             self._audit_file_for_sql_injection(file_path)
             self._audit_file_for_nosql_injection(file_path)
         
@@ -328,10 +539,7 @@ class SecurityAuditor:
         """Audit scheduler task security."""
         self.logger.info("Auditing scheduler security...")
         
-        scheduler_files = list(self.project_root.glob('**/scheduler*.py'))
-        scheduler_files.extend(self.project_root.glob('**/tasks/*.py'))
-        
-        for file_path in scheduler_files:
+        for file_path in self._scheduler_files():
             self._audit_scheduler_file(file_path)
 
     def _audit_scheduler_file(self, file_path: Path):
@@ -382,10 +590,7 @@ class SecurityAuditor:
         """Audit API endpoint security."""
         self.logger.info("Auditing API endpoint security...")
         
-        endpoint_files = list(self.project_root.glob('**/endpoint/*.py'))
-        endpoint_files.extend(self.project_root.glob('**/*api*.py'))
-        
-        for file_path in endpoint_files:
+        for file_path in self._endpoint_files():
             self._audit_endpoint_file(file_path)
 
     def _audit_endpoint_file(self, file_path: Path):
@@ -444,18 +649,8 @@ class SecurityAuditor:
         """Audit configuration security."""
         self.logger.info("Auditing configuration security...")
         
-        config_files = [
-            'core/config.py',
-            '.env',
-            '.env.example',
-            'config.py',
-            'settings.py'
-        ]
-        
-        for config_file in config_files:
-            file_path = self.project_root / config_file
-            if file_path.exists():
-                self._audit_config_file(file_path)
+        for file_path in self._config_files():
+            self._audit_config_file(file_path)
 
     def _audit_config_file(self, file_path: Path):
         """Audit configuration file for security issues."""
@@ -567,17 +762,8 @@ class SecurityAuditor:
         """Audit dependencies for known vulnerabilities."""
         self.logger.info("Auditing dependencies...")
         
-        requirements_files = [
-            'requirements.txt',
-            'requirements-dev.txt',
-            'Pipfile',
-            'pyproject.toml'
-        ]
-        
-        for req_file in requirements_files:
-            file_path = self.project_root / req_file
-            if file_path.exists():
-                self._audit_requirements_file(file_path)
+        for file_path in self._requirements_files():
+            self._audit_requirements_file(file_path)
 
     def _audit_requirements_file(self, file_path: Path):
         """Audit requirements file for security issues."""
@@ -629,12 +815,7 @@ class SecurityAuditor:
         self.logger.info("Auditing input validation...")
         
         # This is partially covered by endpoint auditing, but we can add more specific checks
-        python_files = list(self.project_root.glob('**/*.py'))
-        
-        for file_path in python_files:
-            if 'test' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-            
+        for file_path in self._python_files():
             self._audit_input_validation_in_file(file_path)
 
     def _audit_input_validation_in_file(self, file_path: Path):
@@ -683,12 +864,7 @@ class SecurityAuditor:
         """Audit error handling for information disclosure."""
         self.logger.info("Auditing error handling...")
         
-        python_files = list(self.project_root.glob('**/*.py'))
-        
-        for file_path in python_files:
-            if 'test' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-            
+        for file_path in self._python_files():
             self._audit_error_handling_in_file(file_path)
 
     def _audit_error_handling_in_file(self, file_path: Path):
@@ -733,12 +909,7 @@ class SecurityAuditor:
         """Audit logging for security issues."""
         self.logger.info("Auditing logging security...")
         
-        python_files = list(self.project_root.glob('**/*.py'))
-        
-        for file_path in python_files:
-            if 'test' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-            
+        for file_path in self._python_files():
             self._audit_logging_in_file(file_path)
 
     def _audit_logging_in_file(self, file_path: Path):
@@ -883,9 +1054,12 @@ class SecurityAuditor:
         
         return recommendations
 
-def run_security_audit(project_root: str) -> Dict[str, Any]:
-    """Run a complete security audit and return the report."""
-    auditor = SecurityAuditor(project_root)
+def run_security_audit(project_root: str, manifest_path: Optional[str] = None) -> Dict[str, Any]:
+    """Run a complete security audit and return the report.
+    
+    With a manifest_path, files unchanged since the previous audit reuse its results.
+    """
+    auditor = SecurityAuditor(project_root, manifest_path=manifest_path)
     return auditor.generate_report()
 
 if __name__ == "__main__":
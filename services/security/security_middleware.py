@@ -17,12 +17,12 @@ from starlette.types import ASGIApp
 import time
 import logging
 import json
-import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 import ipaddress
 
 from .rate_limiter import RateLimiter, RateLimitConfig
+from .threat_scanner import ThreatScanner
 from .security_config import (
     security_settings,
     SECURITY_HEADERS,
@@ -56,10 +56,21 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         self.enable_ip_filtering = enable_ip_filtering
         self.enable_audit_logging = enable_audit_logging and AUDIT_CONFIG["enabled"]
         
-        # Compile regex patterns for performance
-        self.dangerous_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in VALIDATION_RULES["dangerous_patterns"]]
-        self.sql_injection_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in VALIDATION_RULES["sql_injection_patterns"]]
-        self.nosql_injection_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in VALIDATION_RULES["nosql_injection_patterns"]]
+        # All validation rules compiled into one scanner, so a body is scanned once
+        self.threat_scanner = ThreatScanner({
+            "Potentially dangerous content detected": VALIDATION_RULES["dangerous_patterns"],
+            "Potential SQL injection detected": VALIDATION_RULES["sql_injection_patterns"],
+            "Potential NoSQL injection detected": VALIDATION_RULES["nosql_injection_patterns"],
+        })
+        
+        # Binary uploads carry no text for the rules to match
+        self.uninspected_content_types = (
+            "image/",
+            "audio/",
+            "video/",
+            "font/",
+            "application/octet-stream",
+        )
         
         # Whitelist paths that bypass security checks
         self.bypass_paths = {
@@ -244,8 +255,14 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     async def _validate_request_input(self, request: Request) -> Dict[str, Any]:
         """Validate request input for security threats."""
         try:
+            content_type = request.headers.get("content-type", "")
+            if content_type.startswith(self.uninspected_content_types):
+                return {"valid": True}
+            
             # Get request body
-            body = await request.body()
+            body = await self._read_body(request, VALIDATION_RULES["max_content_length"])
+            if body is None:
+                return {"valid": False, "reason": "Content too large"}
             if not body:
                 return {"valid": True}
             
@@ -259,23 +276,12 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             if len(body_str) > VALIDATION_RULES["max_content_length"]:
                 return {"valid": False, "reason": "Content too large"}
             
-            # Check for dangerous patterns
-            for pattern in self.dangerous_patterns:
-                if pattern.search(body_str):
-                    return {"valid": False, "reason": "Potentially dangerous content detected"}
-            
-            # Check for SQL injection patterns
-            for pattern in self.sql_injection_patterns:
-                if pattern.search(body_str):
-                    return {"valid": False, "reason": "Potential SQL injection detected"}
-            
-            # Check for NoSQL injection patterns
-            for pattern in self.nosql_injection_patterns:
-                if pattern.search(body_str):
-                    return {"valid": False, "reason": "Potential NoSQL injection detected"}
+            # Check for dangerous, SQL injection and NoSQL injection patterns
+            threat = self.threat_scanner.scan(body_str)
+            if threat:
+                return {"valid": False, "reason": threat}
             
             # Validate JSON structure if content-type is JSON
-            content_type = request.headers.get("content-type", "")
             if "application/json" in content_type:
                 try:
                     json_data = json.loads(body_str)
@@ -290,6 +296,32 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             # Be conservative - reject if validation fails
             return {"valid": False, "reason": "Validation error"}
     
+    async def _read_body(self, request: Request, max_length: int) -> Optional[bytes]:
+        """Stream the request body, giving up as soon as it is too large.
+        
+        Returns:
+            The body, or None if it is longer than max_length characters
+        """
+        # UTF-8 needs at most four bytes per character
+        max_bytes = max_length * 4
+        
+        declared_length = request.headers.get("content-length", "")
+        if declared_length.isdigit() and int(declared_length) > max_bytes:
+            return None
+        
+        chunks = []
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > max_bytes:
+                return None
+            chunks.append(chunk)
+        
+        # Cache the body the way Request.body() does, so the route handler can still read it
+        body = b"".join(chunks)
+        request._body = body
+        return body
+    
     def _add_security_headers(self, response: Response) -> None:
         """Add security headers to response."""
         # Add standard security headers
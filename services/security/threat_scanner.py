@@ -0,0 +1,111 @@
+"""
+Single-pass threat detection for request inputs.
+
+Every rule pattern is indexed by the literal text its matches have to start
+with ("$where" for ``\\$where``, "or" and "and" for ``\\b(OR|AND)\\s+...``).
+The literals of all rules are merged into one trie-shaped regex, so an input
+is scanned once however many rules there are, and a rule is only tried at
+the positions where one of its literals occurs. Rules without a literal
+prefix fall back to a search of their own.
+
+Rules are matched case-insensitively against the lowercased input.
+"""
+
+import re
+from re import _parser as sre_parse
+from re._constants import AT, BRANCH, LITERAL, SUBPATTERN
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+def _literal_prefixes(items) -> Optional[List[str]]:
+    """Literals one of which starts every match of a parsed pattern, or None if there are none."""
+    literal = []
+    for op, av in items:
+        if op is LITERAL:
+            literal.append(chr(av))
+        elif literal:
+            break
+        elif op is AT:
+            # Anchors such as \b consume no text
+            continue
+        elif op is SUBPATTERN:
+            return _literal_prefixes(av[-1])
+        elif op is BRANCH:
+            options = [_literal_prefixes(alternative) for alternative in av[1]]
+            if any(option is None for option in options):
+                return None
+            return [prefix for option in options for prefix in option]
+        else:
+            break
+    return ["".join(literal).lower()] if literal else None
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex matching any of the words, with shared prefixes merged and longer words first."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{pattern})?" if "" in node else pattern
+
+    return build(trie)
+
+
+class ThreatScanner:
+    """Scan text against groups of rule patterns in one pass."""
+
+    def __init__(self, rules: Dict[str, Iterable[str]]):
+        """
+        Args:
+            rules: Rule patterns keyed by the reason reported when one of them matches
+        """
+        candidates: Dict[str, List[Tuple[Pattern, str]]] = {}
+        self._unindexed: List[Tuple[Pattern, str]] = []
+
+        for reason, patterns in rules.items():
+            for pattern in patterns:
+                compiled = re.compile(pattern, re.IGNORECASE)
+                prefixes = _literal_prefixes(sre_parse.parse(pattern))
+                if prefixes is None:
+                    self._unindexed.append((compiled, reason))
+                    continue
+                for prefix in prefixes:
+                    candidates.setdefault(prefix, []).append((compiled, reason))
+
+        # The prefilter reports the longest literal at a position, so a hit on "document.cookie"
+        # also has to try the rules indexed by any shorter literal it starts with
+        self._candidates = {
+            literal: [rule for prefix, rules in candidates.items() if literal.startswith(prefix) for rule in rules]
+            for literal in candidates
+        }
+        self._prefilter = re.compile(_trie_pattern(candidates)) if candidates else None
+
+    def scan(self, text: str) -> Optional[str]:
+        """Return the reason for the first rule that matches the text, or None if it is clean."""
+        folded = text.lower()
+
+        for pattern, reason in self._unindexed:
+            if pattern.search(folded):
+                return reason
+
+        if self._prefilter is None:
+            return None
+
+        search = self._prefilter.search
+        hit = search(folded)
+        while hit:
+            start = hit.start()
+            for pattern, reason in self._candidates[hit.group()]:
+                if pattern.match(folded, start):
+                    return reason
+            # Restart one character on so literals overlapping this hit are still seen
+            hit = search(folded, start + 1)
+        return None
@@ -1,14 +1,16 @@
 from datetime import datetime, timedelta
-import random
 from typing import Dict, Optional, List, Union
 import pytz
 
+from services.scheduler.posting_time_model import EngagementHistogram, MIN_MODEL_POSTS, slot_for
+
 def smart_schedule(
     platform: str,
     content_type: str = "post",
     timezone: str = "UTC",
     custom_peak_hours: Optional[Dict] = None,
-    audience_location: Optional[str] = None
+    audience_location: Optional[str] = None,
+    engagement_model: Optional[EngagementHistogram] = None
 ) -> Dict[str, Union[str, List[int], Dict]]:
     """
     Advanced scheduling system for all social platforms with:
@@ -16,7 +18,7 @@ def smart_schedule(
     - Content-type based scheduling
     - Timezone and location awareness
     - Custom peak hour overrides
-    - Performance-based recommendations
+    - Performance-based recommendations from the user's engagement history
     
     Args:
         platform: Social platform name (e.g., 'instagram', 'tiktok')
@@ -24,6 +26,8 @@ def smart_schedule(
         timezone: IANA timezone string (e.g., 'Asia/Kolkata')
         custom_peak_hours: Custom peak hours to override defaults
         audience_location: Target audience location for time optimization
+        engagement_model: The user's hour-of-week engagement histogram; used
+            instead of the platform peak hours once it has enough posts
         
     Returns:
         Detailed scheduling recommendation with optimal times
@@ -82,20 +86,27 @@ def smart_schedule(
     content_type = content_type.lower()
     hour_choices = peak_db[platform].get(content_type, peak_db[platform].get("post", [10, 14, 19]))
 
-    # Intelligent time selection with randomization
-    selected_hour = random.choice(hour_choices)
-    selected_minute = random.randint(0, 59)  # Add organic variation
-
-    schedule_time = now.replace(
-        hour=selected_hour,
-        minute=selected_minute,
-        second=0,
-        microsecond=0
-    )
+    if engagement_model is not None and engagement_model.total_posts >= MIN_MODEL_POSTS:
+        # Best upcoming hours according to the user's own engagement history
+        ranked = engagement_model.next_best_times(now.astimezone(pytz.utc), limit=4)
+        best_scores = [round(score, 2) for _, score in ranked]
+        candidates = [moment.astimezone(tz) for moment, _ in ranked]
+        source = "engagement_history"
+        confidence = round(engagement_model.confidence(slot_for(ranked[0][0])), 2)
+    else:
+        # Upcoming platform peak hours, soonest first
+        candidates = []
+        for day_offset in (0, 1):
+            for hour in sorted(hour_choices):
+                moment = now.replace(hour=hour, minute=0, second=0, microsecond=0) + timedelta(days=day_offset)
+                if moment > now:
+                    candidates.append(moment)
+        candidates = candidates[:4]
+        best_scores = [None] * len(candidates)
+        source = "platform_defaults"
+        confidence = None
 
-    # Adjust to next day if time has passed
-    if schedule_time < now:
-        schedule_time += timedelta(days=1)
+    schedule_time = candidates[0]
 
     # Calculate time until posting
     time_until_post = schedule_time - now
@@ -108,13 +119,15 @@ def smart_schedule(
         "time_until_post": str(time_until_post),
         "peak_hours_available": hour_choices,
         "location_aware": bool(audience_location),
+        "best_times": [
+            {"time": moment.strftime("%Y-%m-%d %H:%M"), "day": moment.strftime("%A"), "score": score}
+            for moment, score in zip(candidates, best_scores)
+        ],
         "metadata": {
-            "algorithm_version": "smart_scheduler_v4.2",
+            "algorithm_version": "smart_scheduler_v5.0",
+            "recommendation_source": source,
             "generated_at": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "confidence_score": round(random.uniform(0.85, 0.97), 2),
-            "suggested_alternate_times": [
-                (schedule_time + timedelta(hours=delta)).strftime("%H:%M")
-                for delta in [-2, -1, 1, 2]  # Suggest nearby time slots
-            ]
+            "confidence_score": confidence,
+            "suggested_alternate_times": [moment.strftime("%H:%M") for moment in candidates[1:]]
         }
-    }
\ No newline at end of file
+    }
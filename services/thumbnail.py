@@ -1,16 +1,17 @@
 import os
-import time
+import asyncio
 import requests
 import base64
-from typing import Dict, Optional
-from urllib.parse import quote
+from typing import Any, Dict, Optional, Tuple
+
+from services.thumbnail_store import ThumbnailStore, thumbnail_key
 
 
 class SDXLThumbnailGenerator:
-    def __init__(self):
+    def __init__(self, store: Optional[ThumbnailStore] = None):
         self.SDXL_API_KEY = os.getenv("SDXL_API_KEY")
         self.SDXL_ENDPOINT = "https://api.stability.ai/v1/generation/sdxl-512x512/text-to-image"
-        self.CACHE = {}
+        self.store = store or ThumbnailStore()
 
     def _get_platform_size(self, platform: str):
         sizes = {
@@ -25,26 +26,8 @@ class SDXLThumbnailGenerator:
         }
         return sizes.get(platform, sizes["universal"])
 
-    def generate_thumbnail(
-        self,
-        prompt: str,
-        platform: str = "universal",
-        logo_base64: Optional[str] = None,
-        cache_timeout: int = 3600
-    ) -> Dict[str, Optional[str]]:
-        """
-        Generates image based on prompt and optional logo.
-        Returns base64 image for direct frontend use.
-        """
-        cache_key = f"{platform}_{quote(prompt)}_{hash(logo_base64)}"
-        now = time.time()
-
-        # Return cached image if available
-        if cache_key in self.CACHE:
-            timestamp, cached_result = self.CACHE[cache_key]
-            if now - timestamp < cache_timeout:
-                return cached_result
-
+    def _request_image(self, prompt: str, platform: str, logo_base64: Optional[str] = None) -> bytes:
+        """Call the SDXL API and return the decoded image bytes."""
         width, height = self._get_platform_size(platform)
 
         headers = {
@@ -66,21 +49,71 @@ class SDXLThumbnailGenerator:
             body["init_image"] = logo_base64
             body["image_strength"] = 0.35  # how much to preserve from logo (0.0 = use logo fully, 1.0 = ignore)
 
+        response = requests.post(self.SDXL_ENDPOINT, headers=headers, json=body, timeout=120)
+        response.raise_for_status()
+        data = response.json()
+        return base64.b64decode(data["artifacts"][0]["base64"])
+
+    def generate_thumbnail(
+        self,
+        prompt: str,
+        platform: str = "universal",
+        logo_base64: Optional[str] = None,
+        cache_timeout: int = 3600
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generates image based on prompt and optional logo.
+        Returns base64 image for direct frontend use.
+
+        Images are kept in the content-addressed thumbnail store, so a repeat
+        request is served from disk. ``cache_timeout`` is kept for backwards
+        compatibility; stored images are evicted by size, not age.
+        """
+        key = thumbnail_key(prompt, platform, logo_base64)
+
         try:
-            response = requests.post(self.SDXL_ENDPOINT, headers=headers, json=body)
-            response.raise_for_status()
-            data = response.json()
+            image = self.store.read(key)
+            if image is None:
+                image = self._request_image(prompt, platform, logo_base64)
+                self.store.write(key, image)
 
-            image_base64 = data["artifacts"][0]["base64"]
-            result = {
-                "image_base64": image_base64,
+            return {
+                "image_base64": base64.b64encode(image).decode("ascii"),
                 "platform": platform,
-                "prompt": prompt
+                "prompt": prompt,
+                "thumbnail_id": key
             }
 
-            self.CACHE[cache_key] = (now, result)
-            return result
+        except requests.exceptions.RequestException as e:
+            return {"error": str(e), "platform": platform}
+        except Exception as e:
+            return {"error": f"Unexpected Error: {str(e)}", "platform": platform}
 
+    async def generate_thumbnail_async(
+        self,
+        prompt: str,
+        platform: str = "universal",
+        logo_base64: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generates (or reuses) a thumbnail without blocking the event loop.
+        Returns the thumbnail id and metadata; the image itself is served by URL.
+        Concurrent requests for the same prompt, platform and logo share one generation.
+        """
+        key = thumbnail_key(prompt, platform, logo_base64)
+
+        async def generate() -> Tuple[bytes, Dict[str, Any]]:
+            image = await asyncio.to_thread(self._request_image, prompt, platform, logo_base64)
+            return image, {"platform": platform, "prompt": prompt, "content_type": "image/png"}
+
+        try:
+            metadata = await self.store.get_or_create(key, generate)
+            return {
+                "thumbnail_id": key,
+                "platform": platform,
+                "prompt": prompt,
+                "cached": metadata.get("cached", False)
+            }
         except requests.exceptions.RequestException as e:
             return {"error": str(e), "platform": platform}
         except Exception as e:
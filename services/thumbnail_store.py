@@ -0,0 +1,211 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from services.database.redis import RedisManager
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def thumbnail_key(prompt: str, style: str, logo_base64: Optional[str] = None) -> str:
+    """
+    Stable, content-addressed key for a thumbnail request.
+
+    The logo contributes the digest of its decoded bytes, so the same image
+    sent with different base64 line wrapping maps to the same key, and the
+    key is identical across processes and restarts (unlike ``hash()``).
+    """
+    logo_digest = None
+    if logo_base64:
+        try:
+            logo_bytes = base64.b64decode(logo_base64, validate=False)
+        except (binascii.Error, ValueError):
+            logo_bytes = logo_base64.encode("utf-8")
+        logo_digest = hashlib.sha256(logo_bytes).hexdigest()
+
+    canonical = json.dumps({"prompt": prompt, "style": style, "logo": logo_digest}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ThumbnailStore:
+    """
+    Size-bounded, content-addressed store for generated thumbnails.
+
+    Images live on local disk as ``<key>.png`` and are evicted least recently
+    used first once the directory grows past ``max_bytes``. Metadata (prompt,
+    style, size) is mirrored to Redis so any worker can describe a thumbnail.
+    Concurrent requests for the same key inside one process share a single
+    generation.
+
+    The directory is shared by every worker, so it is the source of truth: the
+    in-memory index only caches it. Lookups that miss the index check the disk,
+    file mtimes record use across workers, and the size cap is enforced by
+    rescanning the directory after each write.
+    """
+
+    META_KEY = "thumbnail:meta:{key}"
+    META_TTL = 7 * 24 * 3600  # 7 days
+
+    def __init__(self, directory: str = None, max_bytes: int = None):
+        self.directory = directory or os.getenv("THUMBNAIL_CACHE_DIR", os.path.join("media", "thumbnails"))
+        self.max_bytes = max_bytes or int(os.getenv("THUMBNAIL_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # key -> size in bytes, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    def _load_index(self) -> None:
+        self._index, self._total_bytes = self._scan()
+
+    def _scan(self) -> "Tuple[OrderedDict[str, int], int]":
+        """Index every stored thumbnail, least recently used (oldest mtime) first."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                key, ext = os.path.splitext(entry.name)
+                if ext != ".png" or not THUMBNAIL_KEY_RE.match(key):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Evicted by another worker mid-scan
+                entries.append((stat.st_mtime_ns, key, stat.st_size))
+
+        index: "OrderedDict[str, int]" = OrderedDict()
+        for _, key, size in sorted(entries):
+            index[key] = size
+        return index, sum(index.values())
+
+    def path_for(self, key: str) -> str:
+        if not THUMBNAIL_KEY_RE.match(key):
+            raise ValueError(f"Invalid thumbnail key: {key}")
+        return os.path.join(self.directory, f"{key}.png")
+
+    def get_path(self, key: str) -> Optional[str]:
+        """Return the file path for a stored thumbnail and mark it recently used."""
+        path = self.path_for(key)
+        try:
+            # The mtime is the recency every worker's eviction sees
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._total_bytes -= self._index.pop(key, 0)
+            return None
+        with self._lock:
+            # Possibly written by another worker since this index was built
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+        return path
+
+    def size_of(self, key: str) -> Optional[int]:
+        """Size in bytes of a stored thumbnail, or None if it is not stored."""
+        size = self._index.get(key)
+        if size is not None:
+            return size
+        try:
+            return os.path.getsize(self.path_for(key))
+        except FileNotFoundError:
+            return None
+
+    def read(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def write(self, key: str, image: bytes) -> str:
+        """Store image bytes under ``key`` and evict old entries past the size cap."""
+        path = self.path_for(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(image)
+        os.replace(tmp_path, path)
+        os.utime(path, ns=(time.time_ns(), time.time_ns()))
+
+        # Other workers write to the same directory, so the cap is checked against a fresh scan
+        index, total_bytes = self._scan()
+        if key in index:
+            index.move_to_end(key)
+        else:
+            index[key] = len(image)
+            total_bytes += len(image)
+        evicted = []
+        # The new thumbnail is the most recently used and is never evicted
+        for old_key in list(index)[:-1]:
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= index.pop(old_key)
+            evicted.append(old_key)
+
+        with self._lock:
+            self._index, self._total_bytes = index, total_bytes
+
+        for old_key in evicted:
+            try:
+                os.remove(self.path_for(old_key))
+            except FileNotFoundError:
+                pass
+        return path
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        return await RedisManager.cache_get(self.META_KEY.format(key=key))
+
+    async def get_or_create(self, key: str, generate: Callable[[], Awaitable[Tuple[bytes, Dict[str, Any]]]]) -> Dict[str, Any]:
+        """
+        Return metadata for ``key``, generating and storing the image on a miss.
+
+        Args:
+            key: Content-addressed thumbnail key
+            generate: Coroutine factory returning (image bytes, metadata)
+
+        Returns:
+            Thumbnail metadata including ``key``, ``size`` and ``cached``
+        """
+        if await asyncio.to_thread(self.get_path, key):
+            return {"key": key, "size": self.size_of(key), "cached": True}
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            image, metadata = await generate()
+            await asyncio.to_thread(self.write, key, image)
+            metadata = {**metadata, "key": key, "size": len(image), "created_at": time.time()}
+            await RedisManager.cache_set(self.META_KEY.format(key=key), metadata, ttl_seconds=self.META_TTL)
+            result = {**metadata, "cached": False}
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
@@ -0,0 +1,139 @@
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern substring matcher (Aho-Corasick automaton).
+
+    All keywords are compiled into a single automaton so a text is scanned
+    once, in time linear in its length, no matter how many keywords are
+    registered. Matching keeps the semantics of ``keyword in text`` checks:
+    keywords match anywhere in the text, case-insensitively by default.
+
+    Every keyword carries a value. When several values match, they are
+    reported in the order they were first registered, which lets callers
+    reproduce "first rule wins" loops over ordered keyword lists.
+    """
+
+    def __init__(self, case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        self._values: List[Any] = []
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @classmethod
+    def from_groups(cls, groups: Dict[Any, Iterable[str]], case_sensitive: bool = False) -> "KeywordMatcher":
+        """Build a matcher whose values are the group labels of ``groups``."""
+        matcher = cls(case_sensitive=case_sensitive)
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                matcher.add(keyword, label)
+        return matcher.build()
+
+    def add(self, keyword: str, value: Any) -> None:
+        """Register ``keyword``; matches of it report ``value``."""
+        if not keyword:
+            return
+        if not self.case_sensitive:
+            keyword = keyword.lower()
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append((keyword, len(self._values)))
+        self._values.append(value)
+        self._built = False
+
+    def build(self) -> "KeywordMatcher":
+        """Compute failure links. Called automatically before the first search."""
+        queue = deque()
+        for next_state in self._goto[0].values():
+            self._fail[next_state] = 0
+            queue.append(next_state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, Any]]:
+        """Yield ``(end_index, keyword, value)`` for every keyword occurrence in ``text``."""
+        if not self._built:
+            self.build()
+        if not text or not self._values:
+            return
+        if not self.case_sensitive:
+            text = text.lower()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword, rank in output[state]:
+                yield index, keyword, self._values[rank]
+
+    def matched_values(self, text: str) -> List[Any]:
+        """Return the distinct matched values, ordered by registration order."""
+        if not self._built:
+            self.build()
+        if not text or not self._values:
+            return []
+        if not self.case_sensitive:
+            text = text.lower()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        ranks = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for _, rank in output[state]:
+                ranks.add(rank)
+
+        values: List[Any] = []
+        seen = set()
+        for rank in sorted(ranks):
+            value = self._values[rank]
+            marker = id(value) if not _is_hashable(value) else value
+            if marker not in seen:
+                seen.add(marker)
+                values.append(value)
+        return values
+
+    def first_value(self, text: str, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the earliest-registered value whose keyword occurs in ``text``."""
+        values = self.matched_values(text)
+        return values[0] if values else default
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
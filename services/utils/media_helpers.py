@@ -1,8 +1,11 @@
 # services/utils/download_media_helper.py
 
 import os
+import hashlib
 import requests
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
 from services.utils.logger_config import logger
 
 import cloudinary
@@ -15,28 +18,173 @@ cloudinary.config(
     api_secret=os.getenv("CLOUDINARY_API_SECRET")
 )
 
-def download_media_from_cloudinary(media_url: str, suffix=".jpg") -> str:
+# 👉 Media pipeline settings
+# off: no audit copy | async: Cloudinary fetches the source URL in the background | sync: same, but wait
+MEDIA_AUDIT_MODE = os.getenv("MEDIA_AUDIT_MODE", "async").lower()
+MEDIA_DEDUPE_TTL = int(os.getenv("MEDIA_DEDUPE_TTL", str(12 * 3600)))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+_audit_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="media-audit")
+_redis_client = None
+
+
+class FetchedMedia(NamedTuple):
+    path: str
+    size: int
+    sha256: str
+    content_type: Optional[str]
+
+
+def fetch_media(media_url: str, suffix=".jpg") -> FetchedMedia:
     """
-    Downloads a media file from Cloudinary (or any URL) to a local temp file.
-    Returns the local file path.
+    Streams a media file to a local temp file in one pass, hashing it on the way.
+    Returns the path, size, SHA-256 and content type.
     """
+    tmp_path = None
     try:
-        response = requests.get(media_url, stream=True, timeout=30)
-        response.raise_for_status()
+        digest = hashlib.sha256()
+        size = 0
+        with requests.get(media_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type")
 
-        tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                tmp_file.write(chunk)
-        tmp_file.close()
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
+                tmp_path = tmp_file.name
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        tmp_file.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
 
-        logger.info(f"[Download] Temp file created: {tmp_file.name}")
-        return tmp_file.name
+        logger.info(f"[Download] Temp file created: {tmp_path} ({size} bytes)")
+        return FetchedMedia(tmp_path, size, digest.hexdigest(), content_type)
 
     except Exception as e:
         logger.error(f"[Download] Failed: {e}")
+        if tmp_path:
+            cleanup_temp_file(tmp_path)
         raise RuntimeError(f"Failed to download media: {str(e)}")
 
+
+def download_media_from_cloudinary(media_url: str, suffix=".jpg") -> str:
+    """
+    Downloads a media file from Cloudinary (or any URL) to a local temp file.
+    Returns the local file path.
+    """
+    return fetch_media(media_url, suffix=suffix).path
+
+
+def audit_media_copy(media_url: str, folder: str = "socialsuit_uploads") -> Optional[str]:
+    """
+    Keeps an audit copy of published media according to MEDIA_AUDIT_MODE.
+    Cloudinary fetches the source URL itself, so no local bytes are re-uploaded.
+    Returns the CDN URL in sync mode, None otherwise.
+    """
+    if MEDIA_AUDIT_MODE == "off":
+        return None
+
+    def upload() -> Optional[str]:
+        try:
+            response = cloudinary.uploader.upload(media_url, folder=folder)
+            url = response.get("secure_url")
+            logger.info(f"[Audit] Media copied to CDN: {url}")
+            return url
+        except Exception as e:
+            logger.warning(f"[Audit] Could not copy media to CDN: {e}")
+            return None
+
+    if MEDIA_AUDIT_MODE == "sync":
+        return upload()
+
+    _audit_executor.submit(upload)
+    return None
+
+
+def _get_redis():
+    """Lazily connect the synchronous Redis client used by publisher workers."""
+    global _redis_client
+    if _redis_client is None:
+        import redis
+
+        _redis_client = redis.Redis.from_url(
+            os.getenv("REDIS_URL", "redis://localhost:6379"),
+            decode_responses=True,
+            socket_timeout=2
+        )
+    return _redis_client
+
+
+def _media_url_key(media_url: str) -> str:
+    return f"media:url:{hashlib.sha256(media_url.encode('utf-8')).hexdigest()}"
+
+
+def _platform_media_key(platform: str, account_id: str, content_hash: str) -> str:
+    return f"media:{platform}:{account_id}:{content_hash}"
+
+
+def lookup_platform_media(platform: str, account_id: str, media_url: str = None,
+                          content_hash: str = None) -> Optional[str]:
+    """
+    Returns a platform media id already uploaded for the same bytes, if any.
+    With only a URL, the content hash recorded for that URL is used, so a
+    known URL skips the download entirely.
+    """
+    try:
+        client = _get_redis()
+        if content_hash is None and media_url:
+            content_hash = client.get(_media_url_key(media_url))
+        if not content_hash:
+            return None
+        return client.get(_platform_media_key(platform, account_id, content_hash))
+    except Exception as e:
+        logger.warning(f"[Media] Dedupe lookup skipped: {e}")
+        return None
+
+
+def remember_platform_media(platform: str, account_id: str, media_id: str, content_hash: str,
+                            media_url: str = None, ttl_seconds: int = None) -> None:
+    """Records an uploaded media id under its content hash (and the URL it came from)."""
+    ttl = min(ttl_seconds or MEDIA_DEDUPE_TTL, MEDIA_DEDUPE_TTL)
+    try:
+        pipe = _get_redis().pipeline()
+        pipe.set(_platform_media_key(platform, account_id, content_hash), media_id, ex=ttl)
+        if media_url:
+            pipe.set(_media_url_key(media_url), content_hash, ex=MEDIA_DEDUPE_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"[Media] Could not record uploaded media: {e}")
+
+
+def upload_file_chunks(file_path: str, total_bytes: int, chunk_size: int,
+                       upload_chunk: Callable[[int, bytes], None], max_workers: int = 1) -> int:
+    """
+    Calls upload_chunk(segment_index, data) for every chunk of a file.
+    Up to max_workers chunks are read and uploaded at once; each worker reads
+    its own slice, so memory stays at max_workers * chunk_size.
+    Returns the number of segments. Any upload error is re-raised.
+    """
+    segments = (total_bytes + chunk_size - 1) // chunk_size
+
+    def send(segment_index: int) -> None:
+        with open(file_path, "rb") as f:
+            f.seek(segment_index * chunk_size)
+            upload_chunk(segment_index, f.read(chunk_size))
+
+    if max_workers <= 1:
+        for segment_index in range(segments):
+            send(segment_index)
+        return segments
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="media-chunk") as executor:
+        futures = [executor.submit(send, index) for index in range(segments)]
+        try:
+            for future in futures:
+                future.result()
+        except Exception:
+            executor.shutdown(cancel_futures=True)
+            raise
+    return segments
+
 def upload_temp_file_to_cdn(file_path: str, folder: str = "socialsuit_uploads") -> str:
     """
     Uploads a local temp file to Cloudinary CDN.
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Gauge, Histogram, Summary
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, Summary
 import time
 from functools import wraps
 
@@ -128,4 +128,30 @@ def update_scheduled_post_gauges(pending_count, retry_count, failed_count, compl
     SCHEDULED_POSTS_PENDING.set(pending_count)
     SCHEDULED_POSTS_RETRY.set(retry_count)
     SCHEDULED_POSTS_FAILED.set(failed_count)
-    SCHEDULED_POSTS_COMPLETED.set(completed_count)
\ No newline at end of file
+    SCHEDULED_POSTS_COMPLETED.set(completed_count)
+
+# Broker queue telemetry (see services/scheduler/queue_telemetry.py)
+# Kept in their own registry: /queues/metrics serves only these, not the process-wide metrics
+QUEUE_REGISTRY = CollectorRegistry()
+CELERY_QUEUE_READY = Gauge('socialsuit_celery_queue_ready', 'Messages waiting in the broker queue', ['queue'], registry=QUEUE_REGISTRY)
+CELERY_QUEUE_OLDEST_AGE = Gauge('socialsuit_celery_queue_oldest_age_seconds', 'Age of the oldest waiting message', ['queue'], registry=QUEUE_REGISTRY)
+CELERY_QUEUE_RESERVED = Gauge('socialsuit_celery_queue_reserved', 'Messages taken by workers and not yet acknowledged', ['queue'], registry=QUEUE_REGISTRY)
+CELERY_QUEUE_SCHEDULED = Gauge('socialsuit_celery_queue_scheduled', 'Countdown/ETA messages held by workers until due', ['queue'], registry=QUEUE_REGISTRY)
+CELERY_UNACKED = Gauge('socialsuit_celery_unacked', 'Total unacknowledged messages in the broker', registry=QUEUE_REGISTRY)
+CELERY_DESIRED_WORKERS = Gauge('socialsuit_celery_desired_workers', 'Worker count needed to meet the target queue lag', registry=QUEUE_REGISTRY)
+
+
+def update_queue_gauges(snapshot):
+    """
+    Update the broker queue gauges from a queue telemetry snapshot.
+    
+    Args:
+        snapshot: Result of queue_telemetry.collect_queue_snapshot
+    """
+    for queue, stats in snapshot.get("queues", {}).items():
+        CELERY_QUEUE_READY.labels(queue=queue).set(stats["ready"])
+        CELERY_QUEUE_OLDEST_AGE.labels(queue=queue).set(stats["oldest_age_seconds"])
+        CELERY_QUEUE_RESERVED.labels(queue=queue).set(stats["reserved"])
+        CELERY_QUEUE_SCHEDULED.labels(queue=queue).set(stats["scheduled"])
+    CELERY_UNACKED.set(snapshot.get("unacked", 0))
+    CELERY_DESIRED_WORKERS.set(snapshot.get("desired_workers", 0))
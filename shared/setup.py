@@ -15,6 +15,7 @@ setup(
         "passlib>=1.7.4",
         "redis>=4.0.0",
         "pyyaml>=6.0",
+        "orjson>=3.10.0",
     ],
     python_requires=">=3.8",
 )
\ No newline at end of file
@@ -8,4 +8,6 @@ request logging, correlation ID tracking, health check endpoints, and security m
 from shared.middleware.rate_limiter import RateLimiter, RateLimitConfig
 from shared.middleware.request_logger import RequestLoggingMiddleware
 from shared.middleware.correlation import CorrelationIDMiddleware, get_correlation_id
-from shared.middleware.health import HealthCheckConfig, setup_health_endpoints, HealthStatus
\ No newline at end of file
+from shared.middleware.health import (
+    HealthCheck, HealthCheckConfig, HealthMonitor, HealthStatus, CheckStatus, setup_health_endpoints
+)
\ No newline at end of file
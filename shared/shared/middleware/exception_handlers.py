@@ -1,12 +1,12 @@
 from typing import Any, Callable, Dict, Optional, Type, Union
 
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException
 
-from shared.utils.response_envelope import ResponseEnvelope
+from shared.utils.json_response import EnvelopeJSONResponse
 
 
 # Error code prefixes
@@ -27,7 +27,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(Exception, unhandled_exception_handler)
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> EnvelopeJSONResponse:
     """Handle HTTPException and return a standardized error response.
     
     Args:
@@ -35,20 +35,19 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc: The HTTPException that was raised
         
     Returns:
-        A JSONResponse with the standardized error format
+        An EnvelopeJSONResponse with the standardized error format
     """
     error_code = f"{HTTP_ERROR_CODE}_{exc.status_code}"
-    return JSONResponse(
+    return EnvelopeJSONResponse.error_response(
+        code=error_code,
+        message=exc.detail,
         status_code=exc.status_code,
-        content=ResponseEnvelope.error_response(
-            code=error_code,
-            message=exc.detail,
-            details={"headers": exc.headers} if exc.headers else None
-        ).dict(exclude_none=True)
+        details={"headers": exc.headers} if exc.headers else None,
+        headers=exc.headers
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> EnvelopeJSONResponse:
     """Handle RequestValidationError and return a standardized error response.
     
     Args:
@@ -56,19 +55,18 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         exc: The RequestValidationError that was raised
         
     Returns:
-        A JSONResponse with the standardized error format
+        An EnvelopeJSONResponse with the standardized error format
     """
-    return JSONResponse(
+    return EnvelopeJSONResponse.error_response(
+        code=VALIDATION_ERROR_CODE,
+        message="Request validation error",
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ResponseEnvelope.error_response(
-            code=VALIDATION_ERROR_CODE,
-            message="Request validation error",
-            details={"errors": exc.errors()}
-        ).dict(exclude_none=True)
+        # Error contexts can hold exception instances
+        details={"errors": jsonable_encoder(exc.errors())}
     )
 
 
-async def pydantic_validation_exception_handler(request: Request, exc: ValidationError) -> JSONResponse:
+async def pydantic_validation_exception_handler(request: Request, exc: ValidationError) -> EnvelopeJSONResponse:
     """Handle Pydantic ValidationError and return a standardized error response.
     
     Args:
@@ -76,19 +74,18 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
         exc: The ValidationError that was raised
         
     Returns:
-        A JSONResponse with the standardized error format
+        An EnvelopeJSONResponse with the standardized error format
     """
-    return JSONResponse(
+    return EnvelopeJSONResponse.error_response(
+        code=VALIDATION_ERROR_CODE,
+        message="Data validation error",
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=ResponseEnvelope.error_response(
-            code=VALIDATION_ERROR_CODE,
-            message="Data validation error",
-            details={"errors": exc.errors()}
-        ).dict(exclude_none=True)
+        # Error contexts can hold exception instances
+        details={"errors": jsonable_encoder(exc.errors())}
     )
 
 
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> EnvelopeJSONResponse:
     """Handle any unhandled exceptions and return a standardized error response.
     
     Args:
@@ -96,15 +93,13 @@ async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONR
         exc: The unhandled exception that was raised
         
     Returns:
-        A JSONResponse with the standardized error format
+        An EnvelopeJSONResponse with the standardized error format
     """
     # In production, you would want to log the exception here
-    return JSONResponse(
+    return EnvelopeJSONResponse.error_response(
+        code=SERVER_ERROR_CODE,
+        message="An unexpected error occurred",
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=ResponseEnvelope.error_response(
-            code=SERVER_ERROR_CODE,
-            message="An unexpected error occurred",
-            # In production, you might not want to expose the exception details
-            details={"type": exc.__class__.__name__, "message": str(exc)}
-        ).dict(exclude_none=True)
+        # In production, you might not want to expose the exception details
+        details={"type": exc.__class__.__name__, "message": str(exc)}
     )
\ No newline at end of file
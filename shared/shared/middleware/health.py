@@ -1,165 +1,281 @@
 """Health check endpoints for FastAPI applications.
 
-This module provides utilities for setting up health check endpoints in FastAPI applications.
+This module provides utilities for setting up liveness and readiness endpoints
+in FastAPI applications. Checks run concurrently, each under its own timeout,
+and a background refresher keeps the latest results in memory so probes are
+answered without calling the application's dependencies on every request.
 """
 
-from typing import Callable, Dict, List, Optional, Union
+import asyncio
+import inspect
+import time
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Callable, List, Optional, Sequence, Union
 
 from fastapi import FastAPI, Response, status
 from pydantic import BaseModel
 
 
+class CheckStatus(str, Enum):
+    """Outcome of a health check, from best to worst."""
+    HEALTHY = "healthy"
+    DEGRADED = "degraded"
+    UNHEALTHY = "unhealthy"
+
+
+_SEVERITY = {CheckStatus.HEALTHY: 0, CheckStatus.DEGRADED: 1, CheckStatus.UNHEALTHY: 2}
+
+
+class CheckResult(BaseModel):
+    """Result of a single health check."""
+    name: str
+    status: CheckStatus
+    message: str = ""
+    duration_ms: float
+
+
 class HealthStatus(BaseModel):
     """Health status response model."""
-    status: str
+    status: CheckStatus
     version: str
-    details: Dict[str, Dict[str, Union[str, bool]]]
+    timestamp: str
+    checks: List[CheckResult]
+
+
+class HealthCheck:
+    """A check function together with the options it runs under.
+
+    Check functions may be sync or async and return a bool, a status, or a
+    tuple of either with a message. Sync functions run in a worker thread so
+    a slow dependency cannot block the event loop.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        critical: bool = True,
+    ):
+        """Initialize the health check.
+
+        Args:
+            func: The check function
+            name: Name reported for the check, defaults to the function name
+            timeout: Seconds before the check counts as failed, defaults to the config's check_timeout
+            critical: Whether a failure makes the service unhealthy; non-critical failures only degrade it
+        """
+        self.func = func
+        self.name = name or getattr(func, "__name__", "check")
+        self.timeout = timeout
+        self.critical = critical
+
+    async def call(self) -> Any:
+        """Run the check function without blocking the event loop."""
+        if inspect.iscoroutinefunction(self.func):
+            return await self.func()
+        result = await asyncio.to_thread(self.func)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+
+CheckLike = Union[HealthCheck, Callable[[], Any]]
 
 
 class HealthCheckConfig:
     """Configuration for health check endpoints."""
-    
+
     def __init__(
         self,
-        app: FastAPI,
-        version: str,
-        healthz_path: str = "/healthz",
-        readyz_path: str = "/readyz",
-        liveness_checks: Optional[List[Callable[[], bool]]] = None,
-        readiness_checks: Optional[List[Callable[[], bool]]] = None,
+        app_version: str,
+        liveness_path: str = "/healthz",
+        readiness_path: str = "/readyz",
+        liveness_checks: Optional[Sequence[CheckLike]] = None,
+        readiness_checks: Optional[Sequence[CheckLike]] = None,
+        check_timeout: float = 2.0,
+        cache_ttl: float = 10.0,
+        refresh_interval: Optional[float] = None,
     ):
         """Initialize the health check configuration.
-        
+
         Args:
-            app: The FastAPI application
-            version: The application version
-            healthz_path: The path for the liveness endpoint
-            readyz_path: The path for the readiness endpoint
+            app_version: The application version
+            liveness_path: The path for the liveness endpoint
+            readiness_path: The path for the readiness endpoint
             liveness_checks: Optional list of liveness check functions
             readiness_checks: Optional list of readiness check functions
+            check_timeout: Default per-check timeout in seconds
+            cache_ttl: How long check results may be served before they are rerun
+            refresh_interval: How often the background refresher reruns the checks,
+                defaults to half of cache_ttl so probes never see stale results
+        """
+        self.app_version = app_version
+        self.liveness_path = liveness_path
+        self.readiness_path = readiness_path
+        self.liveness_checks = list(liveness_checks or [])
+        self.readiness_checks = list(readiness_checks or [])
+        self.check_timeout = check_timeout
+        self.cache_ttl = cache_ttl
+        self.refresh_interval = refresh_interval if refresh_interval is not None else cache_ttl / 2
+
+
+def _interpret(outcome: Any) -> "tuple[CheckStatus, str]":
+    """Turn whatever a check function returned into a status and message."""
+    message = ""
+    if isinstance(outcome, tuple):
+        outcome, message = outcome
+    if isinstance(outcome, bool):
+        return (CheckStatus.HEALTHY if outcome else CheckStatus.UNHEALTHY), message
+    return CheckStatus(outcome), message
+
+
+def _overall(results: Sequence[CheckResult]) -> CheckStatus:
+    """The worst status among the results; healthy when there are none."""
+    return max((result.status for result in results), key=_SEVERITY.__getitem__, default=CheckStatus.HEALTHY)
+
+
+class HealthMonitor:
+    """Runs the configured checks and keeps their latest results in memory.
+
+    Probes read the cached results. They are rerun by the background refresher
+    while the application is running, or on demand once they are older than
+    the cache TTL; concurrent probes share a single run.
+    """
+
+    def __init__(self, config: HealthCheckConfig):
+        """Initialize the monitor.
+
+        Args:
+            config: The health check configuration
         """
-        self.app = app
-        self.version = version
-        self.healthz_path = healthz_path
-        self.readyz_path = readyz_path
-        self.liveness_checks = liveness_checks or []
-        self.readiness_checks = readiness_checks or []
+        self.config = config
+        self.liveness_checks = [self._as_check(check) for check in config.liveness_checks]
+        self.readiness_checks = [self._as_check(check) for check in config.readiness_checks]
+        self._liveness_results: List[CheckResult] = []
+        self._readiness_results: List[CheckResult] = []
+        self._checked_at: Optional[float] = None
+        self._timestamp = ""
+        self._refreshing: Optional[asyncio.Task] = None
+        self._refresher: Optional[asyncio.Task] = None
+
+    def _as_check(self, check: CheckLike) -> HealthCheck:
+        if not isinstance(check, HealthCheck):
+            check = HealthCheck(check)
+        if check.timeout is None:
+            check.timeout = self.config.check_timeout
+        return check
+
+    async def _run_check(self, check: HealthCheck) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            state, message = _interpret(await asyncio.wait_for(check.call(), check.timeout))
+        except asyncio.TimeoutError:
+            state, message = CheckStatus.UNHEALTHY, f"Timed out after {check.timeout:g}s"
+        except Exception as e:
+            state, message = CheckStatus.UNHEALTHY, str(e)
+        if state is CheckStatus.UNHEALTHY and not check.critical:
+            state = CheckStatus.DEGRADED
+        return CheckResult(
+            name=check.name,
+            status=state,
+            message=message,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    async def refresh(self) -> None:
+        """Run every check concurrently and replace the cached results."""
+        results = await asyncio.gather(
+            *(self._run_check(check) for check in self.liveness_checks + self.readiness_checks)
+        )
+        self._liveness_results = results[:len(self.liveness_checks)]
+        self._readiness_results = results[len(self.liveness_checks):]
+        self._checked_at = time.monotonic()
+        self._timestamp = datetime.now(timezone.utc).isoformat()
+
+    def is_fresh(self) -> bool:
+        """Whether the cached results are younger than the cache TTL."""
+        return self._checked_at is not None and time.monotonic() - self._checked_at < self.config.cache_ttl
+
+    async def ensure_fresh(self) -> None:
+        """Refresh the cached results if they are stale, sharing any run already in flight."""
+        if self.is_fresh():
+            return
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self.refresh())
+        # Shielded so a probe that disconnects does not cancel the run other probes wait on
+        await asyncio.shield(self._refreshing)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.config.refresh_interval)
 
+    async def start(self) -> None:
+        """Start the background refresher."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_forever())
 
-def setup_health_endpoints(config: HealthCheckConfig) -> None:
+    async def stop(self) -> None:
+        """Stop the background refresher."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            await asyncio.gather(self._refresher, return_exceptions=True)
+            self._refresher = None
+
+    async def report(self, readiness: bool = False) -> HealthStatus:
+        """The cached health report, refreshed first if it has gone stale."""
+        await self.ensure_fresh()
+        results = self._readiness_results if readiness else self._liveness_results
+        return HealthStatus(
+            status=_overall(results),
+            version=self.config.app_version,
+            timestamp=self._timestamp,
+            checks=results,
+        )
+
+
+def _to_response(report: HealthStatus) -> Response:
+    # Degraded still serves traffic; only a failed check takes the pod out of rotation
+    failed = report.status is CheckStatus.UNHEALTHY
+    return Response(
+        content=report.model_dump_json(),
+        media_type="application/json",
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE if failed else status.HTTP_200_OK,
+    )
+
+
+def setup_health_endpoints(app: FastAPI, config: HealthCheckConfig) -> HealthMonitor:
     """Set up health check endpoints in a FastAPI application.
-    
+
     Args:
+        app: The FastAPI application
         config: The health check configuration
+
+    Returns:
+        The monitor serving the endpoints, e.g. to force a refresh after a deploy step
     """
-    app = config.app
-    
-    @app.get(config.healthz_path, tags=["Health"])
+    monitor = HealthMonitor(config)
+    app.add_event_handler("startup", monitor.start)
+    app.add_event_handler("shutdown", monitor.stop)
+
+    @app.get(config.liveness_path, tags=["Health"])
     async def healthz() -> Response:
         """Liveness probe endpoint.
-        
+
         This endpoint checks if the application is running and responding to requests.
         It is used by Kubernetes to determine if the pod is alive.
         """
-        # Run liveness checks
-        details = {}
-        all_healthy = True
-        
-        for i, check in enumerate(config.liveness_checks):
-            check_name = getattr(check, "__name__", f"liveness_check_{i}")
-            try:
-                result = check()
-                details[check_name] = {
-                    "status": "up" if result else "down",
-                    "healthy": result,
-                }
-                if not result:
-                    all_healthy = False
-            except Exception as e:
-                details[check_name] = {
-                    "status": "error",
-                    "message": str(e),
-                    "healthy": False,
-                }
-                all_healthy = False
-        
-        # Always include a basic check
-        if not details:
-            details["application"] = {"status": "up", "healthy": True}
-        
-        status_code = status.HTTP_200_OK if all_healthy else status.HTTP_503_SERVICE_UNAVAILABLE
-        
-        return Response(
-            content=HealthStatus(
-                status="healthy" if all_healthy else "unhealthy",
-                version=config.version,
-                details=details,
-            ).json(),
-            media_type="application/json",
-            status_code=status_code,
-        )
-    
-    @app.get(config.readyz_path, tags=["Health"])
+        return _to_response(await monitor.report())
+
+    @app.get(config.readiness_path, tags=["Health"])
     async def readyz() -> Response:
         """Readiness probe endpoint.
-        
+
         This endpoint checks if the application is ready to receive traffic.
         It is used by Kubernetes to determine if the pod is ready to receive requests.
         """
-        # Run readiness checks
-        details = {}
-        all_ready = True
-        
-        # Run liveness checks first
-        for i, check in enumerate(config.liveness_checks):
-            check_name = getattr(check, "__name__", f"liveness_check_{i}")
-            try:
-                result = check()
-                details[check_name] = {
-                    "status": "up" if result else "down",
-                    "ready": result,
-                }
-                if not result:
-                    all_ready = False
-            except Exception as e:
-                details[check_name] = {
-                    "status": "error",
-                    "message": str(e),
-                    "ready": False,
-                }
-                all_ready = False
-        
-        # Then run readiness checks
-        for i, check in enumerate(config.readiness_checks):
-            check_name = getattr(check, "__name__", f"readiness_check_{i}")
-            try:
-                result = check()
-                details[check_name] = {
-                    "status": "up" if result else "down",
-                    "ready": result,
-                }
-                if not result:
-                    all_ready = False
-            except Exception as e:
-                details[check_name] = {
-                    "status": "error",
-                    "message": str(e),
-                    "ready": False,
-                }
-                all_ready = False
-        
-        # Always include a basic check
-        if not details:
-            details["application"] = {"status": "up", "ready": True}
-        
-        status_code = status.HTTP_200_OK if all_ready else status.HTTP_503_SERVICE_UNAVAILABLE
-        
-        return Response(
-            content=HealthStatus(
-                status="ready" if all_ready else "not_ready",
-                version=config.version,
-                details=details,
-            ).json(),
-            media_type="application/json",
-            status_code=status_code,
-        )
\ No newline at end of file
+        return _to_response(await monitor.report(readiness=True))
+
+    return monitor
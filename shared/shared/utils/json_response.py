@@ -0,0 +1,110 @@
+"""Fast JSON responses for FastAPI applications.
+
+This module provides orjson-based response classes. EnvelopeJSONResponse
+writes the standard response envelope around the data while serializing it,
+so routes do not build a ResponseEnvelope model or an enveloped copy of their
+data first.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# datetime, date, UUID, enums and dataclasses are serialized natively
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(value: Any) -> Any:
+    """Serialize the types orjson does not handle itself.
+
+    Args:
+        value: The object orjson could not serialize
+
+    Returns:
+        A serializable replacement for the object
+
+    Raises:
+        TypeError: If the object cannot be serialized
+    """
+    if isinstance(value, BaseModel):
+        # Embedded as-is: pydantic writes the JSON without building a dict first
+        return orjson.Fragment(value.model_dump_json(by_alias=True))
+    if isinstance(value, Decimal):
+        # Same as jsonable_encoder: whole numbers stay integers
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes.
+
+    Args:
+        content: The content to serialize
+
+    Returns:
+        The JSON document
+    """
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class EnvelopeJSONResponse(JSONResponse):
+    """JSON response that wraps its content in the standard ResponseEnvelope.
+
+    The output matches ResponseEnvelope.success_response(data=content), or
+    ResponseEnvelope.error_response(...) when created with error().
+    """
+
+    def __init__(self, content: Any = None, status_code: int = 200, error: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """Initialize the response.
+
+        Args:
+            content: The data payload
+            status_code: HTTP status code to return
+            error: Error details; the envelope reports success when omitted
+            **kwargs: Further arguments for JSONResponse, e.g. headers
+        """
+        self.error = error
+        super().__init__(content, status_code=status_code, **kwargs)
+
+    @classmethod
+    def error_response(
+        cls,
+        code: str,
+        message: str,
+        status_code: int = 400,
+        details: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "EnvelopeJSONResponse":
+        """Create an error response.
+
+        Args:
+            code: Error code for programmatic handling
+            message: Human-readable error message
+            status_code: HTTP status code to return
+            details: Additional error details
+
+        Returns:
+            An EnvelopeJSONResponse with success=False and the error details
+        """
+        error: Dict[str, Any] = {"code": code, "message": message}
+        if details is not None:
+            error["details"] = details
+        return cls(None, status_code=status_code, error=error, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        # render() runs inside JSONResponse.__init__, after self.error is set
+        return dumps({"success": self.error is None, "data": content, "error": self.error})
@@ -4,7 +4,7 @@ from typing import Any, Callable, TypeVar
 from fastapi import Response
 from fastapi.responses import JSONResponse
 
-from shared.utils.response_envelope import ResponseEnvelope
+from shared.utils.json_response import EnvelopeJSONResponse
 
 # Type variable for the route handler function
 F = TypeVar('F', bound=Callable[..., Any])
@@ -17,6 +17,9 @@ def envelope_response(func: F) -> F:
     in a ResponseEnvelope with success=True. If the handler returns a Response object
     (like JSONResponse, HTMLResponse, etc.), it passes it through unchanged.
     
+    The envelope is written while the result is serialized with orjson, so the
+    result is not copied into a ResponseEnvelope or run through jsonable_encoder.
+    
     Args:
         func: The FastAPI route handler function to wrap
         
@@ -32,7 +35,7 @@ def envelope_response(func: F) -> F:
             return result
         
         # Otherwise, wrap the result in a ResponseEnvelope
-        return ResponseEnvelope.success_response(data=result)
+        return EnvelopeJSONResponse(result)
     
     return wrapper  # type: ignore
 
@@ -56,11 +59,9 @@ def create_error_response(
     Returns:
         A JSONResponse with the error ResponseEnvelope
     """
-    return JSONResponse(
+    return EnvelopeJSONResponse.error_response(
+        code=code,
+        message=message,
         status_code=status_code,
-        content=ResponseEnvelope.error_response(
-            code=code,
-            message=message,
-            details=details
-        ).dict(exclude_none=True)
+        details=details
     )
\ No newline at end of file
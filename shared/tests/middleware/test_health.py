@@ -1,10 +1,15 @@
 """Tests for the health check endpoints."""
 
+import asyncio
+import time
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest
 
-from shared.middleware.health import HealthCheckConfig, setup_health_endpoints, HealthStatus
+from shared.middleware.health import (
+    CheckStatus, HealthCheck, HealthCheckConfig, setup_health_endpoints, HealthStatus
+)
 
 
 @pytest.fixture
@@ -132,4 +137,121 @@ def test_custom_paths():
     assert response.status_code == 404
     
     response = client.get("/readyz")
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+def test_probes_are_served_from_cache():
+    """Test that probes within the cache TTL do not rerun the checks."""
+    calls = []
+
+    def counted_check():
+        calls.append(1)
+        return True
+
+    app = FastAPI()
+    setup_health_endpoints(app, HealthCheckConfig(
+        app_version="1.0.0-test",
+        readiness_checks=[counted_check],
+        cache_ttl=60,
+    ))
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/readyz").status_code == 200
+    assert len(calls) == 1
+
+
+def test_stale_results_are_rerun():
+    """Test that results older than the cache TTL are refreshed on the next probe."""
+    calls = []
+
+    async def counted_check():
+        calls.append(1)
+        return True, "ok"
+
+    app = FastAPI()
+    setup_health_endpoints(app, HealthCheckConfig(
+        app_version="1.0.0-test",
+        readiness_checks=[counted_check],
+        cache_ttl=0,
+    ))
+    client = TestClient(app)
+    client.get("/readyz")
+    client.get("/readyz")
+    assert len(calls) == 2
+
+
+def test_checks_run_concurrently_with_timeouts():
+    """Test that checks run at the same time and a hung check fails on its own timeout."""
+    async def slow_database():
+        await asyncio.sleep(0.2)
+        return True, "Database connection is healthy"
+
+    async def slow_cache():
+        await asyncio.sleep(0.2)
+        return True, "Redis connection is healthy"
+
+    async def hung_dependency():
+        await asyncio.sleep(5)
+        return True
+
+    app = FastAPI()
+    setup_health_endpoints(app, HealthCheckConfig(
+        app_version="1.0.0-test",
+        readiness_checks=[slow_database, slow_cache, HealthCheck(hung_dependency, timeout=0.3)],
+    ))
+    client = TestClient(app)
+
+    started = time.perf_counter()
+    response = client.get("/readyz")
+    assert time.perf_counter() - started < 1
+
+    assert response.status_code == 503
+    checks = {check["name"]: check for check in response.json()["checks"]}
+    assert checks["slow_database"]["status"] == "healthy"
+    assert checks["slow_cache"]["status"] == "healthy"
+    assert checks["hung_dependency"]["status"] == "unhealthy"
+    assert checks["hung_dependency"]["message"] == "Timed out after 0.3s"
+
+
+def test_degraded_is_reported_separately_from_unhealthy():
+    """Test that non-critical failures degrade the service without taking it out of rotation."""
+    def broken_thumbnail_service():
+        raise ConnectionError("thumbnail service unreachable")
+
+    async def lagging_replica():
+        return CheckStatus.DEGRADED, "Replica is 30s behind"
+
+    app = FastAPI()
+    setup_health_endpoints(app, HealthCheckConfig(
+        app_version="1.0.0-test",
+        readiness_checks=[HealthCheck(broken_thumbnail_service, critical=False), lagging_replica],
+    ))
+    response = TestClient(app).get("/readyz")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert [check["status"] for check in data["checks"]] == ["degraded", "degraded"]
+    assert data["checks"][0]["message"] == "thumbnail service unreachable"
+
+
+def test_background_refresher_fills_the_cache_at_startup():
+    """Test that the refresher runs the checks before the first probe arrives."""
+    calls = []
+
+    def counted_check():
+        calls.append(1)
+        return True
+
+    app = FastAPI()
+    monitor = setup_health_endpoints(app, HealthCheckConfig(
+        app_version="1.0.0-test",
+        liveness_checks=[counted_check],
+        cache_ttl=60,
+    ))
+    with TestClient(app) as client:
+        deadline = time.perf_counter() + 2
+        while not calls and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert monitor.is_fresh()
+        assert client.get("/healthz").json()["checks"][0]["status"] == "healthy"
+        assert len(calls) == 1
@@ -1,3 +1,8 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
 import pytest
 from fastapi import FastAPI, HTTPException, status
 from fastapi.testclient import TestClient
@@ -5,6 +10,7 @@ from pydantic import BaseModel, ValidationError
 
 from shared.utils.response_envelope import ResponseEnvelope, ErrorDetail
 from shared.utils.response_wrapper import envelope_response, create_error_response
+from shared.utils.json_response import EnvelopeJSONResponse, FastJSONResponse
 from shared.middleware.exception_handlers import register_exception_handlers
 
 
@@ -88,7 +94,8 @@ class TestExceptionHandlers:
     @pytest.fixture
     def client(self, app):
         """Create a test client for the app."""
-        return TestClient(app)
+        # Return the 500 handler's response instead of re-raising the server error
+        return TestClient(app, raise_server_exceptions=False)
     
     def test_http_exception_handler(self, client):
         """Test the HTTP exception handler."""
@@ -174,4 +181,56 @@ class TestResponseWrapper:
         assert data["data"] is None
         assert data["error"]["code"] == "TEST_ERROR"
         assert data["error"]["message"] == "Test error message"
-        assert data["error"]["details"]["field"] == "value"
\ No newline at end of file
+        assert data["error"]["details"]["field"] == "value"
+
+
+class TestEnvelopeJSONResponse:
+    """Tests for the orjson-based response classes."""
+    
+    def test_matches_response_envelope(self):
+        """Test that the envelope written during serialization matches ResponseEnvelope."""
+        data = {"posts": [{"id": 1, "caption": "Summer launch"}], "total": 1}
+        
+        response = EnvelopeJSONResponse(data)
+        
+        expected = ResponseEnvelope.success_response(data=data).model_dump(mode="json")
+        assert json.loads(response.body) == expected
+    
+    def test_error_response_matches_response_envelope(self):
+        """Test that error responses match ResponseEnvelope.error_response."""
+        response = EnvelopeJSONResponse.error_response(code="TEST_ERROR", message="Test error message", status_code=409)
+        
+        assert response.status_code == 409
+        assert json.loads(response.body) == ResponseEnvelope.error_response(
+            code="TEST_ERROR", message="Test error message"
+        ).model_dump(mode="json", exclude={"error": {"details"}})
+    
+    def test_native_types(self):
+        """Test serializing datetimes, UUIDs, decimals and pydantic models."""
+        class Post(BaseModel):
+            id: uuid.UUID
+            published_at: datetime
+        
+        post_id = uuid.uuid4()
+        published_at = datetime(2025, 6, 1, 9, 30, tzinfo=timezone.utc)
+        
+        response = FastJSONResponse({
+            "post": Post(id=post_id, published_at=published_at),
+            "created_at": published_at,
+            "budget": Decimal("12.50"),
+            "reach": Decimal("1200"),
+            "tags": {"launch"},
+        })
+        
+        assert json.loads(response.body) == {
+            "post": {"id": str(post_id), "published_at": "2025-06-01T09:30:00Z"},
+            "created_at": "2025-06-01T09:30:00+00:00",
+            "budget": 12.5,
+            "reach": 1200,
+            "tags": ["launch"],
+        }
+    
+    def test_unserializable_content(self):
+        """Test that unknown types raise TypeError like the stdlib encoder."""
+        with pytest.raises(TypeError):
+            FastJSONResponse({"value": object()})
@@ -0,0 +1,26 @@
+"""Record when submission verification was enqueued
+
+Revision ID: add_submission_enqueued_at
+Revises: add_submission_listing_indexes
+Create Date: 2024-03-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = 'add_submission_enqueued_at'
+down_revision = 'add_submission_listing_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Nullable without a default, so adding it does not rewrite the table.
+    # Pending rows start out NULL and are re-published once by the sweeper.
+    op.add_column('submissions', sa.Column('enqueued_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('submissions', 'enqueued_at')
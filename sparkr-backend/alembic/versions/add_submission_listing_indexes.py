@@ -0,0 +1,43 @@
+"""Add composite indexes for submission listings
+
+Revision ID: add_submission_listing_indexes
+Revises: add_submission_task_user_unique
+Create Date: 2024-03-11 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = 'add_submission_listing_indexes'
+down_revision = 'add_submission_task_user_unique'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Build the listing indexes without blocking intake
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_task_status_created "
+            "ON submissions (task_id, status, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_user_created "
+            "ON submissions (user_id, created_at)"
+        )
+        # Only pending rows: the admin review queue and the requeue sweeper
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_submissions_pending_created "
+            "ON submissions (created_at, id) WHERE status = 'PENDING'"
+        )
+
+    # user_id is the leading column of ix_submissions_user_created, so its own index is redundant
+    op.drop_index('ix_submissions_user_id', table_name='submissions')
+
+
+def downgrade():
+    op.create_index('ix_submissions_user_id', 'submissions', ['user_id'], unique=False)
+    op.drop_index('ix_submissions_pending_created', table_name='submissions')
+    op.drop_index('ix_submissions_user_created', table_name='submissions')
+    op.drop_index('ix_submissions_task_status_created', table_name='submissions')
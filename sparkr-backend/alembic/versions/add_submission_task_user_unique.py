@@ -0,0 +1,103 @@
+"""Make (task_id, user_id) unique on submissions
+
+Revision ID: add_submission_task_user_unique
+Revises: add_rewards_table
+Create Date: 2024-03-04 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic
+revision = 'add_submission_task_user_unique'
+down_revision = 'add_rewards_table'
+branch_labels = None
+depends_on = None
+
+
+# Per (task_id, user_id): keep the submission that already earned a reward, else the earliest
+RANKED_SUBMISSIONS = """
+    WITH ranked AS (
+        SELECT s.id,
+               row_number() OVER w AS rn
+        FROM submissions s
+        WINDOW w AS (
+            PARTITION BY s.task_id, s.user_id
+            ORDER BY EXISTS (SELECT 1 FROM rewards r WHERE r.submission_id = s.id) DESC, s.created_at, s.id
+        )
+    )
+"""
+
+
+# (task_id, user_id) pairs where more than one submission already earned a reward
+REWARD_CONFLICTS = """
+    SELECT s.task_id, s.user_id, count(DISTINCT s.id) AS rewarded
+    FROM submissions s
+    JOIN rewards r ON r.submission_id = s.id
+    GROUP BY s.task_id, s.user_id
+    HAVING count(DISTINCT s.id) > 1
+    ORDER BY s.task_id, s.user_id
+"""
+
+
+INDEX_VALIDITY = """
+    SELECT i.indisvalid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname = :name AND pg_table_is_visible(c.oid)
+"""
+
+
+def _index_is_valid(connection, name):
+    """True or False for an existing index, None if there is none"""
+    return connection.execute(sa.text(INDEX_VALIDITY), {"name": name}).scalar()
+
+
+def upgrade():
+    connection = op.get_bind()
+
+    # Duplicates that were each rewarded have already been paid out twice; merging them
+    # would leave one submission with several rewards, so they have to be settled by hand
+    conflicts = connection.execute(sa.text(REWARD_CONFLICTS)).fetchall()
+    if conflicts:
+        listed = ", ".join(f"({row.task_id}, {row.user_id}): {row.rewarded}" for row in conflicts[:20])
+        raise RuntimeError(
+            f"{len(conflicts)} (task_id, user_id) pairs have more than one rewarded submission "
+            f"[{listed}{', ...' if len(conflicts) > 20 else ''}]. Remove the extra rewards, "
+            "adjust users.total_points, and rerun the migration."
+        )
+
+    # Remove existing duplicates; the kept submission is the rewarded one, if any
+    connection.execute(sa.text(RANKED_SUBMISSIONS + """
+        DELETE FROM submissions
+        USING ranked
+        WHERE submissions.id = ranked.id AND ranked.rn > 1
+    """))
+
+    # Build the index without blocking intake, then attach it as the constraint
+    with op.get_context().autocommit_block():
+        # A failed concurrent build leaves an invalid index behind, which IF NOT EXISTS would keep
+        if _index_is_valid(connection, 'uq_submissions_task_user') is False:
+            op.execute("DROP INDEX CONCURRENTLY uq_submissions_task_user")
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_submissions_task_user "
+            "ON submissions (task_id, user_id)"
+        )
+    if not _index_is_valid(connection, 'uq_submissions_task_user'):
+        raise RuntimeError(
+            "uq_submissions_task_user was not built; duplicate (task_id, user_id) submissions "
+            "were probably added during the build. Rerun the migration."
+        )
+    op.execute(
+        "ALTER TABLE submissions ADD CONSTRAINT uq_submissions_task_user "
+        "UNIQUE USING INDEX uq_submissions_task_user"
+    )
+
+    # task_id is the leading column of the new index, so its own index is redundant
+    op.drop_index('ix_submissions_task_id', table_name='submissions')
+
+
+def downgrade():
+    op.create_index('ix_submissions_task_id', 'submissions', ['task_id'], unique=False)
+    op.drop_constraint('uq_submissions_task_user', 'submissions', type_='unique')
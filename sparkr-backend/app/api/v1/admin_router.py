@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
@@ -6,40 +6,37 @@ from sqlmodel import select, func
 from app.models.schemas import SubmissionResponse, VerificationStatusEnum
 from app.models.models import Submission, Task, User, Campaign
 from app.db.session import get_session
+from app.services import catalog
 from app.services.points import calculate_points, award_points
+from app.services.submissions import list_submissions
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/submissions", response_model=List[SubmissionResponse])
 async def get_admin_submissions(
+    response: Response,
     status: Optional[VerificationStatusEnum] = Query(None, description="Filter by submission status"),
     task_id: Optional[str] = Query(None, description="Filter by task ID"),
     campaign_id: Optional[str] = Query(None, description="Filter by campaign ID"),
     limit: int = Query(100, ge=1, le=1000, description="Limit the number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
     session: AsyncSession = Depends(get_session),
 ):
     """
     Admin endpoint to list submissions with optional filtering
-    """
-    query = select(Submission)
-    
-    # Apply filters if provided
-    if status:
-        query = query.where(Submission.status == status)
-    if task_id:
-        query = query.where(Submission.task_id == task_id)
-    if campaign_id:
-        # Join with Task to filter by campaign_id
-        query = query.join(Task).where(Task.campaign_id == campaign_id)
     
-    # Apply pagination
-    query = query.offset(offset).limit(limit)
+    Newest first; the cursor for the next page is returned in the X-Next-Cursor header
+    """
+    try:
+        submissions, next_cursor = await list_submissions(
+            session, status=status, task_id=task_id, campaign_id=campaign_id, limit=limit, cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     
-    # Execute query
-    result = await session.execute(query)
-    submissions = result.scalars().all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return submissions
 
@@ -65,10 +62,7 @@ async def approve_submission(
         )
     
     # Get the associated task
-    result = await session.execute(
-        select(Task).where(Task.id == submission.task_id)
-    )
-    task = result.scalar_one_or_none()
+    task = await catalog.get_task(session, submission.task_id)
     
     if not task:
         raise HTTPException(
@@ -80,7 +74,7 @@ async def approve_submission(
     submission.status = VerificationStatusEnum.VERIFIED
     
     # Calculate points based on task
-    points = calculate_points(task.platform, submission)
+    points = calculate_points(task["platform"], submission)
     
     # Award points to the user
     success = await award_points(
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.models.schemas import CampaignCreate, CampaignResponse
+from app.models.schemas import CampaignCreate, CampaignResponse, StatusEnum
 from app.models.models import Campaign
 from app.db.session import get_session
+from app.services import catalog
 
 router = APIRouter(
     prefix="/campaigns", 
@@ -30,26 +32,33 @@ async def create_campaign(campaign: CampaignCreate, session: AsyncSession = Depe
     session.add(db_campaign)
     await session.commit()
     await session.refresh(db_campaign)
+    await catalog.invalidate(catalog.CAMPAIGNS)
     
     return db_campaign
 
 
 @router.get("/", response_model=List[CampaignResponse])
-async def get_campaigns(session: AsyncSession = Depends(get_session)):
-    """Get all campaigns"""
-    # Query all campaigns
-    result = await session.execute(select(Campaign))
-    campaigns = result.scalars().all()
-    
-    return campaigns
+async def get_campaigns(
+    status_filter: Optional[StatusEnum] = Query(None, alias="status", description="Filter by campaign status"),
+    running: bool = Query(False, description="Only campaigns running today"),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session)
+):
+    """Get campaigns newest first (cached)"""
+    return await catalog.list_campaigns(
+        session,
+        status=status_filter,
+        running_on=date.today() if running else None,
+        limit=limit,
+        offset=offset
+    )
 
 
 @router.get("/{campaign_id}", response_model=CampaignResponse)
 async def get_campaign(campaign_id: str, session: AsyncSession = Depends(get_session)):
-    """Get a specific campaign by ID"""
-    # Query campaign by ID
-    result = await session.execute(select(Campaign).where(Campaign.id == campaign_id))
-    campaign = result.scalar_one_or_none()
+    """Get a specific campaign by ID (cached)"""
+    campaign = await catalog.get_campaign(session, campaign_id)
     
     # Raise 404 if not found
     if not campaign:
@@ -84,6 +93,7 @@ async def update_campaign(campaign_id: str, campaign_data: CampaignCreate, sessi
     # Save to database
     await session.commit()
     await session.refresh(campaign)
+    await catalog.invalidate(catalog.CAMPAIGNS)
     
     return campaign
 
@@ -105,5 +115,6 @@ async def delete_campaign(campaign_id: str, session: AsyncSession = Depends(get_
     # Delete from database
     await session.delete(campaign)
     await session.commit()
+    await catalog.invalidate(catalog.CAMPAIGNS)
     
     return None
\ No newline at end of file
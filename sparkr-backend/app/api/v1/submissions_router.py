@@ -1,17 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 from pydantic import BaseModel, HttpUrl
 
 from app.models.schemas import SubmissionCreate, SubmissionResponse, VerificationStatusEnum
-from app.models.models import Submission, Task, User
+from app.models.models import Submission, User
 from app.models.reward import Reward
 from app.db.session import get_session
 from app.core.security import get_current_user
 from app.services.verification import verify_submission
 from app.services.points import calculate_points, award_points
-from app.workers.tasks_worker import verify_submission_task
+from app.services import catalog
+from app.services.submissions import create_submission, list_submissions, publish_verification
 
 router = APIRouter(prefix="/submissions", tags=["submissions"])
 
@@ -28,72 +29,49 @@ class TaskSubmission(BaseModel):
 async def submit_task(
     task_id: str,
     proof_data: dict,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """Submit a completed task with proof URL"""
-    # Verify task exists
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    # Extract proof_url from the request data
+    proof_url = proof_data.get("proof_url")
+    if not proof_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Proof URL is required"
+        )
     
+    # Verify task exists (cached)
+    task = await catalog.get_task(session, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with ID {task_id} not found"
         )
     
-    # Check if user already submitted this task
-    result = await session.execute(
-        select(Submission).where(
-            Submission.task_id == task_id,
-            Submission.user_id == current_user.id
-        )
-    )
-    existing_submission = result.scalar_one_or_none()
-    
-    if existing_submission:
+    # Insert unless this user already submitted the task; the unique index settles races
+    db_submission = await create_submission(session, task_id, current_user.id, str(proof_url))
+    if not db_submission:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already submitted this task"
         )
     
-    # Extract proof_url from the request data
-    proof_url = proof_data.get("proof_url")
-    if not proof_url:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Proof URL is required"
-        )
-    
-    # Create new submission
-    db_submission = Submission(
-        task_id=task_id,
-        user_id=current_user.id,
-        submission_url=str(proof_url),  # Use proof_url as submission_url
-        proof_url=str(proof_url),
-        status=VerificationStatusEnum.PENDING,
-        points_awarded=0
-    )
-    
-    # Add to database
-    session.add(db_submission)
-    await session.commit()
-    await session.refresh(db_submission)
-    
-    # Enqueue background job for verification and points awarding
-    verify_submission_task.delay(db_submission.id)
-    
-    # Return the submission with pending status
-    # The background task will update the status and points
-    await session.refresh(db_submission)
+    # Enqueue verification after the response is sent; the background task
+    # will update the status and points
+    background_tasks.add_task(publish_verification, db_submission.id)
     
     return db_submission
 
 
 @router.get("/", response_model=List[SubmissionResponse])
 async def get_submissions(
+    response: Response,
     task_id: Optional[str] = None,
     status: Optional[VerificationStatusEnum] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -101,29 +79,30 @@ async def get_submissions(
     
     For regular users: Returns only their own submissions
     For admins: Returns all submissions with optional status filtering
-    """
-    # Start with a base query
-    query = select(Submission)
     
+    Results are newest first; the cursor for the next page is returned in
+    the X-Next-Cursor header.
+    """
     # Check if user is admin (you may need to adjust this based on your auth system)
     # For this implementation, we'll assume there's an is_admin field in the User model
     # If there isn't, you'll need to implement your own admin check logic
     is_admin = getattr(current_user, "is_admin", False)
     
     # For non-admin users, only show their own submissions
-    if not is_admin:
-        query = query.where(Submission.user_id == current_user.id)
-    
-    # Apply filters if provided
-    if task_id:
-        query = query.where(Submission.task_id == task_id)
-        
-    if status:
-        query = query.where(Submission.status == status)
+    try:
+        submissions, next_cursor = await list_submissions(
+            session,
+            user_id=None if is_admin else current_user.id,
+            status=status,
+            task_id=task_id,
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     
-    # Execute query
-    result = await session.execute(query)
-    submissions = result.scalars().all()
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return submissions
 
@@ -190,10 +169,7 @@ async def review_submission(
         )
     
     # Get the associated task to calculate points
-    result = await session.execute(
-        select(Task).where(Task.id == submission.task_id)
-    )
-    task = result.scalar_one_or_none()
+    task = await catalog.get_task(session, submission.task_id)
     
     if not task:
         raise HTTPException(
@@ -207,7 +183,7 @@ async def review_submission(
     # If approved, calculate and award points
     if review_data.status == VerificationStatusEnum.VERIFIED:
         # Calculate points based on task
-        points = calculate_points(task.platform, submission)
+        points = calculate_points(task["platform"], submission)
         
         # Award points to the user
         success = await award_points(
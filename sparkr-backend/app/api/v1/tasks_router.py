@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from app.models.schemas import TaskCreate, TaskResponse
-from app.models.models import Task, Campaign
+from app.models.models import Task
 from app.db.session import get_session
+from app.services import catalog
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -14,8 +15,7 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 async def create_task(task: TaskCreate, session: AsyncSession = Depends(get_session)):
     """Create a new task"""
     # Verify campaign exists
-    result = await session.execute(select(Campaign).where(Campaign.id == task.campaign_id))
-    campaign = result.scalar_one_or_none()
+    campaign = await catalog.get_campaign(session, task.campaign_id)
     
     if not campaign:
         raise HTTPException(
@@ -37,33 +37,26 @@ async def create_task(task: TaskCreate, session: AsyncSession = Depends(get_sess
     session.add(db_task)
     await session.commit()
     await session.refresh(db_task)
+    await catalog.invalidate(catalog.TASKS)
     
     return db_task
 
 
 @router.get("/", response_model=List[TaskResponse])
-async def get_tasks(campaign_id: str = None, session: AsyncSession = Depends(get_session)):
-    """Get all tasks, optionally filtered by campaign_id"""
-    # Build query
-    query = select(Task)
-    
-    # Filter by campaign_id if provided
-    if campaign_id:
-        query = query.where(Task.campaign_id == campaign_id)
-    
-    # Execute query
-    result = await session.execute(query)
-    tasks = result.scalars().all()
-    
-    return tasks
+async def get_tasks(
+    campaign_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_session)
+):
+    """Get tasks newest first, optionally filtered by campaign_id (cached)"""
+    return await catalog.list_tasks(session, campaign_id=campaign_id, limit=limit, offset=offset)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(task_id: str, session: AsyncSession = Depends(get_session)):
-    """Get a specific task by ID"""
-    # Query task by ID
-    result = await session.execute(select(Task).where(Task.id == task_id))
-    task = result.scalar_one_or_none()
+    """Get a specific task by ID (cached)"""
+    task = await catalog.get_task(session, task_id)
     
     # Raise 404 if not found
     if not task:
@@ -91,8 +84,7 @@ async def update_task(task_id: str, task_data: TaskCreate, session: AsyncSession
     
     # Verify campaign exists if campaign_id is being updated
     if task.campaign_id != task_data.campaign_id:
-        campaign_result = await session.execute(select(Campaign).where(Campaign.id == task_data.campaign_id))
-        campaign = campaign_result.scalar_one_or_none()
+        campaign = await catalog.get_campaign(session, task_data.campaign_id)
         
         if not campaign:
             raise HTTPException(
@@ -110,6 +102,7 @@ async def update_task(task_id: str, task_data: TaskCreate, session: AsyncSession
     # Save to database
     await session.commit()
     await session.refresh(task)
+    await catalog.invalidate(catalog.TASKS)
     
     return task
 
@@ -131,5 +124,6 @@ async def delete_task(task_id: str, session: AsyncSession = Depends(get_session)
     # Delete from database
     await session.delete(task)
     await session.commit()
+    await catalog.invalidate(catalog.TASKS)
     
     return None
\ No newline at end of file
@@ -1,5 +1,6 @@
 from datetime import datetime, date
 from typing import Optional, List
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlmodel import SQLModel, Field, Relationship
 from uuid import uuid4
 
@@ -32,7 +33,7 @@ class Task(SQLModel, table=True):
     __tablename__ = "tasks"
     
     id: str = Field(default_factory=generate_uuid, primary_key=True)
-    campaign_id: str = Field(foreign_key="campaigns.id")
+    campaign_id: str = Field(foreign_key="campaigns.id", index=True)
     title: str
     description: Optional[str] = None
     platform: PlatformEnum
@@ -48,6 +49,16 @@ class Task(SQLModel, table=True):
 class Submission(SQLModel, table=True):
     """Submission database model"""
     __tablename__ = "submissions"
+    __table_args__ = (
+        # One submission per user per task; also serves the duplicate check on intake
+        UniqueConstraint("task_id", "user_id", name="uq_submissions_task_user"),
+        # Listing paths, all seek-paginated on (created_at, id)
+        Index("ix_submissions_task_status_created", "task_id", "status", "created_at"),
+        Index("ix_submissions_user_created", "user_id", "created_at"),
+        # Moderation queue; sa.Enum stores member names, hence 'PENDING'
+        Index("ix_submissions_pending_created", "created_at", "id",
+              postgresql_where=text("status = 'PENDING'"), sqlite_where=text("status = 'PENDING'")),
+    )
     
     id: str = Field(default_factory=generate_uuid, primary_key=True)
     task_id: str = Field(foreign_key="tasks.id")
@@ -59,6 +70,8 @@ class Submission(SQLModel, table=True):
     status: VerificationStatusEnum = Field(default=VerificationStatusEnum.PENDING)
     points_awarded: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Set once verification reaches the broker; the requeue sweeper looks for pending rows without it
+    enqueued_at: Optional[datetime] = None
     
     # Relationships
     task: Task = Relationship(back_populates="submissions")
@@ -0,0 +1,227 @@
+import json
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.core.config import settings
+from app.models.models import Campaign, Task
+from app.models.schemas import StatusEnum
+
+# Create Redis client
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+CAMPAIGNS = "campaigns"
+TASKS = "tasks"
+
+# Entries live under catalog:{kind}:v{version}:..., so bumping the version retires them all at once
+REDIS_TTL_SECONDS = 5 * 60
+LOCAL_TTL_SECONDS = 30
+# How stale another process's write may look here: the version is re-read at most this often
+VERSION_CHECK_SECONDS = 1
+LOCAL_MAX_ENTRIES = 10000
+
+_local: Dict[str, Tuple[float, object]] = {}
+_versions: Dict[str, Tuple[float, int]] = {}
+
+
+def _snapshot(row) -> Dict:
+    """JSON-safe copy of a row, identical whether it came from the database or Redis"""
+    values = {column.name: getattr(row, column.name) for column in row.__table__.columns}
+    return json.loads(json.dumps(values, default=lambda value: value.isoformat()))
+
+
+def _remember(key: str, value) -> None:
+    if len(_local) >= LOCAL_MAX_ENTRIES:
+        _local.clear()
+    _local[key] = (time.monotonic() + LOCAL_TTL_SECONDS, value)
+
+
+async def _version(kind: str) -> int:
+    now = time.monotonic()
+    cached = _versions.get(kind)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    try:
+        version = int(await redis_client.get(f"catalog:{kind}:version") or 0)
+    except Exception as e:
+        logger.warning(f"Error reading catalog version for {kind}: {e}")
+        version = cached[1] if cached else 0
+    _versions[kind] = (now + VERSION_CHECK_SECONDS, version)
+    return version
+
+
+async def _cached(kind: str, names: List[str], load: Callable[[List[str]], Awaitable[Dict[str, object]]]) -> Dict[str, object]:
+    """
+    Resolve cache entries through the process-local tier, then Redis, then ``load``
+
+    Args:
+        kind: CAMPAIGNS or TASKS
+        names: Entry names within the kind
+        load: Coroutine building the entries that missed both tiers; names it omits are not cached
+
+    Returns:
+        dict: Entry name to value for every name that resolved
+    """
+    version = await _version(kind)
+    keys = {name: f"catalog:{kind}:v{version}:{name}" for name in names}
+    found = {}
+
+    now = time.monotonic()
+    for name, key in keys.items():
+        cached = _local.get(key)
+        if cached and cached[0] > now:
+            found[name] = cached[1]
+
+    missing = [name for name in keys if name not in found]
+    if missing:
+        try:
+            stored = await redis_client.mget([keys[name] for name in missing])
+        except Exception as e:
+            logger.warning(f"Error reading catalog cache: {e}")
+            stored = [None] * len(missing)
+        for name, raw in zip(missing, stored):
+            if raw is not None:
+                found[name] = json.loads(raw)
+                _remember(keys[name], found[name])
+        missing = [name for name in missing if name not in found]
+
+    if missing:
+        loaded = await load(missing)
+        found.update(loaded)
+        for name, value in loaded.items():
+            _remember(keys[name], value)
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for name, value in loaded.items():
+                    pipe.set(keys[name], json.dumps(value), ex=REDIS_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Error writing catalog cache: {e}")
+
+    return found
+
+
+async def invalidate(kind: str) -> None:
+    """
+    Retire every cached entry of a kind; call after committing a create, update or delete
+
+    Args:
+        kind: CAMPAIGNS or TASKS
+    """
+    prefix = f"catalog:{kind}:"
+    for key in [key for key in _local if key.startswith(prefix)]:
+        _local.pop(key, None)
+
+    try:
+        version = await redis_client.incr(f"catalog:{kind}:version")
+    except Exception as e:
+        # Other processes keep serving their local tier until it expires
+        logger.warning(f"Error bumping catalog version for {kind}: {e}")
+        _versions.pop(kind, None)
+        return
+    _versions[kind] = (time.monotonic() + VERSION_CHECK_SECONDS, version)
+
+
+async def list_campaigns(
+    session: AsyncSession,
+    status: Optional[StatusEnum] = None,
+    running_on: Optional[date] = None,
+    limit: int = 50,
+    offset: int = 0
+) -> List[Dict]:
+    """
+    List campaigns newest first
+
+    Args:
+        session: Database session used on a cache miss
+        status: Only campaigns in this status
+        running_on: Only campaigns whose start/end dates include this day
+        limit: Page size
+        offset: Number of campaigns to skip
+
+    Returns:
+        list: Campaign dictionaries
+    """
+    name = f"list:{status.value if status else ''}:{running_on or ''}:{limit}:{offset}"
+
+    async def load(_):
+        query = select(Campaign)
+        if status:
+            query = query.where(Campaign.status == status)
+        if running_on:
+            query = query.where(Campaign.start_date <= running_on, Campaign.end_date >= running_on)
+        query = query.order_by(Campaign.created_at.desc(), Campaign.id.desc()).offset(offset).limit(limit)
+        result = await session.execute(query)
+        return {name: [_snapshot(campaign) for campaign in result.scalars().all()]}
+
+    return (await _cached(CAMPAIGNS, [name], load))[name]
+
+
+async def get_campaign(session: AsyncSession, campaign_id: str) -> Optional[Dict]:
+    """Get one campaign as a dictionary, or None if it doesn't exist"""
+    name = f"id:{campaign_id}"
+
+    async def load(_):
+        result = await session.execute(select(Campaign).where(Campaign.id == campaign_id))
+        campaign = result.scalar_one_or_none()
+        return {name: _snapshot(campaign)} if campaign else {}
+
+    return (await _cached(CAMPAIGNS, [name], load)).get(name)
+
+
+async def list_tasks(session: AsyncSession, campaign_id: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[Dict]:
+    """
+    List tasks newest first
+
+    Args:
+        session: Database session used on a cache miss
+        campaign_id: Only tasks of this campaign
+        limit: Page size
+        offset: Number of tasks to skip
+
+    Returns:
+        list: Task dictionaries
+    """
+    name = f"list:{campaign_id or ''}:{limit}:{offset}"
+
+    async def load(_):
+        query = select(Task)
+        if campaign_id:
+            query = query.where(Task.campaign_id == campaign_id)
+        query = query.order_by(Task.created_at.desc(), Task.id.desc()).offset(offset).limit(limit)
+        result = await session.execute(query)
+        return {name: [_snapshot(task) for task in result.scalars().all()]}
+
+    return (await _cached(TASKS, [name], load))[name]
+
+
+async def get_tasks(session: AsyncSession, task_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Get several tasks at once; only the ones missing from both cache tiers are queried, in one SELECT
+
+    Args:
+        session: Database session used on a cache miss
+        task_ids: IDs of the tasks to fetch
+
+    Returns:
+        dict: Task ID to task dictionary; IDs that don't exist are left out
+    """
+    names = {f"id:{task_id}": task_id for task_id in task_ids}
+
+    async def load(missing):
+        result = await session.execute(select(Task).where(Task.id.in_([names[name] for name in missing])))
+        return {f"id:{task.id}": _snapshot(task) for task in result.scalars().all()}
+
+    found = await _cached(TASKS, list(names), load)
+    return {names[name]: task for name, task in found.items()}
+
+
+async def get_task(session: AsyncSession, task_id: str) -> Optional[Dict]:
+    """Get one task as a dictionary, or None if it doesn't exist"""
+    return (await get_tasks(session, [task_id])).get(task_id)
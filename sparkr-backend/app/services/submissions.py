@@ -0,0 +1,214 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import or_, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from app.models.models import Submission, Task, generate_uuid
+from app.models.schemas import VerificationStatusEnum
+
+# A submission still pending this long without being enqueued is re-published by the sweeper
+REQUEUE_AFTER = timedelta(minutes=2)
+# An enqueued submission still pending this long is assumed lost by the broker and re-published
+REENQUEUE_AFTER = timedelta(hours=1)
+REQUEUE_BATCH_SIZE = 500
+
+
+async def create_submission(session: AsyncSession, task_id: str, user_id: str, proof_url: str) -> Optional[Submission]:
+    """
+    Insert a submission unless the user already submitted this task
+
+    A single INSERT ... ON CONFLICT (task_id, user_id) DO NOTHING against the
+    unique constraint decides the race, so concurrent duplicates can never
+    both be stored.
+
+    Args:
+        session: Database session
+        task_id: The ID of the submitted task
+        user_id: The ID of the submitting user
+        proof_url: URL proving the task was completed
+
+    Returns:
+        Submission: The stored submission, or None if it was a duplicate
+    """
+    values = {
+        "id": generate_uuid(),
+        "task_id": task_id,
+        "user_id": user_id,
+        "submission_url": proof_url,
+        "proof_url": proof_url,
+        "status": VerificationStatusEnum.PENDING,
+        "points_awarded": 0,
+        "created_at": datetime.utcnow()
+    }
+
+    if session.bind.dialect.name == "postgresql":
+        statement = (pg_insert(Submission.__table__).values(**values)
+                     .on_conflict_do_nothing(index_elements=["task_id", "user_id"])
+                     .returning(Submission.__table__.c.id))
+        result = await session.execute(statement)
+        inserted = result.scalar_one_or_none() is not None
+    else:
+        # Other dialects (SQLite in tests) may lack RETURNING; the client-side id makes rowcount enough
+        statement = (sqlite_insert(Submission.__table__).values(**values)
+                     .on_conflict_do_nothing(index_elements=["task_id", "user_id"]))
+        result = await session.execute(statement)
+        inserted = result.rowcount == 1
+
+    await session.commit()
+    return Submission(**values) if inserted else None
+
+
+async def publish_verification(submission_id: str) -> bool:
+    """
+    Enqueue verification for a submission without blocking the event loop
+
+    The broker publish runs in a thread. ``enqueued_at`` records that the
+    job was enqueued; submissions left pending without it are picked up
+    by ``requeue_pending_submissions``, so the submissions table acts as
+    the outbox and a failed publish is never lost.
+
+    Args:
+        submission_id: The ID of the submission to verify
+
+    Returns:
+        bool: True if the job reached the broker
+    """
+    from app.db.session import async_session_maker
+    from app.workers.tasks_worker import verify_submission_task
+
+    try:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, lambda: verify_submission_task.apply_async(args=[submission_id]))
+    except Exception as e:
+        logger.error(f"Error enqueueing verification for submission {submission_id}: {e}")
+        return False
+
+    try:
+        async with async_session_maker() as session:
+            await mark_enqueued(session, submission_id)
+    except Exception as e:
+        # Worst case the sweeper enqueues it again; verification skips non-pending submissions
+        logger.warning(f"Error marking submission {submission_id} as enqueued: {e}")
+    return True
+
+
+async def mark_enqueued(session: AsyncSession, submission_id: str, now: datetime = None) -> None:
+    """
+    Record that verification for a submission reached the broker
+
+    Args:
+        session: Database session
+        submission_id: The ID of the enqueued submission
+        now: Enqueue time (defaults to utcnow)
+    """
+    await session.execute(
+        update(Submission)
+        .where(Submission.id == submission_id)
+        .values(enqueued_at=now or datetime.utcnow())
+    )
+    await session.commit()
+
+
+async def find_unpublished_submissions(session: AsyncSession, now: datetime = None) -> List[str]:
+    """
+    IDs of pending submissions old enough to have been enqueued but never enqueued,
+    or enqueued so long ago that the job was probably lost
+
+    The enqueue state is filtered in SQL, so the batch limit applies to
+    submissions that actually need publishing.
+
+    Args:
+        session: Database session
+        now: Reference time (defaults to utcnow)
+
+    Returns:
+        list: Submission IDs that need publishing
+    """
+    now = now or datetime.utcnow()
+    result = await session.execute(
+        select(Submission.id)
+        .where(
+            Submission.status == VerificationStatusEnum.PENDING,
+            Submission.created_at <= now - REQUEUE_AFTER,
+            or_(Submission.enqueued_at.is_(None), Submission.enqueued_at <= now - REENQUEUE_AFTER)
+        )
+        .order_by(Submission.created_at)
+        .limit(REQUEUE_BATCH_SIZE)
+    )
+    return list(result.scalars().all())
+
+
+def encode_cursor(submission: Submission) -> str:
+    """Opaque seek position after ``submission`` in (created_at, id) descending order"""
+    return f"{submission.created_at.isoformat()}|{submission.id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Raises ValueError for a malformed cursor"""
+    created_at, separator, submission_id = cursor.partition("|")
+    if not separator or not submission_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(created_at), submission_id
+
+
+async def list_submissions(
+    session: AsyncSession,
+    user_id: Optional[str] = None,
+    status: Optional[VerificationStatusEnum] = None,
+    task_id: Optional[str] = None,
+    campaign_id: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None
+) -> Tuple[List[Submission], Optional[str]]:
+    """
+    List submissions newest first with seek pagination
+
+    Each filter combination is served by a declared index on Submission:
+    (user_id, created_at), (task_id, status, created_at) or the partial
+    pending index, so a page costs the same however deep it is.
+
+    Args:
+        session: Database session
+        user_id: Only this user's submissions
+        status: Only submissions in this status
+        task_id: Only submissions for this task
+        campaign_id: Only submissions for tasks of this campaign
+        limit: Page size
+        cursor: next_cursor returned with the previous page
+
+    Returns:
+        tuple: The page of submissions and the cursor for the next page (None on the last page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    query = select(Submission)
+
+    if user_id:
+        query = query.where(Submission.user_id == user_id)
+    if status:
+        query = query.where(Submission.status == status)
+    if task_id:
+        query = query.where(Submission.task_id == task_id)
+    if campaign_id:
+        # Resolved through ix_tasks_campaign_id, then the task_id-leading submission index
+        query = query.where(Submission.task_id.in_(select(Task.id).where(Task.campaign_id == campaign_id)))
+    if cursor:
+        created_at, submission_id = decode_cursor(cursor)
+        query = query.where(tuple_(Submission.created_at, Submission.id) < tuple_(created_at, submission_id))
+
+    query = query.order_by(Submission.created_at.desc(), Submission.id.desc()).limit(limit + 1)
+    result = await session.execute(query)
+    page = list(result.scalars().all())
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = encode_cursor(page[-1])
+    return page, next_cursor
@@ -0,0 +1,124 @@
+import pytest
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.models.models import Campaign, Task
+from app.models.reward import Reward  # noqa: F401 - target of User.rewards
+from app.models.schemas import StatusEnum
+from app.services import catalog
+
+
+class FakeRedis:
+    """The handful of redis.asyncio calls the catalog makes, backed by a dict"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            async def __aenter__(self):
+                self.writes = []
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def set(self, key, value, ex=None):
+                self.writes.append((key, value))
+
+            async def execute(self):
+                redis.data.update(self.writes)
+
+        return Pipeline()
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    with patch.object(catalog, "redis_client", FakeRedis()):
+        yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+    catalog._local.clear()
+    catalog._versions.clear()
+
+
+async def _seed(session_maker):
+    today = date.today()
+    async with session_maker() as session:
+        running = Campaign(name="Running", start_date=today, end_date=today, status=StatusEnum.ACTIVE)
+        finished = Campaign(name="Finished", start_date=today - timedelta(days=9), end_date=today - timedelta(days=2),
+                            status=StatusEnum.COMPLETED)
+        session.add_all([running, finished])
+        await session.commit()
+        tasks = [Task(campaign_id=running.id, title=f"Task {n}", platform="twitter", points=n) for n in range(3)]
+        session.add_all(tasks)
+        await session.commit()
+        return running, finished, tasks
+
+
+@pytest.mark.asyncio
+async def test_campaign_listing_filters_and_is_served_from_cache(session_maker):
+    running, finished, _ = await _seed(session_maker)
+
+    async with session_maker() as session:
+        assert [c["id"] for c in await catalog.list_campaigns(session, running_on=date.today())] == [running.id]
+        assert [c["id"] for c in await catalog.list_campaigns(session, status=StatusEnum.COMPLETED)] == [finished.id]
+        assert len(await catalog.list_campaigns(session, limit=1, offset=1)) == 1
+
+        session.execute = AsyncMock(side_effect=AssertionError("database hit"))
+        assert (await catalog.list_campaigns(session, running_on=date.today()))[0]["name"] == "Running"
+
+        # A fresh process only has the Redis tier
+        catalog._local.clear()
+        assert [c["id"] for c in await catalog.list_campaigns(session, status=StatusEnum.COMPLETED)] == [finished.id]
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_queries_only_uncached_ids_in_one_select(session_maker):
+    _, _, tasks = await _seed(session_maker)
+    ids = [task.id for task in tasks]
+
+    async with session_maker() as session:
+        assert (await catalog.get_task(session, ids[0]))["points"] == 0
+
+        execute = session.execute
+        session.execute = AsyncMock(side_effect=execute)
+        found = await catalog.get_tasks(session, ids + ["missing"])
+
+    assert set(found) == set(ids)
+    assert found[ids[2]]["title"] == "Task 2"
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_retires_cached_entries(session_maker):
+    running, _, tasks = await _seed(session_maker)
+
+    async with session_maker() as session:
+        assert (await catalog.get_task(session, tasks[0].id))["points"] == 0
+        task = await session.get(Task, tasks[0].id)
+        task.points = 50
+        await session.commit()
+        assert (await catalog.get_task(session, tasks[0].id))["points"] == 0
+
+        await catalog.invalidate(catalog.TASKS)
+
+        assert (await catalog.get_task(session, tasks[0].id))["points"] == 50
+        assert (await catalog.get_campaign(session, running.id))["status"] == "active"
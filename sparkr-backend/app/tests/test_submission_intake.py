@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, select
+
+from app.models.models import Campaign, Task, User, Submission
+from app.models.reward import Reward  # noqa: F401 - target of User.rewards
+from app.services import submissions
+from app.services.submissions import create_submission, find_unpublished_submissions, mark_enqueued
+
+
+@pytest.fixture
+async def session_maker():
+    """Fresh in-memory database per test so the unique constraint starts empty"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _seed(session_maker):
+    async with session_maker() as session:
+        campaign = Campaign(name="Launch", start_date=date.today(), end_date=date.today())
+        user = User(email="intake@example.com", username="intake", hashed_password="x")
+        session.add_all([campaign, user])
+        await session.commit()
+        task = Task(campaign_id=campaign.id, title="Retweet", platform="twitter", points=10)
+        session.add(task)
+        await session.commit()
+        return task.id, user.id
+
+
+@pytest.mark.asyncio
+async def test_duplicate_submissions_are_rejected(session_maker):
+    task_id, user_id = await _seed(session_maker)
+
+    async with session_maker() as session:
+        first = await create_submission(session, task_id, user_id, "https://x.com/a/status/1")
+        second = await create_submission(session, task_id, user_id, "https://x.com/a/status/2")
+
+    assert first is not None and first.status == "pending"
+    assert second is None
+    async with session_maker() as session:
+        stored = (await session.execute(select(Submission))).scalars().all()
+    assert [submission.id for submission in stored] == [first.id]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_insert_once(session_maker):
+    task_id, user_id = await _seed(session_maker)
+
+    async def submit(n):
+        async with session_maker() as session:
+            return await create_submission(session, task_id, user_id, f"https://x.com/a/status/{n}")
+
+    results = await asyncio.gather(*(submit(n) for n in range(5)))
+
+    assert sum(result is not None for result in results) == 1
+
+
+@pytest.mark.asyncio
+async def test_unpublished_submissions_are_found_for_requeue(session_maker):
+    task_id, user_id = await _seed(session_maker)
+    async with session_maker() as session:
+        submission = await create_submission(session, task_id, user_id, "https://x.com/a/status/1")
+
+    async with session_maker() as session:
+        assert await find_unpublished_submissions(session) == []
+        later = datetime.utcnow() + timedelta(minutes=5)
+        assert await find_unpublished_submissions(session, now=later) == [submission.id]
+        await mark_enqueued(session, submission.id)
+        assert await find_unpublished_submissions(session, now=later) == []
+        # Enqueued but still pending after REENQUEUE_AFTER: the job was probably lost
+        assert await find_unpublished_submissions(session, now=later + submissions.REENQUEUE_AFTER) == [submission.id]
+
+
+@pytest.mark.asyncio
+async def test_requeue_batch_skips_enqueued_submissions(session_maker):
+    task_id, first_user = await _seed(session_maker)
+    async with session_maker() as session:
+        second_user = User(email="late@example.com", username="late", hashed_password="x")
+        session.add(second_user)
+        await session.commit()
+        enqueued = await create_submission(session, task_id, first_user, "https://x.com/a/status/1")
+        pending = await create_submission(session, task_id, second_user.id, "https://x.com/b/status/2")
+        await mark_enqueued(session, enqueued.id)
+
+    later = datetime.utcnow() + timedelta(minutes=5)
+    with patch.object(submissions, "REQUEUE_BATCH_SIZE", 1):
+        async with session_maker() as session:
+            assert await find_unpublished_submissions(session, now=later) == [pending.id]
@@ -0,0 +1,79 @@
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.models.models import Campaign, Task, User, Submission
+from app.models.reward import Reward  # noqa: F401 - target of User.rewards
+from app.models.schemas import VerificationStatusEnum
+from app.services.submissions import list_submissions
+
+
+@pytest.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _seed(session_maker):
+    """Two campaigns with one task each; two users submitting to both at distinct times"""
+    async with session_maker() as session:
+        campaigns = [Campaign(name=f"c{n}", start_date=date.today(), end_date=date.today()) for n in range(2)]
+        users = [User(email=f"u{n}@example.com", username=f"u{n}", hashed_password="x") for n in range(2)]
+        session.add_all(campaigns + users)
+        await session.commit()
+        tasks = [Task(campaign_id=campaign.id, title="Retweet", platform="twitter", points=10) for campaign in campaigns]
+        session.add_all(tasks)
+        await session.commit()
+
+        base = datetime(2024, 3, 1)
+        rows = []
+        for n, (task, user) in enumerate((task, user) for task in tasks for user in users):
+            rows.append(Submission(task_id=task.id, user_id=user.id, submission_url="u", proof_url="u",
+                                   status=VerificationStatusEnum.VERIFIED if n % 2 else VerificationStatusEnum.PENDING,
+                                   created_at=base + timedelta(minutes=n)))
+        session.add_all(rows)
+        await session.commit()
+        return campaigns, tasks, users, rows
+
+
+@pytest.mark.asyncio
+async def test_seek_pagination_visits_every_submission_once_newest_first(session_maker):
+    _, _, _, rows = await _seed(session_maker)
+
+    seen, cursor = [], None
+    async with session_maker() as session:
+        while True:
+            page, cursor = await list_submissions(session, limit=3, cursor=cursor)
+            seen.extend(submission.id for submission in page)
+            if not cursor:
+                break
+
+    assert seen == [row.id for row in reversed(rows)]
+
+
+@pytest.mark.asyncio
+async def test_filters_combine(session_maker):
+    campaigns, tasks, users, rows = await _seed(session_maker)
+
+    async with session_maker() as session:
+        mine, _ = await list_submissions(session, user_id=users[0].id)
+        pending, _ = await list_submissions(session, task_id=tasks[1].id, status=VerificationStatusEnum.PENDING)
+        in_campaign, _ = await list_submissions(session, campaign_id=campaigns[0].id)
+
+    assert {submission.user_id for submission in mine} == {users[0].id} and len(mine) == 2
+    assert [submission.id for submission in pending] == [rows[2].id]
+    assert {submission.task_id for submission in in_campaign} == {tasks[0].id}
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected(session_maker):
+    async with session_maker() as session:
+        with pytest.raises(ValueError):
+            await list_submissions(session, cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            await list_submissions(session, cursor="yesterday|abc")
@@ -5,6 +5,7 @@ import asyncio
 from app.core.config import settings
 from app.services.verification import verify_submission
 from app.services.points import calculate_points, award_points
+from app.services.submissions import find_unpublished_submissions, publish_verification
 from app.models.models import Submission, Task, User
 from app.models.schemas import VerificationStatusEnum
 from app.db.session import async_session_maker
@@ -28,6 +29,12 @@ celery_app.conf.update(
     task_time_limit=30 * 60,  # 30 minutes
     worker_max_tasks_per_child=1000,
     broker_connection_retry_on_startup=True,
+    beat_schedule={
+        "requeue-pending-submissions": {
+            "task": "requeue_pending_submissions",
+            "schedule": 60.0,
+        },
+    },
 )
 
 
@@ -133,6 +140,34 @@ async def _verify_submission_async(submission_id: str):
             return {"success": False, "error": str(e)}
 
 
+@celery_app.task(name="requeue_pending_submissions")
+def requeue_pending_submissions():
+    """Periodic task re-publishing pending submissions whose verification was never enqueued
+    
+    Returns:
+        dict: Number of submissions re-enqueued
+    """
+    try:
+        return asyncio.run(_requeue_pending_submissions_async())
+    except Exception as e:
+        logger.error(f"Error requeueing pending submissions: {e}")
+        return {"success": False, "error": str(e)}
+
+
+async def _requeue_pending_submissions_async():
+    async with async_session_maker() as session:
+        submission_ids = await find_unpublished_submissions(session)
+    
+    requeued = 0
+    for submission_id in submission_ids:
+        if await publish_verification(submission_id):
+            requeued += 1
+    
+    if requeued:
+        logger.info(f"Re-enqueued verification for {requeued} pending submissions")
+    return {"success": True, "requeued": requeued}
+
+
 @celery_app.task(name="process_campaign_analytics")
 def process_campaign_analytics(campaign_id: str):
     """Background task to process analytics for a campaign"""
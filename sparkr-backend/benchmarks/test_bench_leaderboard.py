@@ -0,0 +1,54 @@
+import asyncio
+import random
+
+import fakeredis.aioredis
+import pytest
+from unittest import mock
+
+from app.services import leaderboard
+from app.services.leaderboard import add_points, top_n
+
+USERS = 10_000
+
+
+@pytest.fixture
+def loop():
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture
+def redis(loop):
+    """A leaderboard of 10,000 users with cached profiles, in fakeredis"""
+    rng = random.Random(7)
+    fake_redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    async def seed():
+        pipe = fake_redis.pipeline(transaction=False)
+        for n in range(USERS):
+            points = rng.randint(0, 50_000)
+            pipe.zadd("leaderboard:global", {f"user{n}": points})
+            pipe.zadd("leaderboard:twitter", {f"user{n}": points // 2})
+            pipe.hset(f"user:user{n}", mapping={"username": f"user{n}", "total_points": points})
+        await pipe.execute()
+
+    loop.run_until_complete(seed())
+    with mock.patch.object(leaderboard, "redis_client", fake_redis):
+        yield fake_redis
+
+
+def test_top_n_global(benchmark, redis, loop):
+    result = benchmark(lambda: loop.run_until_complete(top_n(n=100)))
+    assert len(result) == 100
+    assert result[0]["total_points"] >= result[-1]["total_points"]
+
+
+def test_top_n_platform(benchmark, redis, loop):
+    result = benchmark(lambda: loop.run_until_complete(top_n(platform="twitter", n=100)))
+    assert len(result) == 100
+
+
+def test_add_points(benchmark, redis, loop):
+    users = iter(range(10**9))
+    assert benchmark(lambda: loop.run_until_complete(add_points(f"user{next(users) % USERS}", "twitter", 10)))
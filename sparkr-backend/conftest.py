@@ -2,4 +2,7 @@ import sys
 import os
 
 # Add the project root directory to Python's module search path
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
\ No newline at end of file
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+# Benchmarks run through scripts/run_benchmarks.sh, not with the test suite
+collect_ignore = ["benchmarks"]
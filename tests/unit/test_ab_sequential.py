@@ -0,0 +1,116 @@
+import random
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.ab_testing import cache_service
+from services.ab_testing.cache_service import ABTestCacheService
+from services.ab_testing.sequential import compare_rates, evaluate_test, wilson_interval
+
+
+def _counts(impressions, engagements):
+    return {"impressions": impressions, "engagements": engagements, "clicks": 0, "conversions": 0}
+
+
+def test_wilson_interval_contains_rate():
+    low, high = wilson_interval(30, 100)
+    assert low < 0.3 < high
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_clear_difference_is_significant():
+    result = compare_rates(100, 2000, 200, 2000)
+    assert result["significant"]
+    assert result["difference"] == pytest.approx(0.05)
+    low, high = result["confidence_interval"]
+    assert 0 < low < 0.05 < high
+
+
+def test_small_samples_are_never_significant():
+    assert not compare_rates(0, 10, 10, 10)["significant"]
+
+
+def test_peeking_under_null_keeps_false_positives_low():
+    rng = random.Random(7)
+    false_positives = 0
+    for _ in range(100):
+        s_a = s_b = n = 0
+        for _ in range(40):
+            for _ in range(50):
+                s_a += rng.random() < 0.1
+                s_b += rng.random() < 0.1
+            n += 50
+            if compare_rates(s_a, n, s_b, n)["significant"]:
+                false_positives += 1
+                break
+    # A fixed-horizon z-test checked 40 times would flag far more than alpha
+    assert false_positives <= 10
+
+
+def test_evaluate_requires_leader_to_beat_every_arm():
+    variations = {"A": _counts(2000, 100), "B": _counts(2000, 200), "C": _counts(2000, 195)}
+    result = evaluate_test(variations, "engagement_rate")
+    assert result["leader"] == "B"
+    assert result["winner"] is None
+
+    variations["C"] = _counts(2000, 90)
+    assert evaluate_test(variations, "engagement_rate")["winner"] == "B"
+
+
+@pytest.mark.asyncio
+async def test_update_increments_summary_document():
+    update = AsyncMock(return_value={"matched_count": 1})
+    aggregate = AsyncMock()
+    with patch.object(cache_service.MongoDBManager, "update_with_options", update), \
+            patch.object(cache_service.MongoDBManager, "aggregate", aggregate):
+        ok = await ABTestCacheService.update_test_metrics("t1", "A", {"impressions": 10, "clicks": 2})
+
+    assert ok
+    aggregate.assert_not_called()
+    collection, query, change = update.call_args.args
+    assert collection == "ab_test_summaries"
+    assert query == {"test_id": "t1"}
+    assert change["$inc"]["variations.A.impressions"] == 10
+    assert change["$inc"]["variations.A.clicks"] == 2
+
+
+@pytest.mark.asyncio
+async def test_first_update_seeds_summary_from_metric_history():
+    update = AsyncMock(side_effect=[{"matched_count": 0}, {"matched_count": 0}, {"matched_count": 1}])
+    history = [{"_id": "A", "impressions": 500, "engagements": 40}, {"_id": "B", "impressions": 480}]
+    with patch.object(cache_service.MongoDBManager, "update_with_options", update), \
+            patch.object(cache_service.MongoDBManager, "aggregate", AsyncMock(return_value=history)):
+        ok = await ABTestCacheService.update_test_metrics("t1", "A", {"impressions": 10})
+
+    assert ok
+    first, seed, retry = update.call_args_list
+    assert seed.kwargs["upsert"] is True
+    seeded = seed.args[2]["$setOnInsert"]["variations"]
+    assert seeded["A"] == {"impressions": 500, "engagements": 40, "clicks": 0, "conversions": 0}
+    assert seeded["B"]["impressions"] == 480
+    assert retry.args == first.args
+    assert not retry.kwargs.get("upsert")
+
+
+@pytest.mark.asyncio
+async def test_update_rejects_unsafe_variation_and_negative_counts():
+    update = AsyncMock()
+    with patch.object(cache_service.MongoDBManager, "update_with_options", update):
+        assert not await ABTestCacheService.update_test_metrics("t1", "A.$x", {"impressions": 1})
+        assert not await ABTestCacheService.update_test_metrics("t1", "A", {"impressions": -5})
+    update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_results_read_summary_and_report_early_winner():
+    summary = {"test_id": "t1", "variations": {"A": _counts(2000, 100), "B": _counts(2000, 200)}}
+    details = {"test_id": "t1", "status": "running", "target_metric": "engagement_rate"}
+    aggregate = AsyncMock()
+    with patch.object(ABTestCacheService, "get_test_details", AsyncMock(return_value=details)), \
+            patch.object(cache_service.MongoDBManager, "find_with_options", AsyncMock(return_value=[summary])), \
+            patch.object(cache_service.MongoDBManager, "aggregate", aggregate):
+        results = await ABTestCacheService.get_test_results("t1")
+
+    aggregate.assert_not_called()
+    assert results["winner"] == "B"
+    assert results["significance"]["can_stop"]
+    assert results["variations"]["B"]["engagement_rate"] == 10.0
@@ -0,0 +1,127 @@
+import asyncio
+import copy
+import pytest
+from unittest.mock import MagicMock, patch
+
+from services.analytics import collection_jobs
+from services.analytics.collection_jobs import enqueue_collection, get_job, run_collection_job
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def cache_set(self, key, value, ttl_seconds=300):
+        self.data[key] = copy.deepcopy(value)
+        return True
+
+    async def cache_set_if_absent(self, key, value, ttl_seconds=300):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def cache_get(self, key, default=None):
+        return copy.deepcopy(self.data.get(key, default))
+
+    async def cache_delete(self, key):
+        return self.data.pop(key, None) is not None
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch.object(collection_jobs, "RedisManager", fake), \
+            patch.object(collection_jobs, "_dispatch") as dispatch:
+        fake.dispatch = dispatch
+        yield fake
+
+
+def _collector(active_peak=None, delay=0.0):
+    collector = MagicMock()
+    state = {"active": 0, "peak": 0}
+
+    async def collect(user_id, platform, days_back):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        return {"success": True, "platform": platform, "data_points": 1}
+
+    collector.collect_platform_data.side_effect = collect
+    collector.state = state
+    return collector
+
+
+@pytest.mark.asyncio
+async def test_second_trigger_joins_running_job(redis):
+    first, created = await enqueue_collection("user-1", 7)
+    second, joined_created = await enqueue_collection("user-1", 7)
+
+    assert created is True
+    assert joined_created is False
+    assert second["job_id"] == first["job_id"]
+    redis.dispatch.assert_called_once_with(first["job_id"])
+
+
+@pytest.mark.asyncio
+async def test_finished_job_releases_user_slot(redis):
+    job, _ = await enqueue_collection("user-1", 7)
+    await run_collection_job(job["job_id"], collector_service=_collector())
+
+    next_job, created = await enqueue_collection("user-1", 7)
+    assert created is True
+    assert next_job["job_id"] != job["job_id"]
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_checkpointed_platforms(redis):
+    job, _ = await enqueue_collection("user-1", 7)
+    stored = await get_job(job["job_id"])
+    stored["platforms"]["facebook"] = {"status": "completed", "result": {"success": True}}
+    stored["status"] = "running"
+    await redis.cache_set(collection_jobs.JOB_KEY.format(job_id=job["job_id"]), stored)
+
+    collector = _collector()
+    result = await run_collection_job(job["job_id"], collector_service=collector)
+
+    collected = {call.args[1] for call in collector.collect_platform_data.call_args_list}
+    assert "facebook" not in collected
+    assert len(collected) == len(collection_jobs.PLATFORMS) - 1
+    assert result["status"] == "completed"
+    assert result["progress"] == {"completed": len(collection_jobs.PLATFORMS), "total": len(collection_jobs.PLATFORMS)}
+
+
+@pytest.mark.asyncio
+async def test_platform_fan_out_is_bounded(redis):
+    job, _ = await enqueue_collection("user-1", 7)
+    collector = _collector(delay=0.01)
+
+    with patch.object(collection_jobs, "ANALYTICS_COLLECTION_CONCURRENCY", 2):
+        await run_collection_job(job["job_id"], collector_service=collector)
+
+    assert collector.state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unstored_job_releases_user_slot(redis):
+    async def failing_set(key, value, ttl_seconds=300):
+        return False
+
+    redis.cache_set = failing_set
+    with pytest.raises(RuntimeError):
+        await enqueue_collection("user-1", 7)
+
+    redis.dispatch.assert_not_called()
+    assert collection_jobs.ACTIVE_KEY.format(user_id="user-1") not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_failed_dispatch_releases_user_slot(redis):
+    redis.dispatch.side_effect = ConnectionError("broker unavailable")
+    with pytest.raises(ConnectionError):
+        await enqueue_collection("user-1", 7)
+
+    redis.dispatch.side_effect = None
+    job, created = await enqueue_collection("user-1", 7)
+    assert created is True
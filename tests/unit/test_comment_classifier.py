@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.comment_classifier import (
+    classify_comments_batch,
+    classify_locally,
+    comment_hash,
+    fallback_classify,
+    _parse_batch_response,
+)
+from services.utils.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    def test_overlapping_keywords(self):
+        matcher = KeywordMatcher.from_groups({"a": ["he", "hers"], "b": ["she", "his"]})
+        matches = [(end, keyword) for end, keyword, _ in matcher.iter_matches("ushers")]
+        assert (3, "she") in matches
+        assert (3, "he") in matches
+        assert (5, "hers") in matches
+
+    def test_matched_values_follow_registration_order(self):
+        matcher = KeywordMatcher.from_groups({"first": ["zeta"], "second": ["alpha"]})
+        assert matcher.matched_values("alpha then zeta") == ["first", "second"]
+        assert matcher.first_value("ALPHA") == "second"
+        assert matcher.first_value("nothing here", default="none") == "none"
+
+    def test_case_sensitive(self):
+        matcher = KeywordMatcher.from_groups({"x": ["Buy"]}, case_sensitive=True)
+        assert matcher.first_value("buy now") is None
+        assert matcher.first_value("Buy now") == "x"
+
+
+class TestLocalClassification:
+    def test_spam_wins_over_community(self):
+        assert fallback_classify("Big fan! Click here for a discount code") == ("spam", 0.8)
+        assert fallback_classify("Big fan of the new release") == ("community", 0.8)
+        assert fallback_classify("When is the roadmap update?") == ("relevant", 0.6)
+
+    def test_low_value_comments_are_spam(self):
+        assert classify_locally("GM") == ("spam", 0.9)
+        assert classify_locally("moon moon moon") == ("spam", 0.9)
+        assert classify_locally("   ") == ("spam", 0.9)
+
+    def test_ambiguous_comments_need_llm(self):
+        assert classify_locally("When will pricing for the pro plan change?") is None
+
+    def test_hash_ignores_case_and_whitespace(self):
+        assert comment_hash("Great  Launch\n") == comment_hash("great launch")
+
+
+class TestBatchResponseParsing:
+    def test_parses_json_array(self):
+        response = 'Sure: [{"id": 1, "category": "Relevant", "confidence": 0.9}, {"id": 2, "category": "spam"}]'
+        assert _parse_batch_response(response, 2) == {0: ("relevant", 0.9), 1: ("spam", 0.7)}
+
+    def test_ignores_unknown_entries(self):
+        response = '[{"id": 5, "category": "spam"}, {"id": 1, "category": "other"}, "x"]'
+        assert _parse_batch_response(response, 2) == {}
+        assert _parse_batch_response("not json", 2) == {}
+
+
+@pytest.mark.asyncio
+async def test_batch_uses_local_cache_and_llm():
+    texts = ["gm", "What is the price?", "what is the   price?", "Is there an API?"]
+    llm_batch = AsyncMock(return_value=[("relevant", 0.95)])
+
+    with patch("services.comment_classifier.RedisManager") as redis_manager, \
+            patch("services.comment_classifier._classify_llm_batch", llm_batch):
+        redis_manager.cache_get_many = AsyncMock(return_value=[{"category": "relevant", "confidence": 0.9}, None])
+        redis_manager.warm_cache_batch = AsyncMock(return_value=1)
+
+        results, stats = await classify_comments_batch(texts)
+
+    assert results == [("spam", 0.9), ("relevant", 0.9), ("relevant", 0.9), ("relevant", 0.95)]
+    assert stats == {"local": 1, "cached": 1, "llm": 1, "llm_calls": 1}
+    redis_manager.warm_cache_batch.assert_awaited_once()
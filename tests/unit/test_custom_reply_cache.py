@@ -0,0 +1,77 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.auto_engagement import detect_intent
+from services.custom_reply_cache import CustomReplyCache, CustomReplyRuleSet
+
+RULES = [
+    {"id": 3, "intent": "support", "keyword": "refund", "custom_reply": "Refunds take 5 days", "platform": "twitter"},
+    {"id": 1, "intent": "pricing", "keyword": "discount", "custom_reply": "Use code SUIT10", "platform": "general"},
+    {"id": 2, "intent": "promo", "keyword": "discount", "custom_reply": "Twitter-only promo", "platform": "twitter"},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    CustomReplyCache.clear_local()
+    yield
+    CustomReplyCache.clear_local()
+
+
+class TestCustomReplyRuleSet:
+    def test_intent_match_wins(self):
+        rule_set = CustomReplyRuleSet(RULES)
+        assert rule_set.match("anything at all", "instagram", "pricing")["id"] == 1
+
+    def test_keyword_match_respects_platform_and_order(self):
+        rule_set = CustomReplyRuleSet(RULES)
+        assert rule_set.match("is there a discount", "twitter", "general")["id"] == 1
+        assert rule_set.match("i want a refund", "twitter", "general")["id"] == 3
+        assert rule_set.match("i want a refund", "instagram", "general") is None
+
+    def test_keywords_are_case_insensitive(self):
+        rule_set = CustomReplyRuleSet([dict(RULES[0], keyword="ReFund")])
+        assert rule_set.match("refund please", "twitter", "general")["id"] == 3
+
+
+def test_detect_intent_keeps_declaration_order():
+    assert detect_intent("how much does the tutorial cost") == ("pricing", 0.85)
+    assert detect_intent("getting started guide") == ("onboarding", 0.85)
+    assert detect_intent("hello there") == ("general", 0.5)
+
+
+@pytest.mark.asyncio
+async def test_rule_set_is_loaded_once_and_reloaded_after_version_change():
+    redis_manager = AsyncMock()
+    redis_manager.cache_get_many = AsyncMock(return_value=[None, None])
+
+    with patch("services.custom_reply_cache.RedisManager", redis_manager), \
+            patch.object(CustomReplyCache, "_load_rules_from_db", return_value=RULES) as load_rules:
+        first = await CustomReplyCache.get_rule_set("brand-1")
+        second = await CustomReplyCache.get_rule_set("brand-1")
+
+        assert first is second
+        assert load_rules.call_count == 1
+        redis_manager.cache_set.assert_awaited_once()
+
+        # Another worker changed a rule and cached the new rows under version 1
+        CustomReplyCache._local["brand-1"] = (0, first, 0.0)
+        redis_manager.cache_get_many = AsyncMock(return_value=[1, {"version": 1, "rules": RULES[:1]}])
+        third = await CustomReplyCache.get_rule_set("brand-1")
+
+        assert len(third) == 1
+        assert load_rules.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version_and_drops_rows():
+    redis_manager = AsyncMock()
+    CustomReplyCache._local["brand-1"] = (0, CustomReplyRuleSet(RULES), 0.0)
+
+    with patch("services.custom_reply_cache.RedisManager", redis_manager):
+        await CustomReplyCache.invalidate("brand-1")
+
+    assert "brand-1" not in CustomReplyCache._local
+    # No TTL: the version must never restart from zero
+    redis_manager.cache_increment.assert_awaited_once_with("engagement:custom_replies:version:brand-1")
+    redis_manager.cache_delete.assert_awaited_once_with("engagement:custom_replies:brand-1")
@@ -0,0 +1,189 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import asynccontextmanager
+
+from services.scheduler import dispatcher
+from services.scheduler.dispatcher import bucket_parameters, dispatch_scheduled_posts, lane_for, release_ready_posts
+
+
+class FakeRedis:
+    """Sorted sets, sets and Python stand-ins for the token bucket and lock release scripts"""
+
+    def __init__(self):
+        self.zsets = {}
+        self.sets = {}
+        self.buckets = {}
+        self.paused = set()
+        self.locks = {}
+
+    def pipeline(self, transaction=False):
+        redis = self
+
+        class Pipe:
+            def zadd(self, key, mapping):
+                redis.zsets.setdefault(key, {}).update(mapping)
+
+            def sadd(self, key, value):
+                redis.sets.setdefault(key, set()).add(value)
+
+            async def execute(self):
+                return []
+
+        return Pipe()
+
+    async def zrangebyscore(self, key, low, high, start=0, num=None):
+        items = sorted((score, member) for member, score in self.zsets.get(key, {}).items() if score <= high)
+        return [member for _, member in items][start:start + num]
+
+    async def zrem(self, key, member):
+        return self.zsets.get(key, {}).pop(member, None) is not None
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def exists(self, key):
+        return key in self.paused
+
+    def register_script(self, script):
+        if script == dispatcher._RELEASE_LOCK_LUA:
+            async def release(keys, args):
+                if self.locks.get(keys[0]) != args[0]:
+                    return 0
+                del self.locks[keys[0]]
+                return 1
+            return release
+
+        async def take(keys, args):
+            now, p_cap, p_rate, a_cap, a_rate = args
+            platform = self.buckets.setdefault(keys[0], p_cap)
+            account = self.buckets.setdefault(keys[1], a_cap)
+            if platform < 1:
+                return 0
+            if account < 1:
+                return 2
+            self.buckets[keys[0]] -= 1
+            self.buckets[keys[1]] -= 1
+            return 1
+        return take
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+
+    @asynccontextmanager
+    async def connection():
+        yield fake
+
+    async def set_if_absent(key, value, ttl_seconds=300):
+        if key in fake.locks:
+            return False
+        fake.locks[key] = value
+        return True
+
+    manager = MagicMock()
+    manager.get_connection = connection
+    manager.cache_set_if_absent = set_if_absent
+    manager.cache_set = AsyncMock(return_value=True)
+    limits = AsyncMock(return_value={"limits": {"hourly": 2, "daily": 10}})
+    with patch.object(dispatcher, "RedisManager", manager), \
+            patch.object(dispatcher.SchedulerCacheService, "get_platform_posting_limits", limits), \
+            patch.object(dispatcher, "update_dispatch_metrics", AsyncMock()), \
+            patch.object(dispatcher, "current_app") as app:
+        fake.app = app
+        yield fake
+
+
+def _post(post_id, user_id="u1", **extra):
+    return {"platform": "instagram", "user_token": {"access_token": "t"}, "post_payload": {"text": post_id},
+            "post_id": post_id, "user_id": user_id, **extra}
+
+
+def _released(redis):
+    return [call.kwargs["args"][3] for call in redis.app.send_task.call_args_list]
+
+
+def test_lanes_and_bucket_parameters():
+    assert lane_for({"attempt": 1, "priority": "low"}) == "retry"
+    assert lane_for({"time_critical": True}) == "critical"
+    assert lane_for({"priority": "low"}) == "low"
+    assert lane_for({}) == "normal"
+    p_cap, p_rate, a_cap, a_rate = bucket_parameters({"hourly": 36, "daily": 864})
+    assert (p_cap, a_cap) == (36.0, 36.0)
+    assert p_rate == pytest.approx(0.01)
+    assert a_rate == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_burst_is_held_until_capacity_exists(redis):
+    result = await dispatch_scheduled_posts([_post(i, user_id=f"u{i}") for i in range(5)])
+
+    assert result == {"queued": 5, "dispatched": 2, "failed": 0}
+    assert redis.app.send_task.call_count == 2
+    assert "countdown" not in redis.app.send_task.call_args.kwargs
+    assert await redis.zcard("dispatch:lane:instagram:normal") == 3
+
+    redis.buckets["dispatch:bucket:platform:instagram"] = 2
+    await release_ready_posts()
+    assert await redis.zcard("dispatch:lane:instagram:normal") == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_and_critical_lanes_go_first(redis):
+    await dispatcher.enqueue_posts([_post("normal", user_id="a"), _post("late", user_id="b", time_critical=True),
+                                    _post("retry", user_id="c", attempt=1)])
+    await release_ready_posts()
+
+    assert _released(redis) == ["retry", "late"]
+    assert redis.app.send_task.call_args_list[0].kwargs["kwargs"] == {"attempt": 1, "user_id": "c"}
+    assert redis.app.send_task.call_args_list[0].kwargs["queue"] == "high_priority"
+
+
+@pytest.mark.asyncio
+async def test_exhausted_account_does_not_block_others(redis):
+    redis.buckets["dispatch:bucket:account:instagram:busy"] = 0
+    await dispatcher.enqueue_posts([_post("a", user_id="busy"), _post("b", user_id="busy"), _post("c", user_id="idle")])
+    summary = await release_ready_posts()
+
+    assert _released(redis) == ["c"]
+    assert summary["deferred"] == 2
+
+
+@pytest.mark.asyncio
+async def test_paused_platform_and_invalid_posts(redis):
+    redis.paused.add("dispatch:paused:instagram")
+    result = await dispatch_scheduled_posts([_post("a"), {"platform": "instagram"}])
+
+    assert result == {"queued": 1, "dispatched": 0, "failed": 1}
+    redis.app.send_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_post_stays_queued_when_publish_fails(redis):
+    await dispatcher.enqueue_posts([_post("a")])
+    redis.app.send_task.side_effect = ConnectionError("broker down")
+
+    summary = await release_ready_posts()
+
+    assert summary["released"] == 0
+    assert await redis.zcard("dispatch:lane:instagram:normal") == 1
+    assert redis.locks == {}
+
+
+@pytest.mark.asyncio
+async def test_lock_taken_over_by_another_run_is_left_alone(redis):
+    original = dispatcher._release_platform
+
+    async def outlive_lock(*args):
+        # The TTL expired mid-run and another releaser acquired the lock
+        redis.locks[dispatcher.RELEASE_LOCK_KEY] = "other-run"
+        return await original(*args)
+
+    await dispatcher.enqueue_posts([_post("a")])
+    with patch.object(dispatcher, "_release_platform", outlive_lock):
+        await release_ready_posts()
+
+    assert redis.locks == {dispatcher.RELEASE_LOCK_KEY: "other-run"}
@@ -0,0 +1,66 @@
+import json
+import os
+import sys
+import types
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+# tests/utils.py shadows the top-level utils namespace package on the test path
+if not hasattr(sys.modules.get("utils"), "__path__"):
+    utils_package = types.ModuleType("utils")
+    utils_package.__path__ = [os.path.join(os.path.dirname(__file__), "..", "..", "utils")]
+    sys.modules["utils"] = utils_package
+
+from utils.json_response import FastJSONResponse, fast_json_response
+
+
+class Comment(BaseModel):
+    id: str
+    comment_text: str
+    timestamp: datetime
+
+
+def _chart(points=50):
+    return {
+        "labels": [datetime(2025, 6, 1, n % 24) for n in range(points)],
+        "datasets": [{"label": "engagement", "data": [Decimal(n) / 4 for n in range(points)]}],
+        "request_id": uuid.UUID(int=7),
+        "platforms": {"twitter", "instagram"},
+    }
+
+
+def test_renders_the_same_json_as_jsonable_encoder():
+    chart = _chart()
+    response = FastJSONResponse(chart)
+    expected = jsonable_encoder(chart)
+    rendered = json.loads(response.body)
+    rendered["platforms"].sort()
+    expected["platforms"].sort()
+    assert rendered == expected
+
+
+def test_decorated_routes_keep_the_response_model_output():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    comments = [Comment(id=str(n), comment_text=f"comment {n}", timestamp=datetime(2025, 6, 1, 9, n)) for n in range(3)]
+
+    @app.get("/plain", response_model=List[Comment])
+    async def plain():
+        return comments
+
+    @app.get("/fast", response_model=List[Comment])
+    @fast_json_response
+    async def fast(limit: int = 50):
+        return comments[:limit]
+
+    client = TestClient(app)
+    assert client.get("/fast").json() == client.get("/plain").json()
+    assert len(client.get("/fast", params={"limit": 1}).json()) == 1
+    # Query parameters of the wrapped handler are still documented
+    assert app.openapi()["paths"]["/fast"]["get"]["parameters"][0]["name"] == "limit"
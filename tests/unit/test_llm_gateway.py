@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.llm_gateway import LLMGateway
+
+RESPONSE = {"choices": [{"message": {"content": "hello"}}]}
+MESSAGES = [{"role": "user", "content": "Say hello"}]
+
+
+@pytest.fixture
+def gateway():
+    return LLMGateway(api_url="https://llm.test/chat", api_key="key", default_model="test-model")
+
+
+@pytest.fixture
+def redis_manager():
+    with patch("services.llm_gateway.RedisManager") as manager:
+        manager.cache_get = AsyncMock(return_value=None)
+        manager.cache_set = AsyncMock(return_value=True)
+        yield manager
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_prompts_are_coalesced(gateway, redis_manager):
+    release = asyncio.Event()
+
+    async def slow_post(payload, title):
+        await release.wait()
+        return RESPONSE
+
+    with patch.object(gateway, "_post", side_effect=slow_post) as post:
+        tasks = [asyncio.create_task(gateway.complete(MESSAGES)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert results == ["hello"] * 5
+    assert post.call_count == 1
+    assert gateway.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_coalesced_waiters(gateway, redis_manager):
+    release = asyncio.Event()
+
+    async def slow_post(payload, title):
+        await release.wait()
+        return RESPONSE
+
+    with patch.object(gateway, "_post", side_effect=slow_post) as post:
+        owner = asyncio.create_task(gateway.complete(MESSAGES))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(gateway.complete(MESSAGES))
+        await asyncio.sleep(0)
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await waiter == "hello"
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+
+    assert post.call_count == 1
+    assert gateway._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_responses_are_cached_per_model_and_prompt(gateway, redis_manager):
+    with patch.object(gateway, "_post", AsyncMock(return_value=RESPONSE)) as post:
+        await gateway.chat(MESSAGES)
+        await gateway.chat(MESSAGES)
+        await gateway.chat(MESSAGES, model="other-model")
+        await gateway.chat(MESSAGES, cache_ttl=0)
+
+    assert post.call_count == 3
+    assert gateway.stats["cache_hits"] == 1
+    redis_manager.cache_set.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached(gateway, redis_manager):
+    with patch.object(gateway, "_post", AsyncMock(side_effect=RuntimeError("boom"))) as post:
+        with pytest.raises(RuntimeError):
+            await gateway.chat(MESSAGES)
+        with pytest.raises(RuntimeError):
+            await gateway.chat(MESSAGES)
+
+    assert post.call_count == 2
+    redis_manager.cache_set.assert_not_awaited()
@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from unittest.mock import MagicMock, patch
+
+from services.utils import media_helpers
+from services.utils.media_helpers import (
+    audit_media_copy,
+    fetch_media,
+    lookup_platform_media,
+    upload_file_chunks,
+)
+
+
+def test_fetch_media_hashes_while_streaming():
+    chunks = [b"abc", b"", b"defg"]
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.headers = {"Content-Type": "video/mp4"}
+    response.iter_content.return_value = chunks
+
+    with patch("services.utils.media_helpers.requests.get", return_value=response):
+        media = fetch_media("https://cdn.test/video.mp4", suffix=".mp4")
+
+    try:
+        assert media.size == 7
+        assert media.sha256 == hashlib.sha256(b"abcdefg").hexdigest()
+        assert media.content_type == "video/mp4"
+        with open(media.path, "rb") as f:
+            assert f.read() == b"abcdefg"
+    finally:
+        media_helpers.cleanup_temp_file(media.path)
+
+
+def test_upload_file_chunks_in_parallel(tmp_path):
+    data = bytes(range(256)) * 40  # 10240 bytes
+    path = tmp_path / "video.mp4"
+    path.write_bytes(data)
+    received = {}
+    lock = threading.Lock()
+
+    def upload_chunk(index, chunk):
+        with lock:
+            received[index] = chunk
+
+    segments = upload_file_chunks(str(path), len(data), 4096, upload_chunk, max_workers=3)
+
+    assert segments == 3
+    assert b"".join(received[i] for i in range(segments)) == data
+
+
+def test_lookup_uses_url_index_before_download():
+    client = MagicMock()
+    client.get.side_effect = lambda key: "content-hash" if key.startswith("media:url:") else "media-123"
+
+    with patch("services.utils.media_helpers._get_redis", return_value=client):
+        assert lookup_platform_media("twitter", "acct", media_url="https://cdn.test/a.jpg") == "media-123"
+
+    client.get.assert_called_with("media:twitter:acct:content-hash")
+
+
+def test_lookup_tolerates_redis_errors():
+    with patch("services.utils.media_helpers._get_redis", side_effect=ConnectionError("down")):
+        assert lookup_platform_media("twitter", "acct", media_url="https://cdn.test/a.jpg") is None
+
+
+def test_audit_copy_respects_mode():
+    with patch("services.utils.media_helpers.cloudinary") as cloudinary, \
+            patch.object(media_helpers, "MEDIA_AUDIT_MODE", "off"):
+        assert audit_media_copy("https://cdn.test/a.jpg") is None
+        cloudinary.uploader.upload.assert_not_called()
+
+    with patch("services.utils.media_helpers.cloudinary") as cloudinary, \
+            patch.object(media_helpers, "MEDIA_AUDIT_MODE", "sync"):
+        cloudinary.uploader.upload.return_value = {"secure_url": "https://cdn.test/audit.jpg"}
+        assert audit_media_copy("https://cdn.test/a.jpg") == "https://cdn.test/audit.jpg"
@@ -0,0 +1,28 @@
+import pytest
+
+from services.monitoring import middleware
+from services.monitoring.middleware import HealthCheckMiddleware
+
+
+@pytest.mark.asyncio
+async def test_health_summary_is_cached_between_probes(monkeypatch):
+    calls = []
+
+    def performance_summary(hours=1):
+        calls.append(hours)
+        return {"avg_duration_ms": 120, "total_operations": 40}
+
+    monkeypatch.setattr(middleware.structured_logger, "get_performance_summary", performance_summary)
+    monkeypatch.setattr(middleware.structured_logger, "get_error_summary", lambda: {})
+
+    health = HealthCheckMiddleware(cache_ttl=60)
+    first = await health.health_check()
+    second = await health.health_check()
+
+    assert len(calls) == 1
+    assert first["status"] == second["status"] == "healthy"
+    assert second["performance"] == {"avg_response_time_ms": 120, "total_requests": 40}
+
+    health.cache_ttl = 0
+    await health.health_check()
+    assert len(calls) == 2
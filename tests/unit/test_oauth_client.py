@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from services.auth.platform import linkedin_auth, meta_auth
+from services.auth.platform.oauth_client import OAuthExchangeError, OAuthHTTPClient, RetryBudget
+
+
+def _response(status_code, body):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+def _client_with(*outcomes, budget=None):
+    client = OAuthHTTPClient(backoff=0, budget=budget)
+    http = MagicMock()
+    http.request = AsyncMock(side_effect=list(outcomes))
+    client._get_client = MagicMock(return_value=http)
+    return client, http
+
+
+@pytest.mark.asyncio
+async def test_retries_refused_requests_then_succeeds():
+    client, http = _client_with(_response(503, {}), _response(200, {"access_token": "abc"}))
+
+    assert await client.post_form("https://provider.test/token", data={"code": "c"}) == {"access_token": "abc"}
+    assert http.request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_error_bodies_are_returned_without_retry():
+    client, http = _client_with(_response(400, {"error": "invalid_grant"}))
+
+    assert await client.post_form("https://provider.test/token", data={}) == {"error": "invalid_grant"}
+    assert http.request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.0, min_tokens=1)
+    client, http = _client_with(
+        httpx.ConnectError("down"), httpx.ConnectError("down"), httpx.ConnectError("down"),
+        budget=budget
+    )
+
+    with pytest.raises(OAuthExchangeError):
+        await client.get_json("https://provider.test/token")
+    assert http.request.await_count == 2  # one attempt plus the single budgeted retry
+
+
+@pytest.mark.asyncio
+async def test_meta_exchange_runs_both_steps_and_saves():
+    oauth = MagicMock()
+    oauth.get_json = AsyncMock(side_effect=[
+        {"access_token": "short"},
+        {"access_token": "long", "expires_in": 5183944}
+    ])
+
+    with patch.object(meta_auth, "get_oauth_client", return_value=oauth), \
+            patch.object(meta_auth, "save_platform_token", new_callable=AsyncMock) as save:
+        result = await meta_auth.exchange_code("code", "user-1")
+
+    assert result["access_token"] == "long"
+    assert oauth.get_json.await_args_list[1].kwargs["params"]["fb_exchange_token"] == "short"
+    save.assert_awaited_once_with(user_id="user-1", platform="meta", access_token="long", expires_in=5183944)
+
+
+@pytest.mark.asyncio
+async def test_linkedin_refresh_uses_the_shared_client():
+    oauth = MagicMock()
+    oauth.post_form = AsyncMock(return_value={"access_token": "fresh", "expires_in": 5184000})
+
+    with patch.object(linkedin_auth, "get_oauth_client", return_value=oauth):
+        result = await linkedin_auth.refresh_token("old-refresh")
+
+    assert result == {"access_token": "fresh", "expires_in": 5184000}
+    assert oauth.post_form.await_args.kwargs["data"]["refresh_token"] == "old-refresh"
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import MagicMock
+
+from services.auth.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+def _blocking_context(release: threading.Event):
+    context = MagicMock()
+
+    def slow_hash(password):
+        release.wait(timeout=2)
+        return f"hashed:{password}"
+
+    context.hash.side_effect = slow_hash
+    return context
+
+
+@pytest.mark.asyncio
+async def test_hash_runs_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    context = MagicMock()
+    context.hash.side_effect = lambda password: threading.get_ident()
+    hasher = PasswordHasher(context=context, max_workers=1, max_queue=0)
+
+    assert await hasher.hash("secret") != loop_thread
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_pool_and_queue_are_full():
+    release = threading.Event()
+    hasher = PasswordHasher(context=_blocking_context(release), max_workers=1, max_queue=1)
+
+    first = asyncio.ensure_future(hasher.hash("a"))
+    second = asyncio.ensure_future(hasher.hash("b"))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(PasswordHasherBusy) as exc_info:
+        await hasher.hash("c")
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+    release.set()
+    assert await asyncio.gather(first, second) == ["hashed:a", "hashed:b"]
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_fails_fast():
+    release = threading.Event()
+    hasher = PasswordHasher(context=_blocking_context(release), max_workers=1, max_queue=4, queue_timeout=0.05)
+
+    running = asyncio.ensure_future(hasher.hash("a"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(PasswordHasherBusy):
+        await hasher.hash("b")
+
+    release.set()
+    assert await running == "hashed:a"
+
+
+@pytest.mark.asyncio
+async def test_verify_and_update_returns_new_hash():
+    context = MagicMock()
+    context.verify_and_update.return_value = (True, "$2b$13$upgraded")
+    hasher = PasswordHasher(context=context, max_workers=1)
+
+    assert await hasher.verify_and_update("secret", "$2b$10$old") == (True, "$2b$13$upgraded")
+    context.verify_and_update.assert_called_once_with("secret", "$2b$10$old")
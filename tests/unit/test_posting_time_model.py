@@ -0,0 +1,118 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from services.scheduler import posting_time_model
+from services.scheduler.posting_time_model import EngagementHistogram, record_post_engagement, slot_for
+from services.smart_schedule import smart_schedule
+
+# A Monday
+MONDAY = datetime(2024, 1, 1)
+
+
+def _histogram_favouring(slot_hour, weekday=2, posts=20):
+    histogram = EngagementHistogram()
+    for week in range(posts):
+        base = MONDAY + timedelta(weeks=week)
+        histogram.add(base + timedelta(days=weekday, hours=slot_hour), 100.0)
+        histogram.add(base + timedelta(hours=3), 10.0)
+    return histogram
+
+
+def test_slot_for_uses_utc_hour_of_week():
+    assert slot_for(MONDAY) == 0
+    assert slot_for(MONDAY + timedelta(days=6, hours=23)) == 167
+    aware = datetime(2024, 1, 1, 5, tzinfo=timezone(timedelta(hours=5)))
+    assert slot_for(aware) == 0
+
+
+def test_best_slot_reflects_history():
+    histogram = _histogram_favouring(14)
+    slot, _ = histogram.best_slots(1)[0]
+    assert slot == 2 * 24 + 14
+    assert histogram.day_scores()["wednesday"] == 1.0
+
+
+def test_single_post_is_shrunk_towards_mean():
+    histogram = _histogram_favouring(14)
+    histogram.add(MONDAY + timedelta(days=5, hours=20), 200.0)
+    slot, _ = histogram.best_slots(1)[0]
+    assert slot == 2 * 24 + 14
+
+
+def test_document_round_trip():
+    histogram = _histogram_favouring(9)
+    restored = EngagementHistogram.from_document(histogram.to_document())
+    assert restored.scores() == histogram.scores()
+    with pytest.raises(ValueError):
+        EngagementHistogram([0.0] * 3, [0.0] * 3)
+
+
+def test_smart_schedule_uses_model_when_it_has_enough_posts():
+    histogram = _histogram_favouring(14)
+    result = smart_schedule("instagram", timezone="UTC", engagement_model=histogram)
+    assert result["metadata"]["recommendation_source"] == "engagement_history"
+    best = datetime.strptime(result["best_times"][0]["time"], "%Y-%m-%d %H:%M")
+    assert (best.weekday(), best.hour) == (2, 14)
+
+    fallback = smart_schedule("instagram", timezone="UTC", engagement_model=EngagementHistogram())
+    assert fallback["metadata"]["recommendation_source"] == "platform_defaults"
+    assert fallback["best_times"]
+
+
+@pytest.mark.asyncio
+async def test_record_post_engagement_counts_mature_posts_once():
+    seen = set()
+
+    async def set_if_absent(key, value, ttl_seconds=300):
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    record = AsyncMock()
+    redis = AsyncMock()
+    redis.cache_set_if_absent.side_effect = set_if_absent
+    with patch.object(posting_time_model, "RedisManager", redis), \
+            patch.object(posting_time_model, "record_engagement", record):
+        old = datetime.utcnow() - timedelta(days=3)
+        assert await record_post_engagement("u1", "twitter", "p1", old, 12)
+        assert not await record_post_engagement("u1", "twitter", "p1", old, 15)
+        assert not await record_post_engagement("u1", "twitter", "p2", datetime.utcnow(), 5)
+
+    record.assert_awaited_once_with("u1", "twitter", old, 12.0)
+
+
+@pytest.mark.asyncio
+async def test_record_engagement_bootstraps_missing_model_then_increments():
+    update = AsyncMock(side_effect=[{"matched_count": 0}, {"upserted_id": "x"}, {"matched_count": 1}])
+    history = [{"_id": {"hour": 9, "day_of_week": 3}, "total_engagement": 40.0, "post_count": 4,
+                "last_posted_at": MONDAY - timedelta(days=6)}]
+    with patch.object(posting_time_model.MongoDBManager, "update_with_options", update), \
+            patch.object(posting_time_model.MongoDBManager, "find_with_options", AsyncMock(return_value=[])), \
+            patch.object(posting_time_model.MongoDBManager, "aggregate", AsyncMock(return_value=history)):
+        added = await posting_time_model.record_engagement("u1", "twitter", MONDAY + timedelta(hours=5), 7.0)
+
+    assert added
+    created = update.call_args_list[1]
+    assert created.kwargs["upsert"] is True
+    model = created.args[2]["$setOnInsert"]
+    assert model["posts"][1 * 24 + 9] == 4
+    assert model["history_through"] == MONDAY - timedelta(days=6)
+    increment = update.call_args_list[-1].args[2]["$inc"]
+    assert increment == {"engagement.5": 7.0, "posts.5": 1}
+
+
+@pytest.mark.asyncio
+async def test_record_engagement_skips_posts_covered_by_history():
+    update = AsyncMock(return_value={"matched_count": 0})
+    aggregate = AsyncMock()
+    with patch.object(posting_time_model.MongoDBManager, "update_with_options", update), \
+            patch.object(posting_time_model.MongoDBManager, "find_with_options", AsyncMock(return_value=[{"_id": 1}])), \
+            patch.object(posting_time_model.MongoDBManager, "aggregate", aggregate):
+        added = await posting_time_model.record_engagement("u1", "twitter", MONDAY, 7.0)
+
+    assert not added
+    aggregate.assert_not_called()
+    update.assert_awaited_once()
+    assert update.call_args.args[1]["history_through"] == {"$not": {"$gte": MONDAY}}
@@ -0,0 +1,150 @@
+import json
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from services.scheduler import queue_telemetry
+from services.scheduler.queue_telemetry import (
+    PRIORITY_SEPARATOR, collect_queue_snapshot, desired_workers, queue_keys, stamp_sent_at
+)
+
+
+class FakeBroker:
+    def __init__(self, lists=None, unacked=None, unacked_index=None):
+        self.lists = lists or {}
+        self.unacked = unacked or {}
+        self.unacked_index = unacked_index or {}
+        self.fetched = []
+
+    def pipeline(self, transaction=False):
+        broker = self
+        calls = []
+
+        class Pipe:
+            def llen(self, key):
+                calls.append(len(broker.lists.get(key, [])))
+
+            def lindex(self, key, index):
+                items = broker.lists.get(key, [])
+                calls.append(items[index] if items else None)
+
+            def zcard(self, key):
+                calls.append(len(broker.unacked_index))
+
+            def zrange(self, key, start, end, withscores=False):
+                calls.append(sorted(broker.unacked_index.items(), key=lambda item: item[1])[start:end + 1])
+
+            async def execute(self):
+                return calls
+
+        return Pipe()
+
+    async def hmget(self, key, fields):
+        self.fetched.extend(fields)
+        return [self.unacked.get(field) for field in fields]
+
+
+@pytest.fixture(autouse=True)
+def clear_unacked_cache():
+    queue_telemetry._unacked_seen.clear()
+    yield
+    queue_telemetry._unacked_seen.clear()
+
+
+def _message(sent_at=None, eta=None):
+    headers = {}
+    if sent_at is not None:
+        headers["sent_at"] = sent_at
+    if eta is not None:
+        headers["eta"] = eta
+    return {"headers": headers, "body": "", "properties": {}}
+
+
+def test_stamp_sent_at_keeps_existing_value():
+    headers = {}
+    stamp_sent_at(headers=headers)
+    assert headers["sent_at"] <= time.time()
+    existing = {"sent_at": 1.0}
+    stamp_sent_at(headers=existing)
+    assert existing["sent_at"] == 1.0
+
+
+def test_queue_keys_cover_priority_steps():
+    assert queue_keys("celery") == ["celery", f"celery{PRIORITY_SEPARATOR}3",
+                                    f"celery{PRIORITY_SEPARATOR}6", f"celery{PRIORITY_SEPARATOR}9"]
+
+
+def test_desired_workers_scales_with_backlog_and_lag():
+    assert desired_workers(0, 0, 0.0, concurrency=4, avg_task_seconds=2, target_lag=60) == 1
+    assert desired_workers(600, 0, 0.0, concurrency=4, avg_task_seconds=2, target_lag=60) == 5
+    assert desired_workers(600, 0, 180.0, concurrency=4, avg_task_seconds=2, target_lag=60) == 15
+    assert desired_workers(10 ** 6, 0, 0.0) == 20
+
+
+@pytest.mark.asyncio
+async def test_snapshot_counts_ready_reserved_and_eta_tasks():
+    now = time.time()
+    future = (datetime.now() + timedelta(minutes=5)).isoformat()
+    broker = FakeBroker(
+        lists={
+            "celery": [json.dumps(_message(now - 5)), json.dumps(_message(now - 30))],
+            f"celery{PRIORITY_SEPARATOR}3": [json.dumps(_message(now - 90))],
+            "high_priority": [json.dumps(_message())],
+        },
+        unacked={
+            "a": json.dumps([_message(eta=future), "", "celery"]),
+            "b": json.dumps([_message(), "", "celery"]),
+            "c": json.dumps([_message(), "", "high_priority"]),
+        },
+        unacked_index={"a": now - 10, "b": now - 40, "c": now - 1},
+    )
+
+    snapshot = await collect_queue_snapshot(["celery", "high_priority"], broker=broker)
+
+    celery = snapshot["queues"]["celery"]
+    assert celery["ready"] == 3
+    assert celery["oldest_age_seconds"] == pytest.approx(90, abs=1)
+    assert (celery["reserved"], celery["scheduled"]) == (1, 1)
+    assert snapshot["queues"]["high_priority"] == {"ready": 1, "oldest_age_seconds": 0.0, "reserved": 1, "scheduled": 0}
+    assert snapshot["unacked"] == 3
+    assert snapshot["oldest_reserved_age_seconds"] == pytest.approx(40, abs=1)
+    assert snapshot["total_ready"] == 4
+    assert snapshot["desired_workers"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_fetches_only_new_unacked_messages():
+    now = time.time()
+    broker = FakeBroker(
+        unacked={"a": json.dumps([_message(), "", "celery"]), "b": json.dumps([_message(), "", "celery"])},
+        unacked_index={"a": now - 10, "b": now - 5},
+    )
+    await collect_queue_snapshot(["celery"], broker=broker)
+    assert sorted(broker.fetched) == ["a", "b"]
+
+    # a was acknowledged, c reserved since
+    del broker.unacked["a"], broker.unacked_index["a"]
+    broker.unacked["c"] = json.dumps([_message(), "", "celery"])
+    broker.unacked_index["c"] = now
+    broker.fetched.clear()
+    snapshot = await collect_queue_snapshot(["celery"], broker=broker)
+
+    assert broker.fetched == ["c"]
+    assert snapshot["queues"]["celery"]["reserved"] == 2
+    assert set(queue_telemetry._unacked_seen) == {"b", "c"}
+
+
+def test_metrics_endpoints_refuse_to_serve_without_token(monkeypatch):
+    from fastapi import HTTPException
+    from services.endpoint import queue_metrics
+
+    monkeypatch.setattr(queue_metrics, "METRICS_TOKEN", None)
+    with pytest.raises(HTTPException) as disabled:
+        queue_metrics._check_token("Bearer anything")
+    assert disabled.value.status_code == 503
+
+    monkeypatch.setattr(queue_metrics, "METRICS_TOKEN", "secret")
+    with pytest.raises(HTTPException) as denied:
+        queue_metrics._check_token("Bearer wrong")
+    assert denied.value.status_code == 401
+    queue_metrics._check_token("Bearer secret")
@@ -0,0 +1,114 @@
+import asyncio
+import html
+import json
+import os
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+# tests/utils.py shadows the top-level utils namespace package on the test path
+if not hasattr(sys.modules.get("utils"), "__path__"):
+    utils_package = types.ModuleType("utils")
+    utils_package.__path__ = [os.path.join(os.path.dirname(__file__), "..", "..", "utils")]
+    sys.modules["utils"] = utils_package
+
+from middleware.sanitization_middleware import SanitizationMiddleware
+from utils import sanitization
+from utils.sanitization import (
+    compile_field_spec, json_needs_sanitizing, loads_sanitized, sanitize_dict, sanitize_fields, sanitize_string,
+)
+
+SAMPLES = [
+    "plain caption #launch",
+    "Tom & Jerry",
+    "<script>alert(1)</script>",
+    "click <a href='x' onclick=\"steal()\">here</a>",
+    "JavaScript:alert(1)",
+    "it's \"quoted\"",
+    "emoji 🎉 and ünïcode",
+    "",
+]
+
+
+def _full_chain(value):
+    """sanitize_string without its fast path"""
+    escaped = html.escape(value)
+    escaped = sanitization.SCRIPT_PATTERN.sub('', escaped)
+    escaped = sanitization.ON_EVENT_PATTERN.sub('', escaped)
+    return sanitization.JAVASCRIPT_URL_PATTERN.sub('', escaped)
+
+
+@pytest.mark.parametrize("value", SAMPLES)
+def test_fast_path_matches_full_chain(value):
+    assert sanitize_string(value) == _full_chain(value)
+    if not sanitization.UNSAFE_TEXT_PATTERN.search(value):
+        assert sanitize_string(value) is value
+
+
+def test_raw_scan_sees_through_json_escapes():
+    for value in SAMPLES:
+        body = json.dumps({"text": value}).encode()
+        if sanitize_string(value) != value:
+            assert json_needs_sanitizing(body)
+    assert json_needs_sanitizing(b'{"text": "\\u003cscript\\u003e"}')
+    assert json_needs_sanitizing(b'{"url": "JAVASCRIPT:alert(1)"}')
+    assert not json_needs_sanitizing(b'{"text": "plain", "n": [1, 2.5, null]}')
+
+
+def test_loads_sanitized_matches_sanitize_dict():
+    payload = {
+        "caption": "<b>hi</b>",
+        "tags": ["ok", "<i>x</i>", ["nested & deep"]],
+        "posts": [{"content": "a & b", "meta": {"alt": "javascript:void(0)"}}, {"content": "fine"}],
+        "count": 3,
+    }
+    data, changed = loads_sanitized(json.dumps(payload))
+    assert changed and data == sanitize_dict(payload)
+
+    data, changed = loads_sanitized('{"caption": "clean", "posts": [{"content": "fine"}]}')
+    assert not changed and data["caption"] == "clean"
+
+
+def test_field_spec_only_touches_declared_fields():
+    spec = compile_field_spec(["posts.content", "posts.metadata", "posts.metadata.alt_text"])
+    assert spec == {"posts": {"content": True, "metadata": True}}
+
+    body = {"posts": [
+        {"content": "<b>x</b>", "media_urls": ["https://e.com/a?x=1&y=2"], "metadata": {"tags": ["<i>"]}},
+        {"content": "plain", "scheduled_time": "2025-01-01T00:00:00"},
+    ]}
+    assert sanitize_fields(body, spec)
+    assert body["posts"][0]["content"] == "&lt;b&gt;x&lt;/b&gt;"
+    assert body["posts"][0]["media_urls"] == ["https://e.com/a?x=1&y=2"]
+    assert body["posts"][0]["metadata"] == {"tags": ["&lt;i&gt;"]}
+
+
+def _dispatch(middleware, path, body):
+    request = SimpleNamespace(
+        url=SimpleNamespace(path=path),
+        headers={"content-type": "application/json"},
+        body=lambda: asyncio.sleep(0, result=body),
+        _receive=None,
+    )
+    seen = {}
+
+    async def call_next(forwarded):
+        seen["body"] = (await forwarded._receive())["body"] if forwarded._receive else body
+        return "response"
+
+    assert asyncio.run(middleware.dispatch(request, call_next)) == "response"
+    return seen["body"]
+
+
+def test_middleware_forwards_clean_bodies_untouched_and_rewrites_unsafe_ones():
+    middleware = SanitizationMiddleware(app=None, schemas={"/api/v1/bulk/cancel": ()})
+
+    clean = b'{"caption": "hello",  "n": 1}'
+    assert _dispatch(middleware, "/api/v1/posts", clean) is clean
+
+    unsafe = b'{"caption": "<script>x</script>", "n": 1}'
+    assert json.loads(_dispatch(middleware, "/api/v1/posts", unsafe)) == {"caption": "&lt;script&gt;x&lt;/script&gt;", "n": 1}
+    assert _dispatch(middleware, "/api/v1/bulk/cancel", unsafe) is unsafe
+    assert _dispatch(middleware, "/api/v1/posts", b'{"broken": "<') == b'{"broken": "<'
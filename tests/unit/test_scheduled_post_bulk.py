@@ -0,0 +1,107 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from services.database.database import Base
+from services.models.user_model import User
+from services.models.token_model import PlatformToken
+from services.models.analytics_model import ContentPerformance, PostEngagement, UserMetrics
+from services.models.scheduled_post_model import ScheduledPost, PostStatus
+from services.repositories.scheduled_post_repository import ScheduledPostRepository
+from services import scheduled_post_service as service_module
+from services.scheduled_post_service import ScheduledPostService
+
+# User's relationships are resolved against these mapped classes
+RELATED_MODELS = (PlatformToken, PostEngagement, UserMetrics, ContentPerformance)
+
+
+@pytest.fixture
+def service():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, ScheduledPost.__table__])
+    session = sessionmaker(bind=engine)()
+    users = MagicMock()
+    users.get_by_id.return_value = MagicMock(id="u1")
+    redis = MagicMock()
+    redis.cache_pipeline_execute = AsyncMock(return_value=[])
+    redis.cache_delete_pattern = AsyncMock(return_value=0)
+    try:
+        with patch.object(service_module, "RedisManager", MagicMock(return_value=redis)):
+            yield ScheduledPostService(ScheduledPostRepository(session), users)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _future(hours=1):
+    return (datetime.utcnow() + timedelta(hours=hours)).isoformat()
+
+
+def _post(content="Hello", platform="twitter", scheduled_time=None):
+    return {"platform": platform, "scheduled_time": scheduled_time or _future(), "post_payload": {"content": content}}
+
+
+def test_bulk_create_inserts_valid_posts_and_reports_the_rest(service):
+    result = service.bulk_create_scheduled_posts("u1", [
+        _post("first"),
+        _post(platform="myspace"),
+        _post(scheduled_time="tomorrow"),
+        _post(scheduled_time=(datetime.utcnow() - timedelta(hours=1)).isoformat()),
+        _post("fifth", scheduled_time=_future(2) + "Z"),
+    ])
+
+    assert [item["index"] for item in result["succeeded"]] == [0, 4]
+    assert [item["index"] for item in result["failed"]] == [1, 2, 3]
+
+    posts = service.scheduled_post_repository.db.query(ScheduledPost).order_by(ScheduledPost.id).all()
+    assert [post.id for post in posts] == [item["post_id"] for item in result["succeeded"]]
+    assert posts[1].search_text == "fifth"
+    assert posts[0].status == PostStatus.PENDING
+    service.redis_manager.cache_pipeline_execute.assert_awaited_once()
+
+
+def test_bulk_create_rejects_oversized_batches_and_unknown_users(service):
+    with pytest.raises(ValueError):
+        service.bulk_create_scheduled_posts("u1", [_post()] * (service_module.MAX_BULK_POSTS + 1))
+
+    service.user_repository.get_by_id.return_value = None
+    with pytest.raises(ValueError):
+        service.bulk_create_scheduled_posts("ghost", [_post()])
+
+
+def test_bulk_reschedule_only_moves_own_editable_posts(service):
+    created = service.bulk_create_scheduled_posts("u1", [_post("a"), _post("b"), _post("c")])["succeeded"]
+    mine, published, other = (item["post_id"] for item in created)
+    db = service.scheduled_post_repository.db
+    db.get(ScheduledPost, published).status = PostStatus.PUBLISHED
+    db.get(ScheduledPost, other).user_id = "u2"
+    db.commit()
+
+    new_time = _future(48)
+    result = service.bulk_reschedule_posts("u1", [
+        {"post_id": mine, "scheduled_time": new_time},
+        {"post_id": published, "scheduled_time": new_time},
+        {"post_id": other, "scheduled_time": new_time},
+        {"post_id": mine, "scheduled_time": _future(72)},
+    ])
+
+    assert [item["post_id"] for item in result["succeeded"]] == [mine]
+    assert [(item["index"], item["post_id"]) for item in result["failed"]] == [(1, published), (2, other), (3, mine)]
+    db.expire_all()
+    assert db.get(ScheduledPost, mine).scheduled_time == datetime.fromisoformat(new_time)
+
+
+def test_bulk_cancel_reports_missing_posts(service):
+    created = service.bulk_create_scheduled_posts("u1", [_post("a"), _post("b")])["succeeded"]
+    ids = [item["post_id"] for item in created]
+
+    result = service.bulk_cancel_posts("u1", ids + [999])
+
+    assert [item["post_id"] for item in result["succeeded"]] == ids
+    assert result["failed"] == [{"index": 2, "post_id": 999, "error": "Post not found or can no longer be cancelled"}]
+    db = service.scheduled_post_repository.db
+    db.expire_all()
+    assert {post.status for post in db.query(ScheduledPost).all()} == {PostStatus.CANCELLED}
@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from services.database.database import Base
+from services.models.user_model import User
+from services.models.token_model import PlatformToken
+from services.models.analytics_model import ContentPerformance, PostEngagement, UserMetrics
+from services.models.scheduled_post_model import ScheduledPost, extract_search_text
+from services.repositories.scheduled_post_repository import ScheduledPostRepository, search_rank
+
+# User's relationships are resolved against these mapped classes
+RELATED_MODELS = (PlatformToken, PostEngagement, UserMetrics, ContentPerformance)
+
+
+@pytest.fixture
+def repository():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, ScheduledPost.__table__])
+    session = sessionmaker(bind=engine)()
+    try:
+        yield ScheduledPostRepository(session)
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _add(repository, payload, user_id="u1", platform="twitter"):
+    post = ScheduledPost(user_id=user_id, platform=platform, post_payload=payload, scheduled_time=datetime(2025, 1, 1))
+    repository.db.add(post)
+    repository.db.commit()
+    return post
+
+
+def test_search_text_follows_payload():
+    post = ScheduledPost(post_payload={"caption": "Summer launch", "hashtags": ["#sale", "#new"], "image_url": "x.png"})
+    assert post.search_text == "Summer launch #sale #new"
+    post.post_payload = {"text": "Updated"}
+    assert post.search_text == "Updated"
+    assert extract_search_text(None) == ""
+
+
+def test_search_rank_prefers_whole_word_matches():
+    assert search_rank("launch", "Product launch today") == 1.0
+    assert search_rank("launch", "launching soon") > search_rank("launch", "lunch menu")
+    assert search_rank("", "anything") == 0.0
+
+
+def test_search_ranks_and_filters(repository):
+    exact = _add(repository, {"text": "Big product launch tomorrow"})
+    partial = _add(repository, {"caption": "Launching our spring collection"})
+    _add(repository, {"text": "Lunch menu"})
+    _add(repository, {"text": "Product launch"}, user_id="someone-else")
+    _add(repository, {"text": "Product launch", "tags": ["promo"]}, platform="instagram")
+
+    page = repository.search_posts("launch", user_id="u1", platform="twitter")
+    assert [post.id for post in page["posts"]] == [exact.id, partial.id]
+    assert page["next_cursor"] is None
+
+    tagged = repository.search_posts("launch", user_id="u1", tags=["promo"])
+    assert [post.platform for post in tagged["posts"]] == ["instagram"]
+    assert repository.search_posts("launch", user_id="u1", tags=["pro"])["posts"] == []
+
+
+def test_tag_filter_matches_whole_tags(repository):
+    tagged = _add(repository, {"text": "New model release", "hashtags": ["#AI"]})
+    _add(repository, {"text": "She said the release is near"})
+
+    page = repository.search_posts("release", user_id="u1", tags=["ai"])
+    assert [post.id for post in page["posts"]] == [tagged.id]
+    assert [post.id for post in repository.search_posts("release", user_id="u1", tags=["#ai"])["posts"]] == [tagged.id]
+
+
+def test_search_keyset_pagination_visits_every_match_once(repository):
+    ids = {_add(repository, {"text": f"weekly update {i}"}).id for i in range(5)}
+
+    seen, cursor = [], None
+    while True:
+        page = repository.search_posts("update", user_id="u1", limit=2, cursor=cursor)
+        seen.extend(post.id for post in page["posts"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(ids) and set(seen) == ids
+    with pytest.raises(ValueError):
+        repository.search_posts("update", cursor="not-a-cursor")
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from services.security import security_audit
+from services.security.security_audit import SecurityAuditor
+
+AUDIT_METHODS = [
+    "audit_jwt_security", "audit_database_security", "audit_scheduler_security", "audit_api_endpoints",
+    "audit_configuration_security", "audit_file_permissions", "audit_dependencies", "audit_input_validation",
+    "audit_error_handling", "audit_logging_security",
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = {
+        "services/auth/jwt_handler.py": 'SECRET_KEY = "hardcoded"\n',
+        "services/models/post_model.py": 'cursor.execute("SELECT * FROM posts WHERE id=" + post_id)\n',
+        "services/scheduler/scheduler_jobs.py": "import os\nos.system('ls')\n",
+        "services/worker.py": "try:\n    run()\nexcept:\n    logger.info(f'token {token}')\n",
+        "requirements.txt": "fastapi\nrequests==2.31.0\n",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def _sequential_findings(root):
+    auditor = SecurityAuditor(str(root))
+    for method in AUDIT_METHODS:
+        getattr(auditor, method)()
+    return auditor.findings
+
+
+def test_unchanged_files_reuse_manifest_results(project, tmp_path_factory):
+    manifest = tmp_path_factory.mktemp("audit") / "manifest.json"
+
+    first = SecurityAuditor(str(project), manifest_path=str(manifest))
+    assert first.audit_all() == _sequential_findings(project)
+    assert first.files_scanned == 5 and first.files_reused == 0
+
+    second = SecurityAuditor(str(project), manifest_path=str(manifest))
+    assert second.audit_all() == first.findings
+    assert second.files_scanned == 0 and second.files_reused == 5
+
+    # A touched file with the same content is still reused
+    worker = project / "services/worker.py"
+    os.utime(worker, ns=(0, 0))
+    third = SecurityAuditor(str(project), manifest_path=str(manifest))
+    third.audit_all()
+    assert third.files_scanned == 0
+
+
+def test_changed_files_are_rechecked(project, tmp_path_factory):
+    manifest = tmp_path_factory.mktemp("audit") / "manifest.json"
+    SecurityAuditor(str(project), manifest_path=str(manifest)).audit_all()
+
+    (project / "services/worker.py").write_text("run()\n")
+    auditor = SecurityAuditor(str(project), manifest_path=str(manifest))
+    findings = auditor.audit_all()
+
+    assert auditor.files_scanned == 1
+    assert findings == _sequential_findings(project)
+    assert not any(finding.file_path.endswith("worker.py") for finding in findings)
+
+
+def test_manifest_from_other_checks_is_ignored(project, tmp_path_factory, monkeypatch):
+    manifest = tmp_path_factory.mktemp("audit") / "manifest.json"
+    SecurityAuditor(str(project), manifest_path=str(manifest)).audit_all()
+
+    monkeypatch.setattr(security_audit, "CHECKS_FINGERPRINT", "changed")
+    auditor = SecurityAuditor(str(project), manifest_path=str(manifest))
+    auditor.audit_all()
+    assert auditor.files_reused == 0
+
+
+def test_changed_files_are_checked_in_worker_processes(project, monkeypatch):
+    monkeypatch.setattr(security_audit, "PARALLEL_SCAN_THRESHOLD", 1)
+    auditor = SecurityAuditor(str(project), max_workers=2)
+    assert auditor.audit_all() == _sequential_findings(project)
+
+    # Without a manifest path results are still kept on the instance
+    auditor.audit_all()
+    assert auditor.files_reused == 5
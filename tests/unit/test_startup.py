@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from core import startup
+from core.startup import StartupReport, run_concurrently, run_in_background
+
+
+@pytest.fixture(autouse=True)
+def report(monkeypatch):
+    fresh = StartupReport()
+    monkeypatch.setattr(startup, "startup_report", fresh)
+    return fresh
+
+
+@pytest.mark.asyncio
+async def test_phases_connect_concurrently_and_are_timed(report):
+    async def connect():
+        await asyncio.sleep(0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await run_concurrently({"postgresql": connect, "mongodb": connect, "redis": connect})
+
+    assert loop.time() - started < 0.12
+    assert set(report.phases) == {"postgresql", "mongodb", "redis"}
+    assert all(phase["status"] == "ok" and phase["seconds"] >= 0.04 for phase in report.phases.values())
+
+
+@pytest.mark.asyncio
+async def test_a_failed_phase_is_raised_after_the_others_finish(report):
+    finished = []
+
+    async def ok():
+        await asyncio.sleep(0.01)
+        finished.append("ok")
+
+    async def broken():
+        raise ConnectionError("mongo down")
+
+    with pytest.raises(ConnectionError):
+        await run_concurrently({"redis": ok, "mongodb": broken})
+
+    assert finished == ["ok"]
+    assert report.phases["mongodb"]["status"] == "failed"
+    assert report.phases["mongodb"]["error"] == "mongo down"
+
+
+@pytest.mark.asyncio
+async def test_background_phases_do_not_block_readiness(report):
+    release = asyncio.Event()
+
+    async def build_indexes():
+        await release.wait()
+
+    async def broken():
+        raise RuntimeError("sweep failed")
+
+    task = run_in_background("mongodb_indexes", build_indexes)
+    failing = run_in_background("redis_ttl_sweep", broken)
+    report.mark_ready()
+
+    assert report.as_dict()["ready"]
+    assert report.phases["mongodb_indexes"]["status"] == "running"
+
+    release.set()
+    await asyncio.gather(task, failing)
+    assert report.phases["mongodb_indexes"]["status"] == "ok"
+    assert report.phases["mongodb_indexes"]["background"]
+    assert report.phases["redis_ttl_sweep"]["status"] == "failed"
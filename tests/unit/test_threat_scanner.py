@@ -0,0 +1,84 @@
+import json
+import re
+
+import pytest
+
+from services.security.threat_scanner import ThreatScanner
+
+# The pattern lists from VALIDATION_RULES in services/security/security_config.py
+DANGEROUS = [
+    r"<script[^>]*>.*?</script>", r"javascript:", r"vbscript:", r"onload\s*=", r"onerror\s*=",
+    r"onclick\s*=", r"eval\s*\(", r"document\.cookie", r"document\.write", r"window\.location",
+]
+SQL = [
+    r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION)\b)", r"(\b(OR|AND)\s+\d+\s*=\s*\d+)",
+    r"(\b(OR|AND)\s+['\"].*['\"])", r"(--|#|/\*|\*/)", r"(\bxp_cmdshell\b)", r"(\bsp_executesql\b)",
+]
+NOSQL = [
+    r"\$where", r"\$ne", r"\$gt", r"\$lt", r"\$regex", r"\$or", r"\$and",
+    r"function\s*\(", r"this\.", r"sleep\s*\(",
+]
+RULES = {"dangerous": DANGEROUS, "sql": SQL, "nosql": NOSQL}
+
+SAMPLES = [
+    "Launch day post for our store and more words here",
+    "<SCRIPT type='x'>alert(1)</script>",
+    "visit JavaScript:void(0)",
+    "<img onError = 'x'>",
+    "x' OR 1=1",
+    "name' or 'a'='a",
+    "Select your plan",
+    "selection of orders",
+    "comment -- here",
+    "exec xp_cmdshell 'dir'",
+    '{"user": {"$Ne": null}}',
+    "this.constructor",
+    "Sleep (5)",
+    "document.Cookie",
+    "document.writeln",
+    "$orbit",
+    "forward and sideways",
+    "",
+]
+
+
+def _first_category(text):
+    """What the middleware's former per-list scans reported"""
+    for category, patterns in RULES.items():
+        if any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns):
+            return category
+    return None
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_scan_flags_the_same_inputs_as_separate_searches(text):
+    result = ThreatScanner(RULES).scan(text)
+    expected = _first_category(text)
+    assert (result is None) == (expected is None)
+
+
+def test_scan_reports_the_category_of_the_matching_rule():
+    scanner = ThreatScanner(RULES)
+    assert scanner.scan("document.cookie") == "dangerous"
+    assert scanner.scan("1 OR 2=2") == "sql"
+    assert scanner.scan('{"$gt": 1}') == "nosql"
+    assert scanner.scan(json.dumps({"caption": "Summer launch, tap the link in bio"})) is None
+
+
+def test_overlapping_literals_are_all_tried():
+    # Both document literals share a prefix, and the "or" hit starts inside the "$or" hit
+    scanner = ThreatScanner({
+        "a": [r"document\.write"], "b": [r"document\.cookie"], "c": [r"\$or\d"], "d": [r"or\s+\d"],
+    })
+    assert scanner.scan("DOCUMENT.WRITE") == "a"
+    assert scanner.scan("x document.cookie") == "b"
+    assert scanner.scan("$or1") == "c"
+    assert scanner.scan("$or 5") == "d"
+
+
+def test_rules_without_a_literal_prefix_are_still_searched():
+    scanner = ThreatScanner({"digits": [r"[0-9]{4}-[0-9]{4}"], "word": [r"secret"]})
+    assert scanner.scan("card 1234-5678") == "digits"
+    assert scanner.scan("my SECRET") == "word"
+    assert scanner.scan("nothing here") is None
+    assert ThreatScanner({}).scan("anything") is None
@@ -0,0 +1,85 @@
+import asyncio
+import base64
+import os
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.thumbnail_store import ThumbnailStore, thumbnail_key
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ThumbnailStore(directory=str(tmp_path), max_bytes=25)
+
+
+def test_key_is_stable_and_content_addressed():
+    logo = base64.b64encode(b"logo-bytes").decode()
+    assert thumbnail_key("sunset", "twitter", logo) == thumbnail_key("sunset", "twitter", logo)
+    assert thumbnail_key("sunset", "twitter", logo) != thumbnail_key("sunset", "linkedin", logo)
+    assert thumbnail_key("sunset", "twitter") != thumbnail_key("sunset", "twitter", logo)
+    assert len(thumbnail_key("sunset", "twitter")) == 64
+
+
+def test_lru_eviction_respects_size_cap(store):
+    keys = [thumbnail_key(f"prompt {i}", "universal") for i in range(3)]
+    store.write(keys[0], b"a" * 10)
+    store.write(keys[1], b"b" * 10)
+    assert store.read(keys[0]) == b"a" * 10  # keys[0] is now most recently used
+    store.write(keys[2], b"c" * 10)
+
+    assert store.get_path(keys[1]) is None
+    assert store.read(keys[0]) == b"a" * 10
+    assert store.total_bytes == 20
+
+
+def test_index_survives_restart(store, tmp_path):
+    key = thumbnail_key("restart", "universal")
+    store.write(key, b"png")
+    assert ThumbnailStore(directory=str(tmp_path)).read(key) == b"png"
+
+
+def test_rejects_invalid_keys(store):
+    with pytest.raises(ValueError):
+        store.path_for("../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generation_is_coalesced(store):
+    key = thumbnail_key("coalesce", "universal")
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"image", {"platform": "universal"}
+
+    with patch("services.thumbnail_store.RedisManager") as redis_manager:
+        redis_manager.cache_set = AsyncMock(return_value=True)
+        results = await asyncio.gather(*(store.get_or_create(key, generate) for _ in range(4)))
+        again = await store.get_or_create(key, generate)
+
+    assert calls == 1
+    assert all(result["key"] == key for result in results)
+    assert again["cached"] is True
+
+
+def test_workers_sharing_a_directory_see_each_others_thumbnails(tmp_path):
+    worker_a = ThumbnailStore(directory=str(tmp_path), max_bytes=25)
+    worker_b = ThumbnailStore(directory=str(tmp_path), max_bytes=25)
+    key = thumbnail_key("shared", "universal")
+
+    worker_a.write(key, b"a" * 10)
+    assert worker_b.read(key) == b"a" * 10
+    assert worker_b.size_of(key) == 10
+
+
+def test_size_cap_applies_to_the_whole_directory(tmp_path):
+    workers = [ThumbnailStore(directory=str(tmp_path), max_bytes=25) for _ in range(3)]
+    keys = [thumbnail_key(f"prompt {i}", "universal") for i in range(3)]
+    for worker, key in zip(workers, keys):
+        worker.write(key, b"x" * 10)
+
+    on_disk = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert on_disk == 20
+    assert workers[0].get_path(keys[0]) is None
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from services.auth.wallet import signature
+from services.auth.wallet.nonce_store import InMemoryNonceStore, RedisNonceStore
+
+
+@pytest.mark.asyncio
+async def test_nonce_is_single_use():
+    store = InMemoryNonceStore()
+    await store.issue("login", "ethereum:0xabc", "nonce-1")
+
+    assert await store.consume("login", "ethereum:0xabc") == "nonce-1"
+    assert await store.consume("login", "ethereum:0xabc") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_nonce_is_rejected_and_purged():
+    store = InMemoryNonceStore()
+    with patch("services.auth.wallet.nonce_store.time.monotonic", return_value=1000.0):
+        await store.issue("login", "a", "old", ttl_seconds=10)
+    with patch("services.auth.wallet.nonce_store.time.monotonic", return_value=1011.0):
+        assert await store.consume("login", "a") is None
+        await store.issue("login", "b", "old", ttl_seconds=10)
+        await store.issue("login", "c", "new", ttl_seconds=10)
+    assert len(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_store_is_bounded():
+    store = InMemoryNonceStore(max_entries=2)
+    for i in range(3):
+        await store.issue("login", f"wallet-{i}", f"nonce-{i}")
+
+    assert len(store) == 2
+    assert await store.consume("login", "wallet-0") is None
+    assert await store.consume("login", "wallet-2") == "nonce-2"
+
+
+@pytest.mark.asyncio
+async def test_redis_store_consumes_atomically():
+    with patch("services.auth.wallet.nonce_store.RedisManager") as redis_manager:
+        redis_manager.cache_pop = AsyncMock(return_value="nonce-1")
+        assert await RedisNonceStore().consume("login", "ethereum:0xabc") == "nonce-1"
+
+    redis_manager.cache_pop.assert_awaited_once_with("wallet:nonce:login:ethereum:0xabc")
+
+
+@pytest.mark.asyncio
+async def test_mismatched_value_does_not_consume_nonce():
+    store = InMemoryNonceStore()
+    await store.issue("challenge", "0xabc", "sign me")
+
+    assert await store.consume_if_matches("challenge", "0xabc", "forged") is False
+    assert await store.consume_if_matches("challenge", "0xabc", "sign me") is True
+    assert await store.consume_if_matches("challenge", "0xabc", "sign me") is False
+
+
+@pytest.mark.asyncio
+async def test_redis_store_compares_and_deletes_atomically():
+    with patch("services.auth.wallet.nonce_store.RedisManager") as redis_manager:
+        redis_manager.cache_pop_if_equal = AsyncMock(return_value=True)
+        assert await RedisNonceStore().consume_if_matches("challenge", "0xabc", "sign me") is True
+
+    redis_manager.cache_pop_if_equal.assert_awaited_once_with("wallet:nonce:challenge:0xabc", "sign me")
+
+
+@pytest.mark.asyncio
+async def test_signature_recovery_is_cached():
+    signature.clear_signature_cache()
+    address = "0x71c7656ec7ab88b098defb751b7401b5f6d8976f"
+
+    with patch("services.auth.wallet.signature.recover_address", return_value=address) as recover:
+        assert await signature.verify_wallet_signature_async(address.upper().replace("0X", "0x"), "msg", "0xsig")
+        assert await signature.verify_wallet_signature_async(address, "msg", "0xsig")
+        assert not await signature.verify_wallet_signature_async("0x" + "0" * 40, "msg", "0xsig")
+
+    recover.assert_called_once_with("msg", "0xsig")
+    signature.clear_signature_cache()
+
+
+@pytest.mark.asyncio
+async def test_failed_recovery_is_rejected():
+    signature.clear_signature_cache()
+    with patch("services.auth.wallet.signature.recover_address", return_value=None):
+        assert not await signature.verify_wallet_signature_async("0xabc", "msg", "0xbad")
+    signature.clear_signature_cache()
@@ -0,0 +1,92 @@
+"""Fast JSON responses for Social Suit.
+
+This module provides an orjson-based response class used as the application's
+default, and a decorator for read endpoints that return large payloads, so
+their results are serialized directly instead of first being converted by
+FastAPI's jsonable_encoder.
+"""
+
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Type variable for the route handler function
+F = TypeVar('F', bound=Callable[..., Any])
+
+# datetime, date, UUID, enums and dataclasses are serialized natively
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(value: Any) -> Any:
+    """Serialize the types orjson does not handle itself.
+
+    Args:
+        value: The object orjson could not serialize
+
+    Returns:
+        A serializable replacement for the object
+
+    Raises:
+        TypeError: If the object cannot be serialized
+    """
+    if isinstance(value, BaseModel):
+        # Embedded as-is: pydantic writes the JSON without building a dict first
+        return orjson.Fragment(value.model_dump_json(by_alias=True))
+    if isinstance(value, Decimal):
+        # Same as jsonable_encoder: whole numbers stay integers
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with the application's options.
+
+    Args:
+        content: The content to serialize
+
+    Returns:
+        The JSON document
+    """
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(func: F) -> F:
+    """Decorator to serialize a route's result straight to a FastJSONResponse.
+
+    FastAPI otherwise validates the result against the response model and runs
+    it through jsonable_encoder before rendering, copying large payloads twice.
+    Use it on read endpoints whose handlers already return the response model's
+    objects (or plain data, when there is no response model); the response
+    model still documents the endpoint. Responses returned by the handler are
+    passed through unchanged.
+
+    Args:
+        func: The FastAPI route handler function to wrap
+
+    Returns:
+        The wrapped function that returns a FastJSONResponse
+    """
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await func(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return FastJSONResponse(result)
+
+    return wrapper  # type: ignore
@@ -7,7 +7,8 @@ and other malicious inputs.
 
 import re
 import html
-from typing import Any, Dict, List, Union, Optional
+import json
+from typing import Any, Dict, Iterable, List, Union, Optional, Tuple
 from fastapi import Request
 from pydantic import BaseModel
 
@@ -18,6 +19,30 @@ ON_EVENT_PATTERN = re.compile(r'\s+on\w+\s*=\s*["\'][^"\'>]*["\']', re.IGNORECAS
 JAVASCRIPT_URL_PATTERN = re.compile(r'javascript:\s*', re.IGNORECASE)
 DANGEROUS_ATTRIBUTES = re.compile(r'\s+(src|href|style|action)\s*=\s*["\'][^"\'>]*["\']', re.IGNORECASE)
 
+# Everything sanitize_string can change: the characters html.escape rewrites and javascript: URLs.
+# Text without a match comes back unchanged, so it skips the escape/regex chain entirely.
+UNSAFE_TEXT_PATTERN = re.compile(r'[<>&"\']|javascript:', re.IGNORECASE)
+
+# The same check on a raw JSON body. Inside JSON strings a quote is always escaped (\") and any
+# character may be written as \uXXXX, so both escapes count as unsafe. Plain substring searches
+# scan a large body several times faster than one regex alternation.
+UNSAFE_JSON_MARKERS = (b'<', b'>', b'&', b"'", b'\\"', b'\\u')
+
+
+def json_needs_sanitizing(body: bytes) -> bool:
+    """Check whether sanitizing a raw JSON body could change any of its strings.
+    
+    Args:
+        body: The raw JSON body
+        
+    Returns:
+        False if every string in the body would come back unchanged
+    """
+    for marker in UNSAFE_JSON_MARKERS:
+        if marker in body:
+            return True
+    return b'javascript:' in body.lower()
+
 
 def sanitize_string(value: str) -> str:
     """Sanitize a string by escaping HTML entities and removing potentially malicious content.
@@ -31,6 +56,10 @@ def sanitize_string(value: str) -> str:
     if not value or not isinstance(value, str):
         return value
     
+    # Fast path: nothing below would change the string
+    if not UNSAFE_TEXT_PATTERN.search(value):
+        return value
+    
     # Escape HTML entities
     sanitized = html.escape(value)
     
@@ -113,6 +142,147 @@ def sanitize_list(data: List[Any]) -> List[Any]:
     return sanitized_data
 
 
+def _sanitize_in_place(value: Any) -> Tuple[Any, bool]:
+    """Sanitize every string in a parsed JSON value, mutating containers in place.
+
+    Returns:
+        The sanitized value and whether anything changed
+    """
+    if isinstance(value, str):
+        if UNSAFE_TEXT_PATTERN.search(value):
+            return sanitize_string(value), True
+        return value, False
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return value, False
+
+    # Only values are replaced, never keys, so iterating while assigning is safe
+    changed = False
+    for key, item in items:
+        if isinstance(item, str):
+            if UNSAFE_TEXT_PATTERN.search(item):
+                value[key] = sanitize_string(item)
+                changed = True
+        elif isinstance(item, (dict, list)):
+            changed = _sanitize_in_place(item)[1] or changed
+    return value, changed
+
+
+def compile_field_spec(fields: Iterable[str]) -> Dict[str, Any]:
+    """Compile dotted field paths into a spec for sanitize_fields.
+
+    Path segments name object keys and arrays are transparent, so
+    "posts.content" covers the content of every item in a posts array.
+    A path that ends at an object or array covers everything below it.
+
+    Args:
+        fields: Dotted paths such as "posts.content" or "posts.metadata"
+
+    Returns:
+        A nested dictionary where True marks a subtree to sanitize in full
+    """
+    spec: Dict[str, Any] = {}
+    for field in fields:
+        node = spec
+        parts = field.split(".")
+        for part in parts[:-1]:
+            if node.get(part) is True:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = True
+    return spec
+
+
+def sanitize_fields(data: Any, spec: Dict[str, Any]) -> bool:
+    """Sanitize only the fields a compiled spec names, in place.
+
+    Args:
+        data: A parsed JSON value
+        spec: A spec from compile_field_spec
+
+    Returns:
+        True if any value was changed
+    """
+    if isinstance(data, list):
+        changed = False
+        for item in data:
+            changed = sanitize_fields(item, spec) or changed
+        return changed
+    if not isinstance(data, dict):
+        return False
+
+    changed = False
+    for key, subspec in spec.items():
+        if key not in data:
+            continue
+        if subspec is True:
+            data[key], field_changed = _sanitize_in_place(data[key])
+        else:
+            field_changed = sanitize_fields(data[key], subspec)
+        changed = changed or field_changed
+    return changed
+
+
+def loads_sanitized(body: Union[str, bytes], spec: Optional[Dict[str, Any]] = None) -> Tuple[Any, bool]:
+    """Parse a JSON body and sanitize it in the same pass.
+
+    Without a spec every string is sanitized while the parser builds each
+    object, so the body is walked once. With a spec only the named fields
+    are visited after parsing.
+
+    Args:
+        body: The raw JSON body
+        spec: Optional spec from compile_field_spec limiting what is sanitized
+
+    Returns:
+        The parsed body and whether sanitization changed anything
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if spec is not None:
+        data = json.loads(body)
+        return data, sanitize_fields(data, spec)
+
+    changed = False
+    unsafe = UNSAFE_TEXT_PATTERN.search
+
+    # Objects inside arrays were already sanitized by the hook, so arrays only need their strings
+    def sanitize_array(items: List[Any]) -> bool:
+        array_changed = False
+        for index, item in enumerate(items):
+            if isinstance(item, str):
+                if unsafe(item):
+                    items[index] = sanitize_string(item)
+                    array_changed = True
+            elif isinstance(item, list):
+                array_changed = sanitize_array(item) or array_changed
+        return array_changed
+
+    def sanitize_object(obj: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal changed
+        for key, value in obj.items():
+            if isinstance(value, str):
+                if unsafe(value):
+                    obj[key] = sanitize_string(value)
+                    changed = True
+            elif isinstance(value, list):
+                changed = sanitize_array(value) or changed
+        return obj
+
+    data = json.loads(body, object_hook=sanitize_object)
+    if isinstance(data, str):
+        sanitized = sanitize_string(data)
+        return sanitized, sanitized is not data
+    if isinstance(data, list):
+        changed = sanitize_array(data) or changed
+    return data, changed
+
+
 def sanitize_model(model: BaseModel) -> BaseModel:
     """Sanitize all string fields in a Pydantic model.
     